@@ -95,8 +95,12 @@ MIGRATION_MODULES = {
     "nutrition_tracker": "nutrition_tracker.database.migrations",
 }
 
+# Opted in reads go to DATABASES["replica"] when configured, everything else to DATABASES["default"].
+DATABASE_ROUTERS = ["nutrition_tracker.database.routers.ReplicaRouter"]
+
 # https://docs.djangoproject.com/en/3.2/ref/middleware/#middleware-ordering
 MIDDLEWARE = [
+    "nutrition_tracker.middleware.query_stats.QueryStatsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -107,6 +111,8 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "nutrition_tracker.middleware.timezone.TimezoneMiddleware",
+    "nutrition_tracker.middleware.request_cache.RequestCacheMiddleware",
+    "nutrition_tracker.middleware.replica.ReplicaRoutingMiddleware",
 ]
 
 TEMPLATES = [
@@ -208,6 +214,19 @@ CACHES = {
     }
 }
 
+# Gunicorn web processes per box, gunicorn reads the same environment variable.
+WEB_CONCURRENCY = config("WEB_CONCURRENCY", default=1, cast=int)
+# Mealplan solver jobs, per process. 0 solves inline on the calling thread.
+MEALPLAN_JOB_WORKERS = config("MEALPLAN_JOB_WORKERS", default=1, cast=int)
+# Solver search workers per box. Each process runs its own job pool, so the budget is split across
+# WEB_CONCURRENCY * MEALPLAN_JOB_WORKERS concurrent solves, with at least one search worker each.
+# Solver threads per box are at most max(MEALPLAN_SOLVER_MAX_WORKERS, WEB_CONCURRENCY * MEALPLAN_JOB_WORKERS).
+MEALPLAN_SOLVER_MAX_WORKERS = config("MEALPLAN_SOLVER_MAX_WORKERS", default=10, cast=int)
+
+# Per request query count and DB time, see nutrition_tracker.middleware.query_stats.
+QUERY_STATS_HEADERS = config("QUERY_STATS_HEADERS", default=False, cast=bool)
+QUERY_STATS_LOG = config("QUERY_STATS_LOG", default=False, cast=bool)
+
 SECURE_SSL_REDIRECT = config("SECURE_SSL_REDIRECT", default=False, cast=bool)
 
 # Rest framework settings
@@ -35,6 +35,14 @@ DATABASES = {
     }
 }
 
+# Optional read replica, e.g. a second local Postgres instance streaming from the first.
+if config("DB_REPLICA_PORT", default=""):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "PORT": config("DB_REPLICA_PORT"),
+        "TEST": {"MIRROR": "default"},
+    }
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -41,6 +41,11 @@ db_config = dj_database_url.config(
 )
 DATABASES = {"default": db_config}
 
+# Optional read replica, see nutrition_tracker.database.routers.
+replica_db_config = dj_database_url.config(env="DATABASE_REPLICA_URL", conn_max_age=600, ssl_require=True)
+if replica_db_config:
+    DATABASES["replica"] = replica_db_config
+
 SECURE_SSL_REDIRECT = True
 SECURE_HSTS_SECONDS = 60
 SESSION_COOKIE_SECURE = True
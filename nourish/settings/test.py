@@ -10,3 +10,8 @@ TEMPLATE_DEBUG = False
 
 db_config = dj_database_url.config()
 DATABASES = {"default": db_config}
+
+# Solve mealplan jobs inline, test data is not visible to other DB connections.
+MEALPLAN_JOB_WORKERS = 0
+# Solver budgets don't depend on the environment's gunicorn processes.
+WEB_CONCURRENCY = 1
@@ -3,6 +3,7 @@ from .db_branded_food import DBBrandedFoodAdmin
 from .db_food import DBFoodAdmin
 from .db_food_nutrient import DBFoodNutrientAdmin
 from .db_food_portion import DBFoodPortionAdmin
+from .mealplan_solve_stat import MealplanSolveStatAdmin
 from .search_result import SearchResultAdmin
 from .usda_branded_food import USDABrandedFoodAdmin
 from .usda_fndds_food import USDAFnddsFoodAdmin
@@ -0,0 +1,21 @@
+"""Admin module for Mealplan Solve Stat."""
+from __future__ import annotations
+
+from django.contrib import admin
+
+from nutrition_tracker.models import MealplanSolveStat
+from nutrition_tracker.utils import model as model_utils
+
+
+@admin.register(MealplanSolveStat)
+class MealplanSolveStatAdmin(admin.ModelAdmin):
+    """Mealplan Solve Stat Admin"""
+
+    fields: list[str] = model_utils.get_field_names(
+        list(MealplanSolveStat._meta.fields), prefix_fields_in_order=["status", "wall_time"]
+    )
+    list_display: list[str] = model_utils.get_field_names(
+        list(MealplanSolveStat._meta.fields), prefix_fields_in_order=["status", "wall_time"]
+    )
+    list_filter = ["status", "warm_start", "num_search_workers"]
+    autocomplete_fields = ["user"]
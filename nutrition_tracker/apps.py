@@ -2,9 +2,16 @@
 from __future__ import annotations
 
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class NutritionTrackerConfig(AppConfig):
     """Configure application attributes for nutrition_tracker."""
 
     name = "nutrition_tracker"
+
+    def ready(self) -> None:
+        """Forget resolved user model content type IDs after migrations, they are resolved lazily on first use."""
+        from nutrition_tracker.logic import data_loaders  # pylint: disable=import-outside-toplevel
+
+        post_migrate.connect(data_loaders.reset_content_type_ids, sender=self)
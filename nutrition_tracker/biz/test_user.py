@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import datetime
 from unittest.mock import patch
 
 from django.test import TestCase
+from django.utils import timezone
 
 import users.models as user_model
 from nutrition_tracker.biz import user
@@ -50,6 +52,19 @@ class TestBizUser(TestCase):
         luser_2.save()
         self.assertEqual(2, user.load_lusers(family_id=test_constants.TEST_UUID).count())
 
+    def test_load_active_lusers(self):
+        since = timezone.now() - datetime.timedelta(days=1)
+        self.assertFalse(user.load_active_lusers(since).exists())
+
+        test_objects.get_meal_today_1()
+        test_objects.get_meal_today_2()
+        self.assertEqual([self.USER], list(user.load_active_lusers(since)))
+
+        luser_2 = test_objects.get_user_2()
+        luser_2.last_login = timezone.now()
+        luser_2.save()
+        self.assertEqual(2, user.load_active_lusers(since).count())
+
     def test_get_flags(self):
         self.assertEqual(1, user.get_flags({user_model.User.FLAG_IS_PREGNANT: True}))
 
@@ -145,3 +160,26 @@ class TestBizUser(TestCase):
         self.USER.save()
         user.get_family_members(self.USER)
         self.assertEqual(1, user.get_family_members(self.USER).count())
+
+    def test_get_family_member_ids_no_family_id(self):
+        with self.assertNumQueries(0):
+            self.assertEqual([self.USER.id], user.get_family_member_ids(self.USER))
+
+    def test_get_family_member_ids_with_family_id(self):
+        luser_2 = test_objects.get_user_2()
+        user.create_family(self.USER, luser_2.email)
+        self.USER.refresh_from_db()
+        self.assertCountEqual([self.USER.id, luser_2.id], user.get_family_member_ids(self.USER))
+
+        # Cached
+        with self.assertNumQueries(0):
+            self.assertCountEqual([self.USER.id, luser_2.id], user.get_family_member_ids(self.USER))
+
+        # Invalidated when a user joins or leaves the family
+        luser_3 = user_model.User.objects.create_user(email="user_3@famnom.com")
+        user.add_to_family(luser_3, self.USER.family_id)
+        self.assertCountEqual([self.USER.id, luser_2.id, luser_3.id], user.get_family_member_ids(self.USER))
+
+        luser_3.family_id = None
+        luser_3.save()
+        self.assertCountEqual([self.USER.id, luser_2.id], user.get_family_member_ids(self.USER))
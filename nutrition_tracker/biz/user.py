@@ -1,16 +1,18 @@
 """User logic module."""
 from __future__ import annotations
 
+import datetime
 import uuid
 from typing import Any
 
 from allauth.utils import get_user_model
+from django.core.cache import cache
 from django.db import models
 
 import users.models as user_model
 from nutrition_tracker.constants import constants
 from nutrition_tracker.database import models as db_models
-from nutrition_tracker.utils import exceptions
+from nutrition_tracker.utils import exceptions, request_cache
 
 
 def get_flags(flags_dict: dict[str, bool]) -> int:
@@ -77,6 +79,25 @@ def load_lusers(
     return qs.filter(**params)
 
 
+def load_active_lusers(since: datetime.datetime) -> models.QuerySet[user_model.User]:
+    """Load users active since, who logged in or logged a meal."""
+    return (
+        _load_queryset()
+        .filter(is_active=True)
+        .filter(models.Q(last_login__gte=since) | models.Q(usermeal__meal_date__gte=since.date()))
+        .distinct()
+    )
+
+
+def set_time_zone(luser: user_model.User, time_zone: str) -> None:
+    """Store the user's timezone, for work done outside their requests."""
+    if luser.time_zone == time_zone:
+        return
+
+    luser.time_zone = time_zone
+    luser.save(update_fields=["time_zone"])
+
+
 def create_family(parent_luser: user_model.User, child_email: str) -> None:
     """Create a family of parent_luser and child_email.
     Add to family if already exists, create one otherwise."""
@@ -120,3 +141,23 @@ def get_family_members(luser: user_model.User) -> models.QuerySet[user_model.Use
         return empty_qs()
 
     return load_lusers(family_id=luser.family_id)
+
+
+def get_family_member_ids(luser: user_model.User) -> list[int]:
+    """Returns ids of all users in a user's family, only the user's id if not in a family.
+    Family rosters are cached, and invalidated when a user's family_id changes."""
+    if not luser.family_id:
+        return [luser.id]
+
+    return _get_family_member_ids(luser.family_id)
+
+
+@request_cache.memoize
+def _get_family_member_ids(family_id: uuid.UUID) -> list[int]:
+    key: str = user_model.get_family_roster_key(family_id)
+    member_ids: list[int] | None = cache.get(key)
+    if member_ids is None:
+        member_ids = list(load_lusers(family_id=family_id).values_list("id", flat=True))
+        cache.set(key, member_ids, constants.FAMILY_ROSTER_CACHE_TIMEOUT)
+
+    return member_ids
@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import dataclasses
+from typing import Any, Callable, Iterable, TypeVar
 
 from nutrition_tracker.constants import constants
 
+_T = TypeVar("_T")
+
+
+def _index(items: Iterable[_T], key: Callable[[_T], Any]) -> dict[Any, _T]:
+    """Index config items by key, the first item wins on duplicate keys."""
+    index: dict[Any, _T] = {}
+    for item in items:
+        index.setdefault(key(item), item)
+
+    return index
+
 
 @dataclasses.dataclass
 class USDAFoodCategory:
     """Wrapper class for USDA Food Category."""
 
+    __slots__ = ("id_", "code", "description")
+
     def __init__(self, id_: int, code: str | None, description: str) -> None:
         self.id_ = id_
         self.code = code
@@ -54,6 +68,8 @@ usda_food_categories: list[USDAFoodCategory] = [
 class WWEIAFoodCategory:
     """Wrapper class for USDA WWEIA Food Category."""
 
+    __slots__ = ("id_", "description")
+
     def __init__(self, id_: int, description: str) -> None:
         self.id_ = id_
         self.description = description
@@ -234,6 +250,8 @@ wweia_food_categories: list[WWEIAFoodCategory] = [
 class USDAMeasureUnit:
     """Wrapper class for USDA Measure Unit."""
 
+    __slots__ = ("id_", "name", "abbreviation")
+
     def __init__(self, id_: int, name: str, abbreviation: str) -> None:
         self.id_ = id_
         self.name = name
@@ -370,6 +388,8 @@ usda_measure_units: list[USDAMeasureUnit] = [
 class USDANutrient:  # pylint: disable=too-many-instance-attributes
     """Wrapper class for USDA Nutrient."""
 
+    __slots__ = ("id_", "name", "unit_name", "nutrient_nbr", "rank", "display_name", "description", "wikipedia_url")
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         id_: int,
@@ -1376,3 +1396,11 @@ usda_nutrients: list[USDANutrient] = [
 
 EQUIVALENT_NUTRIENTS: list[frozenset] = [frozenset([1008, 2047, 2048])]
 ALTERNATE_UNIT_NAME: dict[str, str] = {"UG": "MCG"}
+
+# Indexes for O(1) lookups, built once per process at import.
+usda_food_categories_by_id: dict[int, USDAFoodCategory] = _index(usda_food_categories, lambda x: x.id_)
+wweia_food_categories_by_id: dict[int, WWEIAFoodCategory] = _index(wweia_food_categories, lambda x: x.id_)
+usda_measure_units_by_id: dict[int, USDAMeasureUnit] = _index(usda_measure_units, lambda x: x.id_)
+usda_measure_units_by_name: dict[str, USDAMeasureUnit] = _index(usda_measure_units, lambda x: x.name)
+usda_nutrients_by_id: dict[int, USDANutrient] = _index(usda_nutrients, lambda x: x.id_)
+usda_nutrients_by_nutrient_nbr: dict[str, USDANutrient] = _index(usda_nutrients, lambda x: x.nutrient_nbr)
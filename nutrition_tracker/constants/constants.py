@@ -48,6 +48,27 @@ class ExpansionSet(models.IntegerChoices):
     MEMBERS = 2, _("Apply preference to members, only applicable to categories.")
 
 
+class MealplanJobStatus(models.TextChoices):
+    """Mealplan Job Status"""
+
+    QUEUED = "queued", _("Queued")
+    RUNNING = "running", _("Running")
+    DONE = "done", _("Done")
+    FAILED = "failed", _("Failed")
+    CANCELLED = "cancelled", _("Cancelled")
+
+
+class LoadProfile(models.TextChoices):
+    """Loader Profile"""
+
+    # Model fields only, no joins or prefetches.
+    IDS = "ids", _("IDs")
+    # Fields needed to display the object in lists.
+    DISPLAY = "display", _("Display")
+    # Everything, including members and portions.
+    FULL = "full", _("Full")
+
+
 class Threshold(models.TextChoices):
     """Threshold"""
 
@@ -89,6 +110,13 @@ class DBFoodSourceSubType(models.IntegerChoices):
     OTHER = 9999, _("Other")
 
 
+class TopFoodBasis(models.IntegerChoices):
+    """Top Food Basis"""
+
+    PORTION_SIZE = 1, _("Per 100g")
+    SERVING = 2, _("Per serving")
+
+
 DB_SUB_TYPE_TO_USDA_TYPE_MAP = {
     DBFoodSourceSubType.USDA_FOUNDATION_FOOD: USDA_FOUNDATION_FOOD,
     DBFoodSourceSubType.USDA_SR_LEGACY_FOOD: USDA_SR_LEGACY_FOOD,
@@ -108,6 +136,22 @@ BRAND_FIELDS = ["brand_name", "subbrand_name", "brand_owner", "gtin_upc"]
 SCALING_FACTOR = 1000  # CP-SAT is an integer solver. Multiply everything by 1000 when solving.
 PORTION_SIZE = 100  # Portion normalization factor
 WRITE_BATCH_SIZE = 100
+ITERATOR_CHUNK_SIZE = 2000  # rows per keyset page when streaming full tables
+QUERY_STATS_MAX_REPEATS = 10  # a query repeated more often per request is logged as a likely N+1
+TOP_FOODS_MAX_ITEMS = 20
+TOP_FOODS_DB_SOURCE_SUB_TYPES = [DBFoodSourceSubType.USDA_FOUNDATION_FOOD, DBFoodSourceSubType.USDA_SR_LEGACY_FOOD]
+TOP_FOODS_FALLBACK_CACHE_TIMEOUT = 3600  # seconds, live rankings are kept in cache this long while the index is empty
+MEALPLAN_JOB_TIMEOUT = 600  # seconds, job state is kept in cache for this long
+MEALPLAN_JOB_STALE_TIMEOUT = 60  # seconds, unfinished jobs not updated for this long are from a dead worker
+MEALPLAN_JOB_POLL_INTERVAL = 2  # seconds, pages waiting on a job reload after this long
+MEALPLAN_MAX_DAYS = 7
+MEALPLAN_CACHE_TIMEOUT = 86400  # seconds, solved mealplans are kept in cache for this long
+MEALPLAN_PREPLAN_ACTIVE_DAYS = 7  # days, users active within this window are preplanned
+MEALPLAN_PREPLAN_WORKERS = 2  # concurrent preplanning solves
+FAMILY_ROSTER_CACHE_TIMEOUT = 86400  # seconds, family member ids are kept in cache for this long
+LOG_MEAL_MAX_ITEMS = 50  # items logged in a single batch log request
+DB_REPLICA_ALIAS = "replica"  # optional read replica in settings.DATABASES
+DB_REPLICA_PIN_TIMEOUT = 30  # seconds, users read from the primary for this long after their writes
 SITE_NAME = "Famnom"
 SITE_URL = "www.famnom.com"
 SITE_TAGLINE = "The Family Nutrition Planner"
@@ -459,6 +503,8 @@ MESSAGE_ERROR_MISSING_MEAL = _("Sorry, we didn't find the requested meal.")
 MESSAGE_ERROR_MISSING_RECIPE = _("Sorry, we didn't find the requested recipe.")
 MESSAGE_ERROR_INVALID_PORTION = _("Sorry, we didn't understand the serving details.")
 MESSAGE_ERROR_DELETE_NOT_ALLOWED = _("Sorry, this item cannot be deleted.")
+MESSAGE_ERROR_MEALPLAN_EXPIRED = _("Sorry, this mealplan has expired, please review the updated mealplan.")
+MESSAGE_ERROR_MEALPLAN_FAILED = _("Sorry, a mealplan could not be computed, please try again.")
 MESSAGE_ERROR_NUTRIENT_NOT_FOUND = _("Nutrient information not found.")
 MESSAGE_SUCCESS_FOOD_SAVE = _("Food saved.")
 MESSAGE_SUCCESS_FOOD_DELETE = _("Food deleted.")
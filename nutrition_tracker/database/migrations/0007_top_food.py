@@ -0,0 +1,75 @@
+# Generated by Django 4.0.6 on 2026-10-19 16:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nutrition_tracker", "0006_userfoodmembership_nutrition_tracker_userfoodmembership_parent_child_different"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TopFood",
+            fields=[
+                ("created_timestamp", models.DateTimeField(auto_now_add=True)),
+                ("updated_timestamp", models.DateTimeField(auto_now=True)),
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "nutrient_id",
+                    models.PositiveIntegerField(
+                        help_text="ID of the nutrient the food is ranked for.", verbose_name="nutrient_id"
+                    ),
+                ),
+                (
+                    "basis",
+                    models.PositiveSmallIntegerField(
+                        choices=[(1, "Per 100g"), (2, "Per serving")],
+                        default=1,
+                        help_text="Basis of the nutrient amount used for ranking.",
+                        verbose_name="basis",
+                    ),
+                ),
+                (
+                    "category_id",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        help_text="Id of the food category the ranking is restricted to, null for all foods.",
+                        null=True,
+                        verbose_name="food_category_id",
+                    ),
+                ),
+                (
+                    "rank",
+                    models.PositiveSmallIntegerField(
+                        help_text="Rank of the food, starting at 1.", verbose_name="rank"
+                    ),
+                ),
+                (
+                    "amount",
+                    models.FloatField(
+                        help_text="Amount of the nutrient in the food, on the given basis.", verbose_name="amount"
+                    ),
+                ),
+                (
+                    "db_food",
+                    models.ForeignKey(
+                        help_text="DB Food for this ranking.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="nutrition_tracker.dbfood",
+                        verbose_name="db_food",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "gt_top_food",
+                "abstract": False,
+            },
+        ),
+        migrations.AddIndex(
+            model_name="topfood",
+            index=models.Index(fields=["nutrient_id", "basis", "category_id", "rank"], name="top_food_lookup_idx"),
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 4.0.6 on 2026-10-19 17:15
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("nutrition_tracker", "0007_top_food"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MealplanSolveStat",
+            fields=[
+                ("created_timestamp", models.DateTimeField(auto_now_add=True)),
+                ("updated_timestamp", models.DateTimeField(auto_now=True)),
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "num_foods",
+                    models.PositiveIntegerField(
+                        help_text="Number of candidate foods and recipes in the model.", verbose_name="num_foods"
+                    ),
+                ),
+                (
+                    "num_nutrient_constraints",
+                    models.PositiveIntegerField(
+                        help_text="Number of nutrient preferences in the model.",
+                        verbose_name="num_nutrient_constraints",
+                    ),
+                ),
+                (
+                    "num_category_constraints",
+                    models.PositiveIntegerField(
+                        help_text="Number of category preferences in the model.",
+                        verbose_name="num_category_constraints",
+                    ),
+                ),
+                (
+                    "num_search_workers",
+                    models.PositiveSmallIntegerField(
+                        help_text="Solver search workers used for the solve.", verbose_name="num_search_workers"
+                    ),
+                ),
+                (
+                    "max_time_in_seconds",
+                    models.FloatField(
+                        help_text="Solver time limit used for the solve.", verbose_name="max_time_in_seconds"
+                    ),
+                ),
+                (
+                    "warm_start",
+                    models.BooleanField(
+                        default=False,
+                        help_text="Solve was hinted with a previous solution.",
+                        verbose_name="warm_start",
+                    ),
+                ),
+                ("status", models.CharField(help_text="Solver status name.", max_length=20, verbose_name="status")),
+                ("wall_time", models.FloatField(help_text="Solver wall time in seconds.", verbose_name="wall_time")),
+                (
+                    "objective_value",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Objective value of the solution.",
+                        null=True,
+                        verbose_name="objective_value",
+                    ),
+                ),
+                (
+                    "best_objective_bound",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Best proven objective bound.",
+                        null=True,
+                        verbose_name="best_objective_bound",
+                    ),
+                ),
+                (
+                    "gap",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Relative gap between the objective bound and value, 0 for optimal solutions.",
+                        null=True,
+                        verbose_name="gap",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="User that owns the row.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="owner user",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "gt_mealplan_solve_stat",
+                "abstract": False,
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.0.6 on 2026-10-19 17:22
+
+from __future__ import annotations
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("nutrition_tracker", "0008_mealplan_solve_stat"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mealplansolvestat",
+            name="num_days",
+            field=models.PositiveSmallIntegerField(
+                default=1, help_text="Number of days planned in the model.", verbose_name="num_days"
+            ),
+        ),
+    ]
@@ -5,11 +5,13 @@ used by all models."""
 from __future__ import annotations
 
 from functools import reduce
-from typing import Any, MutableMapping, TypeVar
+from typing import Any, Iterator, MutableMapping, TypeVar
 
-from django.db.models import Q, QuerySet
+from django.db.models import Q, QuerySet, prefetch_related_objects
 from django.db.models.lookups import Transform
+from django.utils import timezone
 
+from nutrition_tracker.constants import constants
 from nutrition_tracker.models import db_base
 
 
@@ -68,8 +70,50 @@ def bulk_load(qs: QuerySet[TDbBase], params: dict) -> QuerySet[TDbBase]:
     return qs
 
 
+def iterate(qs: QuerySet[TDbBase], chunk_size: int | None = None, start: int = 0, rows: int = 0) -> Iterator[TDbBase]:
+    """Stream the objects in qs in primary key order, chunk_size objects at a time.
+
+    Each chunk is a keyset page (pk > last pk of the previous chunk) read through a server-side cursor,
+    so memory stays flat and late chunks cost as much as the first. Prefetch lookups of qs run once per chunk.
+    Skips the first start objects, and stops after rows objects if rows is set."""
+    if not chunk_size:
+        chunk_size = constants.ITERATOR_CHUNK_SIZE
+
+    lookups: tuple = qs._prefetch_related_lookups  # pylint: disable=protected-access
+    qs = qs.prefetch_related(None).order_by("pk")
+    if start > 0:
+        # Resolve the offset once on the pk index, chunks are keyset pages from there.
+        start_pks: list[Any] = list(qs.values_list("pk", flat=True)[start - 1 : start])
+        if not start_pks:
+            return
+        qs = qs.filter(pk__gt=start_pks[0])
+
+    remaining: int = rows
+    chunk_qs: QuerySet[TDbBase] = qs
+    while True:
+        limit: int = min(chunk_size, remaining) if rows > 0 else chunk_size
+        chunk: list[TDbBase] = list(chunk_qs[:limit].iterator(chunk_size=limit))
+        if lookups:
+            prefetch_related_objects(chunk, *lookups)
+
+        yield from chunk
+
+        remaining -= len(chunk)
+        if len(chunk) < limit or (rows > 0 and remaining <= 0):
+            return
+
+        chunk_qs = qs.filter(pk__gt=chunk[-1].pk)
+
+
 def bulk_update(cls: type[TDbBase], objs: list[TDbBase], fields: list[str], batch_size: int | None = None) -> None:
-    """Update the given fields on the provided model instances."""
+    """Update the given fields on the provided model instances.
+    QuerySet.bulk_update skips auto_now, updated_timestamp is bumped here like save() does."""
+    if "updated_timestamp" not in fields:
+        now = timezone.now()
+        for obj in objs:
+            obj.updated_timestamp = now
+        fields = [*fields, "updated_timestamp"]
+
     return cls.objects.bulk_update(objs, fields, batch_size=batch_size)
 
 
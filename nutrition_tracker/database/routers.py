@@ -0,0 +1,152 @@
+"""Database routers.
+
+Catalog and search reads opted in with use_replica/using_replica go to the read replica, when one is configured.
+User owned data (meals, recipes, foods) is always read from the primary.
+Writes always go to the primary. Users that wrote are pinned to the primary for DB_REPLICA_PIN_TIMEOUT,
+so they read their own writes while the replica catches up."""
+from __future__ import annotations
+
+import contextlib
+from contextvars import ContextVar, Token
+from typing import Any, Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model, QuerySet
+from django.http import HttpRequest
+
+from nutrition_tracker.constants import constants
+
+
+class RoutingState:  # pylint: disable=too-few-public-methods
+    """Replica routing state for the duration of a single request."""
+
+    def __init__(self, request: HttpRequest | None = None) -> None:
+        self.request = request
+        # Set on the first write, reads stay on the primary for the rest of the request.
+        self.wrote: bool = False
+        self.pinned: bool | None = None
+
+
+_routing_state: ContextVar[RoutingState | None] = ContextVar("routing_state", default=None)
+_use_replica: ContextVar[bool] = ContextVar("use_replica", default=False)
+
+
+def _get_pin_key(user_id: int) -> str:
+    return f"replica_pin:{user_id}"
+
+
+def activate(request: HttpRequest | None = None) -> Token:
+    """Install fresh routing state for the current context."""
+    return _routing_state.set(RoutingState(request))
+
+
+def deactivate(token: Token) -> None:
+    """Drop the routing state installed by the matching activate call.
+    Pins the request user to the primary if the request wrote."""
+    state: RoutingState | None = _routing_state.get()
+    _routing_state.reset(token)
+    if not state or not state.wrote or not state.request or not is_replica_configured():
+        return
+
+    user: Any = getattr(state.request, "user", None)
+    if user and user.is_authenticated:
+        pin_user(user.id)
+
+
+def is_replica_configured() -> bool:
+    """True if a read replica is configured."""
+    return constants.DB_REPLICA_ALIAS in settings.DATABASES
+
+
+def pin_user(user_id: int) -> None:
+    """Read from the primary for user_id's requests, for DB_REPLICA_PIN_TIMEOUT."""
+    cache.set(_get_pin_key(user_id), True, timeout=constants.DB_REPLICA_PIN_TIMEOUT)
+
+
+def is_pinned() -> bool:
+    """True if reads in the current context must go to the primary."""
+    state: RoutingState | None = _routing_state.get()
+    if not state:
+        return False
+
+    if state.wrote:
+        return True
+
+    if state.pinned is None:
+        user: Any = getattr(state.request, "user", None)
+        if not user or not user.is_authenticated:
+            return False
+
+        state.pinned = bool(cache.get(_get_pin_key(user.id)))
+
+    return state.pinned
+
+
+def get_read_alias() -> str:
+    """Database alias for opted in reads in the current context."""
+    if is_replica_configured() and not is_pinned():
+        return constants.DB_REPLICA_ALIAS
+
+    return DEFAULT_DB_ALIAS
+
+
+@contextlib.contextmanager
+def use_replica() -> Iterator[None]:
+    """Route reads in this block to the read replica. Also usable as a view/loader decorator.
+    Querysets have to be evaluated inside the block, see using_replica for lazy querysets."""
+    token: Token = _use_replica.set(get_read_alias() == constants.DB_REPLICA_ALIAS)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def using_replica(qs: QuerySet) -> QuerySet:
+    """Bind qs to the read replica, wherever it is evaluated."""
+    alias: str = get_read_alias()
+    if alias == DEFAULT_DB_ALIAS:
+        return qs
+
+    return qs.using(alias)
+
+
+class ReplicaRouter:
+    """Routes opted in reads to the read replica, and all writes to the primary."""
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> str | None:  # pylint: disable=unused-argument
+        """Database alias for reads of model."""
+        if not _use_replica.get():
+            return None
+
+        state: RoutingState | None = _routing_state.get()
+        if state and state.wrote:
+            return DEFAULT_DB_ALIAS
+
+        return constants.DB_REPLICA_ALIAS
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:  # pylint: disable=unused-argument
+        """Database alias for writes of model."""
+        state: RoutingState | None = _routing_state.get()
+        if state:
+            state.wrote = True
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool | None:  # pylint: disable=unused-argument
+        """The replica mirrors the primary, objects from either can be related."""
+        aliases: set[str] = {DEFAULT_DB_ALIAS, constants.DB_REPLICA_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:  # pylint: disable=protected-access
+            return True
+
+        return None
+
+    def allow_migrate(  # pylint: disable=unused-argument
+        self, db: str, app_label: str, model_name: str | None = None, **hints: Any
+    ) -> bool | None:
+        """The replica is migrated through replication, never directly."""
+        if db == constants.DB_REPLICA_ALIAS:
+            return False
+
+        return None
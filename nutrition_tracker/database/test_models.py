@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from django.test import TestCase
+
+from nutrition_tracker.database import models as db_models
+from nutrition_tracker.models import usda_food
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestDatabaseModels(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USDA_FOOD = test_objects.get_usda_food()
+        cls.USDA_FOOD_2 = test_objects.get_usda_food_2()
+        cls.USDA_FOOD_3 = test_objects.get_usda_food_unknown_type()
+        test_objects.get_usda_food_portion()
+        test_objects.get_usda_food_portion_2()
+
+    def get_qs(self):
+        return usda_food.USDAFood.objects.prefetch_related("usdafoodportion_set").order_by("-fdc_id")
+
+    def test_iterate(self):
+        cfoods = list(db_models.iterate(self.get_qs()))
+        self.assertEqual([self.USDA_FOOD, self.USDA_FOOD_2, self.USDA_FOOD_3], cfoods)
+
+    def test_iterate_chunks(self):
+        for chunk_size in [1, 2, 3, 4]:
+            cfoods = list(db_models.iterate(self.get_qs(), chunk_size=chunk_size))
+            self.assertEqual([self.USDA_FOOD, self.USDA_FOOD_2, self.USDA_FOOD_3], cfoods)
+
+    def test_iterate_prefetch_per_chunk(self):
+        # One page query and one prefetch query per chunk, plus an empty last page.
+        with self.assertNumQueries(4):
+            cfoods = list(db_models.iterate(self.get_qs(), chunk_size=2))
+
+        with self.assertNumQueries(0):
+            self.assertEqual([1, 1, 0], [len(cfood.usdafoodportion_set.all()) for cfood in cfoods])
+
+    def test_iterate_start_rows(self):
+        self.assertEqual([self.USDA_FOOD_2, self.USDA_FOOD_3], list(db_models.iterate(self.get_qs(), start=1)))
+        self.assertEqual([self.USDA_FOOD, self.USDA_FOOD_2], list(db_models.iterate(self.get_qs(), rows=2)))
+        self.assertEqual([self.USDA_FOOD_2], list(db_models.iterate(self.get_qs(), chunk_size=1, start=1, rows=1)))
+        self.assertEqual([], list(db_models.iterate(self.get_qs(), start=3)))
+
+    def test_bulk_update_updated_timestamp(self):
+        updated_timestamp = self.USDA_FOOD.updated_timestamp
+        self.USDA_FOOD.description = "updated"
+        db_models.bulk_update(usda_food.USDAFood, [self.USDA_FOOD], ["description"])
+
+        self.USDA_FOOD.refresh_from_db()
+        self.assertEqual("updated", self.USDA_FOOD.description)
+        self.assertGreater(self.USDA_FOOD.updated_timestamp, updated_timestamp)
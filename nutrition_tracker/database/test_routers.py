@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.test import SimpleTestCase
+from django.test.client import RequestFactory
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.database import routers
+from nutrition_tracker.models import db_food
+
+
+class TestDatabaseRouters(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.router = routers.ReplicaRouter()
+
+    def get_request(self, user_id=1):
+        request = RequestFactory().get("/")
+        request.user = SimpleNamespace(is_authenticated=True, id=user_id)
+        return request
+
+    def test_no_replica(self):
+        with routers.use_replica():
+            self.assertIsNone(self.router.db_for_read(db_food.DBFood))
+            self.assertEqual(DEFAULT_DB_ALIAS, routers.get_read_alias())
+
+        qs = db_food.load_cfoods()
+        self.assertIs(qs, routers.using_replica(qs))
+
+    @patch.object(routers, "is_replica_configured", return_value=True)
+    def test_use_replica(self, _mock):
+        self.assertIsNone(self.router.db_for_read(db_food.DBFood))
+        with routers.use_replica():
+            self.assertEqual(constants.DB_REPLICA_ALIAS, self.router.db_for_read(db_food.DBFood))
+        self.assertIsNone(self.router.db_for_read(db_food.DBFood))
+
+        self.assertEqual(constants.DB_REPLICA_ALIAS, routers.using_replica(db_food.load_cfoods()).db)
+
+    @patch.object(routers, "is_replica_configured", return_value=True)
+    def test_use_replica_decorator(self, _mock):
+        @routers.use_replica()
+        def load():
+            return self.router.db_for_read(db_food.DBFood)
+
+        self.assertEqual(constants.DB_REPLICA_ALIAS, load())
+        self.assertEqual(constants.DB_REPLICA_ALIAS, load())
+
+    @patch.object(routers, "is_replica_configured", return_value=True)
+    def test_read_your_writes(self, _mock):
+        token = routers.activate(self.get_request())
+        try:
+            with routers.use_replica():
+                self.assertEqual(constants.DB_REPLICA_ALIAS, self.router.db_for_read(db_food.DBFood))
+                self.assertEqual(DEFAULT_DB_ALIAS, self.router.db_for_write(db_food.DBFood))
+                self.assertEqual(DEFAULT_DB_ALIAS, self.router.db_for_read(db_food.DBFood))
+        finally:
+            routers.deactivate(token)
+
+        # Pinned to the primary on later requests.
+        token = routers.activate(self.get_request())
+        try:
+            self.assertTrue(routers.is_pinned())
+            self.assertEqual(DEFAULT_DB_ALIAS, routers.get_read_alias())
+            with routers.use_replica():
+                self.assertIsNone(self.router.db_for_read(db_food.DBFood))
+        finally:
+            routers.deactivate(token)
+
+        # Other users are not pinned.
+        token = routers.activate(self.get_request(user_id=2))
+        try:
+            self.assertFalse(routers.is_pinned())
+        finally:
+            routers.deactivate(token)
+
+    def test_no_pin_without_replica(self):
+        token = routers.activate(self.get_request())
+        self.router.db_for_write(db_food.DBFood)
+        routers.deactivate(token)
+
+        token = routers.activate(self.get_request())
+        try:
+            self.assertFalse(routers.is_pinned())
+        finally:
+            routers.deactivate(token)
+
+    def test_allow_migrate(self):
+        self.assertIsNone(self.router.allow_migrate(DEFAULT_DB_ALIAS, "nutrition_tracker"))
+        self.assertFalse(self.router.allow_migrate(constants.DB_REPLICA_ALIAS, "nutrition_tracker"))
@@ -44,9 +44,7 @@ class FoodForm(forms.Form, mixins.ServingsMixin):
         self.food_portions: list[tuple[UUID, str, float | None, str | None, float | None, float | None]] = kwargs.pop(
             "food_portions", []
         )
-        self.food_nutrients: list[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient] = kwargs.pop(
-            "food_nutrients", []
-        )
+        self.food_nutrients: list[food_nutrient.FoodNutrientValue] = kwargs.pop("food_nutrients", [])
         self.serving_size: float | None = None
         self.serving_size_unit: str | None = None
 
@@ -595,6 +595,7 @@ def mealplan_three(rows: Sequence[str | uuid.UUID]) -> Layout:
         )
     fields["submit"] = _submit(_("Save"), constants.URL_HOME, offset=False)
     return Layout(
+        Field("plan_id"),
         *fields["form"],
         *fields["submit"],
     )
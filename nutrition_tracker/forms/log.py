@@ -1,7 +1,6 @@
 """Log form, process food/recipe logging into meals."""
 from __future__ import annotations
 
-from datetime import date
 from typing import Any
 from uuid import UUID
 
@@ -15,10 +14,10 @@ from nutrition_tracker.constants import constants
 from nutrition_tracker.forms import base
 from nutrition_tracker.logic import food_portion
 from nutrition_tracker.logic import forms as forms_logic
+from nutrition_tracker.logic import meal_log
 from nutrition_tracker.models import (
     db_food,
     user_food_membership,
-    user_food_portion,
     user_ingredient,
     user_meal,
     user_preference,
@@ -92,54 +91,20 @@ class LogForm(forms.Form):  # pylint: disable=too-many-instance-attributes
 
     def save(self) -> None:
         """Save form: Log food/recipe in meal."""
-        meal_type: constants.MealType = self.cleaned_data["meal_type"]
-        meal_date: date = self.cleaned_data["meal_date"]
-        quantity: float | None = self.cleaned_data["quantity"]
-        serving: str = self.cleaned_data["serving"]
-
+        is_available: bool | None = None
         if self.lobject and "is_available" in self.changed_data:
-            is_available: bool | None = self.cleaned_data["is_available"]
-            if is_available is not None:
-                luser_preference, _unused = user_preference.get_or_create(
-                    self.user, food_external_id=self.lobject.external_id
-                )
-                luser_preference.update_flag(user_preference.FLAG_IS_AVAILABLE, is_available)
-                luser_preference.save()
-
-        if not self.lobject and self.cfood:
-            self.lobject = user_ingredient.create(luser=self.user, db_food=self.cfood)
-
-        self.lmeal, _unused = user_meal.get_or_create(self.user, meal_date=meal_date, meal_type=meal_type)
-        if not self.lmembership:
-            self.lmembership = user_food_membership.create(self.user, parent=self.lmeal, child=self.lobject)
-
-            lfood_portion: user_food_portion.UserFoodPortion = forms_logic.process_portion_choices_form_data(
-                quantity, serving, self.lobject, cfood=self.cfood
-            )
-
-        elif self.lmembership.parent == self.lmeal:
-            lfood_portion = forms_logic.process_portion_choices_form_data(
-                quantity, serving, self.lobject, cfood=self.cfood, lfood_portion=self.lmembership.portions[0]  # type: ignore
-            )
-
-        else:
-            old_meal_id: int = self.lmembership.parent_id
-            self.lmembership.delete()
-
-            # Delete meal also if this was the only membership.
-            old_lmeal: user_meal.UserMeal | None = user_meal.load_lmeal(self.user, id_=old_meal_id)
-            if not old_lmeal:
-                return
-
-            if len(old_lmeal.members) == 0:  # type: ignore
-                old_lmeal.delete()
-
-            self.lmembership = user_food_membership.create(self.user, parent=self.lmeal, child=self.lobject)
-
-            lfood_portion = forms_logic.process_portion_choices_form_data(
-                quantity, serving, self.lobject, cfood=self.cfood
-            )
-
-        lfood_portion.user = self.user
-        lfood_portion.content_object = self.lmembership
-        lfood_portion.save()
+            is_available = self.cleaned_data["is_available"]
+
+        item: meal_log.LogItem = meal_log.LogItem(
+            self.lobject,
+            self.cleaned_data["quantity"],
+            self.cleaned_data["serving"],
+            cfood=self.cfood,
+            is_available=is_available,
+            lmembership=self.lmembership,
+        )
+        self.lmeal = meal_log.log_items(
+            self.user, self.cleaned_data["meal_date"], self.cleaned_data["meal_type"], [item]
+        )
+        self.lobject = item.lobject  # type: ignore
+        self.lmembership = item.lmembership  # type: ignore
@@ -15,7 +15,7 @@ from nutrition_tracker.constants import constants
 from nutrition_tracker.forms import base, mixins
 from nutrition_tracker.logic import data_loaders
 from nutrition_tracker.logic import forms as forms_logic
-from nutrition_tracker.logic import user_prefs
+from nutrition_tracker.logic import mealplan, user_prefs
 from nutrition_tracker.models import (
     user_food_membership,
     user_food_portion,
@@ -250,7 +250,9 @@ class MealplanFormTwo(mixins.ThresholdsMixin, MealplanForm):
         items: list[UUID] = [fp.food_external_id for fp in food_preferences if fp.food_external_id]
 
         rows: list[UUID] = []
-        lfoods: list[user_ingredient.UserIngredient] = list(user_ingredient.load_lfoods(self.user, external_ids=items))
+        lfoods: list[user_ingredient.UserIngredient] = list(
+            user_ingredient.load_lfoods(self.user, external_ids=items, load_profile=constants.LoadProfile.DISPLAY)
+        )
         for lfood in lfoods:
             rows.append(lfood.external_id)
             field_name: str = form_utils.get_field_name(lfood.external_id)
@@ -260,7 +262,9 @@ class MealplanFormTwo(mixins.ThresholdsMixin, MealplanForm):
                 label="", choices=constants.Threshold.choices, required=False
             )
 
-        lrecipes: list[user_recipe.UserRecipe] = list(user_recipe.load_lrecipes(self.user, external_ids=items))
+        lrecipes: list[user_recipe.UserRecipe] = list(
+            user_recipe.load_lrecipes(self.user, external_ids=items, load_profile=constants.LoadProfile.IDS)
+        )
         for lrecipe in lrecipes:
             rows.append(lrecipe.external_id)
             field_name = form_utils.get_field_name(lrecipe.external_id)
@@ -289,145 +293,111 @@ class MealplanFormTwo(mixins.ThresholdsMixin, MealplanForm):
 class MealplanFormThree(MealplanForm):
     """Mealplan three form - save mealplan to meals."""
 
+    plan_id = forms.UUIDField(widget=forms.HiddenInput())
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._init_mealplan()
 
-    # flake8: noqa: C901
-    def _init_mealplan(self) -> None:  # pylint: disable=too-many-branches
-        """Initialize form with computed mealplan."""
-        rows: list[UUID] = []
+    def _init_mealplan(self) -> None:
+        """Initialize form with the computed mealplan, persisted under a plan ID.
+        A plan already persisted by the mealplan job is reused, the mealplan is only persisted if it expired.
+        Bound forms are initialized with the persisted plan, so submissions are validated against it."""
+        self.plan: dict[str, dict[str, Any]] = {}
         if self.lmealplan:
-            for lfood in self.lmealplan.lfoods:
-                if lfood.external_id not in self.lmealplan.quantity_map:
-                    continue
-
-                quantity: float = self.lmealplan.quantity_map.get(lfood.external_id, 0)
-                for lmeal in self.lmealplan.lmeals_today:
-                    for lmeal_member in lmeal.members:
-                        if lmeal_member.child_id == lfood.id and (
-                            lmeal_member.child_type_id == data_loaders.get_content_type_ingredient_id()
-                        ):
-                            quantity -= lmeal_member.portions[0].serving_size
-
-                r_quantity: int = round(quantity)
-                if r_quantity == 0:
-                    continue
-
-                rows.append(lfood.external_id)
-                field_name: str = form_utils.get_field_name(lfood.external_id)
-                self.fields[field_name] = forms.FloatField(
-                    label=lfood.display_name, min_value=0, initial=r_quantity, required=False
-                )
-                meal_field_name: str = form_utils.get_meal_field_name(lfood.external_id)
-                self.fields[meal_field_name] = forms.ChoiceField(
-                    label="", choices=constants.MealType.choices, required=False
-                )
-
-            for lrecipe in self.lmealplan.lrecipes:
-                if lrecipe.external_id not in self.lmealplan.quantity_map:
-                    continue
-
-                quantity = self.lmealplan.quantity_map.get(lrecipe.external_id, 0)
-                for lmeal in self.lmealplan.lmeals_today:
-                    for lmeal_member in lmeal.members:
-                        if lmeal_member.child_id == lrecipe.id and (
-                            lmeal_member.child_type_id == data_loaders.get_content_type_recipe_id()
-                        ):
-                            quantity -= lmeal_member.portions[0].serving_size
-
-                r_quantity = round(quantity)
-                if r_quantity == 0:
-                    continue
-
-                rows.append(lrecipe.external_id)
-                field_name = form_utils.get_field_name(lrecipe.external_id)
-                self.fields[field_name] = forms.FloatField(
-                    label=lrecipe.display_name(),
-                    min_value=0,
-                    initial=r_quantity,
-                    required=False,
-                )
-                meal_field_name = form_utils.get_meal_field_name(lrecipe.external_id)
-                self.fields[meal_field_name] = forms.ChoiceField(
-                    label="", choices=constants.MealType.choices, required=False
-                )
+            plan_id: str | None = self.lmealplan.plan_id
+            plan: dict[str, dict[str, Any]] | None = mealplan.load_plan(self.user, plan_id) if plan_id else None
+            if plan_id is None or plan is None:
+                plan_id, plan = mealplan.save_plan(self.user, self.lmealplan)
+            self.initial["plan_id"] = plan_id
+            self.plan = plan
+        elif self.is_bound and text.is_valid_uuid(str(self.data.get("plan_id"))):
+            self.plan = mealplan.load_plan(self.user, str(self.data["plan_id"])) or {}
+
+        rows: list[str] = []
+        for external_id, item in self.plan.items():
+            rows.append(external_id)
+            field_name: str = form_utils.get_field_name(external_id)
+            self.fields[field_name] = forms.FloatField(
+                label=item["name"], min_value=0, initial=item["quantity"], required=False
+            )
+            meal_field_name: str = form_utils.get_meal_field_name(external_id)
+            self.fields[meal_field_name] = forms.ChoiceField(
+                label="", choices=constants.MealType.choices, required=False
+            )
 
         self.helper: base.MealplanFormThreeHelper = base.MealplanFormThreeHelper(rows, self)
 
+    def clean_plan_id(self) -> UUID:
+        """Validate the submitted plan is known, and owned by the user."""
+        plan_id: UUID = self.cleaned_data["plan_id"]
+        if not self.plan:
+            raise forms.ValidationError(constants.MESSAGE_ERROR_MEALPLAN_EXPIRED)
+
+        return plan_id
+
     def save(self) -> bool:
         """Save form."""
         return self._save_mealplan()
 
-    def _save_mealplan(self) -> bool:  # pylint: disable=too-many-locals,too-many-branches
-        """Save mealplan to selected meals.
-
-        The rendered mealplan is gone once the form is rendered, so cleaned_data and changed_data aren't populated. Iterate through form.data and validate fields manually."""
+    def _save_mealplan(self) -> bool:
+        """Save the persisted mealplan items to selected meals. The plan is deleted once saved."""
         changed: bool = False
-        if not self.data:
-            return changed
-
-        external_ids: list[str] = [f for f in self.data if text.is_valid_uuid(f)]
-        if not external_ids:
-            return changed
-
-        lobject_ids: list[UUID] = []
-        for external_id in external_ids:
-            quantity: float | None = text.valid_float(self.data[external_id])
-            if not quantity:
+        plan_id: UUID = self.cleaned_data["plan_id"]
+        selected: list[tuple[str, float, constants.MealType]] = []
+        for external_id in self.plan:
+            quantity: float | None = self.cleaned_data.get(form_utils.get_field_name(external_id))
+            raw_meal_type: str | None = self.cleaned_data.get(form_utils.get_meal_field_name(external_id))
+            if not quantity or not raw_meal_type or raw_meal_type == constants.MealType.__empty__:
                 continue
 
-            lobject_ids.append(UUID(external_id, version=4))
-
-        lobjects: dict[UUID, user_ingredient.UserIngredient | user_recipe.UserRecipe] = {}
-        lfoods: list[user_ingredient.UserIngredient] = list(
-            user_ingredient.load_lfoods(self.user, external_ids=lobject_ids)
-        )
-        lrecipes: list[user_recipe.UserRecipe] = list(user_recipe.load_lrecipes(self.user, external_ids=lobject_ids))
-        for lfood in lfoods:
-            lobjects[lfood.external_id] = lfood
-
-        for lrecipe in lrecipes:
-            lobjects[lrecipe.external_id] = lrecipe
+            selected.append((external_id, quantity, constants.MealType(raw_meal_type)))
+
+        ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+        recipe_type_id: int = data_loaders.get_content_type_recipe_id()
+        food_ids: list[int] = [
+            self.plan[external_id]["id"]
+            for external_id, _unused, _unused_meal_type in selected
+            if self.plan[external_id]["type_id"] == ingredient_type_id
+        ]
+        recipe_ids: list[int] = [
+            self.plan[external_id]["id"]
+            for external_id, _unused, _unused_meal_type in selected
+            if self.plan[external_id]["type_id"] == recipe_type_id
+        ]
+        lobjects: dict[tuple[int, int], user_ingredient.UserIngredient | user_recipe.UserRecipe] = {}
+        if food_ids:
+            for lfood in user_ingredient.load_lfoods(self.user, ids=food_ids):
+                lobjects[(ingredient_type_id, lfood.id)] = lfood
+
+        if recipe_ids:
+            for lrecipe in user_recipe.load_lrecipes(self.user, ids=recipe_ids):
+                lobjects[(recipe_type_id, lrecipe.id)] = lrecipe
 
         lmeals: dict[constants.MealType, user_meal.UserMeal] = {}
         meal_date: date = timezone.localdate()
-        for external_id_uuid in lobject_ids:
-            external_id = str(external_id_uuid)
-            quantity = text.valid_float(self.data[external_id])
-            field_name: str = form_utils.get_meal_field_name(external_id)
-            raw_meal_type: constants.MealType = self.data[field_name]
-            if not raw_meal_type:
-                continue
-
-            if raw_meal_type == constants.MealType.__empty__:
+        for external_id, quantity, meal_type_ in selected:
+            lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe | None = lobjects.get(
+                (self.plan[external_id]["type_id"], self.plan[external_id]["id"])
+            )
+            if not lobject:
                 continue
 
-            for type_, _unused in constants.MealType.choices:
-                if not type_:
-                    continue
-
-                meal_type_: constants.MealType = constants.MealType(type_)
-                if not raw_meal_type == meal_type_:
-                    continue
-
-                if meal_type_ in lmeals:
-                    lmeal = lmeals[meal_type_]
-                else:
-                    lmeal, _unused_created = user_meal.get_or_create(
-                        self.user, meal_date=meal_date, meal_type=meal_type_
-                    )
-                    lmeals[meal_type_] = lmeal
-
-                changed = True
-                lmembership: user_food_membership.UserFoodMembership = user_food_membership.create(
-                    self.user, parent=lmeal, child=lobjects[external_id_uuid]
-                )
-                lfood_portion: user_food_portion.UserFoodPortion = forms_logic.process_portion_choices_form_data(
-                    quantity, str(constants.ONE_SERVING_ID), lobjects[external_id_uuid]
+            if meal_type_ not in lmeals:
+                lmeals[meal_type_], _unused_created = user_meal.get_or_create(
+                    self.user, meal_date=meal_date, meal_type=meal_type_
                 )
-                lfood_portion.user = self.user
-                lfood_portion.content_object = lmembership
-                lfood_portion.save()
 
+            changed = True
+            lmembership: user_food_membership.UserFoodMembership = user_food_membership.create(
+                self.user, parent=lmeals[meal_type_], child=lobject
+            )
+            lfood_portion: user_food_portion.UserFoodPortion = forms_logic.process_portion_choices_form_data(
+                quantity, str(constants.ONE_SERVING_ID), lobject
+            )
+            lfood_portion.user = self.user
+            lfood_portion.content_object = lmembership
+            lfood_portion.save()
+
+        mealplan.delete_plan(plan_id)
         return changed
@@ -25,6 +25,15 @@ from nutrition_tracker.models import (
 )
 from nutrition_tracker.utils import form as form_utils
 
+# User food portion fields set by the servings formset.
+SERVING_FIELDS: list[str] = [
+    "servings_per_container",
+    "serving_size",
+    "serving_size_unit",
+    "measure_unit_id",
+    "amount",
+]
+
 
 class ServingsMixin:  # pylint: disable=too-few-public-methods
     """Servings formset mixin for foods/recipes."""
@@ -36,8 +45,9 @@ class ServingsMixin:  # pylint: disable=too-few-public-methods
         content_type: ContentType,
         is_new_lfood: bool = False,
     ) -> Any:
-        """Save formset."""
+        """Save formset. Portions are written in one insert and one update, deleted portions in one delete."""
         if is_new_lfood:
+            cfood_portions: list[db_food_portion.DBFoodPortion] = []
             for serving_form in servings.forms:
                 if not serving_form.has_changed():
                     continue
@@ -54,19 +64,26 @@ class ServingsMixin:  # pylint: disable=too-few-public-methods
                 measure_unit_id = measure_unit_id if measure_unit_id else None
                 amount: float | None = float(Fraction(household_quantity)) if household_quantity else None
 
-                db_food_portion.create(
-                    db_food=instance.db_food,  # type: ignore
-                    source_type=constants.DBFoodSourceType.USER,
-                    servings_per_container=servings_per_container,
-                    serving_size=serving_size,
-                    serving_size_unit=serving_size_unit,
-                    measure_unit_id=measure_unit_id,
-                    amount=amount,
+                cfood_portions.append(
+                    db_food_portion.DBFoodPortion(
+                        db_food=instance.db_food,  # type: ignore
+                        source_type=constants.DBFoodSourceType.USER,
+                        servings_per_container=servings_per_container,
+                        serving_size=serving_size,
+                        serving_size_unit=serving_size_unit,
+                        measure_unit_id=measure_unit_id,
+                        amount=amount,
+                    )
                 )
 
+            if cfood_portions:
+                db_food_portion.bulk_create(cfood_portions)
+
             return servings
 
         servings.instance = instance
+        new_lfood_portions: list[user_food_portion.UserFoodPortion] = []
+        updated_lfood_portions: list[user_food_portion.UserFoodPortion] = []
         for serving_form in servings.forms:
             if not serving_form.has_changed():
                 continue
@@ -77,22 +94,41 @@ class ServingsMixin:  # pylint: disable=too-few-public-methods
             serving_form.instance.user = instance.user
             serving_form.instance.content_type = content_type
             serving_form.instance.object_id = instance.id
-            serving_form.save(commit=False)
+            lfood_portion: user_food_portion.UserFoodPortion = serving_form.save(commit=False)
+            if lfood_portion.pk:
+                updated_lfood_portions.append(lfood_portion)
+            else:
+                new_lfood_portions.append(lfood_portion)
+
+        if new_lfood_portions:
+            user_food_portion.bulk_create(new_lfood_portions)
 
-        return servings.save()
+        if updated_lfood_portions:
+            user_food_portion.bulk_update(updated_lfood_portions, SERVING_FIELDS)
+
+        deleted_ids: list[int] = [
+            serving_form.instance.pk for serving_form in servings.deleted_forms if serving_form.instance.pk
+        ]
+        if deleted_ids:
+            user_food_portion.load_lfood_portions(instance.user, ids=deleted_ids).delete()
+
+        return [*new_lfood_portions, *updated_lfood_portions]
 
 
 class MembersMixin:  # pylint: disable=too-few-public-methods
     """Members formset mixin for recipes/meals."""
 
-    def _save_members(  # pylint: disable=no-self-use
+    def _save_members(  # pylint: disable=no-self-use,too-many-locals,too-many-branches
         self,
         members: BaseGenericInlineFormSet,
         instance: user_recipe.UserRecipe | user_meal.UserMeal,
         content_type: ContentType,
     ) -> BaseGenericInlineFormSet:
-        """Save formset."""
+        """Save formset. Children are resolved in one query, and memberships/portions
+        are written in one insert and one update each, deleted memberships in one delete."""
         members.instance = instance
+        member_forms: list[Any] = []
+        is_self_referential: bool = False
         for member_form in members.forms:
             if not member_form.has_changed():
                 continue
@@ -103,52 +139,111 @@ class MembersMixin:  # pylint: disable=too-few-public-methods
             if not instance.user:
                 continue
 
-            child_external_id: str = member_form.cleaned_data["child_external_id"]
             # Bail early for self-referential additions.
             # Can only really happen when editing recipes, to include the
             # same recipe as a member.
-            if str(child_external_id) == str(instance.external_id):
-                return members
+            if str(member_form.cleaned_data["child_external_id"]) == str(instance.external_id):
+                is_self_referential = True
+                break
 
-            quantity: float | None = member_form.cleaned_data["quantity"]
-            serving: str = member_form.cleaned_data["serving"]
+            member_forms.append(member_form)
 
-            lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe | None = None
+        child_external_ids: list[str] = [member_form.cleaned_data["child_external_id"] for member_form in member_forms]
+        lobjects: dict[str, user_ingredient.UserIngredient | user_recipe.UserRecipe] = {}
+        if child_external_ids:
             if content_type == data_loaders.get_content_type_ingredient():
-                lobject = user_ingredient.load_lfood(instance.user, external_id=child_external_id)
+                lobjects = {
+                    str(lfood.external_id): lfood
+                    for lfood in user_ingredient.load_lfoods(instance.user, external_ids=child_external_ids)
+                }
             elif content_type == data_loaders.get_content_type_recipe():
-                lobject = user_recipe.load_lrecipe(instance.user, external_id=child_external_id)
-
+                lobjects = {
+                    str(lrecipe.external_id): lrecipe
+                    for lrecipe in user_recipe.load_lrecipes(
+                        instance.user, external_ids=child_external_ids, load_profile=constants.LoadProfile.DISPLAY
+                    )
+                }
+
+        new_lmemberships: list[user_food_membership.UserFoodMembership] = []
+        updated_lmemberships: list[user_food_membership.UserFoodMembership] = []
+        # Member portions to write, (membership, portion choices form data).
+        member_portions: list[tuple[user_food_membership.UserFoodMembership, user_food_portion.UserFoodPortion]] = []
+        for member_form in member_forms:
+            lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe | None = lobjects.get(
+                str(member_form.cleaned_data["child_external_id"])
+            )
             if not lobject:
                 continue
 
+            lmembership: user_food_membership.UserFoodMembership = member_form.instance
             if "child_external_id" in member_form.changed_data:
-                member_form.instance.user = instance.user
-                member_form.instance.parent = instance
-                member_form.instance.child = lobject
-
-            lmembership: user_food_membership.UserFoodMembership = member_form.save()
+                lmembership.user = instance.user
+                lmembership.parent = instance
+                lmembership.child = lobject
+                if lmembership.pk:
+                    updated_lmemberships.append(lmembership)
+                else:
+                    new_lmemberships.append(lmembership)
 
             if "quantity" in member_form.changed_data or "serving" in member_form.changed_data:
-                lfood_portion: user_food_portion.UserFoodPortion = forms_logic.process_portion_choices_form_data(
-                    quantity, str(serving), lobject, cfood=getattr(lobject, "db_food", None)
-                )
-                user_food_portion.update_or_create(
-                    instance.user,
-                    content_type=data_loaders.get_content_type_membership(),
-                    object_id=lmembership.id,
-                    defaults={
-                        "serving_size": lfood_portion.serving_size,
-                        "serving_size_unit": lfood_portion.serving_size_unit,
-                        "quantity": lfood_portion.quantity,
-                        "amount": lfood_portion.amount,
-                        "measure_unit_id": lfood_portion.measure_unit_id,
-                        "portion_description": lfood_portion.portion_description,
-                        "modifier": lfood_portion.modifier,
-                    },
+                member_portions.append(
+                    (
+                        lmembership,
+                        forms_logic.process_portion_choices_form_data(
+                            member_form.cleaned_data["quantity"],
+                            str(member_form.cleaned_data["serving"]),
+                            lobject,
+                            cfood=getattr(lobject, "db_food", None),
+                        ),
+                    )
                 )
 
-        return members.save()
+        # Existing member portions, loaded before new memberships are created.
+        lfood_portions: dict[int, user_food_portion.UserFoodPortion] = {}
+        existing_ids: list[int] = [lmembership.id for lmembership, _unused in member_portions if lmembership.pk]
+        if existing_ids:
+            for lfood_portion in user_food_portion.load_lfood_portions(
+                instance.user,
+                content_type_id=data_loaders.get_content_type_membership_id(),
+                object_ids=existing_ids,
+            ):
+                lfood_portions.setdefault(lfood_portion.object_id, lfood_portion)
+
+        if new_lmemberships:
+            user_food_membership.bulk_create(new_lmemberships)
+
+        if updated_lmemberships:
+            user_food_membership.bulk_update(updated_lmemberships, ["child_type", "child_id"])
+
+        new_lfood_portions: list[user_food_portion.UserFoodPortion] = []
+        updated_lfood_portions: list[user_food_portion.UserFoodPortion] = []
+        for lmembership, portion_data in member_portions:
+            lfood_portion = lfood_portions.get(lmembership.id)
+            if lfood_portion:
+                for field in forms_logic.PORTION_CHOICES_FIELDS:
+                    setattr(lfood_portion, field, getattr(portion_data, field))
+                updated_lfood_portions.append(lfood_portion)
+            else:
+                portion_data.user = instance.user
+                portion_data.content_object = lmembership
+                new_lfood_portions.append(portion_data)
+
+        if new_lfood_portions:
+            user_food_portion.bulk_create(new_lfood_portions)
+
+        if updated_lfood_portions:
+            user_food_portion.bulk_update(updated_lfood_portions, forms_logic.PORTION_CHOICES_FIELDS)
+
+        if is_self_referential:
+            return members
+
+        deleted_ids: list[int] = [
+            member_form.instance.pk for member_form in members.deleted_forms if member_form.instance.pk
+        ]
+        if deleted_ids:
+            user_food_membership.load_lmemberships(instance.user, ids=deleted_ids).delete()
+
+        return members
 
 
 # Disable mypy type check.
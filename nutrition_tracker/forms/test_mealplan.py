@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from django.test import TestCase
 
 from nutrition_tracker.constants import constants
@@ -69,7 +71,8 @@ class TestFormsMealplanForm(TestCase):
     def test_form_three_empty_init(self):
         kwargs = {"user": self.USER}
         form = MealplanFormThree(data={}, **kwargs)
-        self.assertTrue(form.is_valid())
+        self.assertFalse(form.is_valid())
+        self.assertIn("plan_id", form.errors)
 
     def test_form_three_init(self):
         kwargs = {"user": self.USER}
@@ -80,12 +83,16 @@ class TestFormsMealplanForm(TestCase):
             form_utils.get_meal_field_name(test_constants.TEST_UUID_2): constants.MealType.LUNCH,
         }
         form = MealplanFormThree(data=form_data, **kwargs)
-        self.assertTrue(form.is_valid())
+        # Submissions without a plan are not saved.
+        self.assertFalse(form.is_valid())
+        self.assertIn("plan_id", form.errors)
 
     def test_form_three_init_with_mealplan(self):
         lmealplan = mealplan.get_mealplan_for_user(self.USER)
         kwargs = {"user": self.USER, "lmealplan": lmealplan}
+        form = MealplanFormThree(**kwargs)
         form_data = {
+            "plan_id": form.initial["plan_id"],
             form_utils.get_field_name(test_constants.TEST_UUID): 29,
             form_utils.get_meal_field_name(test_constants.TEST_UUID): constants.MealType.BREAKFAST,
             form_utils.get_field_name(test_constants.TEST_UUID_2): 32,
@@ -93,3 +100,52 @@ class TestFormsMealplanForm(TestCase):
         }
         form = MealplanFormThree(data=form_data, **kwargs)
         self.assertTrue(form.is_valid())
+
+    def test_form_three_init_with_saved_plan(self):
+        lmealplan = mealplan.Mealplan(
+            False, [self.USER_INGREDIENT], [], [], [], [], {self.USER_INGREDIENT.external_id: 100}
+        )
+        lmealplan.plan_id, items = mealplan.save_plan(self.USER, lmealplan)
+        kwargs = {"user": self.USER, "lmealplan": lmealplan}
+        with patch.object(mealplan, "save_plan") as mock:
+            form = MealplanFormThree(**kwargs)
+
+        # The saved plan is reused.
+        mock.assert_not_called()
+        self.assertEqual(lmealplan.plan_id, form.initial["plan_id"])
+        self.assertEqual(items, form.plan)
+
+        # Expired plans are saved again.
+        mealplan.delete_plan(lmealplan.plan_id)
+        form = MealplanFormThree(**kwargs)
+        self.assertNotEqual(lmealplan.plan_id, form.initial["plan_id"])
+        self.assertEqual(items, form.plan)
+
+    def test_form_three_init_with_plan(self):
+        lmealplan = mealplan.Mealplan(
+            False, [self.USER_INGREDIENT], [], [], [], [], {self.USER_INGREDIENT.external_id: 100}
+        )
+        plan_id, _items = mealplan.save_plan(self.USER, lmealplan)
+        kwargs = {"user": self.USER}
+        form_data = {
+            "plan_id": plan_id,
+            form_utils.get_field_name(self.USER_INGREDIENT.external_id): 29,
+            form_utils.get_meal_field_name(self.USER_INGREDIENT.external_id): constants.MealType.BREAKFAST,
+        }
+        form = MealplanFormThree(data=form_data, **kwargs)
+        self.assertTrue(form.is_valid())
+        self.assertTrue(form.save())
+
+        # Plans are saved at most once.
+        form = MealplanFormThree(data=form_data, **kwargs)
+        self.assertFalse(form.is_valid())
+
+    def test_form_three_init_unknown_plan(self):
+        kwargs = {"user": self.USER}
+        form_data = {
+            "plan_id": test_constants.TEST_UUID,
+            form_utils.get_field_name(test_constants.TEST_UUID): 29,
+            form_utils.get_meal_field_name(test_constants.TEST_UUID): constants.MealType.BREAKFAST,
+        }
+        form = MealplanFormThree(data=form_data, **kwargs)
+        self.assertFalse(form.is_valid())
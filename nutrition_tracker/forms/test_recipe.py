@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from crispy_forms.utils import render_crispy_form
+from django.db import connection
 from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from nutrition_tracker.biz import user
@@ -18,7 +20,7 @@ from nutrition_tracker.forms import (
     RecipeMemberFormset,
 )
 from nutrition_tracker.logic import data_loaders
-from nutrition_tracker.models import user_food_membership, user_food_portion, user_recipe
+from nutrition_tracker.models import user_food_membership, user_food_portion, user_ingredient, user_recipe
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.tests import utils as test_utils
 
@@ -286,3 +288,68 @@ class TestFormsRecipeForm(TransactionTestCase):
         self.assertEqual(2, user_food_membership.load_lmemberships(self.USER).count())
         self.assertEqual(3, user_food_portion.load_lfood_portions(luser_2).count())
         self.assertEqual(2, user_food_membership.load_lmemberships(luser_2).count())
+
+    def save_food_members(self, lfoods, deleted_lmemberships=()):
+        form_data = {
+            "name": self.USER_RECIPE.name,
+            "recipe_date": self.USER_RECIPE.recipe_date,
+            "food-TOTAL_FORMS": str(len(deleted_lmemberships) + len(lfoods)),
+            "food-INITIAL_FORMS": str(len(deleted_lmemberships)),
+            "food-MIN_NUM_FORMS": "0",
+            "food-MAX_NUM_FORMS": "1000",
+            "recipe-TOTAL_FORMS": "0",
+            "recipe-INITIAL_FORMS": "0",
+            "recipe-MIN_NUM_FORMS": "0",
+            "recipe-MAX_NUM_FORMS": "1000",
+            "servings-TOTAL_FORMS": "0",
+            "servings-INITIAL_FORMS": "0",
+            "servings-MIN_NUM_FORMS": "0",
+            "servings-MAX_NUM_FORMS": "1000",
+        }
+        for index, lmembership in enumerate(deleted_lmemberships):
+            form_data[f"food-{index}-id"] = lmembership.id
+            form_data[f"food-{index}-child_external_id"] = lmembership.child.external_id
+            form_data[f"food-{index}-serving"] = -2
+            form_data[f"food-{index}-DELETE"] = "on"
+        for index, lfood in enumerate(lfoods, start=len(deleted_lmemberships)):
+            form_data[f"food-{index}-child_external_id"] = lfood.external_id
+            form_data[f"food-{index}-quantity"] = index + 1
+            form_data[f"food-{index}-serving"] = -2
+
+        lrecipe = user_recipe.load_lrecipe(self.USER, id_=self.USER_RECIPE.id)
+        form = RecipeForm(data=form_data, user=self.USER, lrecipe=lrecipe)
+        servings = FoodPortionFormset(form_data, instance=lrecipe, prefix="servings")
+        food_members = FoodMemberFormset(form_data, instance=lrecipe, prefix="food")
+        recipe_members = RecipeMemberFormset(form_data, instance=lrecipe, prefix="recipe")
+        self.assertTrue(form.is_valid())
+        self.assertTrue(servings.is_valid())
+        self.assertTrue(food_members.is_valid())
+        self.assertTrue(recipe_members.is_valid())
+
+        data_loaders.resolve_content_type_ids()
+        with CaptureQueriesContext(connection) as queries:
+            form.save(servings, food_members, recipe_members)
+        return queries
+
+    def test_form_lrecipe_save_members_batched(self):
+        lfoods = [user_ingredient.create(self.USER, name=f"Food {index}") for index in range(5)]
+
+        one_member = self.save_food_members(lfoods[:1])
+        user_food_membership.load_lmemberships(self.USER).delete()
+        five_members = self.save_food_members(lfoods)
+
+        self.assertEqual(len(one_member), len(five_members))
+        self.assertEqual(5, user_food_membership.load_lmemberships(self.USER).count())
+        self.assertEqual(5, user_food_portion.load_lfood_portions(self.USER).count())
+
+    def test_form_lrecipe_save_members_delete(self):
+        lfood = test_objects.get_user_ingredient()
+        lfood_2 = test_objects.get_user_ingredient_2()
+        ufm = test_objects.get_user_food_membership(self.USER_RECIPE, lfood)
+        test_objects.get_user_food_membership_portion(ufm)
+
+        self.save_food_members([lfood_2], deleted_lmemberships=[ufm])
+
+        lmemberships = user_food_membership.load_lmemberships(self.USER)
+        self.assertEqual([lfood_2.id], [lmembership.child_id for lmembership in lmemberships])
+        self.assertEqual(1, user_food_portion.load_lfood_portions(self.USER).count())
@@ -1,40 +1,43 @@
 """Data loading logic module. Batch load APIs for foods/recipes in recipes/meals."""
 from __future__ import annotations
 
-from typing import Sequence, TypeVar
+import dataclasses
+from collections import defaultdict
+from typing import Any, Collection, Sequence, TypeVar
+from uuid import UUID
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import QuerySet
 
 import users.models as user_model
-from nutrition_tracker.models import user_base, user_food_membership, user_ingredient, user_meal, user_recipe
-
-
-def get_lfood_ids_for_lparents(
+from nutrition_tracker.constants import constants
+from nutrition_tracker.models import (
+    user_base,
+    user_food_membership,
+    user_food_portion,
+    user_ingredient,
+    user_meal,
+    user_recipe,
+)
+
+
+def get_lfood_ids_for_lparents(  # pylint: disable=unused-argument
     user: user_model.User, lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal]
 ) -> set[int]:
     """Get all food ids in a list of parents - recipes/meals."""
-    lfood_ids: set[int] = set()
-    if not lparents:
-        return lfood_ids
-
-    lrecipe_ids: set[int] = set()
-    for lparent in lparents:
-        for lmember in lparent.members:  # type: ignore
-            if lmember.child_type_id == get_content_type_ingredient_id():
-                lfood_ids.add(lmember.child_id)
-            elif lmember.child_type_id == get_content_type_recipe_id():
-                lrecipe_ids.add(lmember.child_id)
-
-    lrecipes: Sequence[user_recipe.UserRecipe] = (
-        list(user_recipe.load_lrecipes(user, ids=list(lrecipe_ids))) if lrecipe_ids else []
-    )
-    lfood_ids.update(get_lfood_ids_for_lparents(user, lrecipes))
-    return lfood_ids
+    ingredient_type_id: int = get_content_type_ingredient_id()
+    return {
+        member.child_id
+        for member in get_member_closure_for_lparents(lparents)
+        if member.child_type_id == ingredient_type_id
+    }
 
 
 def load_lfoods_for_lparents(
-    user: user_model.User, lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal]
+    user: user_model.User,
+    lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal],
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> QuerySet[user_ingredient.UserIngredient]:
     """Get all foods (user_ingredient) objects in a list of parents - recipes/meals."""
     if not lparents:
@@ -44,31 +47,25 @@ def load_lfoods_for_lparents(
     if not lfood_ids:
         return user_ingredient.empty_qs()
 
-    return user_ingredient.load_lfoods(user, ids=list(lfood_ids))
+    return user_ingredient.load_lfoods(user, ids=list(lfood_ids), load_profile=load_profile)
 
 
-def get_lrecipe_ids_for_lparents(
+def get_lrecipe_ids_for_lparents(  # pylint: disable=unused-argument
     user: user_model.User, lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal]
 ) -> set[int]:
     """Get all recipe ids in a list of parents - recipes/meals."""
-    lrecipe_ids: set[int] = set()
-    if not lparents:
-        return lrecipe_ids
-
-    for lparent in lparents:
-        for lmember in lparent.members:  # type: ignore
-            if lmember.child_type_id == get_content_type_recipe_id():
-                lrecipe_ids.add(lmember.child_id)
-
-    lrecipes: Sequence[user_recipe.UserRecipe] = (
-        list(user_recipe.load_lrecipes(user, ids=list(lrecipe_ids))) if lrecipe_ids else []
-    )
-    lrecipe_ids.update(get_lrecipe_ids_for_lparents(user, lrecipes))
-    return lrecipe_ids
+    recipe_type_id: int = get_content_type_recipe_id()
+    return {
+        member.child_id
+        for member in get_member_closure_for_lparents(lparents)
+        if member.child_type_id == recipe_type_id
+    }
 
 
 def load_lrecipes_for_lparents(
-    user: user_model.User, lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal]
+    user: user_model.User,
+    lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal],
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> QuerySet[user_recipe.UserRecipe]:
     """Get all recipe objects in a list of parents - recipes/meals."""
     if not lparents:
@@ -78,11 +75,153 @@ def load_lrecipes_for_lparents(
     if not lrecipe_ids:
         return user_recipe.empty_qs()
 
-    return user_recipe.load_lrecipes(user, ids=list(lrecipe_ids))
+    return user_recipe.load_lrecipes(user, ids=list(lrecipe_ids), load_profile=load_profile)
+
+
+# Members of parents (type, ids), including members of nested recipes, with child external IDs.
+# UNION drops rows already in the closure, so a membership cycle terminates.
+_MEMBER_CLOSURE_SQL = """
+    WITH RECURSIVE closure (parent_id, child_type_id, child_id) AS (
+        SELECT m.parent_id, m.child_type_id, m.child_id
+        FROM ut_user_food_membership m
+        WHERE m.parent_type_id = %(parent_type_id)s AND m.parent_id = ANY(%(parent_ids)s)
+        UNION
+        SELECT c.parent_id, m.child_type_id, m.child_id
+        FROM closure c
+        JOIN ut_user_food_membership m ON m.parent_type_id = %(recipe_type_id)s AND m.parent_id = c.child_id
+        WHERE c.child_type_id = %(recipe_type_id)s
+    )
+    SELECT c.parent_id, c.child_type_id, c.child_id, COALESCE(i.external_id, r.external_id)
+    FROM closure c
+    LEFT JOIN ut_user_ingredient i ON c.child_type_id = %(ingredient_type_id)s AND i.id = c.child_id
+    LEFT JOIN ut_user_recipe r ON c.child_type_id = %(recipe_type_id)s AND r.id = c.child_id
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Member:
+    """A direct or nested member of a parent meal/recipe."""
+
+    parent_id: int
+    child_type_id: int
+    child_id: int
+    external_id: UUID | None
+
+
+def get_member_closure(parent_type_id: int, parent_ids: Collection[int]) -> list[Member]:
+    """Get all members of parents, including members of nested recipes, in a single recursive query.
+    Member.parent_id is the top level parent the member was reached from.
+    Parents are expected to be loaded for the user, members are not filtered by user."""
+    if not parent_ids:
+        return []
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _MEMBER_CLOSURE_SQL,
+            {
+                "parent_type_id": parent_type_id,
+                "parent_ids": list(parent_ids),
+                "recipe_type_id": get_content_type_recipe_id(),
+                "ingredient_type_id": get_content_type_ingredient_id(),
+            },
+        )
+        return [Member(*row) for row in cursor.fetchall()]
+
+
+def get_member_closure_for_lparents(
+    lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal],
+) -> list[Member]:
+    """Get all members of a list of parents - recipes/meals, one recursive query per parent type."""
+    parent_ids: dict[int, list[int]] = defaultdict(list)
+    for lparent in lparents:
+        parent_ids[get_content_type_id(type(lparent))].append(lparent.id)
+
+    members: list[Member] = []
+    for parent_type_id, ids in parent_ids.items():
+        members.extend(get_member_closure(parent_type_id, ids))
+
+    return members
+
+
+class MemberGraph:
+    """Foods, recipes and memberships reachable from a list of parents - recipes/meals, for in-memory lookup."""
+
+    def __init__(
+        self,
+        lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal],
+        lfoods: Sequence[user_ingredient.UserIngredient],
+        lrecipes: Sequence[user_recipe.UserRecipe],
+    ) -> None:
+        self.lfoods: dict[int, user_ingredient.UserIngredient] = {lfood.id: lfood for lfood in lfoods}
+        self.lrecipes: dict[int, user_recipe.UserRecipe] = {lrecipe.id: lrecipe for lrecipe in lrecipes}
+        # Direct members by (parent_type_id, parent_id), member portions by membership id.
+        self.members: dict[tuple[int, int], list[user_food_membership.UserFoodMembership]] = {}
+        self.portions: dict[int, list[user_food_portion.UserFoodPortion]] = {}
+        for lparent in [*lparents, *lrecipes]:
+            lmembers: list[user_food_membership.UserFoodMembership] = list(lparent.members)  # type: ignore
+            self.members[(get_content_type_id(type(lparent)), lparent.id)] = lmembers
+            for lmember in lmembers:
+                self.portions[lmember.id] = lmember.portions  # type: ignore
+
+    def get_members(
+        self, lparent: user_recipe.UserRecipe | user_meal.UserMeal
+    ) -> list[user_food_membership.UserFoodMembership]:
+        """Get direct members of a parent in the graph."""
+        return self.members.get((get_content_type_id(type(lparent)), lparent.id), [])
+
+
+def load_member_graph(
+    user: user_model.User, lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal]
+) -> MemberGraph:
+    """Load all foods and recipes in a list of parents - recipes/meals, including nested recipes.
+    Resolves the member closure in one recursive query, then batch loads foods and recipes once."""
+    members: list[Member] = get_member_closure_for_lparents(lparents)
+    ingredient_type_id: int = get_content_type_ingredient_id()
+    recipe_type_id: int = get_content_type_recipe_id()
+    lfood_ids: set[int] = {m.child_id for m in members if m.child_type_id == ingredient_type_id}
+    lrecipe_ids: set[int] = {m.child_id for m in members if m.child_type_id == recipe_type_id}
+    lfoods: list[user_ingredient.UserIngredient] = (
+        list(user_ingredient.load_lfoods(user, ids=list(lfood_ids))) if lfood_ids else []
+    )
+    lrecipes: list[user_recipe.UserRecipe] = (
+        list(user_recipe.load_lrecipes(user, ids=list(lrecipe_ids))) if lrecipe_ids else []
+    )
+    return MemberGraph(lparents, lfoods, lrecipes)
 
 
 TUserBase = TypeVar("TUserBase", bound=user_base.UserBase)
 
+# User model content type IDs, resolved once per process on first use, see resolve_content_type_ids.
+# Hot loops compare member types against these plain ints.
+CONTENT_TYPE_INGREDIENT_ID: int = 0
+CONTENT_TYPE_RECIPE_ID: int = 0
+CONTENT_TYPE_MEAL_ID: int = 0
+CONTENT_TYPE_MEMBERSHIP_ID: int = 0
+
+
+def resolve_content_type_ids() -> None:
+    """Resolve user model content type IDs into process level ints."""
+    global CONTENT_TYPE_INGREDIENT_ID, CONTENT_TYPE_RECIPE_ID  # pylint: disable=global-statement
+    global CONTENT_TYPE_MEAL_ID, CONTENT_TYPE_MEMBERSHIP_ID  # pylint: disable=global-statement
+    content_types: dict[type, ContentType] = ContentType.objects.get_for_models(
+        user_ingredient.UserIngredient,
+        user_recipe.UserRecipe,
+        user_meal.UserMeal,
+        user_food_membership.UserFoodMembership,
+    )
+    CONTENT_TYPE_INGREDIENT_ID = content_types[user_ingredient.UserIngredient].id
+    CONTENT_TYPE_RECIPE_ID = content_types[user_recipe.UserRecipe].id
+    CONTENT_TYPE_MEAL_ID = content_types[user_meal.UserMeal].id
+    CONTENT_TYPE_MEMBERSHIP_ID = content_types[user_food_membership.UserFoodMembership].id
+
+
+def reset_content_type_ids(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    """Forget resolved content type IDs, they are resolved again on next use.
+    Migrations and flushes (test databases) may recreate content types with new IDs."""
+    global CONTENT_TYPE_INGREDIENT_ID, CONTENT_TYPE_RECIPE_ID  # pylint: disable=global-statement
+    global CONTENT_TYPE_MEAL_ID, CONTENT_TYPE_MEMBERSHIP_ID  # pylint: disable=global-statement
+    CONTENT_TYPE_INGREDIENT_ID = CONTENT_TYPE_RECIPE_ID = CONTENT_TYPE_MEAL_ID = CONTENT_TYPE_MEMBERSHIP_ID = 0
+
 
 def get_content_type(cls: type[TUserBase]) -> ContentType:
     """Get content type."""
@@ -91,6 +230,15 @@ def get_content_type(cls: type[TUserBase]) -> ContentType:
 
 def get_content_type_id(cls: type[TUserBase]) -> int:
     """Get content type ID."""
+    if cls is user_ingredient.UserIngredient:
+        return get_content_type_ingredient_id()
+    if cls is user_recipe.UserRecipe:
+        return get_content_type_recipe_id()
+    if cls is user_meal.UserMeal:
+        return get_content_type_meal_id()
+    if cls is user_food_membership.UserFoodMembership:
+        return get_content_type_membership_id()
+
     return get_content_type(cls).id
 
 
@@ -101,7 +249,9 @@ def get_content_type_ingredient() -> ContentType:
 
 def get_content_type_ingredient_id() -> int:
     """Get user_ingredient content type ID."""
-    return get_content_type_id(user_ingredient.UserIngredient)
+    if not CONTENT_TYPE_INGREDIENT_ID:
+        resolve_content_type_ids()
+    return CONTENT_TYPE_INGREDIENT_ID
 
 
 def get_content_type_recipe() -> ContentType:
@@ -111,7 +261,9 @@ def get_content_type_recipe() -> ContentType:
 
 def get_content_type_recipe_id() -> int:
     """Get user_recipe content type ID."""
-    return get_content_type_id(user_recipe.UserRecipe)
+    if not CONTENT_TYPE_RECIPE_ID:
+        resolve_content_type_ids()
+    return CONTENT_TYPE_RECIPE_ID
 
 
 def get_content_type_meal() -> ContentType:
@@ -121,7 +273,9 @@ def get_content_type_meal() -> ContentType:
 
 def get_content_type_meal_id() -> int:
     """Get user_meal content type ID."""
-    return get_content_type_id(user_meal.UserMeal)
+    if not CONTENT_TYPE_MEAL_ID:
+        resolve_content_type_ids()
+    return CONTENT_TYPE_MEAL_ID
 
 
 def get_content_type_membership() -> ContentType:
@@ -131,4 +285,6 @@ def get_content_type_membership() -> ContentType:
 
 def get_content_type_membership_id() -> int:
     """Get membership content type ID."""
-    return get_content_type_id(user_food_membership.UserFoodMembership)
+    if not CONTENT_TYPE_MEMBERSHIP_ID:
+        resolve_content_type_ids()
+    return CONTENT_TYPE_MEMBERSHIP_ID
@@ -11,16 +11,14 @@ from nutrition_tracker.constants import constants
 
 def get_category(category_id: int) -> usda_config.USDAFoodCategory | usda_config.WWEIAFoodCategory | None:
     """Get category from ID."""
-    category: usda_config.USDAFoodCategory | usda_config.WWEIAFoodCategory | None = next(
-        (category for category in usda_config.usda_food_categories if category.id_ == category_id), None
+    category: usda_config.USDAFoodCategory | usda_config.WWEIAFoodCategory | None = (
+        usda_config.usda_food_categories_by_id.get(category_id)
     )
 
     if not category:
         # Sometimes, category_id can include wweia_food_category.
         # For e.g. Lemon, raw
-        category = next(
-            (category for category in usda_config.wweia_food_categories if category.id_ == category_id), None
-        )
+        category = usda_config.wweia_food_categories_by_id.get(category_id)
 
     return category
 
@@ -1,11 +1,11 @@
 """Food nutrition logic module."""
 from __future__ import annotations
 
-import os
+from collections import defaultdict
 from typing import Sequence
 
-from django.conf import settings
-from django.core.cache import cache
+from django.db.models import FloatField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 import users.models as user_model
@@ -23,20 +23,42 @@ from nutrition_tracker.models import (
     user_preference,
     user_recipe,
 )
+from nutrition_tracker.utils import request_cache
+
+
+class FoodNutrientValue:
+    """Read-only nutrient amount for a food.
+
+    Compact stand-in for DBFoodNutrient/UserFoodNutrient model instances on read paths,
+    holds only the owner id, nutrient_id and amount."""
+
+    __slots__ = ("ingredient_id", "db_food_id", "nutrient_id", "amount")
+
+    def __init__(
+        self,
+        nutrient_id: int | None,
+        amount: float | None,
+        ingredient_id: int | None = None,
+        db_food_id: int | None = None,
+    ) -> None:
+        self.ingredient_id = ingredient_id
+        self.db_food_id = db_food_id
+        self.nutrient_id = nutrient_id
+        self.amount = amount
+
+    def __repr__(self) -> str:
+        return (
+            f"FoodNutrientValue(nutrient_id={self.nutrient_id}, amount={self.amount}, "
+            f"ingredient_id={self.ingredient_id}, db_food_id={self.db_food_id})"
+        )
 
 
 def get_nutrient(nutrient_id: int) -> usda_config.USDANutrient | None:
     """Get USDANutrient for a nutrient_id.
     Match against nutrient_nbr if id_ match fails."""
-    for u_nutrient in usda_config.usda_nutrients:
-        if u_nutrient.id_ == nutrient_id:
-            return u_nutrient
-
-    for u_nutrient in usda_config.usda_nutrients:
-        if u_nutrient.nutrient_nbr == str(nutrient_id):
-            return u_nutrient
-
-    return None
+    return usda_config.usda_nutrients_by_id.get(nutrient_id) or usda_config.usda_nutrients_by_nutrient_nbr.get(
+        str(nutrient_id)
+    )
 
 
 def get_nutrients(nutrient_ids: list[int]) -> list[usda_config.USDANutrient]:
@@ -99,6 +121,7 @@ def get_rdi_amount(nutrient_preferences: list[user_preference.UserPreference], n
     return None
 
 
+@request_cache.memoize
 def get_all_aliases_for_nutrient_id(nutrient_id: int) -> list[int]:
     """Get all alternative nutrient_ids for a given nutrient ID."""
     aliases: list[int] = []
@@ -140,9 +163,88 @@ def get_all_aliases_for_nutrient_ids(nutrient_ids: list[int]) -> list[int]:
     return aliases
 
 
+# Food nutrient lists are loaded once and must be passed along unchanged, key them by identity.
+# Foods are keyed by pk. Recipes and meals are keyed by pk and their loaded members, quantity maps by contents,
+# callers may reload or change them within a request.
+def _get_lparents_key(lparents: list) -> tuple | None:
+    keys: list[tuple] = []
+    for lparent in lparents:
+        model_key: tuple | None = request_cache.get_model_key(lparent)
+        if model_key is None:
+            return None
+
+        members_key: tuple = tuple(
+            (
+                lparent_member.child_type_id,
+                lparent_member.child_id,
+                tuple(lportion.serving_size for lportion in lparent_member.portions),
+            )
+            for lparent_member in getattr(lparent, "members", [])
+        )
+        portions_key: tuple = tuple(lportion.serving_size for lportion in getattr(lparent, "portions", None) or [])
+        keys.append((model_key, members_key, portions_key))
+
+    return tuple(keys)
+
+
+def _get_nutrient_amount_key(food_nutrients: Sequence, nutrient_id: int) -> tuple:
+    return (id(food_nutrients), nutrient_id)
+
+
+def _get_nutrient_amount_in_foods_key(
+    lfoods: list[user_ingredient.UserIngredient], lfoods_nutrients: Sequence, nutrient_id: int
+) -> tuple | None:
+    lfoods_key: tuple | None = request_cache.get_models_key(lfoods)
+    if lfoods_key is None:
+        return None
+
+    return (lfoods_key, tuple(lfood.db_food_id for lfood in lfoods), id(lfoods_nutrients), nutrient_id)
+
+
+def _get_nutrient_amount_in_lparents_key(
+    lparents: list, lfoods_nutrients: Sequence, nutrient_id: int, member_recipes: list | None = None
+) -> tuple | None:
+    lparents_key: tuple | None = _get_lparents_key(lparents)
+    member_recipes_key: tuple | None = _get_lparents_key(member_recipes or [])
+    if lparents_key is None or member_recipes_key is None:
+        return None
+
+    return (lparents_key, id(lfoods_nutrients), nutrient_id, member_recipes_key)
+
+
+def _get_nutrient_amount_in_mealplan_key(  # pylint: disable=too-many-arguments
+    lfoods: list,
+    lrecipes: list,
+    quantity_map: dict,
+    lfoods_nutrients: Sequence,
+    nutrient_id: int,
+    member_recipes: list | None = None,
+) -> tuple | None:
+    lfoods_key: tuple | None = request_cache.get_models_key(lfoods)
+    lrecipes_key: tuple | None = _get_lparents_key(lrecipes)
+    member_recipes_key: tuple | None = _get_lparents_key(member_recipes or [])
+    if lfoods_key is None or lrecipes_key is None or member_recipes_key is None:
+        return None
+
+    return (
+        lfoods_key,
+        lrecipes_key,
+        tuple(quantity_map.items()),
+        id(lfoods_nutrients),
+        nutrient_id,
+        member_recipes_key,
+    )
+
+
+@request_cache.memoize(key=_get_nutrient_amount_key)
 def get_nutrient_amount(
     food_nutrients: Sequence[
-        (usda_food_nutrient.USDAFoodNutrient | db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient)
+        (
+            usda_food_nutrient.USDAFoodNutrient
+            | db_food_nutrient.DBFoodNutrient
+            | user_food_nutrient.UserFoodNutrient
+            | FoodNutrientValue
+        )
     ],
     nutrient_id: int,
 ) -> float | None:
@@ -156,55 +258,79 @@ def get_nutrient_amount(
     )
 
 
+def load_lfoods_nutrient_values(
+    luser: user_model.User, lfoods: list[user_ingredient.UserIngredient], nutrient_ids: list[int] | None = None
+) -> dict[int, list[FoodNutrientValue]]:
+    """Load user food nutrient values for a list of foods, keyed by ingredient_id."""
+    values: dict[int, list[FoodNutrientValue]] = defaultdict(list)
+    if not lfoods:
+        return values
+
+    qs = user_food_nutrient.load_nutrients(luser, ingredients=lfoods, nutrient_ids=nutrient_ids)
+    for ingredient_id, nutrient_id, amount in qs.values_list("ingredient_id", "nutrient_id", "amount"):
+        values[ingredient_id].append(FoodNutrientValue(nutrient_id, amount, ingredient_id=ingredient_id))
+
+    return values
+
+
+def load_cfoods_nutrient_values(
+    db_food_ids: list[int], nutrient_ids: list[int] | None = None
+) -> dict[int, list[FoodNutrientValue]]:
+    """Load db food nutrient values for a list of db food ids, keyed by db_food_id."""
+    values: dict[int, list[FoodNutrientValue]] = defaultdict(list)
+    if not db_food_ids:
+        return values
+
+    qs = db_food_nutrient.load_nutrients(db_food_ids=db_food_ids, nutrient_ids=nutrient_ids)
+    for db_food_id, nutrient_id, amount in qs.values_list("db_food_id", "nutrient_id", "amount"):
+        values[db_food_id].append(FoodNutrientValue(nutrient_id, amount, db_food_id=db_food_id))
+
+    return values
+
+
 def get_food_nutrients(
     lfood: user_ingredient.UserIngredient | None, cfood: db_food.DBFood | None
-) -> Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient]:
+) -> list[FoodNutrientValue]:
     """Get food nutrients."""
     if lfood and lfood.user:
         return get_foods_nutrients(lfood.user, [lfood])
     if cfood:
-        return list(cfood.dbfoodnutrient_set.all())
+        return load_cfoods_nutrient_values([cfood.id]).get(cfood.id, [])
 
     return []
 
 
 def get_foods_nutrients(
     luser: user_model.User, lfoods: list[user_ingredient.UserIngredient], nutrient_id: int | None = None
-) -> Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient]:
-    """Get food nutrients for a list of foods."""
+) -> list[FoodNutrientValue]:
+    """Get food nutrients for a list of foods.
+    User food nutrients override db food nutrients for the same nutrient_id."""
     aliases: list[int] = []
     if nutrient_id:
         aliases = get_all_aliases_for_nutrient_id(nutrient_id)
         if not aliases:
             return []
 
-    if lfoods:
-        lfoods_nutrients: list[user_food_nutrient.UserFoodNutrient] = list(
-            user_food_nutrient.load_nutrients(luser, ingredients=lfoods, nutrient_ids=aliases)
-        )
-    else:
-        lfoods_nutrients = []
-
-    db_food_ids = [lfood.db_food_id for lfood in lfoods if lfood.db_food_id]
-    if db_food_ids:
-        cfoods_nutrients: list[db_food_nutrient.DBFoodNutrient] = list(
-            db_food_nutrient.load_nutrients(
-                db_food_ids=[lfood.db_food_id for lfood in lfoods if lfood.db_food_id], nutrient_ids=aliases
-            )
-        )
-    else:
-        cfoods_nutrients = []
+    lfoods_nutrients: dict[int, list[FoodNutrientValue]] = load_lfoods_nutrient_values(
+        luser, lfoods, nutrient_ids=aliases
+    )
+    cfoods_nutrients: dict[int, list[FoodNutrientValue]] = load_cfoods_nutrient_values(
+        [lfood.db_food_id for lfood in lfoods if lfood.db_food_id], nutrient_ids=aliases
+    )
 
-    nutrients: list[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient] = []
+    nutrients: list[FoodNutrientValue] = []
     for lfood in lfoods:
         nutrient_id_set: set[int] = set()
-        for lfood_nutrient in lfoods_nutrients:
-            if lfood_nutrient.ingredient_id == lfood.id and lfood_nutrient.nutrient_id is not None:
+        for lfood_nutrient in lfoods_nutrients.get(lfood.id, []):
+            if lfood_nutrient.nutrient_id is not None:
                 nutrient_id_set.add(lfood_nutrient.nutrient_id)
                 nutrients.append(lfood_nutrient)
 
-        for cfood_nutrient in cfoods_nutrients:
-            if cfood_nutrient.db_food_id == lfood.db_food_id and cfood_nutrient.nutrient_id not in nutrient_id_set:
+        if not lfood.db_food_id:
+            continue
+
+        for cfood_nutrient in cfoods_nutrients.get(lfood.db_food_id, []):
+            if cfood_nutrient.nutrient_id not in nutrient_id_set:
                 nutrients.append(cfood_nutrient)
 
     return nutrients
@@ -212,17 +338,23 @@ def get_foods_nutrients(
 
 def _is_nutrient_for_food(
     lfood: user_ingredient.UserIngredient,
-    food_nutrient: db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient,
+    food_nutrient: db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient | FoodNutrientValue,
 ) -> bool:
     """Returns true if the food_nutrient belongs to lfood."""
-    return (hasattr(food_nutrient, "ingredient_id") and lfood.id == food_nutrient.ingredient_id) or (  # type: ignore
-        hasattr(food_nutrient, "db_food_id") and lfood.db_food_id == food_nutrient.db_food_id  # type: ignore
-    )
+    ingredient_id: int | None = getattr(food_nutrient, "ingredient_id", None)
+    if ingredient_id is not None and lfood.id == ingredient_id:
+        return True
+
+    db_food_id: int | None = getattr(food_nutrient, "db_food_id", None)
+    return db_food_id is not None and lfood.db_food_id == db_food_id
 
 
+@request_cache.memoize(key=_get_nutrient_amount_in_foods_key)
 def get_nutrient_amount_in_foods(
     lfoods: list[user_ingredient.UserIngredient],
-    lfoods_nutrients: Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient],
+    lfoods_nutrients: Sequence[
+        db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient | FoodNutrientValue
+    ],
     nutrient_id: int,
 ) -> float | None:
     """Get nutrient amount for a given nutrient ID in a list of foods."""
@@ -248,9 +380,57 @@ def get_nutrient_amount_in_foods(
     return sum(filter(None, nutrients))
 
 
+def get_nutrient_amounts_in_foods(
+    lfoods: list[user_ingredient.UserIngredient],
+    lfoods_nutrients: Sequence[
+        db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient | FoodNutrientValue
+    ],
+    nutrient_ids: list[int],
+) -> list[list[float | None]]:
+    """Get nutrient amounts matrix, one row per nutrient ID and one column per food.
+    Each cell matches get_nutrient_amount_in_foods([lfood], lfoods_nutrients, nutrient_id),
+    computed in a single pass over lfoods_nutrients."""
+    food_indexes_by_ingredient_id: dict[int, list[int]] = defaultdict(list)
+    food_indexes_by_db_food_id: dict[int, list[int]] = defaultdict(list)
+    for index, lfood in enumerate(lfoods):
+        food_indexes_by_ingredient_id[lfood.id].append(index)
+        if lfood.db_food_id is not None:
+            food_indexes_by_db_food_id[lfood.db_food_id].append(index)
+
+    # First amount per (food, nutrient_id), in lfoods_nutrients order.
+    amounts: list[dict[int, float | None]] = [{} for _unused in lfoods]
+    for lfood_nutrient in lfoods_nutrients:
+        food_indexes: set[int] = set()
+        ingredient_id: int | None = getattr(lfood_nutrient, "ingredient_id", None)
+        if ingredient_id is not None:
+            food_indexes.update(food_indexes_by_ingredient_id.get(ingredient_id, []))
+        db_food_id: int | None = getattr(lfood_nutrient, "db_food_id", None)
+        if db_food_id is not None:
+            food_indexes.update(food_indexes_by_db_food_id.get(db_food_id, []))
+
+        for index in food_indexes:
+            amounts[index].setdefault(lfood_nutrient.nutrient_id, lfood_nutrient.amount)  # type: ignore
+
+    matrix: list[list[float | None]] = []
+    for nutrient_id in nutrient_ids:
+        aliases: list[int] = get_all_aliases_for_nutrient_id(nutrient_id)
+        row: list[float | None] = []
+        for food_amounts in amounts:
+            # Same alias precedence as get_nutrient_amount_in_foods, the earliest matching nutrient wins.
+            alias: int | None = next((id_ for id_ in food_amounts if id_ in aliases), None)
+            row.append(food_amounts[alias] if alias is not None else None)
+
+        matrix.append(row)
+
+    return matrix
+
+
+@request_cache.memoize(key=_get_nutrient_amount_in_lparents_key)
 def get_nutrient_amount_in_lparents(
     lparents: list[user_recipe.UserRecipe] | list[user_meal.UserMeal] | list,
-    lfoods_nutrients: Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient],
+    lfoods_nutrients: Sequence[
+        db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient | FoodNutrientValue
+    ],
     nutrient_id: int,
     member_recipes: list[user_recipe.UserRecipe] | None = None,
 ) -> float | None:
@@ -258,14 +438,16 @@ def get_nutrient_amount_in_lparents(
     if not member_recipes:
         member_recipes = []
 
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    recipe_type_id: int = data_loaders.get_content_type_recipe_id()
     nutrients: list[float | None] = []
     for lparent in lparents:
         for lparent_member in lparent.members:  # type: ignore
-            if lparent_member.child_type_id == data_loaders.get_content_type_ingredient_id():
+            if lparent_member.child_type_id == ingredient_type_id:
                 nutrient: float | None = get_nutrient_amount_in_foods(
                     [lparent_member.child], lfoods_nutrients, nutrient_id
                 )
-            elif lparent_member.child_type_id == data_loaders.get_content_type_recipe_id():
+            elif lparent_member.child_type_id == recipe_type_id:
                 lrecipe: user_recipe.UserRecipe | None = next(
                     (lrecipe for lrecipe in member_recipes if lrecipe.id == lparent_member.child_id), None
                 )
@@ -287,11 +469,102 @@ def get_nutrient_amount_in_lparents(
     return sum(nutrients)
 
 
+def get_nutrient_amounts_in_lparents(
+    lparents: list[user_recipe.UserRecipe] | list[user_meal.UserMeal] | list,
+    lfoods_nutrients: Sequence[
+        db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient | FoodNutrientValue
+    ],
+    nutrient_ids: list[int],
+    member_recipes: list[user_recipe.UserRecipe] | None = None,
+) -> list[list[float | None]]:
+    """Get nutrient amounts matrix, one row per nutrient ID and one column per recipe/meal.
+    Each cell matches get_nutrient_amount_in_lparents([lparent], lfoods_nutrients, nutrient_id, member_recipes),
+    member food amounts are computed in a single pass over lfoods_nutrients, and member recipes once each."""
+    member_recipes_by_id: dict[int, user_recipe.UserRecipe] = {}
+    for lrecipe in member_recipes or []:
+        member_recipes_by_id.setdefault(lrecipe.id, lrecipe)
+
+    # Member foods of lparents, and of their member recipes.
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    recipe_type_id: int = data_loaders.get_content_type_recipe_id()
+    lfoods: list[user_ingredient.UserIngredient] = []
+    lrecipe_ids: set[int] = set()
+    pending: list = list(lparents)
+    while pending:
+        for lparent_member in pending.pop().members:
+            if lparent_member.child_type_id == ingredient_type_id:
+                lfoods.append(lparent_member.child)
+            elif (
+                lparent_member.child_type_id == recipe_type_id
+                and lparent_member.child_id in member_recipes_by_id
+                and lparent_member.child_id not in lrecipe_ids
+            ):
+                lrecipe_ids.add(lparent_member.child_id)
+                pending.append(member_recipes_by_id[lparent_member.child_id])
+
+    foods_matrix: list[list[float | None]] = get_nutrient_amounts_in_foods(lfoods, lfoods_nutrients, nutrient_ids)
+    food_amounts: dict[int, list[float | None]] = {
+        lfood.id: [row[index] for row in foods_matrix] for index, lfood in enumerate(lfoods)
+    }
+
+    recipe_amounts: dict[int, list[float | None]] = {}
+    columns: list[list[float | None]] = [
+        _get_nutrient_amounts_in_lparent(
+            lparent, food_amounts, recipe_amounts, member_recipes_by_id, len(nutrient_ids)
+        )
+        for lparent in lparents
+    ]
+    return [[column[index] for column in columns] for index in range(len(nutrient_ids))]
+
+
+def _get_nutrient_amounts_in_lparent(
+    lparent: user_recipe.UserRecipe | user_meal.UserMeal,
+    food_amounts: dict[int, list[float | None]],
+    recipe_amounts: dict[int, list[float | None]],
+    member_recipes_by_id: dict[int, user_recipe.UserRecipe],
+    num_nutrients: int,
+) -> list[float | None]:
+    """Get nutrient amounts in lparent, one per nutrient. Member recipe amounts are memoized in recipe_amounts."""
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    recipe_type_id: int = data_loaders.get_content_type_recipe_id()
+    if hasattr(lparent, "portions") and lparent.portions:  # type: ignore
+        serving_size: float = lparent.portions[0].serving_size  # type: ignore
+    else:
+        serving_size = constants.PORTION_SIZE
+
+    amounts: list[float | None] = [None] * num_nutrients
+    for lparent_member in lparent.members:  # type: ignore
+        if lparent_member.child_type_id == ingredient_type_id:
+            member_amounts: list[float | None] = food_amounts[lparent_member.child.id]
+        elif lparent_member.child_type_id == recipe_type_id and lparent_member.child_id in member_recipes_by_id:
+            if lparent_member.child_id not in recipe_amounts:
+                recipe_amounts[lparent_member.child_id] = _get_nutrient_amounts_in_lparent(
+                    member_recipes_by_id[lparent_member.child_id],
+                    food_amounts,
+                    recipe_amounts,
+                    member_recipes_by_id,
+                    num_nutrients,
+                )
+            member_amounts = recipe_amounts[lparent_member.child_id]
+        else:
+            continue
+
+        for index, member_amount in enumerate(member_amounts):
+            if member_amount:
+                amount: float = lparent_member.portions[0].serving_size * member_amount / serving_size
+                amounts[index] = (amounts[index] or 0) + amount
+
+    return amounts
+
+
+@request_cache.memoize(key=_get_nutrient_amount_in_mealplan_key)
 def get_nutrient_amount_in_mealplan(  # pylint: disable=too-many-arguments
     lfoods: list[user_ingredient.UserIngredient],
     lrecipes: list[user_recipe.UserRecipe],
     quantity_map: dict,
-    lfoods_nutrients: Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient],
+    lfoods_nutrients: Sequence[
+        db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient | FoodNutrientValue
+    ],
     nutrient_id: int,
     member_recipes: list[user_recipe.UserRecipe] | None = None,
 ) -> float | None:
@@ -326,53 +599,54 @@ def get_nutrient_amount_in_mealplan(  # pylint: disable=too-many-arguments
     return sum(nutrients)
 
 
+def load_top_lfoods_for_nutrient(
+    luser: user_model.User, nutrient_id: int, ids: list[int] | None = None, max_items: int | None = None
+) -> list[user_ingredient.UserIngredient]:
+    """Load foods containing the given nutrient_id, ordered by nutrient amount in descending order.
+    Ranking happens in the database, user food nutrients take precedence over db food nutrients."""
+    aliases: list[int] = get_all_aliases_for_nutrient_id(nutrient_id)
+    if not aliases or (ids is not None and not ids):
+        return []
+
+    lfood_amount = (
+        user_food_nutrient.UserFoodNutrient.objects.filter(ingredient_id=OuterRef("pk"), nutrient_id__in=aliases)
+        .order_by("-amount")
+        .values("amount")[:1]
+    )
+    cfood_amount = (
+        db_food_nutrient.DBFoodNutrient.objects.filter(db_food_id=OuterRef("db_food_id"), nutrient_id__in=aliases)
+        .order_by("-amount")
+        .values("amount")[:1]
+    )
+    qs = (
+        user_ingredient.load_lfoods(luser, ids=ids, load_profile=constants.LoadProfile.DISPLAY)
+        .annotate(
+            nutrient_amount=Coalesce(
+                Subquery(lfood_amount, output_field=FloatField()), Subquery(cfood_amount, output_field=FloatField())
+            )
+        )
+        .filter(nutrient_amount__gt=0)
+        .order_by("-nutrient_amount", "id")
+    )
+    if max_items:
+        qs = qs[:max_items]
+
+    return list(qs)
+
+
 def get_recent_foods_for_nutrient(
     luser: user_model.User, nutrient_id: int, max_items: int = 10, max_meals: int = 10
 ) -> list[user_ingredient.UserIngredient]:
     """Get recent foods containing the given nutrient_id. The resulting list is ordered by nutrient amount in descending order."""
-    recent_lfoods: list[user_ingredient.UserIngredient] = []
     lnutrient = get_nutrient(nutrient_id)
     if not lnutrient:
-        return recent_lfoods
-
-    lmeals = list(user_meal.load_lmeals(luser, order_by="-meal_date", max_rows=max_meals))
-    lfoods = list(data_loaders.load_lfoods_for_lparents(luser, lmeals))
-    lfoods_nutrients = get_foods_nutrients(luser, lfoods, nutrient_id=nutrient_id)
-    lfoods_nutrients = sorted(lfoods_nutrients, key=lambda x: x.amount, reverse=True)  # type: ignore
-
-    for lfn in lfoods_nutrients:
-        if not lfn.amount:
-            continue
-
-        if hasattr(lfn, "ingredient"):
-            lfood = next((lfood for lfood in lfoods if lfood == lfn.ingredient), None)  # type: ignore
-        else:
-            lfood = next((lfood for lfood in lfoods if lfood.db_food == lfn.db_food), None)  # type: ignore
-
-        if lfood and lfood not in recent_lfoods:
-            recent_lfoods.append(lfood)
-            if len(recent_lfoods) == max_items:
-                return recent_lfoods
-
-    return recent_lfoods
-
+        return []
 
-def get_top_cfoods_for_nutrient(nutrient_id: int) -> list[db_food.DBFood]:
-    """Get top foods containing the given nutrient_id."""
-    top_foods_prefix = (
-        f"{os.getcwd()}/nutrition_tracker/generated/top_foods/{'dev' if settings.DJANGO_ENV == 'dev' else 'prod'}/"
+    lmeals = list(
+        user_meal.load_lmeals(luser, order_by="-meal_date", max_rows=max_meals, load_profile=constants.LoadProfile.IDS)
     )
-    cache_key: str = f"top_foods:{nutrient_id}"
-    external_ids: list = cache.get(cache_key, [])
-    if not external_ids:
-        filepath = f"{top_foods_prefix}{nutrient_id}.txt"
-        if os.path.exists(filepath):
-            with open(filepath, encoding="utf8") as file_:
-                external_ids = file_.read().splitlines()
-                if external_ids:
-                    cache.set(cache_key, external_ids)
-
-    return list(db_food.load_cfoods(external_ids=external_ids))
+    lfood_ids: set[int] = data_loaders.get_lfood_ids_for_lparents(luser, lmeals)
+    return load_top_lfoods_for_nutrient(luser, nutrient_id, ids=list(lfood_ids), max_items=max_items)
 
 
 def get_tracker_nutrients(luser: user_model.User, nutrient_id: int, total_days: int = 5) -> dict:
@@ -16,6 +16,7 @@ from nutrition_tracker.models import (
     user_meal,
     user_recipe,
 )
+from nutrition_tracker.utils import request_cache
 
 
 def get_default_portion_choices(
@@ -43,12 +44,15 @@ def get_default_portion_choices(
 
 def get_measure_unit_by_id(id_: int | None) -> usda_config.USDAMeasureUnit | None:
     """Get measure unit by ID."""
-    return next((m for m in usda_config.usda_measure_units if m.id_ == id_), None)
+    if id_ is None:
+        return None
+
+    return usda_config.usda_measure_units_by_id.get(id_)
 
 
 def get_measure_unit_by_name(name: str) -> usda_config.USDAMeasureUnit | None:
     """Get measure unit by unit name."""
-    return next((m for m in usda_config.usda_measure_units if m.name == name), None)
+    return usda_config.usda_measure_units_by_name.get(name)
 
 
 def get_measure_units_sorted_by_name() -> list[usda_config.USDAMeasureUnit]:
@@ -56,6 +60,23 @@ def get_measure_units_sorted_by_name() -> list[usda_config.USDAMeasureUnit]:
     return sorted(usda_config.usda_measure_units, key=lambda x: x.name)
 
 
+def _get_display_portion_key(
+    food_portion: db_food_portion.DBFoodPortion | user_food_portion.UserFoodPortion,
+) -> tuple | None:
+    """Display portions of saved portions by pk, and the fields copies override."""
+    model_key: tuple | None = request_cache.get_model_key(food_portion)
+    if not model_key:
+        return None
+
+    return (
+        model_key,
+        getattr(food_portion, "updated_timestamp", None),
+        getattr(food_portion, "serving_size", None),
+        getattr(food_portion, "quantity", None),
+    )
+
+
+@request_cache.memoize(key=_get_display_portion_key)
 def for_display_portion(food_portion: db_food_portion.DBFoodPortion | user_food_portion.UserFoodPortion) -> str:
     """Formatted food portion for display."""
     measure_unit_id_disallowed: list = [constants.UNDETERMINED_MEASURE_UNIT_ID]
@@ -111,11 +132,34 @@ def for_display_portion(food_portion: db_food_portion.DBFoodPortion | user_food_
     return portion
 
 
+def _get_display_choices_key(
+    lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe | None,
+    cfood: db_food.DBFood | None = None,
+) -> tuple | None:
+    """Display choices of saved objects by pk, and the pks/timestamps of their loaded portions."""
+    if (lobject and lobject.pk is None) or (cfood and cfood.pk is None):
+        return None
+
+    lportions: tuple = tuple(
+        (lfood_portion.pk, lfood_portion.updated_timestamp) for lfood_portion in getattr(lobject, "portions", [])
+    )
+    return (request_cache.get_model_key(lobject), lportions, request_cache.get_model_key(cfood))
+
+
 def for_display_choices(
     lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe | None,
     cfood: db_food.DBFood | None = None,
 ) -> list[tuple[UUID, str, float | None, str | None, float | None, float | None]]:
     """ "Formatted portion choices for display."""
+    # Copy, callers may modify their list of choices.
+    return list(_for_display_choices(lobject, cfood=cfood))
+
+
+@request_cache.memoize(key=_get_display_choices_key)
+def _for_display_choices(
+    lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe | None,
+    cfood: db_food.DBFood | None = None,
+) -> tuple[tuple[UUID, str, float | None, str | None, float | None, float | None], ...]:
     portion_choices: list = []
 
     if lobject and hasattr(lobject, "portions"):
@@ -160,7 +204,7 @@ def for_display_choices(
         display_portion = f"{default_choice[2]}{default_choice[3]}"
         portion_choices.append((default_choice[0], display_portion, default_choice[1], serving_size_unit, None, None))
 
-    return portion_choices
+    return tuple(portion_choices)
 
 
 def get_food_member_portion(
@@ -206,21 +250,20 @@ def get_category_serving_size_in_meals(
     lmeals: list[user_meal.UserMeal], category_lfoods: list[user_ingredient.UserIngredient]
 ) -> float | None:
     """Get total serving size for foods in a category in a list of meals."""
-    return sum(
-        get_serving_size_in_meals(lmeals, lfood, data_loaders.get_content_type_ingredient_id())
-        for lfood in category_lfoods
-    )
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    return sum(get_serving_size_in_meals(lmeals, lfood, ingredient_type_id) for lfood in category_lfoods)
 
 
 def get_category_food_count_in_meals(
     lmeals: list[user_meal.UserMeal], category_lfoods: list[user_ingredient.UserIngredient]
 ) -> int:
     """Get total food count in a category in a list of meals."""
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
     meal_food_ids: set[int] = {
         lmember.child_id
         for lmeal in lmeals
         for lmember in lmeal.members  # type: ignore
-        if lmember.child_type_id == data_loaders.get_content_type_ingredient_id()
+        if lmember.child_type_id == ingredient_type_id
     }
     category_food_ids: set[int] = {lfood.id for lfood in category_lfoods}
     return len(meal_food_ids.intersection(category_food_ids))
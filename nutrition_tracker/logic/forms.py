@@ -18,6 +18,17 @@ from nutrition_tracker.models import (
     user_recipe,
 )
 
+# User food portion fields set by process_portion_choices_form_data.
+PORTION_CHOICES_FIELDS: list[str] = [
+    "serving_size",
+    "serving_size_unit",
+    "quantity",
+    "amount",
+    "measure_unit_id",
+    "modifier",
+    "portion_description",
+]
+
 
 def get_portion_choices_form_data(
     lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe, cfood: db_food.DBFood | None = None
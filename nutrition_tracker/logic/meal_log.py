@@ -0,0 +1,225 @@
+"""Meal logging logic module.
+
+Logs foods/recipes into a meal in one transaction. Writes are batched per model,
+so logging N items costs a fixed number of statements instead of a few per item."""
+from __future__ import annotations
+
+from datetime import date
+from typing import Sequence
+from uuid import UUID
+
+from django.db import transaction
+
+import users.models as user_model
+from nutrition_tracker.constants import constants
+from nutrition_tracker.database import models as db_models
+from nutrition_tracker.logic import data_loaders
+from nutrition_tracker.logic import forms as forms_logic
+from nutrition_tracker.models import (
+    db_food,
+    user_food_membership,
+    user_food_portion,
+    user_ingredient,
+    user_meal,
+    user_preference,
+    user_recipe,
+)
+
+
+class LogItem:  # pylint: disable=too-few-public-methods
+    """A food/recipe to log into a meal.
+    Items with a cfood and no lobject create the user food on log.
+    Items with an lmembership update that member, moving it to the meal if needed."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        lobject: user_ingredient.UserIngredient | user_recipe.UserRecipe | None,
+        quantity: float | None,
+        serving: str,
+        cfood: db_food.DBFood | None = None,
+        is_available: bool | None = None,
+        lmembership: user_food_membership.UserFoodMembership | None = None,
+    ) -> None:
+        self.lobject = lobject
+        self.quantity = quantity
+        self.serving = serving
+        self.cfood = cfood
+        self.is_available = is_available
+        self.lmembership = lmembership
+
+
+def load_log_items_objects(
+    user: user_model.User, external_ids: Sequence[UUID]
+) -> dict[UUID, tuple[user_ingredient.UserIngredient | user_recipe.UserRecipe | None, db_food.DBFood | None]]:
+    """Resolve external IDs of user foods, user recipes or db foods to (lobject, cfood), in a fixed number of queries.
+    Unknown external IDs are left out."""
+    objects: dict[
+        UUID, tuple[user_ingredient.UserIngredient | user_recipe.UserRecipe | None, db_food.DBFood | None]
+    ] = {}
+    if not external_ids:
+        return objects
+
+    for lfood in user_ingredient.load_lfoods(user, external_ids=external_ids):
+        objects[lfood.external_id] = (lfood, lfood.db_food)
+
+    remaining_ids: list[UUID] = [external_id for external_id in external_ids if external_id not in objects]
+    if remaining_ids:
+        for lrecipe in user_recipe.load_lrecipes(
+            user, external_ids=remaining_ids, load_profile=constants.LoadProfile.DISPLAY
+        ):
+            objects[lrecipe.external_id] = (lrecipe, None)
+
+    remaining_ids = [external_id for external_id in remaining_ids if external_id not in objects]
+    if remaining_ids:
+        cfoods: list[db_food.DBFood] = list(db_food.load_cfoods(external_ids=remaining_ids))
+        lfoods: dict[int, user_ingredient.UserIngredient] = {}
+        if cfoods:
+            lfoods = {
+                lfood.db_food_id: lfood
+                for lfood in user_ingredient.load_lfoods(user, db_food_ids=[cfood.id for cfood in cfoods])
+            }
+        for cfood in cfoods:
+            objects[cfood.external_id] = (lfoods.get(cfood.id), cfood)
+
+    return objects
+
+
+def _update_preferences(user: user_model.User, items: Sequence[LogItem]) -> None:
+    """Update the is_available preference flag of logged items, one select and at most one write each way."""
+    is_available_map: dict[UUID, bool] = {
+        item.lobject.external_id: item.is_available for item in items if item.lobject and item.is_available is not None
+    }
+    if not is_available_map:
+        return
+
+    updated: list[user_preference.UserPreference] = []
+    for luser_preference in user_preference.load_luser_preferences(
+        user, food_external_ids=list(is_available_map.keys())
+    ).prefetch_related(None):
+        is_available: bool = is_available_map.pop(luser_preference.food_external_id)
+        if luser_preference.is_available() != is_available:
+            luser_preference.update_flag(user_preference.FLAG_IS_AVAILABLE, is_available)
+            updated.append(luser_preference)
+
+    if updated:
+        user_preference.bulk_update(updated, ["flags"])
+
+    if is_available_map:
+        user_preference.bulk_create(
+            [
+                user_preference.UserPreference(
+                    user=user,
+                    food_external_id=external_id,
+                    flags=user_preference.get_flags({user_preference.FLAG_IS_AVAILABLE: is_available}),
+                )
+                for external_id, is_available in is_available_map.items()
+            ]
+        )
+
+
+def _create_lfoods(user: user_model.User, items: Sequence[LogItem]) -> None:
+    """Create user foods for items logged from db foods, in one insert."""
+    cfoods: dict[int, db_food.DBFood] = {
+        item.cfood.id: item.cfood for item in items if not item.lobject and item.cfood
+    }
+    if not cfoods:
+        return
+
+    lfoods: dict[int, user_ingredient.UserIngredient] = {
+        lfood.db_food_id: lfood
+        for lfood in db_models.bulk_create(
+            user_ingredient.UserIngredient,
+            [user_ingredient.UserIngredient(user=user, db_food=cfood) for cfood in cfoods.values()],
+        )
+    }
+    for item in items:
+        if not item.lobject and item.cfood:
+            item.lobject = lfoods[item.cfood.id]
+
+
+def log_items(  # pylint: disable=too-many-locals,too-many-branches
+    user: user_model.User, meal_date: date, meal_type: constants.MealType, items: Sequence[LogItem]
+) -> user_meal.UserMeal:
+    """Log items into the user's meal for meal_date and meal_type, creating the meal if needed.
+    Items moved from other meals delete those meals once they have no members left.
+    Sets lobject/lmembership on items to the logged food/member."""
+    with transaction.atomic():
+        # Writes the meal even if it exists, bumping updated_timestamp makes it the latest meal for the log form.
+        lmeal, _unused = user_meal.get_or_create(user, meal_date=meal_date, meal_type=meal_type)
+        _update_preferences(user, items)
+        _create_lfoods(user, items)
+
+        meal_type_id: int = data_loaders.get_content_type_meal_id()
+        new_items: list[LogItem] = []
+        moved_lmemberships: list[user_food_membership.UserFoodMembership] = []
+        old_meal_ids: set[int] = set()
+        new_portions: list[user_food_portion.UserFoodPortion] = []
+        updated_portions: list[user_food_portion.UserFoodPortion] = []
+        for item in items:
+            if not item.lobject:
+                continue
+
+            lmembership: user_food_membership.UserFoodMembership | None = item.lmembership
+            if not lmembership:
+                new_items.append(item)
+                continue
+
+            if lmembership.parent_type_id != meal_type_id or lmembership.parent_id != lmeal.id:
+                if lmembership.parent_type_id == meal_type_id:
+                    old_meal_ids.add(lmembership.parent_id)
+                lmembership.parent = lmeal
+                moved_lmemberships.append(lmembership)
+
+            lportions: list[user_food_portion.UserFoodPortion] = getattr(lmembership, "portions", [])
+            lfood_portion: user_food_portion.UserFoodPortion = forms_logic.process_portion_choices_form_data(
+                item.quantity,
+                item.serving,
+                item.lobject,
+                cfood=item.cfood,
+                lfood_portion=lportions[0] if lportions else None,
+            )
+            if lportions:
+                updated_portions.append(lfood_portion)
+            else:
+                lfood_portion.user = user
+                lfood_portion.content_object = lmembership
+                new_portions.append(lfood_portion)
+
+        if moved_lmemberships:
+            user_food_membership.bulk_update(moved_lmemberships, ["parent_type", "parent_id"])
+
+        if updated_portions:
+            user_food_portion.bulk_update(updated_portions, forms_logic.PORTION_CHOICES_FIELDS)
+
+        if new_items:
+            new_lmemberships: list[user_food_membership.UserFoodMembership] = user_food_membership.bulk_create(
+                [
+                    user_food_membership.UserFoodMembership(user=user, parent=lmeal, child=item.lobject)
+                    for item in new_items
+                ],
+            )
+            for item, new_lmembership in zip(new_items, new_lmemberships):
+                item.lmembership = new_lmembership
+                lfood_portion = forms_logic.process_portion_choices_form_data(
+                    item.quantity, item.serving, item.lobject, cfood=item.cfood  # type: ignore
+                )
+                lfood_portion.user = user
+                lfood_portion.content_object = new_lmembership
+                new_portions.append(lfood_portion)
+
+        if new_portions:
+            user_food_portion.bulk_create(new_portions)
+
+        user_meal.delete_empty_lmeals(user, list(old_meal_ids - {lmeal.id}))
+
+    return lmeal
+
+
+def delete_lmembership(user: user_model.User, lmembership: user_food_membership.UserFoodMembership) -> None:
+    """Delete a member, and its meal if this was the meal's only member."""
+    with transaction.atomic():
+        parent_type_id: int = lmembership.parent_type_id
+        parent_id: int = lmembership.parent_id
+        lmembership.delete()
+        if parent_type_id == data_loaders.get_content_type_meal_id():
+            user_meal.delete_empty_lmeals(user, [parent_id])
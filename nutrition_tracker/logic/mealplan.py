@@ -2,31 +2,67 @@
 from __future__ import annotations
 
 import dataclasses
+import datetime
+import hashlib
 import random
-from typing import Any, Sequence
+import time
+import uuid
+from typing import Any, Callable
 from uuid import UUID
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, Count, Max, QuerySet, Value
 from django.utils import timezone
 from ortools.sat.python import cp_model
 
 import users.models as user_model
+from nutrition_tracker.biz import user as user_biz
 from nutrition_tracker.config import usda_config
+from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import data_loaders, food_nutrient, user_prefs
 from nutrition_tracker.logic.planner import category as category_planner
 from nutrition_tracker.logic.planner import common as common_planner
 from nutrition_tracker.logic.planner import food as food_planner
 from nutrition_tracker.logic.planner import nutrition as nutrition_planner
+from nutrition_tracker.logic.planner import variables as planner_variables
 from nutrition_tracker.models import (
     db_food_nutrient,
+    mealplan_solve_stat,
+    user_branded_food,
+    user_food_membership,
     user_food_nutrient,
+    user_food_portion,
     user_ingredient,
     user_meal,
     user_preference,
+    user_preference_threshold,
     user_recipe,
 )
-from nutrition_tracker.utils import planner as planner_utils
 
 MAX_TIME_IN_SECONDS = 5
+WARM_START_MAX_TIME_IN_SECONDS = 2
+
+# Solver budgets by model size (candidate foods, nutrient and category constraints),
+# as (max model size, num_search_workers, max_time_in_seconds), smallest first.
+SOLVER_BUDGETS: list[tuple[int, int, float]] = [
+    (20, 1, 1),
+    (100, 4, 3),
+]
+DEFAULT_SOLVER_BUDGET: tuple[int, float] = (10, MAX_TIME_IN_SECONDS)
+
+# User data read by the planner. Any write to these tables changes the mealplan fingerprint.
+_FINGERPRINT_MODELS: list[type] = [
+    user_preference.UserPreference,
+    user_preference_threshold.UserPreferenceThreshold,
+    user_meal.UserMeal,
+    user_food_membership.UserFoodMembership,
+    user_ingredient.UserIngredient,
+    user_branded_food.UserBrandedFood,
+    user_recipe.UserRecipe,
+    user_food_nutrient.UserFoodNutrient,
+    user_food_portion.UserFoodPortion,
+]
 
 
 @dataclasses.dataclass
@@ -40,8 +76,10 @@ class Mealplan:
         lrecipes: list[user_recipe.UserRecipe],
         lmember_recipes: list[user_recipe.UserRecipe],
         lmeals_today: list[user_meal.UserMeal],
-        lfoods_nutrients: Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient],
+        lfoods_nutrients: list[food_nutrient.FoodNutrientValue],
         quantity_map: dict[UUID, float | None],
+        quantity_maps: list[dict[UUID, float | None]] | None = None,
+        plan_id: str | None = None,
     ) -> None:
         self.infeasible = infeasible
         self.lfoods = lfoods
@@ -50,10 +88,56 @@ class Mealplan:
         self.lmeals_today = lmeals_today
         self.lfoods_nutrients = lfoods_nutrients
         self.quantity_map = quantity_map
+        # Per day quantity maps, quantity_map is the first day.
+        self.quantity_maps = quantity_maps or [quantity_map]
+        # ID of the persisted plan, if already saved e.g. by a mealplan job.
+        self.plan_id = plan_id
+
+
+class StopSearchCallback(cp_model.CpSolverSolutionCallback):
+    """Stops the search at the next solution once should_stop returns True, e.g. for a cancelled job."""
+
+    def __init__(self, should_stop: Callable[[], bool]) -> None:
+        super().__init__()
+        self.should_stop = should_stop
+        self.stopped: bool = False
+
+    def OnSolutionCallback(self) -> None:  # pylint: disable=invalid-name
+        """Called by the solver on each improving solution."""
+        if self.should_stop():
+            self.stopped = True
+            self.StopSearch()
+
+
+def get_mealplan_for_user(  # pylint: disable=too-many-locals,too-many-statements,too-many-arguments
+    user: user_model.User,
+    num_days: int = 1,
+    plan_date: datetime.date | None = None,
+    profile: dict[str, Any] | None = None,
+    solution: dict[str, Any] | None = None,
+    should_stop: Callable[[], bool] | None = None,
+    quantities_only: bool = False,
+) -> Mealplan:
+    """Get mealplan for user, based on user food and nutrient preferences.
+    Plans start on plan_date, default today. num_days > 1 plans consecutive days in one model, per day quantity maps.
+    Solutions are cached by a fingerprint of the planner inputs, unchanged inputs skip the solve.
+    A given solution {infeasible, quantity_maps}, e.g. a solve job result, also skips the solve.
+    Cached and given solutions only load the planned foods and recipes, and today's meals.
+    quantities_only skips those loads, for callers that only read infeasible and the quantity maps.
+    should_stop is checked on each solution found, the search stops early once it returns True.
+    If profile is given, it is filled with phase timings and solver statistics."""
+    start_time: float = time.perf_counter()
+    plan_date = plan_date or timezone.localdate()
+    fingerprint: str = get_mealplan_fingerprint(user, plan_date=plan_date)
+
+    cache_key: str = _get_cache_key(fingerprint, num_days)
+    cached_solution: dict | None = solution if solution is not None else cache.get(cache_key)
+    if cached_solution is not None:
+        lmealplan: Mealplan = _get_cached_mealplan(user, plan_date, cached_solution, quantities_only=quantities_only)
+        if profile is not None:
+            profile.update({"cached": True, "load_seconds": time.perf_counter() - start_time})
+        return lmealplan
 
-
-def get_mealplan_for_user(user: user_model.User) -> Mealplan:  # pylint: disable=too-many-locals
-    """Get mealplan for user, based on user food and nutrient preferences."""
     # Read user preferences
     luser_preferences: list[user_preference.UserPreference] = list(user_preference.load_luser_preferences(user))
     lfood_preferences: list[user_preference.UserPreference] = list(
@@ -67,10 +151,26 @@ def get_mealplan_for_user(user: user_model.User) -> Mealplan:  # pylint: disable
     )
 
     # Read user meal history
-    lmeals_today: list[user_meal.UserMeal] = list(user_meal.load_lmeals(user, meal_date=timezone.localdate()))
-    lmeals_yesterday: list[user_meal.UserMeal] = list(
-        user_meal.load_lmeals(user, meal_date=(timezone.localdate() - timezone.timedelta(days=1)))
+    lmeals_today: list[user_meal.UserMeal] = list(user_meal.load_lmeals(user, meal_date=plan_date))
+    lmeal_ids_yesterday: set[int] = set(
+        user_meal.load_lmeals(
+            user, meal_date=(plan_date - timezone.timedelta(days=1)), load_profile=constants.LoadProfile.IDS
+        ).values_list("id", flat=True)
+    )
+
+    # Read foods and recipes in history, including nested recipes, in one query
+    lmeal_members: list[data_loaders.Member] = data_loaders.get_member_closure(
+        data_loaders.get_content_type_meal_id(),
+        [lmeal.id for lmeal in lmeals_today] + list(lmeal_ids_yesterday),
     )
+    used_external_ids_yesterday: set[UUID] = {
+        lmember.external_id
+        for lmember in lmeal_members
+        if lmember.parent_id in lmeal_ids_yesterday and lmember.external_id
+    }
+    member_external_ids: dict[tuple[int, int], UUID | None] = {
+        (lmember.child_type_id, lmember.child_id): lmember.external_id for lmember in lmeal_members
+    }
 
     # Read available and allowable IDs
     usable_preferences: list[user_preference.UserPreference] = list(
@@ -84,126 +184,434 @@ def get_mealplan_for_user(user: user_model.User) -> Mealplan:  # pylint: disable
 
     # Shuffle IDs, for variety of mealplan solutions.
     # Optimistic shuffle, not sure if this does anything.
-    random.shuffle(external_ids)
+    # Seeded from the fingerprint, so the same inputs build the same model.
+    random.Random(fingerprint).shuffle(external_ids)
 
     # Filter non repeatable IDs
-    member_foods: list[user_ingredient.UserIngredient] = list(
-        data_loaders.load_lfoods_for_lparents(user, lmeals_yesterday)
-    )
-    member_recipes: list[user_recipe.UserRecipe] = list(
-        data_loaders.load_lrecipes_for_lparents(user, lmeals_yesterday)
+    repeatable_ids: set[UUID] = common_planner.restrict_to_repeatable_or_unused(
+        external_ids, lfood_preferences, used_external_ids_yesterday
     )
-    external_ids = list(
-        common_planner.restrict_to_repeatable_or_unused(external_ids, lfood_preferences, member_foods, member_recipes)
-    )
-
     # Add items from history
-    member_foods = list(data_loaders.load_lfoods_for_lparents(user, lmeals_today))
-    member_recipes = list(data_loaders.load_lrecipes_for_lparents(user, lmeals_today))
-    external_ids = list(common_planner.add_from_history(external_ids, lmeals_today, member_foods, member_recipes))
-
-    # Read foods
-    lfoods: list[user_ingredient.UserIngredient] = list(user_ingredient.load_lfoods(user, external_ids=external_ids))
-
-    # Read recipes
-    lrecipes: list[user_recipe.UserRecipe] = list(user_recipe.load_lrecipes(user, external_ids=external_ids))
-    lrecipe_foods: list[user_ingredient.UserIngredient] = list(data_loaders.load_lfoods_for_lparents(user, lrecipes))
-    lmember_recipes: list[user_recipe.UserRecipe] = list(data_loaders.load_lrecipes_for_lparents(user, lrecipes))
+    history_external_ids: set[UUID] = common_planner.add_from_history([], lmeals_today, member_external_ids)
+
+    # Multi day plans keep these foods, they are only excluded on the first day.
+    # Foods logged today, or not zeroable, must be planned on the first day and are not excluded.
+    first_day_excluded_ids: set[UUID] = set()
+    if num_days == 1:
+        external_ids = list(repeatable_ids)
+    else:
+        not_zeroable_ids: set[UUID] = {
+            fp.food_external_id for fp in lfood_preferences if fp.food_external_id and fp.is_not_zeroable()
+        }
+        first_day_excluded_ids = set(external_ids) - repeatable_ids - history_external_ids - not_zeroable_ids
+
+    external_ids = list(set(external_ids) | history_external_ids)
+
+    # Read foods, recipes and their food nutrients
+    lfoods, lrecipes, lmember_recipes, lfoods_nutrients = _load_mealplan_foods(user, external_ids)
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    recipe_type_id: int = data_loaders.get_content_type_recipe_id()
 
     # Read categories
     lcategories: list[usda_config.USDAFoodCategory] = usda_config.usda_food_categories
-
-    lfoods_dict: dict[UUID, user_ingredient.UserIngredient] = {}
-    for lfood in lfoods:
-        lfoods_dict[lfood.external_id] = lfood
-    for lfood in lrecipe_foods:
-        if lfood.external_id not in lfoods_dict:
-            lfoods_dict[lfood.external_id] = lfood
-
-    # Read food nutrients
-    lfoods_nutrients: Sequence[
-        db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient
-    ] = food_nutrient.get_foods_nutrients(user, list(lfoods_dict.values()))
+    load_time: float = time.perf_counter()
 
     # Initialize CP Model
-    variables: dict = {}
+    variables: planner_variables.PlannerVariables = planner_variables.PlannerVariables()
     model: cp_model.CpModel = cp_model.CpModel()
 
     # Setup food constraints
     food_planner.setup_food_constraints(
-        model, variables, lfoods, lfood_preferences, lmeals_today, data_loaders.get_content_type_ingredient_id()
+        model,
+        variables,
+        lfoods,
+        lfood_preferences,
+        lmeals_today,
+        ingredient_type_id,
+        num_days=num_days,
     )
 
     # Setup recipe constraints
     food_planner.setup_food_constraints(
-        model, variables, lrecipes, lfood_preferences, lmeals_today, data_loaders.get_content_type_recipe_id()
+        model,
+        variables,
+        lrecipes,
+        lfood_preferences,
+        lmeals_today,
+        recipe_type_id,
+        num_days=num_days,
     )
 
+    # Exclude non repeatable foods used yesterday from the first day
+    for external_id in first_day_excluded_ids:
+        if variables.has_presence(external_id, 1):
+            model.Add(variables.get_presence(external_id, 1) == 0)
+
     # Setup group/category constraints
     category_planner.setup_category_constraints(
-        model, variables, lfoods, lcategories, lfood_preferences, lcategory_preferences, lmeals_today
+        model,
+        variables,
+        lfoods,
+        lcategories,
+        lfood_preferences,
+        lcategory_preferences,
+        lmeals_today,
+        num_days=num_days,
     )
 
     # Setup nutrition preference constraints
     nutrition_planner.setup_nutrition_constraints(
-        model, variables, lfoods, lrecipes, lmember_recipes, lfoods_nutrients, lnutrient_preferences, lmeals_today
+        model,
+        variables,
+        lfoods,
+        lrecipes,
+        lmember_recipes,
+        lfoods_nutrients,
+        lnutrient_preferences,
+        lmeals_today,
+        num_days=num_days,
     )
 
-    objective: str | int = sum(val for key, val in variables.items() if planner_utils.is_constraint_variable(key))
-    model.Maximize(objective)
+    model.Maximize(variables.get_objective())
+
+    # Warm start from the user's last feasible plan, re-plans after small edits need less time.
+    hint_key: str = _get_hint_key(user.id)
+    hints: dict[str, int] = cache.get(hint_key) or {}
+    warm_start: bool = variables.add_hints(model, hints) > 0
+
+    build_time: float = time.perf_counter()
+
+    num_foods: int = len(lfoods) + len(lrecipes)
+    num_search_workers, max_time_in_seconds = get_solver_budget(
+        (num_foods + len(lnutrient_preferences) + len(lcategory_preferences)) * num_days, warm_start=warm_start
+    )
 
     solver: cp_model.CpSolver = cp_model.CpSolver()
-    solver.parameters.num_search_workers = 10
-    solver.parameters.max_time_in_seconds = MAX_TIME_IN_SECONDS
-    status = solver.Solve(model)
+    solver.parameters.num_search_workers = num_search_workers
+    solver.parameters.max_time_in_seconds = max_time_in_seconds
+    callback: StopSearchCallback | None = StopSearchCallback(should_stop) if should_stop else None
+    status = solver.Solve(model, callback)
+    stopped: bool = bool(callback and callback.stopped)
+    if profile is not None:
+        profile.update(
+            {
+                "cached": False,
+                "load_seconds": load_time - start_time,
+                "build_seconds": build_time - load_time,
+                "solve_seconds": time.perf_counter() - build_time,
+                **_get_solver_profile(model, solver, status),
+            }
+        )
+    _record_solve_stat(
+        user,
+        solver,
+        status,
+        num_foods=num_foods,
+        num_nutrient_constraints=len(lnutrient_preferences),
+        num_category_constraints=len(lcategory_preferences),
+        num_days=num_days,
+        num_search_workers=num_search_workers,
+        max_time_in_seconds=max_time_in_seconds,
+        warm_start=warm_start,
+    )
+    if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+        cache.set(hint_key, variables.get_hints(solver), constants.MEALPLAN_CACHE_TIMEOUT)
+
+    infeasible: bool = status in [
+        cp_model.UNKNOWN,
+        cp_model.MODEL_INVALID,
+        cp_model.INFEASIBLE,
+    ]
+    quantity_maps: list[dict[UUID, float | None]] = [
+        _get_mealplan_from_solution(solver, status, variables, lfoods, lrecipes, day=day)
+        for day in range(1, num_days + 1)
+    ]
+    # UNKNOWN ran out of time, a later solve may still find a solution. Stopped searches are not the best found.
+    if status != cp_model.UNKNOWN and not stopped:
+        cache.set(
+            cache_key, {"infeasible": infeasible, "quantity_maps": quantity_maps}, constants.MEALPLAN_CACHE_TIMEOUT
+        )
+
+    return Mealplan(
+        infeasible,
+        lfoods,
+        lrecipes,
+        lmember_recipes,
+        lmeals_today,
+        lfoods_nutrients,
+        quantity_maps[0],
+        quantity_maps=quantity_maps,
+    )
+
+
+def _load_mealplan_foods(
+    user: user_model.User, external_ids: list[UUID]
+) -> tuple[
+    list[user_ingredient.UserIngredient],
+    list[user_recipe.UserRecipe],
+    list[user_recipe.UserRecipe],
+    list[food_nutrient.FoodNutrientValue],
+]:
+    """Load foods and recipes for external_ids, the nested recipes of the recipes, and nutrients of all their foods."""
+    lfoods: list[user_ingredient.UserIngredient] = list(user_ingredient.load_lfoods(user, external_ids=external_ids))
+
+    # Read recipes, and their foods and nested recipes
+    lrecipes: list[user_recipe.UserRecipe] = list(user_recipe.load_lrecipes(user, external_ids=external_ids))
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    recipe_type_id: int = data_loaders.get_content_type_recipe_id()
+    lrecipe_members: list[data_loaders.Member] = data_loaders.get_member_closure(
+        recipe_type_id, [lrecipe.id for lrecipe in lrecipes]
+    )
+    lfood_ids: set[int] = {lfood.id for lfood in lfoods}
+    lrecipe_food_ids: set[int] = {
+        lmember.child_id
+        for lmember in lrecipe_members
+        if lmember.child_type_id == ingredient_type_id and lmember.child_id not in lfood_ids
+    }
+    lmember_recipe_ids: set[int] = {
+        lmember.child_id for lmember in lrecipe_members if lmember.child_type_id == recipe_type_id
+    }
+    lrecipe_foods: list[user_ingredient.UserIngredient] = (
+        list(user_ingredient.load_lfoods(user, ids=list(lrecipe_food_ids))) if lrecipe_food_ids else []
+    )
+    lmember_recipes: list[user_recipe.UserRecipe] = (
+        list(user_recipe.load_lrecipes(user, ids=list(lmember_recipe_ids))) if lmember_recipe_ids else []
+    )
+
+    lfoods_dict: dict[UUID, user_ingredient.UserIngredient] = {}
+    for lfood in lfoods:
+        lfoods_dict[lfood.external_id] = lfood
+    for lfood in lrecipe_foods:
+        if lfood.external_id not in lfoods_dict:
+            lfoods_dict[lfood.external_id] = lfood
+
+    # Read food nutrients
+    lfoods_nutrients: list[food_nutrient.FoodNutrientValue] = food_nutrient.get_foods_nutrients(
+        user, list(lfoods_dict.values())
+    )
+    return lfoods, lrecipes, lmember_recipes, lfoods_nutrients
+
+
+def _get_cached_mealplan(
+    user: user_model.User, plan_date: datetime.date, cached_solution: dict[str, Any], quantities_only: bool = False
+) -> Mealplan:
+    """Get the mealplan of a cached solution. Only planned foods and recipes, and foods in today's meals are loaded."""
+    quantity_maps: list[dict[UUID, float | None]] = cached_solution["quantity_maps"]
+    if quantities_only:
+        return Mealplan(
+            cached_solution["infeasible"], [], [], [], [], [], quantity_maps[0], quantity_maps=quantity_maps
+        )
+
+    lmeals_today: list[user_meal.UserMeal] = list(user_meal.load_lmeals(user, meal_date=plan_date))
+    lmeal_members: list[data_loaders.Member] = data_loaders.get_member_closure(
+        data_loaders.get_content_type_meal_id(), [lmeal.id for lmeal in lmeals_today]
+    )
+    member_external_ids: dict[tuple[int, int], UUID | None] = {
+        (lmember.child_type_id, lmember.child_id): lmember.external_id for lmember in lmeal_members
+    }
+    external_ids: set[UUID] = common_planner.add_from_history(
+        [external_id for quantity_map in quantity_maps for external_id, quantity in quantity_map.items() if quantity],
+        lmeals_today,
+        member_external_ids,
+    )
+
+    lfoods, lrecipes, lmember_recipes, lfoods_nutrients = _load_mealplan_foods(user, list(external_ids))
     return Mealplan(
-        status
-        in [
-            cp_model.UNKNOWN,
-            cp_model.MODEL_INVALID,
-            cp_model.INFEASIBLE,
-        ],
+        cached_solution["infeasible"],
         lfoods,
         lrecipes,
         lmember_recipes,
         lmeals_today,
         lfoods_nutrients,
-        _get_mealplan_from_solution(solver, status, variables, lfoods, lrecipes),
+        quantity_maps[0],
+        quantity_maps=quantity_maps,
     )
 
 
+def get_solver_budget(model_size: int, warm_start: bool = False) -> tuple[int, float]:
+    """Get (num_search_workers, max_time_in_seconds) for a model with model_size foods and constraints.
+    Workers are capped to this solve's share of MEALPLAN_SOLVER_MAX_WORKERS, across all web processes on the box."""
+    num_search_workers, max_time_in_seconds = next(
+        ((workers, max_time) for max_size, workers, max_time in SOLVER_BUDGETS if model_size <= max_size),
+        DEFAULT_SOLVER_BUDGET,
+    )
+    if warm_start:
+        max_time_in_seconds = min(max_time_in_seconds, WARM_START_MAX_TIME_IN_SECONDS)
+
+    concurrent_solves: int = max(settings.MEALPLAN_JOB_WORKERS, 1) * max(settings.WEB_CONCURRENCY, 1)
+    num_search_workers = max(min(num_search_workers, settings.MEALPLAN_SOLVER_MAX_WORKERS // concurrent_solves), 1)
+    return num_search_workers, max_time_in_seconds
+
+
+def _get_solver_profile(model: cp_model.CpModel, solver: cp_model.CpSolver, status: Any) -> dict[str, Any]:
+    """Get model size and CP-SAT response statistics for a solve."""
+    model_proto: Any = model.Proto()
+    return {
+        "status": solver.StatusName(status),
+        "num_variables": len(model_proto.variables),
+        "num_constraints": len(model_proto.constraints),
+        "num_search_workers": solver.parameters.num_search_workers,
+        "max_time_in_seconds": solver.parameters.max_time_in_seconds,
+        "wall_time": solver.WallTime(),
+        "user_time": solver.UserTime(),
+        "num_booleans": solver.NumBooleans(),
+        "num_branches": solver.NumBranches(),
+        "num_conflicts": solver.NumConflicts(),
+        "objective_value": solver.ObjectiveValue() if status in [cp_model.OPTIMAL, cp_model.FEASIBLE] else None,
+        "best_objective_bound": (
+            solver.BestObjectiveBound() if status in [cp_model.OPTIMAL, cp_model.FEASIBLE] else None
+        ),
+        "response_stats": solver.ResponseStats(),
+    }
+
+
+def _record_solve_stat(user: user_model.User, solver: cp_model.CpSolver, status: Any, **kwargs: Any) -> None:
+    """Record solver statistics, for tuning solver budgets."""
+    objective_value: float | None = None
+    best_objective_bound: float | None = None
+    gap: float | None = None
+    if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+        objective_value = solver.ObjectiveValue()
+        best_objective_bound = solver.BestObjectiveBound()
+        gap = abs(best_objective_bound - objective_value) / max(abs(best_objective_bound), 1)
+
+    mealplan_solve_stat.create(
+        user,
+        status=solver.StatusName(status),
+        wall_time=solver.WallTime(),
+        objective_value=objective_value,
+        best_objective_bound=best_objective_bound,
+        gap=gap,
+        **kwargs,
+    )
+
+
+def _get_fingerprint_qs(qs: QuerySet, table: str) -> QuerySet:
+    """Row count and max updated timestamp of qs, as one (table, count, updated) row."""
+    return (
+        qs.order_by()
+        .annotate(table=Value(table, output_field=CharField()))
+        .values("table")
+        .annotate(count=Count("id"), updated=Max("updated_timestamp"))
+        .values_list("table", "count", "updated")
+    )
+
+
+def get_mealplan_fingerprint(user: user_model.User, plan_date: datetime.date | None = None) -> str:
+    """Get a fingerprint of the planner inputs for user on plan_date (default today).
+    Changes whenever the planner data of the user's family, the db food nutrients of their foods, or the date changes.
+    Row counts catch deletes, max updated timestamps catch inserts and updates."""
+    member_ids: list[int] = user_biz.get_family_member_ids(user)
+    qs: QuerySet = _get_fingerprint_qs(
+        db_food_nutrient.DBFoodNutrient.objects.filter(db_food__useringredient__user__in=member_ids),
+        db_food_nutrient.DBFoodNutrient._meta.db_table,
+    )
+    for model in _FINGERPRINT_MODELS:
+        qs = qs.union(_get_fingerprint_qs(model.objects.filter(user__in=member_ids), model._meta.db_table), all=True)
+
+    values: list[Any] = [user.id, plan_date or timezone.localdate()]
+    values.extend(sorted(qs, key=lambda row: row[0]))
+    return hashlib.sha256(repr(values).encode()).hexdigest()
+
+
+def _get_cache_key(fingerprint: str, num_days: int = 1) -> str:
+    return f"mealplan:{fingerprint}:{num_days}"
+
+
+def _get_hint_key(user_id: int) -> str:
+    return f"mealplan_hint:{user_id}"
+
+
 def _get_mealplan_from_solution(
     solver: cp_model.CpSolver,
     status: Any,
-    variables: dict,
+    variables: planner_variables.PlannerVariables,
     lfoods: list[user_ingredient.UserIngredient],
     lrecipes: list[user_recipe.UserRecipe],
+    day: int = 1,
 ) -> dict[UUID, float | None]:
-    """Get quantity_map from mealplan solution."""
+    """Get quantity_map for a day from mealplan solution."""
     quantity_map: dict[UUID, float | None] = {}
     if status in [cp_model.MODEL_INVALID, cp_model.INFEASIBLE, cp_model.UNKNOWN]:
         return quantity_map
 
     for lfood in lfoods:
-        presence_variable: str = planner_utils.get_presence_variable(lfood.external_id)
-        if not solver.Value(variables[presence_variable]):
+        if not solver.Value(variables.get_presence(lfood.external_id, day)):
             continue
 
-        quantity_variable: str = planner_utils.get_quantity_variable(lfood.external_id)
-        if not solver.Value(variables[quantity_variable]):
+        quantity: int = solver.Value(variables.get_quantity(lfood.external_id, day))
+        if not quantity:
             continue
 
-        quantity_map[lfood.external_id] = solver.Value(variables[quantity_variable])
+        quantity_map[lfood.external_id] = quantity
 
     for lrecipe in lrecipes:
-        presence_variable = planner_utils.get_presence_variable(lrecipe.external_id)
-        if not solver.Value(variables[presence_variable]):
+        if not solver.Value(variables.get_presence(lrecipe.external_id, day)):
             continue
 
-        quantity_variable = planner_utils.get_quantity_variable(lrecipe.external_id)
-        if not solver.Value(variables[quantity_variable]):
+        quantity = solver.Value(variables.get_quantity(lrecipe.external_id, day))
+        if not quantity:
             continue
 
-        quantity_map[lrecipe.external_id] = solver.Value(variables[quantity_variable])
+        quantity_map[lrecipe.external_id] = quantity
 
     return quantity_map
+
+
+def _get_plan_key(plan_id: str) -> str:
+    return f"mealplan_plan:{plan_id}"
+
+
+def get_history_map(lmeals: list[user_meal.UserMeal]) -> dict[tuple[int, int], float]:
+    """Get quantities already logged in lmeals, keyed by (child_type_id, child_id)."""
+    history_map: dict[tuple[int, int], float] = {}
+    for lmeal in lmeals:
+        for lmeal_member in lmeal.members:
+            key: tuple[int, int] = (lmeal_member.child_type_id, lmeal_member.child_id)
+            history_map[key] = history_map.get(key, 0) + lmeal_member.portions[0].serving_size
+
+    return history_map
+
+
+def save_plan(user: user_model.User, lmealplan: Mealplan) -> tuple[str, dict[str, dict[str, Any]]]:
+    """Persist the remaining items of a computed mealplan, and return the plan ID and items.
+    Remaining quantity is the planned quantity less what is already logged today, zero quantities are dropped."""
+    history_map: dict[tuple[int, int], float] = get_history_map(lmealplan.lmeals_today)
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    recipe_type_id: int = data_loaders.get_content_type_recipe_id()
+    lobjects: list[tuple[user_ingredient.UserIngredient | user_recipe.UserRecipe, int, str]] = [
+        (lfood, ingredient_type_id, lfood.display_name) for lfood in lmealplan.lfoods
+    ]
+    lobjects.extend((lrecipe, recipe_type_id, lrecipe.display_name()) for lrecipe in lmealplan.lrecipes)
+
+    items: dict[str, dict[str, Any]] = {}
+    for lobject, type_id, name in lobjects:
+        if lobject.external_id not in lmealplan.quantity_map:
+            continue
+
+        quantity: float = (lmealplan.quantity_map[lobject.external_id] or 0) - history_map.get(
+            (type_id, lobject.id), 0
+        )
+        r_quantity: int = round(quantity)
+        if r_quantity == 0:
+            continue
+
+        items[str(lobject.external_id)] = {"type_id": type_id, "id": lobject.id, "name": name, "quantity": r_quantity}
+
+    plan_id: str = str(uuid.uuid4())
+    cache.set(_get_plan_key(plan_id), {"user_id": user.id, "items": items}, constants.MEALPLAN_CACHE_TIMEOUT)
+    return plan_id, items
+
+
+def load_plan(user: user_model.User, plan_id: str | UUID) -> dict[str, dict[str, Any]] | None:
+    """Load the items {external_id: {type_id, id, name, quantity}} of a plan owned by the user, None if unknown."""
+    plan: dict | None = cache.get(_get_plan_key(str(plan_id)))
+    if not plan or plan["user_id"] != user.id:
+        return None
+
+    return plan["items"]
+
+
+def delete_plan(plan_id: str | UUID) -> None:
+    """Delete a saved plan, plans are saved to meals at most once."""
+    cache.delete(_get_plan_key(str(plan_id)))
@@ -0,0 +1,161 @@
+"""Mealplan benchmark logic module. Solves mealplans for synthetic users, and reports per phase timings."""
+from __future__ import annotations
+
+import dataclasses
+import random
+import statistics
+import uuid
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+import users.models as user_model
+from nutrition_tracker.config import nutrition as nutrition_config
+from nutrition_tracker.config import usda_config
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import mealplan
+from nutrition_tracker.models import (
+    user_food_membership,
+    user_food_nutrient,
+    user_food_portion,
+    user_ingredient,
+    user_preference,
+    user_preference_threshold,
+    user_recipe,
+)
+
+PHASES: list[str] = ["load_seconds", "build_seconds", "solve_seconds"]
+
+
+@dataclasses.dataclass
+class BenchmarkConfig:
+    """Synthetic user shape for a benchmark run."""
+
+    num_foods: int = 50
+    num_recipes: int = 10
+    # Foods per recipe
+    recipe_size: int = 4
+    # Recipes nest in chains of recipe_depth, depth 1 recipes only contain foods
+    recipe_depth: int = 1
+    num_nutrient_thresholds: int = 4
+    num_category_thresholds: int = 2
+    num_food_thresholds: int = 10
+
+
+def create_synthetic_user(config: BenchmarkConfig, rng: random.Random) -> user_model.User:
+    """Create a user with a synthetic kitchen and preferences, shaped by config."""
+    luser: user_model.User = get_user_model().objects.create_user(
+        email=f"mealplan-benchmark-{uuid.uuid4()}@famnom.com"
+    )
+    nutrient_rdis: list[nutrition_config.FDANutrientRDI] = nutrition_config.fda_nutrient_rdis[
+        : config.num_nutrient_thresholds
+    ]
+    category_ids: list[int] = [
+        category.id_ for category in usda_config.usda_food_categories if category.id_ != constants.CATEGORY_ALL_FOODS
+    ]
+
+    lfoods: list[user_ingredient.UserIngredient] = []
+    for index in range(config.num_foods):
+        lfood: user_ingredient.UserIngredient = user_ingredient.create(
+            luser, name=f"Food {index}", category_id=rng.choice(category_ids)
+        )
+        user_food_portion.create(
+            luser,
+            content_object=lfood,
+            serving_size=rng.randint(50, 200),
+            serving_size_unit=constants.ServingSizeUnit.WEIGHT,
+        )
+        for rdi in nutrient_rdis:
+            user_food_nutrient.create(
+                luser, ingredient=lfood, nutrient_id=rdi.nutrient_id, amount=rng.uniform(0, (rdi.adult or 100) / 10)
+            )
+        lfoods.append(lfood)
+
+    lrecipes: list[user_recipe.UserRecipe] = []
+    for index in range(config.num_recipes):
+        lrecipe: user_recipe.UserRecipe = user_recipe.create(
+            luser, name=f"Recipe {index}", recipe_date=timezone.localdate()
+        )
+        user_food_portion.create(
+            luser, content_object=lrecipe, serving_size=500, serving_size_unit=constants.ServingSizeUnit.WEIGHT
+        )
+        lmembers: list[Any] = rng.sample(lfoods, min(config.recipe_size, len(lfoods)))
+        if index % max(config.recipe_depth, 1):
+            lmembers.append(lrecipes[-1])
+        for lmember in lmembers:
+            ufm: user_food_membership.UserFoodMembership = user_food_membership.create(
+                luser, parent=lrecipe, child=lmember
+            )
+            user_food_portion.create(
+                luser,
+                content_object=ufm,
+                serving_size=rng.randint(50, 200),
+                serving_size_unit=constants.ServingSizeUnit.WEIGHT,
+            )
+        lrecipes.append(lrecipe)
+
+    for index, lobject in enumerate([*lfoods, *lrecipes]):
+        luser_preference: user_preference.UserPreference = user_preference.create(
+            luser, food_external_id=lobject.external_id
+        )
+        luser_preference.add_flag(user_preference.FLAG_IS_AVAILABLE)
+        luser_preference.save()
+        if index < config.num_food_thresholds:
+            user_preference_threshold.create(
+                luser, user_preference=luser_preference, num_days=1, min_value=50, max_value=300
+            )
+
+    for rdi in nutrient_rdis:
+        luser_preference = user_preference.create(luser, food_nutrient_id=rdi.nutrient_id)
+        user_preference_threshold.create(
+            luser, user_preference=luser_preference, num_days=1, min_value=(rdi.adult or 100) * 0.8
+        )
+
+    for category_id in rng.sample(category_ids, min(config.num_category_thresholds, len(category_ids))):
+        luser_preference = user_preference.create(luser, food_category_id=category_id)
+        user_preference_threshold.create(luser, user_preference=luser_preference, num_days=1, min_value=50)
+
+    return luser
+
+
+def run_benchmark(config: BenchmarkConfig, repeat: int = 3, seed: int = 0) -> dict[str, Any]:
+    """Solve mealplans for repeat synthetic users shaped by config, and report timings and solver stats.
+    Synthetic users, and their cached solutions and hints, are discarded after each solve."""
+    rng: random.Random = random.Random(seed)
+    runs: list[dict[str, Any]] = []
+    for _unused in range(repeat):
+        with transaction.atomic():
+            luser: user_model.User = create_synthetic_user(config, rng)
+            profile: dict[str, Any] = {}
+            mealplan.get_mealplan_for_user(luser, profile=profile)
+            runs.append(profile)
+            fingerprint: str = mealplan.get_mealplan_fingerprint(luser)
+            transaction.set_rollback(True)
+        cache_keys: list[str] = [
+            mealplan._get_cache_key(fingerprint),  # pylint: disable=protected-access
+            mealplan._get_hint_key(luser.id),  # pylint: disable=protected-access
+        ]
+        cache.delete_many(cache_keys)
+
+    summary: dict[str, dict[str, float]] = {}
+    for phase in PHASES:
+        values: list[float] = [run[phase] for run in runs if phase in run]
+        if values:
+            summary[phase] = {"mean": statistics.mean(values), "median": statistics.median(values), "max": max(values)}
+
+    statuses: dict[str, int] = {}
+    for run in runs:
+        status: str = run.get("status", "CACHED")
+        statuses[status] = statuses.get(status, 0) + 1
+
+    return {
+        "config": dataclasses.asdict(config),
+        "repeat": repeat,
+        "seed": seed,
+        "summary": summary,
+        "statuses": statuses,
+        "runs": runs,
+    }
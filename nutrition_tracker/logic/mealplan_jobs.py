@@ -0,0 +1,210 @@
+"""Mealplan solve jobs logic module.
+
+Solves run on a bounded, process wide thread pool, keeping CP-SAT off the request thread.
+Job state lives in the cache, so any web worker can poll or cancel a job."""
+from __future__ import annotations
+
+import functools
+import threading
+import time
+import uuid
+import zoneinfo
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.utils import timezone
+
+import users.models as user_model
+from nutrition_tracker.biz import user
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import mealplan
+
+FINAL_STATUSES: list[str] = [
+    constants.MealplanJobStatus.DONE,
+    constants.MealplanJobStatus.FAILED,
+    constants.MealplanJobStatus.CANCELLED,
+]
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_futures: dict[str, Future] = {}
+
+
+def _get_executor() -> ThreadPoolExecutor | None:
+    """Return the process wide solver pool, None if jobs solve inline."""
+    global _executor  # pylint: disable=global-statement
+    if settings.MEALPLAN_JOB_WORKERS <= 0:
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.MEALPLAN_JOB_WORKERS, thread_name_prefix="mealplan_job"
+            )
+
+    return _executor
+
+
+def _get_job_key(job_id: str) -> str:
+    return f"mealplan_job:{job_id}"
+
+
+def _get_user_key(user_id: int) -> str:
+    return f"mealplan_job_user:{user_id}"
+
+
+def _get_cancel_key(job_id: str) -> str:
+    return f"mealplan_job_cancel:{job_id}"
+
+
+def _set_job(job_id: str, user_id: int, status: str, result: dict | None = None, num_days: int = 1) -> None:
+    cache.set(
+        _get_job_key(job_id),
+        {
+            "job_id": job_id,
+            "user_id": user_id,
+            "num_days": num_days,
+            "status": status,
+            "result": result,
+            "updated": time.time(),
+        },
+        constants.MEALPLAN_JOB_TIMEOUT,
+    )
+
+
+def _is_stale(job: dict) -> bool:
+    """Is the job running on a worker that died, running jobs finish well within MEALPLAN_JOB_STALE_TIMEOUT."""
+    return (
+        job["status"] == constants.MealplanJobStatus.RUNNING
+        and time.time() - job["updated"] > constants.MEALPLAN_JOB_STALE_TIMEOUT
+    )
+
+
+def _is_cancelled(job_id: str) -> bool:
+    return bool(cache.get(_get_cancel_key(job_id)))
+
+
+def _run_on_pool_thread(func: Callable, timezone_name: str, *args: Any) -> Any:
+    """Run func on a pool thread, with the submitting request's timezone active."""
+    try:
+        timezone.activate(zoneinfo.ZoneInfo(timezone_name))
+        return func(*args)
+    finally:
+        timezone.deactivate()
+        connections.close_all()
+
+
+def _submit(func: Callable, *args: Any) -> Future | None:
+    """Submit func to the solver pool, or run it inline if there is no pool."""
+    executor: ThreadPoolExecutor | None = _get_executor()
+    if not executor:
+        func(*args)
+        return None
+
+    return executor.submit(_run_on_pool_thread, func, timezone.get_current_timezone_name(), *args)
+
+
+def _run_job(job_id: str, user_id: int, num_days: int = 1) -> None:
+    """Solve a mealplan job, persist the plan, and store the result {infeasible, quantity_map(s), plan_id}."""
+    status: str = constants.MealplanJobStatus.FAILED
+    result: dict | None = None
+    try:
+        if _is_cancelled(job_id):
+            status = constants.MealplanJobStatus.CANCELLED
+            return
+
+        luser: user_model.User | None = user.load_luser(id_=user_id)
+        if not luser:
+            return
+
+        _set_job(job_id, user_id, constants.MealplanJobStatus.RUNNING, num_days=num_days)
+        lmealplan: mealplan.Mealplan = mealplan.get_mealplan_for_user(
+            luser, num_days=num_days, should_stop=functools.partial(_is_cancelled, job_id)
+        )
+        if _is_cancelled(job_id):
+            status = constants.MealplanJobStatus.CANCELLED
+            return
+
+        result = {
+            "infeasible": lmealplan.infeasible,
+            "quantity_map": lmealplan.quantity_map,
+            "quantity_maps": lmealplan.quantity_maps,
+            "plan_id": mealplan.save_plan(luser, lmealplan)[0],
+        }
+        status = constants.MealplanJobStatus.DONE
+    finally:
+        _set_job(job_id, user_id, status, result=result, num_days=num_days)
+        # A stale or replaced job no longer holds the user's claim.
+        if cache.get(_get_user_key(user_id)) == job_id:
+            cache.delete(_get_user_key(user_id))
+
+
+def submit_job(luser: user_model.User, num_days: int = 1) -> str:
+    """Submit a mealplan solve job for the user, and return the job ID.
+    A user has at most one job in flight, resubmits return the in flight job.
+    An in flight job for a different number of days is cancelled, and replaced."""
+    job_id: str = str(uuid.uuid4())
+    # The job is stored before it is claimed, a claimed job ID always has a job.
+    _set_job(job_id, luser.id, constants.MealplanJobStatus.QUEUED, num_days=num_days)
+    if not cache.add(_get_user_key(luser.id), job_id, constants.MEALPLAN_JOB_TIMEOUT):
+        in_flight_job_id: str | None = cache.get(_get_user_key(luser.id))
+        in_flight_job: dict | None = get_job(luser, in_flight_job_id) if in_flight_job_id else None
+        if in_flight_job and in_flight_job["status"] not in FINAL_STATUSES:
+            if in_flight_job["num_days"] == num_days:
+                cache.delete(_get_job_key(job_id))
+                return in_flight_job["job_id"]
+
+            cache.set(_get_cancel_key(in_flight_job["job_id"]), True, constants.MEALPLAN_JOB_TIMEOUT)
+
+        cache.set(_get_user_key(luser.id), job_id, constants.MEALPLAN_JOB_TIMEOUT)
+
+    future: Future | None = _submit(_run_job, job_id, luser.id, num_days)
+    if future:
+        _futures[job_id] = future
+        future.add_done_callback(lambda _: _futures.pop(job_id, None))
+
+    return job_id
+
+
+def get_job(luser: user_model.User, job_id: str | UUID) -> dict | None:
+    """Get job state {job_id, num_days, status, result} for a job owned by the user, None if unknown.
+    Stale running jobs are reported as failed."""
+    job: dict | None = cache.get(_get_job_key(str(job_id)))
+    if not job or job["user_id"] != luser.id:
+        return None
+
+    if _is_stale(job):
+        return {**job, "status": constants.MealplanJobStatus.FAILED}
+
+    return job
+
+
+def cancel_job(luser: user_model.User, job_id: str | UUID) -> bool:
+    """Cancel a job owned by the user. Returns False if the job is unknown or already finished.
+    Running jobs stop at the solver's next solution."""
+    job: dict | None = get_job(luser, job_id)
+    if not job or job["status"] in FINAL_STATUSES:
+        return False
+
+    cache.set(_get_cancel_key(job["job_id"]), True, constants.MEALPLAN_JOB_TIMEOUT)
+    future: Future | None = _futures.get(job["job_id"])
+    if future and future.cancel():
+        # Never started, _run_job won't clean up.
+        if cache.get(_get_user_key(luser.id)) == job["job_id"]:
+            cache.delete(_get_user_key(luser.id))
+        _set_job(job["job_id"], luser.id, constants.MealplanJobStatus.CANCELLED, num_days=job["num_days"])
+
+    return True
+
+
+def get_job_mealplan(luser: user_model.User, job: dict) -> mealplan.Mealplan:
+    """Get the mealplan of a done job, with its foods and recipes loaded. The solve is not repeated."""
+    lmealplan: mealplan.Mealplan = mealplan.get_mealplan_for_user(
+        luser, num_days=job["num_days"], solution=job["result"]
+    )
+    lmealplan.plan_id = job["result"]["plan_id"]
+    return lmealplan
@@ -6,120 +6,91 @@ from uuid import UUID
 from ortools.sat.python import cp_model
 
 from nutrition_tracker.constants import constants
-from nutrition_tracker.logic import data_loaders, user_prefs
-from nutrition_tracker.models import (
-    user_ingredient,
-    user_meal,
-    user_preference,
-    user_preference_threshold,
-    user_recipe,
-)
+from nutrition_tracker.logic import data_loaders
+from nutrition_tracker.logic.planner import variables as planner_variables
+from nutrition_tracker.models import user_meal, user_preference, user_preference_threshold
 from nutrition_tracker.utils import nutrition as nutrition_utils
-from nutrition_tracker.utils import planner as planner_utils
 
 
 def restrict_to_repeatable_or_unused(
     external_ids: list[UUID],
     food_preferences: list[user_preference.UserPreference],
-    lfoods: list[user_ingredient.UserIngredient],
-    lrecipes: list[user_recipe.UserRecipe],
+    used_external_ids: set[UUID],
 ) -> set[UUID]:
     """Restrict external_ids to repeatable or unused foods i.e. remove foods that were consumed the previous day and are not repeatable."""
-    r_food_ids: set[UUID] = set()
-    for external_id in external_ids:
-        food_preference: user_preference.UserPreference | None = user_prefs.filter_preferences_by_id(
-            food_preferences, food_external_id=external_id
-        )
-
-        if food_preference:
-            is_repeatable: bool = not food_preference.is_not_repeatable()
-            is_non_repeatable_and_unused_previous_day: bool = food_preference.is_not_repeatable() and (
-                all(f.external_id != external_id for f in lfoods)
-                and all(f.external_id != external_id for f in lrecipes)
-            )
-        else:
-            is_repeatable = True
-
-        if is_repeatable or is_non_repeatable_and_unused_previous_day:
-            r_food_ids.add(external_id)
-
-    return r_food_ids
+    not_repeatable_ids: set[UUID] = {
+        fp.food_external_id for fp in food_preferences if fp.food_external_id and fp.is_not_repeatable()
+    }
+    return {
+        external_id
+        for external_id in external_ids
+        if external_id not in not_repeatable_ids or external_id not in used_external_ids
+    }
 
 
 def add_from_history(
     external_ids: list[UUID],
     today_meals: list[user_meal.UserMeal],
-    lfoods: list[user_ingredient.UserIngredient],
-    lrecipes: list[user_recipe.UserRecipe],
+    member_external_ids: dict[tuple[int, int], UUID | None],
 ) -> set[UUID]:
-    """Add previously consumed foods / recipes in the day from history."""
+    """Add previously consumed foods / recipes in the day from history.
+    member_external_ids maps member (child_type_id, child_id) to the member's external ID."""
     r_food_ids: set[UUID] = set(external_ids)
+    ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
+    recipe_type_id: int = data_loaders.get_content_type_recipe_id()
     for lmeal in today_meals:
         for lmember in lmeal.members:  # type: ignore
-            for lfood in lfoods:
-                if (
-                    lfood.id == lmember.child_id
-                    and lmember.child_type_id == data_loaders.get_content_type_ingredient_id()
-                ):
-                    r_food_ids.add(lfood.external_id)
-                    break
-
-            for lrecipe in lrecipes:
-                if (
-                    lrecipe.id == lmember.child_id
-                    and lmember.child_type_id == data_loaders.get_content_type_recipe_id()
-                ):
-                    r_food_ids.add(lrecipe.external_id)
-                    break
+            if lmember.child_type_id not in (ingredient_type_id, recipe_type_id):
+                continue
+
+            external_id: UUID | None = member_external_ids.get((lmember.child_type_id, lmember.child_id))
+            if external_id:
+                r_food_ids.add(external_id)
 
     return r_food_ids
 
 
 def setup_threshold_constraint_base(  # pylint: disable=too-many-arguments
     model: cp_model.CpModel,
-    variables: dict,
-    variable_name: str,
-    base_id: int | str | UUID,
+    variables: planner_variables.PlannerVariables,
+    variable: cp_model.IntVar,
+    base_id: planner_variables.ItemId,
     threshold: user_preference_threshold.UserPreferenceThreshold,
     history: int = 0,
     multiplier: int = 1,
     enforce_exact: bool = False,
+    day: int = 1,
 ) -> None:
-    """Setup threshold constraint base."""
+    """Setup threshold constraint base, on variable of the item with base_id."""
     if threshold.exact_value is not None:
         exact_value: float = max(threshold.exact_value, history)
         exact_value = nutrition_utils.process_exact_threshold_value(exact_value) * multiplier
-        constraint_variable: str = planner_utils.get_constraint_variable(base_id)
-        variables[constraint_variable] = model.NewBoolVar(constraint_variable)
-        model.Add(variables[variable_name] == exact_value).OnlyEnforceIf(variables[constraint_variable])
-        model.Add(variables[variable_name] != exact_value).OnlyEnforceIf(variables[constraint_variable].Not())
+        constraint_variable: cp_model.IntVar = variables.new_constraint(model, base_id, day)
+        model.Add(variable == exact_value).OnlyEnforceIf(constraint_variable)
+        model.Add(variable != exact_value).OnlyEnforceIf(constraint_variable.Not())
 
     if threshold.min_value is not None:
         min_value: float = max(threshold.min_value, history)
         min_value = nutrition_utils.process_min_threshold_value(min_value) * multiplier
-        constraint_variable = planner_utils.get_constraint_variable(base_id)
-        variables[constraint_variable] = model.NewBoolVar(constraint_variable)
-        model.Add(variables[variable_name] >= min_value).OnlyEnforceIf(variables[constraint_variable])
-        model.Add(variables[variable_name] < min_value).OnlyEnforceIf(variables[constraint_variable].Not())
+        constraint_variable = variables.new_constraint(model, base_id, day)
+        model.Add(variable >= min_value).OnlyEnforceIf(constraint_variable)
+        model.Add(variable < min_value).OnlyEnforceIf(constraint_variable.Not())
 
     if threshold.max_value is not None:
         max_value: float = max(threshold.max_value, history)
         max_value = nutrition_utils.process_max_threshold_value(max_value) * multiplier
-        constraint_variable = planner_utils.get_constraint_variable(base_id)
-        variables[constraint_variable] = model.NewBoolVar(constraint_variable)
-        model.Add(variables[variable_name] <= max_value).OnlyEnforceIf(variables[constraint_variable])
-        model.Add(variables[variable_name] > max_value).OnlyEnforceIf(variables[constraint_variable].Not())
+        constraint_variable = variables.new_constraint(model, base_id, day)
+        model.Add(variable <= max_value).OnlyEnforceIf(constraint_variable)
+        model.Add(variable > max_value).OnlyEnforceIf(constraint_variable.Not())
 
     if enforce_exact:
-        model.Add(variables[constraint_variable] == 1)
+        model.Add(constraint_variable == 1)
 
 
-def setup_default_food_constraints(
-    model: cp_model.CpModel, variables: dict, variable_name: str, history: int = 0
-) -> None:
+def setup_default_food_constraints(model: cp_model.CpModel, variable: cp_model.IntVar, history: int = 0) -> None:
     """Setup default food constraints."""
-    model.Add(variables[variable_name] >= max(history, constants.DEFAULT_DAILY_FOOD_MIN_VALUE))
-    model.Add(variables[variable_name] <= max(history, constants.DEFAULT_DAILY_FOOD_MAX_VALUE))
+    model.Add(variable >= max(history, constants.DEFAULT_DAILY_FOOD_MIN_VALUE))
+    model.Add(variable <= max(history, constants.DEFAULT_DAILY_FOOD_MAX_VALUE))
 
 
 def get_threshold_intervals(
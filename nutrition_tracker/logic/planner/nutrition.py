@@ -8,9 +8,8 @@ from ortools.sat.python import cp_model
 from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import food_nutrient, user_prefs
 from nutrition_tracker.logic.planner import common as common_planner
+from nutrition_tracker.logic.planner import variables as planner_variables
 from nutrition_tracker.models import (
-    db_food_nutrient,
-    user_food_nutrient,
     user_ingredient,
     user_meal,
     user_preference,
@@ -22,81 +21,92 @@ from nutrition_tracker.utils import planner as planner_utils
 
 def setup_nutrition_constraints(  # pylint: disable=too-many-arguments
     model: cp_model.CpModel,
-    variables: dict,
+    variables: planner_variables.PlannerVariables,
     foods: list[user_ingredient.UserIngredient],
     recipes: list[user_recipe.UserRecipe],
     member_recipes: list[user_recipe.UserRecipe],
-    foods_nutrients: Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient],
+    foods_nutrients: Sequence[food_nutrient.FoodNutrientValue],
     nutrient_preferences: list[user_preference.UserPreference],
     today_meals: list[user_meal.UserMeal],
+    num_days: int = 1,
 ) -> None:
-    """Setup nutrition constraints."""
-    for nutrient_preference in nutrient_preferences:
-        if nutrient_preference.is_not_allowed():
-            continue
+    """Setup nutrition constraints, for each of num_days days. History from today_meals applies to the first day.
+    Nutrient coefficients are computed once and shared by all days."""
+    nutrient_preferences = [
+        nutrient_preference
+        for nutrient_preference in nutrient_preferences
+        if not nutrient_preference.is_not_allowed() and nutrient_preference.food_nutrient_id
+    ]
+    if not nutrient_preferences:
+        return
 
-        if not nutrient_preference.food_nutrient_id:
-            continue
+    nutrient_ids: list[int] = [nutrient_preference.food_nutrient_id for nutrient_preference in nutrient_preferences]
+    coefficients: list[list[int]] = _get_nutrient_coefficients(
+        foods, recipes, member_recipes, foods_nutrients, nutrient_ids
+    )
 
-        nutrient_id: int = nutrient_preference.food_nutrient_id
-        multiplier: int = constants.SCALING_FACTOR * constants.PORTION_SIZE
-        quantity_variable: str = planner_utils.get_quantity_variable(nutrient_id)
-        presence_variable: str = planner_utils.get_presence_variable(nutrient_id)
+    for day in range(1, num_days + 1):
+        # Food quantity variables, column aligned with coefficients.
+        quantity_variables: list[cp_model.IntVar] = [
+            variables.get_quantity(food.external_id, day) for food in foods
+        ] + [variables.get_quantity(recipe.external_id, day) for recipe in recipes]
+
+        for nutrient_preference, nutrient_coefficients in zip(nutrient_preferences, coefficients):
+            nutrient_id: int = nutrient_preference.food_nutrient_id  # type: ignore
+            multiplier: int = constants.SCALING_FACTOR * constants.PORTION_SIZE
+            presence_variable: cp_model.IntVar = model.NewBoolVar(
+                planner_utils.get_presence_variable(nutrient_id, day)
+            )
+            quantity_variable: cp_model.IntVar = model.NewIntVar(
+                constants.INT_MIN_VALUE,
+                constants.INT_MAX_VALUE * multiplier,
+                planner_utils.get_quantity_variable(nutrient_id, day),
+            )
+            variables.set_presence(nutrient_id, presence_variable, day=day)
+            variables.set_quantity(nutrient_id, quantity_variable, day=day)
 
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
-        variables[quantity_variable] = model.NewIntVar(
-            constants.INT_MIN_VALUE, constants.INT_MAX_VALUE * multiplier, quantity_variable
-        )
+            model.Add(quantity_variable == 0).OnlyEnforceIf(presence_variable.Not())
+            model.Add(quantity_variable > 0).OnlyEnforceIf(presence_variable)
+            model.Add(cp_model.LinearExpr.WeightedSum(quantity_variables, nutrient_coefficients) == quantity_variable)
 
-        model.Add(variables[quantity_variable] == 0).OnlyEnforceIf(variables[presence_variable].Not())
-        model.Add(variables[quantity_variable] > 0).OnlyEnforceIf(variables[presence_variable])
-        model.Add(
-            sum(
-                [
-                    sum(
-                        variables[planner_utils.get_quantity_variable(food.external_id)]
-                        * round(
-                            (
-                                food_nutrient.get_nutrient_amount_in_foods(
-                                    [food], foods_nutrients, nutrient_preference.food_nutrient_id
-                                )
-                                or 0
-                            )
-                            * constants.SCALING_FACTOR
-                        )
-                        for food in foods
-                    ),
-                    sum(
-                        variables[planner_utils.get_quantity_variable(recipe.external_id)]
-                        * round(
-                            (
-                                food_nutrient.get_nutrient_amount_in_lparents(
-                                    [recipe],
-                                    foods_nutrients,
-                                    nutrient_preference.food_nutrient_id,
-                                    member_recipes=member_recipes,
-                                )
-                                or 0
-                            )
-                            * constants.SCALING_FACTOR
-                        )
-                        for recipe in recipes
-                    ),
-                ]
+            _setup_history_constraints(
+                model, variables, foods_nutrients, nutrient_id, today_meals if day == 1 else [], day=day
             )
-            == variables[quantity_variable]
+            _setup_preference_constraints(model, variables, nutrient_preference, day=day)
+
+
+def _get_nutrient_coefficients(
+    foods: list[user_ingredient.UserIngredient],
+    recipes: list[user_recipe.UserRecipe],
+    member_recipes: list[user_recipe.UserRecipe],
+    foods_nutrients: Sequence[food_nutrient.FoodNutrientValue],
+    nutrient_ids: list[int],
+) -> list[list[int]]:
+    """Get scaled nutrient amounts, one row per nutrient ID and one column per food, then per recipe."""
+    foods_matrix: list[list[float | None]] = food_nutrient.get_nutrient_amounts_in_foods(
+        foods, foods_nutrients, nutrient_ids
+    )
+
+    recipes_matrix: list[list[float | None]] = food_nutrient.get_nutrient_amounts_in_lparents(
+        recipes, foods_nutrients, nutrient_ids, member_recipes=member_recipes
+    )
+
+    coefficients: list[list[int]] = []
+    for food_amounts, recipe_amounts in zip(foods_matrix, recipes_matrix):
+        coefficients.append(
+            [round((amount or 0) * constants.SCALING_FACTOR) for amount in food_amounts + recipe_amounts]
         )
 
-        _setup_history_constraints(model, variables, foods_nutrients, nutrient_id, today_meals)
-        _setup_preference_constraints(model, variables, nutrient_preference)
+    return coefficients
 
 
 def _setup_history_constraints(
     model: cp_model.CpModel,
-    variables: dict,
-    foods_nutrients: Sequence[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient],
+    variables: planner_variables.PlannerVariables,
+    foods_nutrients: Sequence[food_nutrient.FoodNutrientValue],
     nutrient_id: int,
     today_meals: list[user_meal.UserMeal],
+    day: int = 1,
 ) -> None:
     """Setup history constraints."""
     history_size: float | None = food_nutrient.get_nutrient_amount_in_lparents(
@@ -104,12 +114,14 @@ def _setup_history_constraints(
     )
     nutrient_amount_from_history: float = history_size or 0
     multiplier: int = constants.SCALING_FACTOR * constants.PORTION_SIZE
-    quantity_variable: str = planner_utils.get_quantity_variable(nutrient_id)
-    model.Add(variables[quantity_variable] >= round(multiplier * nutrient_amount_from_history))
+    model.Add(variables.get_quantity(nutrient_id, day) >= round(multiplier * nutrient_amount_from_history))
 
 
 def _setup_preference_constraints(
-    model: cp_model.CpModel, variables: dict, nutrient_preference: user_preference.UserPreference
+    model: cp_model.CpModel,
+    variables: planner_variables.PlannerVariables,
+    nutrient_preference: user_preference.UserPreference,
+    day: int = 1,
 ) -> None:
     """Setup user preference constraints."""
     if not nutrient_preference.food_nutrient_id:
@@ -122,14 +134,14 @@ def _setup_preference_constraints(
     if threshold:
         nutrient_id: int = nutrient_preference.food_nutrient_id
         multiplier: int = constants.SCALING_FACTOR * constants.PORTION_SIZE
-        quantity_variable: str = planner_utils.get_quantity_variable(nutrient_id)
         enforce_exact: bool = nutrient_id == constants.ENERGY_NUTRIENT_ID
         common_planner.setup_threshold_constraint_base(
             model,
             variables,
-            quantity_variable,
+            variables.get_quantity(nutrient_id, day),
             nutrient_id,
             threshold,
             multiplier=multiplier,
             enforce_exact=enforce_exact,
+            day=day,
         )
@@ -7,6 +7,7 @@ from ortools.sat.python import cp_model
 
 from nutrition_tracker.constants import constants
 from nutrition_tracker.logic.planner import category
+from nutrition_tracker.logic.planner import variables as planner_variables
 from nutrition_tracker.models import user_meal, user_preference
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.utils import planner as planner_utils
@@ -21,9 +22,9 @@ class TestLogicPlannerCategorySetupMemberCountThresholdConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         sum_variable = planner_utils.get_sum_variable(self.CATEGORY.id_)
-        variables[sum_variable] = model.NewIntVar(0, 100, sum_variable)
+        variables.set_sum(self.CATEGORY.id_, model.NewIntVar(0, 100, sum_variable))
         preference = user_preference.load_luser_preference(self.USER, food_category_id=self.CATEGORY.id_)
         preference_threshold = preference.userpreferencethreshold_set.all().first()
         preference_threshold.dimension = constants.Dimension.COUNT
@@ -53,9 +54,9 @@ class TestLogicPlannerCategorySetupSelfCountThresholdConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.CATEGORY.id_)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.CATEGORY.id_, model.NewBoolVar(presence_variable))
         preference = user_preference.load_luser_preference(self.USER, food_category_id=self.CATEGORY.id_)
         preference_threshold = preference.userpreferencethreshold_set.all().first()
         preference_threshold.dimension = constants.Dimension.COUNT
@@ -98,11 +99,11 @@ class TestLogicPlannerCategorySetupMemberQuantityThresholdConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.USER_INGREDIENT.external_id)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.USER_INGREDIENT.external_id, model.NewBoolVar(presence_variable))
         quantity_variable = planner_utils.get_quantity_variable(self.USER_INGREDIENT.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.USER_INGREDIENT.external_id, model.NewIntVar(0, 100, quantity_variable))
         preference = user_preference.load_luser_preference(self.USER, food_category_id=self.CATEGORY.id_)
         preference_threshold = preference.userpreferencethreshold_set.all().first()
         preference_threshold.dimension = constants.Dimension.QUANTITY
@@ -133,11 +134,11 @@ class TestLogicPlannerCategorySetupSelfQuantityThresholdConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.CATEGORY.id_)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.CATEGORY.id_, model.NewBoolVar(presence_variable))
         quantity_variable = planner_utils.get_quantity_variable(self.CATEGORY.id_)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.CATEGORY.id_, model.NewIntVar(0, 100, quantity_variable))
         preference = user_preference.load_luser_preference(self.USER, food_category_id=self.CATEGORY.id_)
         preference_threshold = preference.userpreferencethreshold_set.all().first()
         preference_threshold.dimension = constants.Dimension.QUANTITY
@@ -215,11 +216,11 @@ class TestLogicPlannerCategorySetupHistoryConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         quantity_variable = planner_utils.get_quantity_variable(self.CATEGORY.id_)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.CATEGORY.id_, model.NewIntVar(0, 100, quantity_variable))
         sum_variable = planner_utils.get_sum_variable(self.CATEGORY.id_)
-        variables[sum_variable] = model.NewIntVar(0, 100, sum_variable)
+        variables.set_sum(self.CATEGORY.id_, model.NewIntVar(0, 100, sum_variable))
         todays_lmeals = user_meal.load_lmeals(self.USER, external_ids=[self.USER_MEAL.external_id])
 
         category._setup_history_constraints(model, variables, self.CATEGORY, [self.USER_INGREDIENT], todays_lmeals)
@@ -246,11 +247,11 @@ class TestLogicPlannerCategorySetupCategoryConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.USER_INGREDIENT.external_id)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.USER_INGREDIENT.external_id, model.NewBoolVar(presence_variable))
         quantity_variable = planner_utils.get_quantity_variable(self.USER_INGREDIENT.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.USER_INGREDIENT.external_id, model.NewIntVar(0, 100, quantity_variable))
         todays_lmeals = user_meal.load_lmeals(self.USER, external_ids=[self.USER_MEAL.external_id])
 
         category.setup_category_constraints(
@@ -3,7 +3,9 @@ from __future__ import annotations
 from django.test import TestCase
 from ortools.sat.python import cp_model
 
+from nutrition_tracker.logic import data_loaders
 from nutrition_tracker.logic.planner import common
+from nutrition_tracker.logic.planner import variables as planner_variables
 from nutrition_tracker.models import user_meal, user_preference, user_preference_threshold
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.utils import planner as planner_utils
@@ -28,7 +30,7 @@ class TestLogicPlannerCommonRestrictToRepeatableOrUnused(TestCase):
             self.USER_RECIPE.external_id,
         ]
         preferences = [p1, p2, p3]
-        self.assertCountEqual(external_ids, common.restrict_to_repeatable_or_unused(external_ids, preferences, [], []))
+        self.assertCountEqual(external_ids, common.restrict_to_repeatable_or_unused(external_ids, preferences, set()))
 
     def test_with_repeatable_items(self):
         p1 = test_objects.get_user_preference()
@@ -44,7 +46,9 @@ class TestLogicPlannerCommonRestrictToRepeatableOrUnused(TestCase):
         self.assertCountEqual(
             external_ids,
             common.restrict_to_repeatable_or_unused(
-                external_ids, preferences, [self.USER_INGREDIENT, self.USER_INGREDIENT_2], [self.USER_RECIPE]
+                external_ids,
+                preferences,
+                {self.USER_INGREDIENT.external_id, self.USER_INGREDIENT_2.external_id, self.USER_RECIPE.external_id},
             ),
         )
 
@@ -67,7 +71,7 @@ class TestLogicPlannerCommonRestrictToRepeatableOrUnused(TestCase):
             self.USER_RECIPE.external_id,
         ]
         preferences = [p1, p2, p3]
-        self.assertCountEqual(external_ids, common.restrict_to_repeatable_or_unused(external_ids, preferences, [], []))
+        self.assertCountEqual(external_ids, common.restrict_to_repeatable_or_unused(external_ids, preferences, set()))
 
     def test_with_non_repeatable_with_previously_consumed_items(self):
         p1 = user_preference.create(self.USER, food_external_id=self.USER_INGREDIENT.external_id)
@@ -84,7 +88,9 @@ class TestLogicPlannerCommonRestrictToRepeatableOrUnused(TestCase):
         self.assertCountEqual(
             external_ids,
             common.restrict_to_repeatable_or_unused(
-                external_ids, preferences, [self.USER_INGREDIENT, self.USER_INGREDIENT_2], [self.USER_RECIPE]
+                external_ids,
+                preferences,
+                {self.USER_INGREDIENT.external_id, self.USER_INGREDIENT_2.external_id, self.USER_RECIPE.external_id},
             ),
         )
 
@@ -101,14 +107,22 @@ class TestLogicPlannerCommonAddFromHistory(TestCase):
         test_objects.get_user_food_membership(cls.USER_MEAL, cls.USER_INGREDIENT_2)
         test_objects.get_user_food_membership(cls.USER_MEAL, cls.USER_RECIPE)
 
+    def _get_member_external_ids(self):
+        return {
+            (data_loaders.get_content_type_ingredient_id(), self.USER_INGREDIENT.id): self.USER_INGREDIENT.external_id,
+            (
+                data_loaders.get_content_type_ingredient_id(),
+                self.USER_INGREDIENT_2.id,
+            ): self.USER_INGREDIENT_2.external_id,
+            (data_loaders.get_content_type_recipe_id(), self.USER_RECIPE.id): self.USER_RECIPE.external_id,
+        }
+
     def test_add_from_history_no_meals(self):
-        self.assertCountEqual([], common.add_from_history([], [], [self.USER_INGREDIENT], [self.USER_RECIPE]))
+        self.assertCountEqual([], common.add_from_history([], [], self._get_member_external_ids()))
 
     def test_add_from_history_with_meals(self):
         todays_lmeals = user_meal.load_lmeals(self.USER, external_ids=[self.USER_MEAL_2.external_id])
-        self.assertCountEqual(
-            [], common.add_from_history([], todays_lmeals, [self.USER_INGREDIENT], [self.USER_RECIPE])
-        )
+        self.assertCountEqual([], common.add_from_history([], todays_lmeals, self._get_member_external_ids()))
 
     def test_add_from_history_with_meals_extra_foods(self):
         external_ids = [self.USER_INGREDIENT_2.external_id, self.USER_RECIPE.external_id]
@@ -117,25 +131,23 @@ class TestLogicPlannerCommonAddFromHistory(TestCase):
         )
         self.assertCountEqual(
             list(external_ids),
-            common.add_from_history(
-                [], todays_lmeals, [self.USER_INGREDIENT, self.USER_INGREDIENT_2], [self.USER_RECIPE]
-            ),
+            common.add_from_history([], todays_lmeals, self._get_member_external_ids()),
         )
 
 
 class TestLogicPlannerCommonSetupThresholdConstraintBase(TestCase):
     def test_threshold_exact(self):
         model = cp_model.CpModel()
-        variables = {}
-        variable_name = "test"
-        variables[variable_name] = model.NewIntVar(0, 100, variable_name)
+        variables = planner_variables.PlannerVariables()
+        variable = model.NewIntVar(0, 100, "test")
         base_id = 123
         threshold = user_preference_threshold.UserPreferenceThreshold(exact_value=43)
-        common.setup_threshold_constraint_base(model, variables, variable_name, base_id, threshold)
+        common.setup_threshold_constraint_base(model, variables, variable, base_id, threshold)
         model_proto = model.Proto()
         self.assertEqual(2, len(model_proto.constraints))
         self.assertEqual(2, len(model_proto.variables))
         self.assertTrue(planner_utils.is_constraint_variable(model_proto.variables[1].name))
+        self.assertEqual(1, len(variables.get_constraint_variables()))
         self.assertEqual(1, model_proto.constraints[0].enforcement_literal[0])
         self.assertEqual(43, model_proto.constraints[0].linear.domain[0])
         self.assertEqual(43, model_proto.constraints[0].linear.domain[1])
@@ -147,12 +159,11 @@ class TestLogicPlannerCommonSetupThresholdConstraintBase(TestCase):
 
     def test_threshold_min(self):
         model = cp_model.CpModel()
-        variables = {}
-        variable_name = "test"
-        variables[variable_name] = model.NewIntVar(0, 100, variable_name)
+        variables = planner_variables.PlannerVariables()
+        variable = model.NewIntVar(0, 100, "test")
         base_id = 123
         threshold = user_preference_threshold.UserPreferenceThreshold(min_value=43)
-        common.setup_threshold_constraint_base(model, variables, variable_name, base_id, threshold)
+        common.setup_threshold_constraint_base(model, variables, variable, base_id, threshold)
         model_proto = model.Proto()
         self.assertEqual(2, len(model_proto.constraints))
         self.assertEqual(2, len(model_proto.variables))
@@ -166,13 +177,12 @@ class TestLogicPlannerCommonSetupThresholdConstraintBase(TestCase):
 
     def test_threshold_max(self):
         model = cp_model.CpModel()
-        variables = {}
-        variable_name = "test"
-        variables[variable_name] = model.NewIntVar(0, 100, variable_name)
+        variables = planner_variables.PlannerVariables()
+        variable = model.NewIntVar(0, 100, "test")
         base_id = 123
         threshold = user_preference_threshold.UserPreferenceThreshold(max_value=43)
         common.setup_threshold_constraint_base(
-            model, variables, variable_name, base_id, threshold, history=53, multiplier=2, enforce_exact=True
+            model, variables, variable, base_id, threshold, history=53, multiplier=2, enforce_exact=True
         )
         model_proto = model.Proto()
         self.assertEqual(3, len(model_proto.constraints))
@@ -191,11 +201,9 @@ class TestLogicPlannerCommonSetupThresholdConstraintBase(TestCase):
 class TestLogicPlannerCommonSetupDefaultFoodConstraints(TestCase):
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
-        variable_name = "test"
-        variables[variable_name] = model.NewIntVar(0, 100, variable_name)
+        variable = model.NewIntVar(0, 100, "test")
         history = 53
-        common.setup_default_food_constraints(model, variables, variable_name, history)
+        common.setup_default_food_constraints(model, variable, history)
 
         model_proto = model.Proto()
         self.assertEqual(2, len(model_proto.constraints))
@@ -8,6 +8,7 @@ from ortools.sat.python import cp_model
 from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import data_loaders
 from nutrition_tracker.logic.planner import food
+from nutrition_tracker.logic.planner import variables as planner_variables
 from nutrition_tracker.models import user_meal, user_preference, user_recipe
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.utils import planner as planner_utils
@@ -22,9 +23,9 @@ class TestLogicPlannerFoodSetupCountThresholdConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.USER_INGREDIENT.external_id)
-        variables[presence_variable] = model.NewIntVar(0, 100, presence_variable)
+        variables.set_presence(self.USER_INGREDIENT.external_id, model.NewIntVar(0, 100, presence_variable))
         preference = user_preference.load_luser_preference(
             self.USER, food_external_id=self.PREFERENCE.food_external_id
         )
@@ -57,9 +58,9 @@ class TestLogicPlannerFoodSetupQuantityThresholdConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.USER_INGREDIENT.external_id)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.USER_INGREDIENT.external_id, model.NewBoolVar(presence_variable))
         preference = user_preference.load_luser_preference(
             self.USER, food_external_id=self.PREFERENCE.food_external_id
         )
@@ -79,11 +80,11 @@ class TestLogicPlannerFoodSetupQuantityThresholdConstraints(TestCase):
 
     def test_setup_with_history(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.USER_INGREDIENT.external_id)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.USER_INGREDIENT.external_id, model.NewBoolVar(presence_variable))
         quantity_variable = planner_utils.get_quantity_variable(self.USER_INGREDIENT.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.USER_INGREDIENT.external_id, model.NewIntVar(0, 100, quantity_variable))
         preference = user_preference.load_luser_preference(
             self.USER, food_external_id=self.PREFERENCE.food_external_id
         )
@@ -114,6 +115,41 @@ class TestLogicPlannerFoodSetupPreferenceConstraints(TestCase):
         self.assertTrue(mock.called)
 
 
+class TestLogicPlannerFoodSetupRepeatConstraints(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        cls.PREFERENCE = test_objects.get_user_preference()
+
+    def _get_variables(self, model, num_days):
+        variables = planner_variables.PlannerVariables()
+        for day in range(1, num_days + 1):
+            presence_variable = planner_utils.get_presence_variable(self.USER_INGREDIENT.external_id, day)
+            variables.set_presence(self.USER_INGREDIENT.external_id, model.NewBoolVar(presence_variable), day=day)
+        return variables
+
+    def test_repeatable_noop(self):
+        model = cp_model.CpModel()
+        food._setup_repeat_constraints(model, self._get_variables(model, 3), self.USER_INGREDIENT, self.PREFERENCE, 3)
+        self.assertEqual(0, len(model.Proto().constraints))
+
+    def test_not_repeatable(self):
+        self.PREFERENCE.add_flag(user_preference.FLAG_IS_NOT_REPEATABLE)
+        model = cp_model.CpModel()
+        food._setup_repeat_constraints(model, self._get_variables(model, 3), self.USER_INGREDIENT, self.PREFERENCE, 3)
+        model_proto = model.Proto()
+        self.assertEqual(2, len(model_proto.constraints))
+        self.assertEqual([0, 1], list(model_proto.constraints[0].linear.vars))
+        self.assertEqual([1, 2], list(model_proto.constraints[1].linear.vars))
+
+    def test_not_repeatable_not_zeroable(self):
+        self.PREFERENCE.add_flag(user_preference.FLAG_IS_NOT_REPEATABLE)
+        self.PREFERENCE.add_flag(user_preference.FLAG_IS_NOT_ZEROABLE)
+        model = cp_model.CpModel()
+        food._setup_repeat_constraints(model, self._get_variables(model, 3), self.USER_INGREDIENT, self.PREFERENCE, 3)
+        self.assertEqual(4, len(model.Proto().constraints))
+
+
 class TestLogicPlannerFoodSetupAvailableQuantityConstraints(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -122,20 +158,20 @@ class TestLogicPlannerFoodSetupAvailableQuantityConstraints(TestCase):
 
     def test_food_noop(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         object_type_id = data_loaders.get_content_type_ingredient_id()
         food._setup_available_quantity_constraints(model, variables, self.USER_INGREDIENT, object_type_id)
         self.assertEqual(f"{model.Proto()}", "")
 
     def test_recipe_constraints(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         lrecipe = test_objects.get_recipe()
         test_objects.get_user_recipe_portion()
         lrecipe = user_recipe.load_lrecipe(self.USER, external_id=lrecipe.external_id)
         object_type_id = data_loaders.get_content_type_recipe_id()
         quantity_variable = planner_utils.get_quantity_variable(lrecipe.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(lrecipe.external_id, model.NewIntVar(0, 100, quantity_variable))
         food._setup_available_quantity_constraints(model, variables, lrecipe, object_type_id)
         model_proto = model.Proto()
         self.assertEqual(cp_model.INT_MIN, model_proto.constraints[0].linear.domain[0])
@@ -154,9 +190,9 @@ class TestLogicPlannerFoodSetupHistoryConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         quantity_variable = planner_utils.get_quantity_variable(self.USER_INGREDIENT.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.USER_INGREDIENT.external_id, model.NewIntVar(0, 100, quantity_variable))
         todays_lmeals = user_meal.load_lmeals(self.USER, external_ids=[self.USER_MEAL.external_id])
         object_type_id = data_loaders.get_content_type_ingredient_id()
         food._setup_history_constraints(model, variables, self.USER_INGREDIENT, todays_lmeals, object_type_id)
@@ -181,7 +217,7 @@ class TestLogicPlannerFoodSetupFoodConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         todays_lmeals = user_meal.load_lmeals(self.USER, external_ids=[self.USER_MEAL.external_id])
         object_type_id = data_loaders.get_content_type_ingredient_id()
         food.setup_food_constraints(
@@ -191,3 +227,50 @@ class TestLogicPlannerFoodSetupFoodConstraints(TestCase):
         model_proto = model.Proto()
         self.assertEqual(6, len(model_proto.constraints))
         self.assertEqual(3, len(model_proto.variables))
+
+
+class TestLogicPlannerFoodSetupFoodConstraintsMultiDay(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        cls.PREFERENCE = test_objects.get_user_preference()
+
+    def _solve(self, num_days):
+        model = cp_model.CpModel()
+        variables = planner_variables.PlannerVariables()
+        food.setup_food_constraints(
+            model,
+            variables,
+            [self.USER_INGREDIENT],
+            [self.PREFERENCE],
+            [],
+            data_loaders.get_content_type_ingredient_id(),
+            num_days=num_days,
+        )
+        solver = cp_model.CpSolver()
+        status = solver.Solve(model)
+        presence = (
+            [
+                solver.Value(variables.get_presence(self.USER_INGREDIENT.external_id, day))
+                for day in range(1, num_days + 1)
+            ]
+            if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
+            else []
+        )
+        return status, presence
+
+    def test_not_zeroable(self):
+        self.PREFERENCE.add_flag(user_preference.FLAG_IS_NOT_ZEROABLE)
+        status, presence = self._solve(3)
+        self.assertIn(status, [cp_model.OPTIMAL, cp_model.FEASIBLE])
+        self.assertEqual([1, 1, 1], presence)
+
+    def test_not_repeatable_not_zeroable(self):
+        self.PREFERENCE.add_flag(user_preference.FLAG_IS_NOT_REPEATABLE)
+        self.PREFERENCE.add_flag(user_preference.FLAG_IS_NOT_ZEROABLE)
+        for num_days in [2, 3]:
+            status, presence = self._solve(num_days)
+            self.assertIn(status, [cp_model.OPTIMAL, cp_model.FEASIBLE])
+            # Planned every other day.
+            for day in range(1, num_days):
+                self.assertEqual(1, presence[day - 1] + presence[day])
@@ -6,6 +6,7 @@ from ortools.sat.python import cp_model
 from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import food_nutrient
 from nutrition_tracker.logic.planner import nutrition
+from nutrition_tracker.logic.planner import variables as planner_variables
 from nutrition_tracker.models import user_meal, user_preference
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.utils import planner as planner_utils
@@ -24,9 +25,9 @@ class TestLogicPlannerNutritionSetupNutritionConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         quantity_variable = planner_utils.get_quantity_variable(self.USER_INGREDIENT.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.USER_INGREDIENT.external_id, model.NewIntVar(0, 100, quantity_variable))
         foods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods=[self.USER_INGREDIENT])
         todays_lmeals = user_meal.load_lmeals(self.USER, external_ids=[self.USER_MEAL.external_id])
         preference = user_preference.load_luser_preference(
@@ -55,8 +56,8 @@ class TestLogicPlannerNutritionSetupHistoryConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
-        variables["1008:q1"] = model.NewIntVar(0, 100, "1008:q1")
+        variables = planner_variables.PlannerVariables()
+        variables.set_quantity(constants.ENERGY_NUTRIENT_ID, model.NewIntVar(0, 100, "1008:q1"))
         foods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods=[self.USER_INGREDIENT])
         todays_lmeals = user_meal.load_lmeals(self.USER, external_ids=[self.USER_MEAL.external_id])
         nutrition._setup_history_constraints(
@@ -77,8 +78,8 @@ class TestLogicPlannerNutritionSetupPreferenceConstraints(TestCase):
 
     def test_setup(self):
         model = cp_model.CpModel()
-        variables = {}
-        variables["1008:q1"] = model.NewIntVar(0, 100, "1008:q1")
+        variables = planner_variables.PlannerVariables()
+        variables.set_quantity(constants.ENERGY_NUTRIENT_ID, model.NewIntVar(0, 100, "1008:q1"))
         preference = user_preference.load_luser_preference(
             self.USER, food_nutrient_id=self.PREFERENCE.food_nutrient_id
         )
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from django.test import TestCase
+from ortools.sat.python import cp_model
+
+from nutrition_tracker.logic.planner import variables as planner_variables
+
+
+class TestLogicPlannerVariablesPlannerVariables(TestCase):
+    def test_variables(self):
+        model = cp_model.CpModel()
+        variables = planner_variables.PlannerVariables()
+        quantity_variable = model.NewIntVar(0, 100, "1:q1")
+        presence_variable = model.NewBoolVar("1:p1")
+        sum_variable = model.NewIntVar(0, 100, "2:s2")
+        variables.set_quantity(1, quantity_variable)
+        variables.set_presence(1, presence_variable)
+        variables.set_sum(2, sum_variable, day=2)
+
+        self.assertIs(quantity_variable, variables.get_quantity(1))
+        self.assertIs(presence_variable, variables.get_presence(1))
+        self.assertIs(sum_variable, variables.get_sum(2, day=2))
+        self.assertTrue(variables.has_presence(1))
+        self.assertFalse(variables.has_presence(1, day=2))
+        self.assertFalse(variables.has_presence(2))
+        self.assertEqual([], variables.get_constraint_variables())
+
+    def test_missing_variable(self):
+        variables = planner_variables.PlannerVariables()
+        with self.assertRaises(KeyError):
+            variables.get_quantity(1)
+
+    def test_redefine_variable(self):
+        model = cp_model.CpModel()
+        variables = planner_variables.PlannerVariables()
+        variables.set_quantity(1, model.NewIntVar(0, 100, "1:q1"))
+        redefined_variable = model.NewIntVar(0, 10, "1:q1")
+        variables.set_quantity(1, redefined_variable)
+
+        self.assertIs(redefined_variable, variables.get_quantity(1))
+
+    def test_new_constraint(self):
+        model = cp_model.CpModel()
+        variables = planner_variables.PlannerVariables()
+        constraint_variable = variables.new_constraint(model, 1)
+        constraint_variable_2 = variables.new_constraint(model, 1)
+
+        self.assertEqual([constraint_variable, constraint_variable_2], variables.get_constraint_variables())
+        self.assertEqual("1:c1", constraint_variable.Name())
+
+    def test_objective(self):
+        model = cp_model.CpModel()
+        variables = planner_variables.PlannerVariables()
+        variables.set_quantity(1, model.NewIntVar(0, 100, "1:q1"))
+        for _unused in range(2):
+            variables.new_constraint(model, 1)
+
+        model.Maximize(variables.get_objective())
+        solver = cp_model.CpSolver()
+        self.assertEqual(cp_model.OPTIMAL, solver.Solve(model))
+        self.assertEqual(2, solver.ObjectiveValue())
@@ -0,0 +1,114 @@
+"""Variables logic module for mealplanning."""
+from __future__ import annotations
+
+from typing import Union
+from uuid import UUID
+
+from ortools.sat.python import cp_model
+
+from nutrition_tracker.utils import planner as planner_utils
+
+# Foods and recipes are planned by external ID, categories and nutrients by ID.
+ItemId = Union[int, str, UUID]
+
+
+class PlannerVariables:
+    """CP model variables for a mealplan.
+
+    Items (foods, recipes, categories and nutrients) are numbered as they are first used. Their quantity,
+    presence and sum variables are stored by (item index, day). Constraint variables are kept in a separate
+    list, the objective is their sum."""
+
+    def __init__(self) -> None:
+        self._item_ids: list[ItemId] = []
+        self._item_indexes: dict[ItemId, int] = {}
+        self._quantity_variables: dict[tuple[int, int], cp_model.IntVar] = {}
+        self._presence_variables: dict[tuple[int, int], cp_model.IntVar] = {}
+        self._sum_variables: dict[tuple[int, int], cp_model.IntVar] = {}
+        self._constraint_variables: list[cp_model.IntVar] = []
+
+    def _get_key(self, item_id: ItemId, day: int, add: bool = False) -> tuple[int, int]:
+        if not add:
+            return self._item_indexes[item_id], day
+
+        index: int | None = self._item_indexes.get(item_id)
+        if index is None:
+            index = len(self._item_ids)
+            self._item_indexes[item_id] = index
+            self._item_ids.append(item_id)
+
+        return index, day
+
+    def get_quantity(self, item_id: ItemId, day: int = 1) -> cp_model.IntVar:
+        """Get the quantity variable of an item."""
+        return self._quantity_variables[self._get_key(item_id, day)]
+
+    def set_quantity(self, item_id: ItemId, variable: cp_model.IntVar, day: int = 1) -> None:
+        """Set the quantity variable of an item, replacing any previous one e.g. with a narrower domain."""
+        self._quantity_variables[self._get_key(item_id, day, add=True)] = variable
+
+    def get_presence(self, item_id: ItemId, day: int = 1) -> cp_model.IntVar:
+        """Get the presence variable of an item."""
+        return self._presence_variables[self._get_key(item_id, day)]
+
+    def set_presence(self, item_id: ItemId, variable: cp_model.IntVar, day: int = 1) -> None:
+        """Set the presence variable of an item."""
+        self._presence_variables[self._get_key(item_id, day, add=True)] = variable
+
+    def has_presence(self, item_id: ItemId, day: int = 1) -> bool:
+        """Is the item planned on day."""
+        index: int | None = self._item_indexes.get(item_id)
+        return index is not None and (index, day) in self._presence_variables
+
+    def get_sum(self, item_id: ItemId, day: int = 1) -> cp_model.IntVar:
+        """Get the sum variable of an item."""
+        return self._sum_variables[self._get_key(item_id, day)]
+
+    def set_sum(self, item_id: ItemId, variable: cp_model.IntVar, day: int = 1) -> None:
+        """Set the sum variable of an item."""
+        self._sum_variables[self._get_key(item_id, day, add=True)] = variable
+
+    def new_constraint(self, model: cp_model.CpModel, item_id: ItemId, day: int = 1) -> cp_model.IntVar:
+        """Add a constraint variable for an item, true if the constraint is satisfied."""
+        variable: cp_model.IntVar = model.NewBoolVar(planner_utils.get_constraint_variable(item_id, day))
+        self._constraint_variables.append(variable)
+        return variable
+
+    def get_constraint_variables(self) -> list[cp_model.IntVar]:
+        """Get all constraint variables."""
+        return self._constraint_variables
+
+    def get_objective(self) -> cp_model.LinearExpr:
+        """Get the mealplan objective, the number of satisfied constraints."""
+        return cp_model.LinearExpr.Sum(self._constraint_variables)
+
+    def get_hints(self, solver: cp_model.CpSolver) -> dict[str, int]:
+        """Get presence and quantity variable values from a solved model, by variable name.
+        Names are stable across models, unlike item indexes."""
+        hints: dict[str, int] = {}
+        for (index, day), variable in self._presence_variables.items():
+            hints[planner_utils.get_presence_variable(self._item_ids[index], day)] = solver.Value(variable)
+        for (index, day), variable in self._quantity_variables.items():
+            hints[planner_utils.get_quantity_variable(self._item_ids[index], day)] = solver.Value(variable)
+
+        return hints
+
+    def add_hints(self, model: cp_model.CpModel, hints: dict[str, int]) -> int:
+        """Add solution hints for variables in the model, returns the number of hints added.
+        Hints for items no longer in the model are skipped."""
+        if not hints:
+            return 0
+
+        count: int = 0
+        for (index, day), variable in self._presence_variables.items():
+            value: int | None = hints.get(planner_utils.get_presence_variable(self._item_ids[index], day))
+            if value is not None:
+                model.AddHint(variable, value)
+                count += 1
+        for (index, day), variable in self._quantity_variables.items():
+            value = hints.get(planner_utils.get_quantity_variable(self._item_ids[index], day))
+            if value is not None:
+                model.AddHint(variable, value)
+                count += 1
+
+        return count
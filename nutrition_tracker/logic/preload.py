@@ -0,0 +1,51 @@
+"""Serializer preload logic module.
+
+Views batch load the foods, recipes and nutrients referenced by the meals/recipes they render,
+and pass them to display serializers through context. Serializers then don't reload them per member."""
+from __future__ import annotations
+
+from typing import Any, Mapping, Sequence
+
+import users.models as user_model
+from nutrition_tracker.logic import data_loaders, food_nutrient
+from nutrition_tracker.models import user_ingredient, user_meal, user_recipe
+
+PRELOAD_KEY = "preload"
+
+
+class Preload:
+    """Foods, recipes and food nutrients in a list of parents - recipes/meals, including nested recipes."""
+
+    def __init__(
+        self,
+        lfoods: Sequence[user_ingredient.UserIngredient],
+        lrecipes: Sequence[user_recipe.UserRecipe],
+        food_nutrients: list[food_nutrient.FoodNutrientValue],
+    ) -> None:
+        self.lfoods: dict[int, user_ingredient.UserIngredient] = {lfood.id: lfood for lfood in lfoods}
+        self.lrecipes: dict[int, user_recipe.UserRecipe] = {lrecipe.id: lrecipe for lrecipe in lrecipes}
+        self.lmember_recipes: list[user_recipe.UserRecipe] = list(lrecipes)
+        self.food_nutrients = food_nutrients
+
+
+def load_preload(
+    user: user_model.User, lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal]
+) -> Preload:
+    """Batch load foods, recipes and food nutrients in a list of parents."""
+    graph: data_loaders.MemberGraph = data_loaders.load_member_graph(user, lparents)
+    lfoods: list[user_ingredient.UserIngredient] = list(graph.lfoods.values())
+    lrecipes: list[user_recipe.UserRecipe] = list(graph.lrecipes.values())
+    return Preload(lfoods, lrecipes, food_nutrient.get_foods_nutrients(user, lfoods) if lfoods else [])
+
+
+def get_context(
+    user: user_model.User, lparents: Sequence[user_recipe.UserRecipe] | Sequence[user_meal.UserMeal]
+) -> dict[str, Preload]:
+    """Serializer context for displaying lparents."""
+    return {PRELOAD_KEY: load_preload(user, lparents)}
+
+
+def get_preload(context: Mapping[str, Any]) -> Preload | None:
+    """Get preload from serializer context, None if the view didn't preload."""
+    return context.get(PRELOAD_KEY)
+
@@ -5,6 +5,7 @@ from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
 from django.db.models import Case, Q, QuerySet, When
 
 from nutrition_tracker.constants import constants
+from nutrition_tracker.database import routers
 from nutrition_tracker.models import search_result
 
 
@@ -69,9 +70,9 @@ def search(query: str | None, raw: bool = False) -> QuerySet[search_result.Searc
         .order_by("-rank1", "-rank0", "-similarity")
     )
 
-    return qs
+    return routers.using_replica(qs)
 
 
 def search_barcode(barcode: str) -> QuerySet[search_result.SearchResult]:
     """Search barcode over foods index."""
-    return search_result.load_results(gtin_upc=barcode)
+    return routers.using_replica(search_result.load_results(gtin_upc=barcode))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 
 from nutrition_tracker.logic import data_loaders
-from nutrition_tracker.models import user_meal, user_recipe
+from nutrition_tracker.models import user_food_membership, user_ingredient, user_meal, user_recipe
 from nutrition_tracker.tests import objects as test_objects
 
 
@@ -107,3 +108,122 @@ class TestLogicDataLoaders(TestCase):
         self.assertQuerysetEqual(
             data_loaders.load_lrecipes_for_lparents(self.USER, [lmeal]), set({lrecipe, lrecipe_2}), ordered=False
         )
+
+    def test_get_member_closure_no_parents(self):
+        self.assertEqual([], data_loaders.get_member_closure(data_loaders.get_content_type_meal_id(), []))
+
+    def test_get_member_closure(self):
+        lfood = test_objects.get_user_ingredient()
+        lfood_2 = test_objects.get_user_ingredient_2()
+        lrecipe = test_objects.get_recipe()
+        lrecipe_2 = test_objects.get_recipe_2()
+        lmeal = test_objects.get_meal_today_1()
+        test_objects.get_user_food_membership(lmeal, lfood)
+        test_objects.get_user_food_membership(lmeal, lrecipe)
+        test_objects.get_user_food_membership(lrecipe, lrecipe_2)
+        test_objects.get_user_food_membership(lrecipe_2, lfood_2)
+        # Cycles terminate.
+        test_objects.get_user_food_membership(lrecipe_2, lrecipe)
+
+        ingredient_type_id = data_loaders.get_content_type_ingredient_id()
+        recipe_type_id = data_loaders.get_content_type_recipe_id()
+        self.assertCountEqual(
+            [
+                data_loaders.Member(lmeal.id, ingredient_type_id, lfood.id, lfood.external_id),
+                data_loaders.Member(lmeal.id, recipe_type_id, lrecipe.id, lrecipe.external_id),
+                data_loaders.Member(lmeal.id, recipe_type_id, lrecipe_2.id, lrecipe_2.external_id),
+                data_loaders.Member(lmeal.id, ingredient_type_id, lfood_2.id, lfood_2.external_id),
+            ],
+            data_loaders.get_member_closure(data_loaders.get_content_type_meal_id(), [lmeal.id]),
+        )
+        self.assertCountEqual(
+            [
+                data_loaders.Member(lrecipe_2.id, recipe_type_id, lrecipe.id, lrecipe.external_id),
+                data_loaders.Member(lrecipe_2.id, recipe_type_id, lrecipe_2.id, lrecipe_2.external_id),
+                data_loaders.Member(lrecipe_2.id, ingredient_type_id, lfood_2.id, lfood_2.external_id),
+            ],
+            data_loaders.get_member_closure(recipe_type_id, [lrecipe_2.id]),
+        )
+
+    def test_get_lfood_ids_for_nested_recipes(self):
+        lfood = test_objects.get_user_ingredient()
+        lfood_2 = test_objects.get_user_ingredient_2()
+        lrecipe = test_objects.get_recipe()
+        lrecipe_2 = test_objects.get_recipe_2()
+        lmeal = test_objects.get_meal_today_1()
+        test_objects.get_user_food_membership(lmeal, lrecipe)
+        test_objects.get_user_food_membership(lrecipe, lfood)
+        test_objects.get_user_food_membership(lrecipe, lrecipe_2)
+        test_objects.get_user_food_membership(lrecipe_2, lfood_2)
+
+        lmeal = user_meal.load_lmeal(self.USER, id_=lmeal.id)
+        with self.assertNumQueries(1):
+            self.assertEqual({lfood.id, lfood_2.id}, data_loaders.get_lfood_ids_for_lparents(self.USER, [lmeal]))
+        with self.assertNumQueries(1):
+            self.assertEqual({lrecipe.id, lrecipe_2.id}, data_loaders.get_lrecipe_ids_for_lparents(self.USER, [lmeal]))
+
+    def test_load_member_graph_no_parents(self):
+        with self.assertNumQueries(0):
+            graph = data_loaders.load_member_graph(self.USER, [])
+
+        self.assertEqual({}, graph.lfoods)
+        self.assertEqual({}, graph.lrecipes)
+        self.assertEqual({}, graph.members)
+
+    def test_load_member_graph(self):
+        lfood = test_objects.get_user_ingredient()
+        lfood_2 = test_objects.get_user_ingredient_2()
+        lrecipe = test_objects.get_recipe()
+        lrecipe_2 = test_objects.get_recipe_2()
+        lmeal = test_objects.get_meal_today_1()
+        test_objects.get_user_food_membership(lmeal, lfood)
+        ufm = test_objects.get_user_food_membership(lmeal, lrecipe)
+        ufmp = test_objects.get_user_food_membership_portion(ufm)
+        test_objects.get_user_food_membership(lrecipe, lrecipe_2)
+        test_objects.get_user_food_membership(lrecipe_2, lfood_2)
+
+        lmeal = user_meal.load_lmeal(self.USER, id_=lmeal.id)
+        graph = data_loaders.load_member_graph(self.USER, [lmeal])
+        self.assertEqual({lfood.id, lfood_2.id}, set(graph.lfoods))
+        self.assertEqual({lrecipe.id, lrecipe_2.id}, set(graph.lrecipes))
+        self.assertEqual([ufmp], graph.portions[ufm.id])
+        with self.assertNumQueries(0):
+            self.assertEqual(2, len(graph.get_members(lmeal)))
+            self.assertEqual(
+                [lrecipe_2.id], [lmember.child_id for lmember in graph.get_members(graph.lrecipes[lrecipe.id])]
+            )
+            self.assertEqual([lfood_2.id], [lmember.child_id for lmember in graph.get_members(lrecipe_2)])
+
+    def test_content_type_ids(self):
+        self.assertEqual(
+            ContentType.objects.get_for_model(user_ingredient.UserIngredient).id,
+            data_loaders.get_content_type_ingredient_id(),
+        )
+        self.assertEqual(
+            ContentType.objects.get_for_model(user_recipe.UserRecipe).id, data_loaders.get_content_type_recipe_id()
+        )
+        self.assertEqual(
+            ContentType.objects.get_for_model(user_meal.UserMeal).id, data_loaders.get_content_type_meal_id()
+        )
+        self.assertEqual(
+            ContentType.objects.get_for_model(user_food_membership.UserFoodMembership).id,
+            data_loaders.get_content_type_membership_id(),
+        )
+        self.assertEqual(
+            data_loaders.get_content_type_recipe_id(), data_loaders.get_content_type_id(user_recipe.UserRecipe)
+        )
+
+    def test_content_type_ids_resolved_once(self):
+        data_loaders.get_content_type_ingredient_id()
+        with self.assertNumQueries(0):
+            data_loaders.get_content_type_ingredient_id()
+            data_loaders.get_content_type_recipe_id()
+            data_loaders.get_content_type_meal_id()
+            data_loaders.get_content_type_membership_id()
+
+    def test_reset_content_type_ids(self):
+        ingredient_type_id = data_loaders.get_content_type_ingredient_id()
+        data_loaders.reset_content_type_ids()
+        self.assertEqual(0, data_loaders.CONTENT_TYPE_INGREDIENT_ID)
+        self.assertEqual(ingredient_type_id, data_loaders.get_content_type_ingredient_id())
+        self.assertEqual(ingredient_type_id, data_loaders.CONTENT_TYPE_INGREDIENT_ID)
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-from unittest.mock import patch
-
 from django.test import SimpleTestCase, TestCase
 
 from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import data_loaders, food_nutrient, user_prefs
-from nutrition_tracker.models import user_ingredient, user_recipe
+from nutrition_tracker.models import user_food_nutrient, user_ingredient, user_recipe
 from nutrition_tracker.tests import objects as test_objects
+from nutrition_tracker.utils import request_cache
 
 INVALID_NUTRIENT_ID = 11001100
 
@@ -182,6 +181,15 @@ class TestLogicFoodNutrientGetFoodsNutrients(TestCase):
             0, len(food_nutrient.get_foods_nutrients(self.USER, lfoods, nutrient_id=constants.PROTEIN_NUTRIENT_ID))
         )
 
+    def test_lfoods_nutrient_values(self):
+        lfoods = user_ingredient.load_lfoods(self.USER)
+        lfood_nutrient = food_nutrient.get_foods_nutrients(self.USER, lfoods)[0]
+        self.assertIsInstance(lfood_nutrient, food_nutrient.FoodNutrientValue)
+        self.assertEqual(self.USER_FOOD.id, lfood_nutrient.ingredient_id)
+        self.assertIsNone(lfood_nutrient.db_food_id)
+        self.assertEqual(constants.ENERGY_NUTRIENT_ID, lfood_nutrient.nutrient_id)
+        self.assertEqual(100, lfood_nutrient.amount)
+
 
 class TestLogicFoodNutrientGetNutrientAmountInFoods(TestCase):
     @classmethod
@@ -211,6 +219,47 @@ class TestLogicFoodNutrientGetNutrientAmountInFoods(TestCase):
         lfoods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods)
         self.assertIsNone(food_nutrient.get_nutrient_amount_in_foods(lfoods, lfoods_nutrients, INVALID_NUTRIENT_ID))
 
+    def test_memoized_by_pk(self):
+        lfoods = list(user_ingredient.load_lfoods(self.USER))
+        lfoods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods)
+        token = request_cache.activate()
+        try:
+            food_nutrient.get_nutrient_amount_in_foods([lfoods[0]], lfoods_nutrients, constants.ENERGY_NUTRIENT_ID)
+            num_entries = len(request_cache.get_request_cache())
+            lfood = user_ingredient.load_lfood(self.USER, id_=lfoods[0].id)
+            food_nutrient.get_nutrient_amount_in_foods([lfood], lfoods_nutrients, constants.ENERGY_NUTRIENT_ID)
+            self.assertEqual(num_entries, len(request_cache.get_request_cache()))
+        finally:
+            request_cache.deactivate(token)
+
+
+class TestLogicFoodNutrientGetNutrientAmountsInFoods(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_FOOD = test_objects.get_user_ingredient()
+        test_objects.get_user_ingredient_2()
+        test_objects.get_user_food_nutrient()
+        test_objects.get_db_food_nutrient()
+
+    def test_matrix(self):
+        lfoods = list(user_ingredient.load_lfoods(self.USER))
+        lfoods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods)
+        nutrient_ids = [constants.ENERGY_NUTRIENT_ID, constants.FAT_NUTRIENT_ID, INVALID_NUTRIENT_ID]
+        matrix = food_nutrient.get_nutrient_amounts_in_foods(lfoods, lfoods_nutrients, nutrient_ids)
+
+        self.assertEqual(len(nutrient_ids), len(matrix))
+        for nutrient_id, row in zip(nutrient_ids, matrix):
+            self.assertEqual(len(lfoods), len(row))
+            for lfood, amount in zip(lfoods, row):
+                self.assertEqual(
+                    food_nutrient.get_nutrient_amount_in_foods([lfood], lfoods_nutrients, nutrient_id), amount
+                )
+
+    def test_empty(self):
+        self.assertEqual([[]], food_nutrient.get_nutrient_amounts_in_foods([], [], [constants.ENERGY_NUTRIENT_ID]))
+        self.assertEqual([], food_nutrient.get_nutrient_amounts_in_foods([self.USER_FOOD], [], []))
+
 
 class TestLogicFoodNutrientGetNutrientAmountInParents(TestCase):
     @classmethod
@@ -251,6 +300,78 @@ class TestLogicFoodNutrientGetNutrientAmountInParents(TestCase):
             food_nutrient.get_nutrient_amount_in_lparents(lrecipes, lfoods_nutrients, INVALID_NUTRIENT_ID)
         )
 
+    def test_memoized_by_members(self):
+        lrecipes = list(user_recipe.load_lrecipes(self.USER))
+        lfoods = data_loaders.load_lfoods_for_lparents(self.USER, lrecipes)
+        lfoods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods)
+        token = request_cache.activate()
+        try:
+            self.assertEqual(
+                25,
+                food_nutrient.get_nutrient_amount_in_lparents(
+                    lrecipes, lfoods_nutrients, constants.ENERGY_NUTRIENT_ID
+                ),
+            )
+            # Changed members are not served from the memoized result.
+            lrecipes[0].members[0].portions[0].serving_size *= 2
+            self.assertEqual(
+                50,
+                food_nutrient.get_nutrient_amount_in_lparents(
+                    lrecipes, lfoods_nutrients, constants.ENERGY_NUTRIENT_ID
+                ),
+            )
+        finally:
+            request_cache.deactivate(token)
+
+
+class TestLogicFoodNutrientGetNutrientAmountsInParents(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_FOOD = test_objects.get_user_ingredient()
+        test_objects.get_user_ingredient_2()
+        test_objects.get_user_food_portion()
+        test_objects.get_user_food_nutrient()
+        test_objects.get_db_food_nutrient()
+        cls.USER_RECIPE = test_objects.get_recipe()
+        test_objects.get_user_recipe_portion()
+        lfood = user_ingredient.load_lfood(cls.USER, id_=cls.USER_FOOD.id)
+        ufm = test_objects.get_user_food_membership(cls.USER_RECIPE, lfood)
+        test_objects.get_user_food_membership_portion(ufm)
+        # Recipe 2 nests recipe 1, and has no portion.
+        cls.USER_RECIPE_2 = test_objects.get_recipe_2()
+        ufm = test_objects.get_user_food_membership(cls.USER_RECIPE_2, lfood)
+        test_objects.get_user_food_membership_portion(ufm)
+        ufm = test_objects.get_user_food_membership(cls.USER_RECIPE_2, cls.USER_RECIPE)
+        test_objects.get_user_food_membership_portion(ufm)
+
+    def test_matrix(self):
+        lrecipes = list(user_recipe.load_lrecipes(self.USER))
+        member_recipes = list(data_loaders.load_lrecipes_for_lparents(self.USER, lrecipes))
+        lfoods = data_loaders.load_lfoods_for_lparents(self.USER, lrecipes)
+        lfoods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods)
+        nutrient_ids = [constants.ENERGY_NUTRIENT_ID, constants.FAT_NUTRIENT_ID, INVALID_NUTRIENT_ID]
+        matrix = food_nutrient.get_nutrient_amounts_in_lparents(
+            lrecipes, lfoods_nutrients, nutrient_ids, member_recipes=member_recipes
+        )
+
+        self.assertEqual(len(nutrient_ids), len(matrix))
+        self.assertEqual(2, len(lrecipes))
+        for nutrient_id, row in zip(nutrient_ids, matrix):
+            self.assertEqual(len(lrecipes), len(row))
+            for lrecipe, amount in zip(lrecipes, row):
+                self.assertEqual(
+                    food_nutrient.get_nutrient_amount_in_lparents(
+                        [lrecipe], lfoods_nutrients, nutrient_id, member_recipes=member_recipes
+                    ),
+                    amount,
+                )
+
+    def test_empty(self):
+        lrecipes = list(user_recipe.load_lrecipes(self.USER))
+        self.assertEqual([[]], food_nutrient.get_nutrient_amounts_in_lparents([], [], [constants.ENERGY_NUTRIENT_ID]))
+        self.assertEqual([], food_nutrient.get_nutrient_amounts_in_lparents(lrecipes, [], []))
+
 
 class TestLogicFoodNutrientGetNutrientAmountInMealplan(TestCase):
     @classmethod
@@ -293,6 +414,30 @@ class TestLogicFoodNutrientGetNutrientAmountInMealplan(TestCase):
             )
         )
 
+    def test_memoized_by_quantity_map(self):
+        lrecipes = list(user_recipe.load_lrecipes(self.USER))
+        lfoods = list(user_ingredient.load_lfoods(self.USER))
+        lfoods_nutrients = food_nutrient.get_foods_nutrients(self.USER, lfoods)
+        quantity_map = dict(self.QUANTITY_MAP)
+        token = request_cache.activate()
+        try:
+            self.assertEqual(
+                7,
+                food_nutrient.get_nutrient_amount_in_mealplan(
+                    lfoods, lrecipes, quantity_map, lfoods_nutrients, constants.ENERGY_NUTRIENT_ID
+                ),
+            )
+            # Quantity maps changed in place are not served from the memoized result.
+            quantity_map.pop(self.USER_RECIPE.external_id)
+            self.assertNotEqual(
+                7,
+                food_nutrient.get_nutrient_amount_in_mealplan(
+                    lfoods, lrecipes, quantity_map, lfoods_nutrients, constants.ENERGY_NUTRIENT_ID
+                ),
+            )
+        finally:
+            request_cache.deactivate(token)
+
 
 class TestLogicFoodNutrientGetRecentFoodsForNutrient(TestCase):
     @classmethod
@@ -308,15 +453,45 @@ class TestLogicFoodNutrientGetRecentFoodsForNutrient(TestCase):
         self.assertTrue(recent_foods)
 
 
-def load_cfoods(**kwargs):
-    return [test_objects.get_db_food()]
+class TestLogicFoodNutrientLoadTopLfoodsForNutrient(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_FOOD = test_objects.get_user_ingredient()
+        cls.USER_FOOD_2 = test_objects.get_user_ingredient_2()
+        test_objects.get_user_food_nutrient()
+        cls.USER_FOOD_NUTRIENT_2 = user_food_nutrient.create(
+            cls.USER, ingredient=cls.USER_FOOD_2, nutrient_id=constants.ENERGY_NUTRIENT_ID, amount=200
+        )
+
+    def test_sorted(self):
+        self.assertEqual(
+            [self.USER_FOOD_2, self.USER_FOOD],
+            food_nutrient.load_top_lfoods_for_nutrient(self.USER, constants.ENERGY_NUTRIENT_ID),
+        )
+
+    def test_max_items(self):
+        self.assertEqual(
+            [self.USER_FOOD_2],
+            food_nutrient.load_top_lfoods_for_nutrient(self.USER, constants.ENERGY_NUTRIENT_ID, max_items=1),
+        )
+
+    def test_ids(self):
+        self.assertEqual(
+            [self.USER_FOOD],
+            food_nutrient.load_top_lfoods_for_nutrient(
+                self.USER, constants.ENERGY_NUTRIENT_ID, ids=[self.USER_FOOD.id]
+            ),
+        )
+        self.assertEqual(
+            [], food_nutrient.load_top_lfoods_for_nutrient(self.USER, constants.ENERGY_NUTRIENT_ID, ids=[])
+        )
 
+    def test_nutrient_not_present(self):
+        self.assertEqual([], food_nutrient.load_top_lfoods_for_nutrient(self.USER, constants.PROTEIN_NUTRIENT_ID))
 
-class TestLogicFoodNutrientGetTopCFoodsForNutrient(TestCase):
-    @patch(target="nutrition_tracker.models.db_food.load_cfoods", wraps=load_cfoods)
-    def test_recent_cfoods(self, mock_load_cfoods):
-        recent_cfoods = food_nutrient.get_top_cfoods_for_nutrient(constants.ENERGY_NUTRIENT_ID)
-        self.assertTrue(recent_cfoods)
+    def test_invalid_nutrient(self):
+        self.assertEqual([], food_nutrient.load_top_lfoods_for_nutrient(self.USER, -1))
 
 
 class TestLogicFoodNutrientGetTrackerNutrients(TestCase):
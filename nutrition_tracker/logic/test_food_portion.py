@@ -13,6 +13,7 @@ from nutrition_tracker.models import (
     user_recipe,
 )
 from nutrition_tracker.tests import objects as test_objects
+from nutrition_tracker.utils import request_cache
 
 
 class TestLogicFoodPortionGetDefaultPortionChoice(SimpleTestCase):
@@ -185,6 +186,18 @@ class TestLogicFoodPortionForDisplayChoices(TransactionTestCase):
         ]
         self.assertEqual(expected_output, food_portion.for_display_choices(lrecipe))
 
+    def test_memoized_choices_are_copies(self):
+        lfood = test_objects.get_user_ingredient()
+        token = request_cache.activate()
+        try:
+            food_portions = food_portion.for_display_choices(lfood)
+            food_portions.append((-4, "1lb", 453.592, "g", None, None))
+            self.assertEqual(
+                3, len(food_portion.for_display_choices(user_ingredient.load_lfood(self.USER, id_=lfood.id)))
+            )
+        finally:
+            request_cache.deactivate(token)
+
 
 class TestLogicFoodPortionGetFoodMemberPortion(TransactionTestCase):
     reset_sequences = True
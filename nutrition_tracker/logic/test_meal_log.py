@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import data_loaders, meal_log
+from nutrition_tracker.models import (
+    user_food_membership,
+    user_ingredient,
+    user_meal,
+    user_preference,
+    user_recipe,
+)
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestLogicMealLog(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        cls.USER_INGREDIENT_2 = test_objects.get_user_ingredient_2()
+        cls.RECIPE = test_objects.get_recipe()
+        test_objects.get_user_recipe_portion()
+
+    def get_item(self, lobject, quantity=1, **kwargs):
+        return meal_log.LogItem(lobject, quantity, f"{constants.HUNDRED_SERVING_ID}", **kwargs)
+
+    def test_log_items(self):
+        items = [self.get_item(self.USER_INGREDIENT), self.get_item(self.USER_INGREDIENT_2, quantity=2)]
+        lmeal = meal_log.log_items(self.USER, timezone.localdate(), constants.MealType.BREAKFAST, items)
+
+        lmeal = user_meal.load_lmeal(self.USER, id_=lmeal.id)
+        self.assertEqual(
+            {lmember.child_id for lmember in lmeal.members}, {self.USER_INGREDIENT.id, self.USER_INGREDIENT_2.id}
+        )
+        for item in items:
+            self.assertEqual(item.lmembership.parent_id, lmeal.id)
+            lmembership = user_food_membership.load_lmembership(self.USER, id_=item.lmembership.id)
+            self.assertEqual(len(lmembership.portions), 1)
+
+        self.assertEqual(user_meal.load_lmeals(self.USER).count(), 1)
+
+    def test_log_items_constant_queries(self):
+        objects = meal_log.load_log_items_objects(
+            self.USER,
+            [self.USER_INGREDIENT.external_id, self.USER_INGREDIENT_2.external_id, self.RECIPE.external_id],
+        )
+        items = [self.get_item(lobject, cfood=cfood) for lobject, cfood in objects.values()]
+        data_loaders.resolve_content_type_ids()
+
+        with CaptureQueriesContext(connection) as one_item:
+            meal_log.log_items(self.USER, timezone.localdate(), constants.MealType.BREAKFAST, items[:1])
+
+        items = [self.get_item(lobject, cfood=cfood) for lobject, cfood in objects.values()]
+        with CaptureQueriesContext(connection) as three_items:
+            meal_log.log_items(self.USER, timezone.localdate(), constants.MealType.LUNCH, items)
+
+        self.assertEqual(len(one_item), len(three_items))
+
+    def test_log_items_cfood(self):
+        cfood = test_objects.get_db_food_2()
+        user_ingredient.load_lfoods(self.USER, db_food_ids=[cfood.id]).delete()
+
+        items = [self.get_item(None, cfood=cfood), self.get_item(None, cfood=cfood, quantity=2)]
+        meal_log.log_items(self.USER, timezone.localdate(), constants.MealType.BREAKFAST, items)
+
+        lfoods = user_ingredient.load_lfoods(self.USER, db_food_ids=[cfood.id])
+        self.assertEqual(lfoods.count(), 1)
+        self.assertEqual(items[0].lobject.id, lfoods[0].id)
+        self.assertEqual(items[1].lobject.id, lfoods[0].id)
+
+    def test_log_items_move(self):
+        old_lmeal = test_objects.get_meal_yesterday_1()
+        ufm = test_objects.get_user_food_membership(old_lmeal, self.USER_INGREDIENT)
+        lportion = test_objects.get_user_food_membership_portion(ufm)
+        lmembership = user_food_membership.load_lmembership(self.USER, id_=ufm.id)
+
+        item = self.get_item(self.USER_INGREDIENT, quantity=3, lmembership=lmembership)
+        lmeal = meal_log.log_items(self.USER, timezone.localdate(), constants.MealType.BREAKFAST, [item])
+
+        self.assertIsNone(user_meal.load_lmeal(self.USER, id_=old_lmeal.id))
+        lmembership = user_food_membership.load_lmembership(self.USER, id_=ufm.id)
+        self.assertEqual(lmembership.parent_id, lmeal.id)
+        self.assertEqual([lfood_portion.id for lfood_portion in lmembership.portions], [lportion.id])
+        self.assertEqual(lmembership.portions[0].quantity, 3)
+
+    def test_log_items_move_keeps_nonempty_meal(self):
+        old_lmeal = test_objects.get_meal_yesterday_1()
+        ufm = test_objects.get_user_food_membership(old_lmeal, self.USER_INGREDIENT)
+        test_objects.get_user_food_membership_portion(ufm)
+        test_objects.get_user_food_membership(old_lmeal, self.USER_INGREDIENT_2)
+        lmembership = user_food_membership.load_lmembership(self.USER, id_=ufm.id)
+
+        item = self.get_item(self.USER_INGREDIENT, lmembership=lmembership)
+        meal_log.log_items(self.USER, timezone.localdate(), constants.MealType.BREAKFAST, [item])
+
+        self.assertIsNotNone(user_meal.load_lmeal(self.USER, id_=old_lmeal.id))
+
+    def test_log_items_preferences(self):
+        luser_preference, _unused = user_preference.get_or_create(
+            self.USER, food_external_id=self.USER_INGREDIENT.external_id
+        )
+        items = [
+            self.get_item(self.USER_INGREDIENT, is_available=True),
+            self.get_item(self.USER_INGREDIENT_2, is_available=False),
+            self.get_item(self.RECIPE),
+        ]
+        meal_log.log_items(self.USER, timezone.localdate(), constants.MealType.BREAKFAST, items)
+
+        luser_preference = user_preference.load_luser_preference(self.USER, id_=luser_preference.id)
+        self.assertTrue(luser_preference.is_available())
+        luser_preference_2 = user_preference.load_luser_preference(
+            self.USER, food_external_id=self.USER_INGREDIENT_2.external_id
+        )
+        self.assertFalse(luser_preference_2.is_available())
+        self.assertIsNone(user_preference.load_luser_preference(self.USER, food_external_id=self.RECIPE.external_id))
+
+    def test_delete_lmembership(self):
+        lmeal = test_objects.get_meal_today_1()
+        ufm = test_objects.get_user_food_membership(lmeal, self.USER_INGREDIENT)
+        ufm_2 = test_objects.get_user_food_membership(lmeal, self.USER_INGREDIENT_2)
+
+        meal_log.delete_lmembership(self.USER, ufm)
+        self.assertIsNotNone(user_meal.load_lmeal(self.USER, id_=lmeal.id))
+
+        meal_log.delete_lmembership(self.USER, ufm_2)
+        self.assertIsNone(user_meal.load_lmeal(self.USER, id_=lmeal.id))
+
+    def test_delete_lmembership_recipe(self):
+        ufm = test_objects.get_user_food_membership(self.RECIPE, self.USER_INGREDIENT)
+        meal_log.delete_lmembership(self.USER, ufm)
+        self.assertIsNone(user_food_membership.load_lmembership(self.USER, id_=ufm.id))
+        self.assertIsNotNone(user_recipe.load_lrecipe(self.USER, id_=self.RECIPE.id))
+
+    def test_load_log_items_objects(self):
+        cfood = test_objects.get_db_food_2()
+        unknown_id = uuid.uuid4()
+        objects = meal_log.load_log_items_objects(
+            self.USER, [self.USER_INGREDIENT.external_id, self.RECIPE.external_id, cfood.external_id, unknown_id]
+        )
+
+        self.assertEqual(objects[self.USER_INGREDIENT.external_id][0].id, self.USER_INGREDIENT.id)
+        self.assertEqual(objects[self.RECIPE.external_id], (self.RECIPE, None))
+        self.assertEqual(objects[cfood.external_id][0].id, self.USER_INGREDIENT_2.id)
+        self.assertEqual(objects[cfood.external_id][1], cfood)
+        self.assertNotIn(unknown_id, objects)
+
+    def test_load_log_items_objects_empty(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(meal_log.load_log_items_objects(self.USER, []), {})
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
 from ortools.sat.python import cp_model
 
-from nutrition_tracker.logic import mealplan
+from nutrition_tracker.biz import user
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import data_loaders, mealplan
+from nutrition_tracker.logic.planner import variables as planner_variables
+from nutrition_tracker.models import (
+    db_food_nutrient,
+    mealplan_solve_stat,
+    user_meal,
+    user_preference,
+    user_preference_threshold,
+)
+from nutrition_tracker.tests import constants as test_constants
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.utils import planner as planner_utils
 
@@ -43,15 +56,15 @@ class TestLogicMealplanGetMealplanFromSolution(TestCase):
     @patch.object(cp_model.CpSolver, "Value", return_value=4)
     def test_valid_mealplan(self, mock):
         model = cp_model.CpModel()
-        variables = {}
+        variables = planner_variables.PlannerVariables()
         presence_variable = planner_utils.get_presence_variable(self.USER_INGREDIENT.external_id)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.USER_INGREDIENT.external_id, model.NewBoolVar(presence_variable))
         presence_variable = planner_utils.get_presence_variable(self.USER_RECIPE.external_id)
-        variables[presence_variable] = model.NewBoolVar(presence_variable)
+        variables.set_presence(self.USER_RECIPE.external_id, model.NewBoolVar(presence_variable))
         quantity_variable = planner_utils.get_quantity_variable(self.USER_INGREDIENT.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.USER_INGREDIENT.external_id, model.NewIntVar(0, 100, quantity_variable))
         quantity_variable = planner_utils.get_quantity_variable(self.USER_RECIPE.external_id)
-        variables[quantity_variable] = model.NewIntVar(0, 100, quantity_variable)
+        variables.set_quantity(self.USER_RECIPE.external_id, model.NewIntVar(0, 100, quantity_variable))
         self.assertEqual(
             len(
                 mealplan._get_mealplan_from_solution(
@@ -78,3 +91,324 @@ class TestLogicMealplanGetMealplanForUser(TestCase):
         lmealplan = mealplan.get_mealplan_for_user(self.USER)
         self.assertFalse(lmealplan.infeasible)
         self.assertEqual(len(lmealplan.quantity_map), 1)
+
+    def test_multi_day_mealplan(self):
+        lmealplan = mealplan.get_mealplan_for_user(self.USER, num_days=3)
+        self.assertFalse(lmealplan.infeasible)
+        self.assertEqual(len(lmealplan.quantity_maps), 3)
+        self.assertEqual(lmealplan.quantity_map, lmealplan.quantity_maps[0])
+        for quantity_map in lmealplan.quantity_maps:
+            self.assertEqual(len(quantity_map), 1)
+
+    def test_cached_mealplan_per_num_days(self):
+        cache.clear()
+        with patch.object(cp_model.CpSolver, "Solve", autospec=True, side_effect=cp_model.CpSolver.Solve) as mock:
+            mealplan.get_mealplan_for_user(self.USER)
+            lmealplan = mealplan.get_mealplan_for_user(self.USER, num_days=2)
+            cached_lmealplan = mealplan.get_mealplan_for_user(self.USER, num_days=2)
+
+        self.assertEqual(mock.call_count, 2)
+        self.assertEqual(lmealplan.quantity_maps, cached_lmealplan.quantity_maps)
+
+    def test_non_repeatable_food_used_yesterday(self):
+        for lfood, flags in [
+            (self.USER_INGREDIENT, [user_preference.FLAG_IS_AVAILABLE, user_preference.FLAG_IS_NOT_REPEATABLE]),
+            (self.USER_INGREDIENT_2, [user_preference.FLAG_IS_AVAILABLE]),
+        ]:
+            luser_preference = user_preference.create(self.USER, food_external_id=lfood.external_id)
+            for flag in flags:
+                luser_preference.add_flag(flag)
+            luser_preference.save()
+
+        # Eaten yesterday in a recipe.
+        lrecipe = test_objects.get_recipe()
+        test_objects.get_user_food_membership(lrecipe, self.USER_INGREDIENT)
+        test_objects.get_user_food_membership(test_objects.get_meal_yesterday_1(), lrecipe)
+
+        lmealplan = mealplan.get_mealplan_for_user(self.USER)
+        self.assertEqual([self.USER_INGREDIENT_2.external_id], [lfood.external_id for lfood in lmealplan.lfoods])
+        self.assertNotIn(self.USER_INGREDIENT.external_id, lmealplan.quantity_map)
+
+    def test_multi_day_non_repeatable_food_used_yesterday_and_today(self):
+        for lfood, flags in [
+            (self.USER_INGREDIENT, [user_preference.FLAG_IS_AVAILABLE, user_preference.FLAG_IS_NOT_REPEATABLE]),
+            (self.USER_INGREDIENT_2, [user_preference.FLAG_IS_AVAILABLE]),
+        ]:
+            luser_preference = user_preference.create(self.USER, food_external_id=lfood.external_id)
+            for flag in flags:
+                luser_preference.add_flag(flag)
+            luser_preference.save()
+            user_preference_threshold.create(
+                self.USER, user_preference=luser_preference, num_days=1, min_value=10, max_value=2000
+            )
+
+        # Eaten yesterday, and logged again today.
+        test_objects.get_user_food_membership(test_objects.get_meal_yesterday_1(), self.USER_INGREDIENT)
+        ufm = test_objects.get_user_food_membership(test_objects.get_meal_today_1(), self.USER_INGREDIENT)
+        test_objects.get_user_food_membership_portion(ufm)
+
+        lmealplan = mealplan.get_mealplan_for_user(self.USER, num_days=2)
+        self.assertFalse(lmealplan.infeasible)
+        self.assertGreaterEqual(lmealplan.quantity_maps[0][self.USER_INGREDIENT.external_id], 50)
+        self.assertNotIn(self.USER_INGREDIENT.external_id, lmealplan.quantity_maps[1])
+
+    def test_profile(self):
+        cache.clear()
+        profile = {}
+        mealplan.get_mealplan_for_user(self.USER, profile=profile)
+        self.assertFalse(profile["cached"])
+        self.assertEqual(profile["status"], "OPTIMAL")
+        for key in ["load_seconds", "build_seconds", "solve_seconds", "num_variables", "response_stats"]:
+            self.assertIn(key, profile)
+
+        cached_profile = {}
+        mealplan.get_mealplan_for_user(self.USER, profile=cached_profile)
+        self.assertTrue(cached_profile["cached"])
+        self.assertNotIn("solve_seconds", cached_profile)
+
+    def test_cached_mealplan(self):
+        cache.clear()
+        with patch.object(cp_model.CpSolver, "Solve", autospec=True, side_effect=cp_model.CpSolver.Solve) as mock:
+            lmealplan = mealplan.get_mealplan_for_user(self.USER)
+            cached_lmealplan = mealplan.get_mealplan_for_user(self.USER)
+
+        mock.assert_called_once()
+        self.assertEqual(lmealplan.quantity_map, cached_lmealplan.quantity_map)
+
+    def test_cached_mealplan_loads(self):
+        cache.clear()
+        lmealplan = mealplan.get_mealplan_for_user(self.USER)
+        # Cache hits skip the planner loads, only planned foods and recipes are loaded.
+        with patch.object(mealplan.user_preference, "load_luser_preferences") as mock:
+            cached_lmealplan = mealplan.get_mealplan_for_user(self.USER)
+
+        mock.assert_not_called()
+        self.assertEqual(
+            [lfood.external_id for lfood in lmealplan.lfoods if lfood.external_id in lmealplan.quantity_map],
+            [lfood.external_id for lfood in cached_lmealplan.lfoods],
+        )
+        self.assertTrue(cached_lmealplan.lfoods_nutrients)
+        self.assertEqual(len(lmealplan.lmeals_today), len(cached_lmealplan.lmeals_today))
+
+        with patch.object(mealplan.user_ingredient, "load_lfoods") as mock:
+            quantities_lmealplan = mealplan.get_mealplan_for_user(self.USER, quantities_only=True)
+
+        mock.assert_not_called()
+        self.assertEqual(lmealplan.quantity_map, quantities_lmealplan.quantity_map)
+        self.assertEqual([], quantities_lmealplan.lfoods)
+
+    def test_solution_mealplan(self):
+        cache.clear()
+        quantity_map = {self.USER_INGREDIENT.external_id: 100}
+        with patch.object(cp_model.CpSolver, "Solve") as mock:
+            lmealplan = mealplan.get_mealplan_for_user(
+                self.USER, solution={"infeasible": False, "quantity_maps": [quantity_map]}
+            )
+
+        mock.assert_not_called()
+        self.assertEqual(lmealplan.quantity_map, quantity_map)
+        self.assertIn(self.USER_INGREDIENT.external_id, [lfood.external_id for lfood in lmealplan.lfoods])
+
+    def test_stopped_mealplan(self):
+        cache.clear()
+        should_stop = MagicMock(return_value=True)
+        mealplan.get_mealplan_for_user(self.USER, should_stop=should_stop)
+
+        should_stop.assert_called()
+        # A stopped search is not cached, the next solve runs again.
+        with patch.object(cp_model.CpSolver, "Solve", autospec=True, side_effect=cp_model.CpSolver.Solve) as mock:
+            mealplan.get_mealplan_for_user(self.USER)
+
+        mock.assert_called_once()
+
+    def test_solve_stat(self):
+        cache.clear()
+        mealplan.get_mealplan_for_user(self.USER)
+
+        solve_stat = mealplan_solve_stat.load_solve_stats(self.USER).get()
+        self.assertEqual(solve_stat.status, "OPTIMAL")
+        self.assertEqual(solve_stat.num_foods, 2)
+        self.assertEqual(solve_stat.num_nutrient_constraints, 1)
+        self.assertEqual(solve_stat.num_category_constraints, 0)
+        self.assertEqual(solve_stat.num_search_workers, 1)
+        self.assertFalse(solve_stat.warm_start)
+        self.assertEqual(solve_stat.gap, 0)
+
+    @patch.object(mealplan, "SOLVER_BUDGETS", [])
+    def test_warm_start_mealplan(self):
+        cache.clear()
+        time_limits = []
+        original_solve = cp_model.CpSolver.Solve
+
+        def solve(solver, model, solution_callback=None):
+            time_limits.append(solver.parameters.max_time_in_seconds)
+            return original_solve(solver, model, solution_callback)
+
+        with patch.object(cp_model.CpSolver, "Solve", autospec=True, side_effect=solve):
+            lmealplan = mealplan.get_mealplan_for_user(self.USER)
+            # Drop the cached solution, keep the hints.
+            cache.delete(mealplan._get_cache_key(mealplan.get_mealplan_fingerprint(self.USER)))
+            warm_lmealplan = mealplan.get_mealplan_for_user(self.USER)
+
+        self.assertEqual(time_limits, [mealplan.MAX_TIME_IN_SECONDS, mealplan.WARM_START_MAX_TIME_IN_SECONDS])
+        self.assertEqual(lmealplan.quantity_map, warm_lmealplan.quantity_map)
+
+
+class TestLogicMealplanGetSolverBudget(TestCase):
+    def test_budget(self):
+        self.assertEqual((1, 1), mealplan.get_solver_budget(5))
+        self.assertEqual((4, 3), mealplan.get_solver_budget(50))
+        self.assertEqual((10, mealplan.MAX_TIME_IN_SECONDS), mealplan.get_solver_budget(500))
+
+    def test_warm_start_budget(self):
+        self.assertEqual((1, 1), mealplan.get_solver_budget(5, warm_start=True))
+        self.assertEqual(
+            (10, mealplan.WARM_START_MAX_TIME_IN_SECONDS), mealplan.get_solver_budget(500, warm_start=True)
+        )
+
+    @override_settings(MEALPLAN_JOB_WORKERS=4, MEALPLAN_SOLVER_MAX_WORKERS=8)
+    def test_concurrency_limit(self):
+        self.assertEqual(2, mealplan.get_solver_budget(500)[0])
+        self.assertEqual(1, mealplan.get_solver_budget(5)[0])
+
+    @override_settings(WEB_CONCURRENCY=2, MEALPLAN_JOB_WORKERS=2, MEALPLAN_SOLVER_MAX_WORKERS=8)
+    def test_concurrency_limit_web_processes(self):
+        self.assertEqual(2, mealplan.get_solver_budget(500)[0])
+
+    @override_settings(MEALPLAN_JOB_WORKERS=16, MEALPLAN_SOLVER_MAX_WORKERS=8)
+    def test_concurrency_limit_min_worker(self):
+        self.assertEqual(1, mealplan.get_solver_budget(500)[0])
+
+
+class TestLogicMealplanHints(TestCase):
+    def test_get_hints(self):
+        model = cp_model.CpModel()
+        variables = planner_variables.PlannerVariables()
+        variables.set_presence("a", model.NewBoolVar("a:p1"))
+        variables.set_quantity("a", model.NewIntVar(0, 10, "a:q1"))
+        variables.new_constraint(model, "a")
+        model.Add(variables.get_quantity("a") == 4)
+        model.Add(variables.get_presence("a") == 1)
+        solver = cp_model.CpSolver()
+        solver.Solve(model)
+
+        self.assertEqual(variables.get_hints(solver), {"a:p1": 1, "a:q1": 4})
+
+    def test_add_hints(self):
+        model = cp_model.CpModel()
+        variables = planner_variables.PlannerVariables()
+        variables.set_presence("a", model.NewBoolVar("a:p1"))
+
+        self.assertEqual(variables.add_hints(model, {}), 0)
+        self.assertEqual(variables.add_hints(model, {"a:p1": 1, "b:p1": 0}), 1)
+
+
+class TestLogicMealplanGetMealplanFingerprint(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_2 = test_objects.get_user_2()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        cls.NUTRIENT_PREFERENCE = test_objects.get_nutrient_preference()
+
+    def test_fingerprint_stable(self):
+        self.assertEqual(mealplan.get_mealplan_fingerprint(self.USER), mealplan.get_mealplan_fingerprint(self.USER))
+        self.assertNotEqual(
+            mealplan.get_mealplan_fingerprint(self.USER), mealplan.get_mealplan_fingerprint(self.USER_2)
+        )
+
+    def test_fingerprint_changes_on_update(self):
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER)
+        self.NUTRIENT_PREFERENCE.save()
+        self.assertNotEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+    def test_fingerprint_changes_on_insert(self):
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER)
+        test_objects.get_meal_today_1()
+        self.assertNotEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+    def test_fingerprint_changes_on_delete(self):
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER)
+        self.NUTRIENT_PREFERENCE.delete()
+        self.assertNotEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+    def test_fingerprint_changes_on_family_member_update(self):
+        user.add_to_family(self.USER, test_constants.TEST_UUID)
+        user.add_to_family(self.USER_2, test_constants.TEST_UUID)
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER)
+        test_objects.get_user_2_ingredient()
+        self.assertNotEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+    def test_fingerprint_changes_on_db_food_nutrient_update(self):
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER)
+        test_objects.get_db_food_nutrient()
+        self.assertNotEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+    def test_fingerprint_ignores_other_db_food_nutrients(self):
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER)
+        db_food_nutrient.create(
+            id=3, db_food=test_objects.get_db_food_2(), nutrient_id=constants.ENERGY_NUTRIENT_ID, amount=50
+        )
+        self.assertEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+    def test_fingerprint_changes_on_date(self):
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER)
+        with patch.object(
+            mealplan.timezone, "localdate", return_value=timezone.localdate() + timezone.timedelta(days=1)
+        ):
+            self.assertNotEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+    def test_fingerprint_plan_date(self):
+        plan_date = timezone.localdate() + timezone.timedelta(days=1)
+        fingerprint = mealplan.get_mealplan_fingerprint(self.USER, plan_date=plan_date)
+        self.assertNotEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+        with patch.object(mealplan.timezone, "localdate", return_value=plan_date):
+            self.assertEqual(fingerprint, mealplan.get_mealplan_fingerprint(self.USER))
+
+
+class TestLogicMealplanPlan(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_2 = test_objects.get_user_2()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        cls.USER_INGREDIENT_2 = test_objects.get_user_ingredient_2()
+        cls.RECIPE = test_objects.get_recipe()
+        test_objects.get_user_food_membership_portion(
+            test_objects.get_user_food_membership(test_objects.get_meal_today_1(), cls.USER_INGREDIENT)
+        )
+        test_objects.get_user_food_membership_portion(
+            test_objects.get_user_food_membership(test_objects.get_meal_today_2(), cls.USER_INGREDIENT)
+        )
+
+    def get_mealplan(self):
+        return mealplan.Mealplan(
+            False,
+            [self.USER_INGREDIENT, self.USER_INGREDIENT_2],
+            [self.RECIPE],
+            [],
+            list(user_meal.load_lmeals(self.USER, meal_date=timezone.localdate())),
+            [],
+            {self.USER_INGREDIENT.external_id: 130, self.USER_INGREDIENT_2.external_id: 100},
+        )
+
+    def test_history_map(self):
+        history_map = mealplan.get_history_map(self.get_mealplan().lmeals_today)
+        self.assertEqual(history_map, {(data_loaders.get_content_type_ingredient_id(), self.USER_INGREDIENT.id): 100})
+
+    def test_save_plan(self):
+        plan_id, items = mealplan.save_plan(self.USER, self.get_mealplan())
+        plan = mealplan.load_plan(self.USER, plan_id)
+        self.assertEqual(items, plan)
+        self.assertEqual(plan[str(self.USER_INGREDIENT.external_id)]["quantity"], 30)
+        self.assertEqual(plan[str(self.USER_INGREDIENT_2.external_id)]["quantity"], 100)
+        self.assertNotIn(str(self.RECIPE.external_id), plan)
+
+    def test_load_plan_other_user(self):
+        plan_id, _items = mealplan.save_plan(self.USER, self.get_mealplan())
+        self.assertIsNone(mealplan.load_plan(self.USER_2, plan_id))
+
+    def test_delete_plan(self):
+        plan_id, _items = mealplan.save_plan(self.USER, self.get_mealplan())
+        mealplan.delete_plan(plan_id)
+        self.assertIsNone(mealplan.load_plan(self.USER, plan_id))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import random
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from nutrition_tracker.logic import data_loaders, mealplan, mealplan_benchmark
+from nutrition_tracker.models import user_ingredient, user_preference, user_recipe
+
+
+class TestLogicMealplanBenchmark(TestCase):
+    def test_create_synthetic_user(self):
+        config = mealplan_benchmark.BenchmarkConfig(
+            num_foods=5,
+            num_recipes=4,
+            recipe_size=2,
+            recipe_depth=2,
+            num_nutrient_thresholds=2,
+            num_category_thresholds=1,
+            num_food_thresholds=3,
+        )
+        luser = mealplan_benchmark.create_synthetic_user(config, random.Random(0))
+
+        self.assertEqual(5, user_ingredient.load_lfoods(luser).count())
+        lrecipes = list(user_recipe.load_lrecipes(luser))
+        self.assertEqual(4, len(lrecipes))
+        # Every other recipe nests the previous recipe.
+        self.assertEqual(2, len(data_loaders.get_lrecipe_ids_for_lparents(luser, lrecipes)))
+        # 9 foods and recipes, 2 nutrients and 1 category.
+        self.assertEqual(12, user_preference.load_luser_preferences(luser).count())
+
+    def test_run_benchmark(self):
+        config = mealplan_benchmark.BenchmarkConfig(num_foods=5, num_recipes=2, num_food_thresholds=2)
+        report = mealplan_benchmark.run_benchmark(config, repeat=2)
+
+        self.assertEqual(2, len(report["runs"]))
+        self.assertEqual(2, sum(report["statuses"].values()))
+        self.assertEqual(5, report["config"]["num_foods"])
+        for phase in mealplan_benchmark.PHASES:
+            self.assertIn(phase, report["summary"])
+            self.assertIn(phase, report["runs"][0])
+        self.assertIn("response_stats", report["runs"][0])
+        # Synthetic users are rolled back.
+        self.assertFalse(user_ingredient.UserIngredient.objects.exists())
+
+    def test_run_benchmark_cache(self):
+        config = mealplan_benchmark.BenchmarkConfig(num_foods=5, num_recipes=2, num_food_thresholds=2)
+        cache_keys = []
+        get_fingerprint = mealplan.get_mealplan_fingerprint
+
+        def get_mealplan_fingerprint(user, *args, **kwargs):
+            fingerprint = get_fingerprint(user, *args, **kwargs)
+            cache_keys.extend([mealplan._get_cache_key(fingerprint), mealplan._get_hint_key(user.id)])
+            return fingerprint
+
+        with mock.patch.object(mealplan_benchmark.mealplan, "get_mealplan_fingerprint", get_mealplan_fingerprint):
+            mealplan_benchmark.run_benchmark(config, repeat=1)
+
+        # Synthetic users' solutions and hints are not left behind.
+        self.assertTrue(cache_keys)
+        for cache_key in cache_keys:
+            self.assertIsNone(cache.get(cache_key))
+
+    def test_benchmark_config(self):
+        config = mealplan_benchmark.BenchmarkConfig(num_foods=5)
+
+        self.assertEqual(mealplan_benchmark.BenchmarkConfig(num_foods=5), config)
+        self.assertNotEqual(mealplan_benchmark.BenchmarkConfig(), config)
+        self.assertIn("num_foods=5", repr(config))
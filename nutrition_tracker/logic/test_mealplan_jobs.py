@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import mealplan, mealplan_jobs
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestLogicMealplanJobs(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_2 = test_objects.get_user_2()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        test_objects.get_user_food_nutrient()
+        test_objects.get_user_food_portion()
+        test_objects.get_nutrient_preference()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_submit_job(self):
+        job_id = mealplan_jobs.submit_job(self.USER)
+        job = mealplan_jobs.get_job(self.USER, job_id)
+
+        self.assertEqual(job["status"], constants.MealplanJobStatus.DONE)
+        self.assertFalse(job["result"]["infeasible"])
+        self.assertIn(self.USER_INGREDIENT.external_id, job["result"]["quantity_map"])
+        self.assertIn(str(self.USER_INGREDIENT.external_id), mealplan.load_plan(self.USER, job["result"]["plan_id"]))
+        self.assertIsNone(cache.get(mealplan_jobs._get_user_key(self.USER.id)))
+
+    def test_submit_job_num_days(self):
+        job_id = mealplan_jobs.submit_job(self.USER, num_days=2)
+        job = mealplan_jobs.get_job(self.USER, job_id)
+
+        self.assertEqual(job["num_days"], 2)
+        self.assertEqual(len(job["result"]["quantity_maps"]), 2)
+
+    def test_submit_job_in_flight(self):
+        job_id = str(uuid.uuid4())
+        cache.set(mealplan_jobs._get_user_key(self.USER.id), job_id)
+        mealplan_jobs._set_job(job_id, self.USER.id, constants.MealplanJobStatus.RUNNING)
+
+        with patch.object(mealplan_jobs.uuid, "uuid4", return_value=uuid.uuid4()) as mock:
+            self.assertEqual(job_id, mealplan_jobs.submit_job(self.USER))
+
+        self.assertIsNone(mealplan_jobs.get_job(self.USER, mock.return_value))
+
+    def test_submit_job_in_flight_other_num_days(self):
+        job_id = str(uuid.uuid4())
+        cache.set(mealplan_jobs._get_user_key(self.USER.id), job_id)
+        mealplan_jobs._set_job(job_id, self.USER.id, constants.MealplanJobStatus.RUNNING)
+
+        new_job_id = mealplan_jobs.submit_job(self.USER, num_days=2)
+        self.assertNotEqual(job_id, new_job_id)
+        self.assertTrue(mealplan_jobs._is_cancelled(job_id))
+        self.assertEqual(mealplan_jobs.get_job(self.USER, new_job_id)["status"], constants.MealplanJobStatus.DONE)
+
+    def test_submit_job_stale(self):
+        job_id = str(uuid.uuid4())
+        cache.set(mealplan_jobs._get_user_key(self.USER.id), job_id)
+        mealplan_jobs._set_job(job_id, self.USER.id, constants.MealplanJobStatus.RUNNING)
+        with patch.object(
+            mealplan_jobs.time, "time", return_value=time.time() + constants.MEALPLAN_JOB_STALE_TIMEOUT + 1
+        ):
+            self.assertEqual(mealplan_jobs.get_job(self.USER, job_id)["status"], constants.MealplanJobStatus.FAILED)
+            self.assertFalse(mealplan_jobs.cancel_job(self.USER, job_id))
+            new_job_id = mealplan_jobs.submit_job(self.USER)
+
+        self.assertNotEqual(job_id, new_job_id)
+        self.assertEqual(mealplan_jobs.get_job(self.USER, new_job_id)["status"], constants.MealplanJobStatus.DONE)
+
+    def test_submit_job_after_final(self):
+        job_id = mealplan_jobs.submit_job(self.USER)
+
+        self.assertNotEqual(job_id, mealplan_jobs.submit_job(self.USER))
+
+    @patch.object(mealplan, "get_mealplan_for_user")
+    def test_submit_job_failed(self, mock):
+        mock.side_effect = ValueError
+        job_id = uuid.uuid4()
+        with patch.object(mealplan_jobs.uuid, "uuid4", return_value=job_id), self.assertRaises(ValueError):
+            mealplan_jobs.submit_job(self.USER)
+
+        job = mealplan_jobs.get_job(self.USER, job_id)
+        self.assertEqual(job["status"], constants.MealplanJobStatus.FAILED)
+        self.assertIsNone(cache.get(mealplan_jobs._get_user_key(self.USER.id)))
+
+    def test_get_job_other_user(self):
+        job_id = mealplan_jobs.submit_job(self.USER)
+
+        self.assertIsNone(mealplan_jobs.get_job(self.USER_2, job_id))
+        self.assertIsNone(mealplan_jobs.get_job(self.USER, uuid.uuid4()))
+
+    def test_cancel_job(self):
+        job_id = str(uuid.uuid4())
+        mealplan_jobs._set_job(job_id, self.USER.id, constants.MealplanJobStatus.QUEUED)
+
+        self.assertFalse(mealplan_jobs.cancel_job(self.USER_2, job_id))
+        self.assertTrue(mealplan_jobs.cancel_job(self.USER, job_id))
+
+        mealplan_jobs._run_job(job_id, self.USER.id)
+        job = mealplan_jobs.get_job(self.USER, job_id)
+        self.assertEqual(job["status"], constants.MealplanJobStatus.CANCELLED)
+        self.assertIsNone(job["result"])
+
+    def test_cancel_job_final(self):
+        job_id = mealplan_jobs.submit_job(self.USER)
+
+        self.assertFalse(mealplan_jobs.cancel_job(self.USER, job_id))
+
+    @override_settings(MEALPLAN_JOB_WORKERS=1)
+    @patch.object(mealplan, "get_mealplan_for_user")
+    def test_submit_job_pool(self, mock):
+        mock.return_value = mealplan.Mealplan(
+            infeasible=True,
+            lfoods=[],
+            lfoods_nutrients={},
+            lrecipes=[],
+            lmember_recipes=[],
+            lmeals_today=[],
+            quantity_map={},
+        )
+        with patch.object(mealplan_jobs.user, "load_luser", return_value=self.USER):
+            job_id = mealplan_jobs.submit_job(self.USER)
+            future = mealplan_jobs._futures.get(job_id)
+            if future:
+                future.result(timeout=30)
+
+        job = mealplan_jobs.get_job(self.USER, job_id)
+        self.assertEqual(job["status"], constants.MealplanJobStatus.DONE)
+        self.assertTrue(job["result"]["infeasible"])
+
+    @patch.object(mealplan, "get_mealplan_for_user")
+    def test_cancel_running_job(self, mock):
+        job_id = str(uuid.uuid4())
+        mealplan_jobs._set_job(job_id, self.USER.id, constants.MealplanJobStatus.QUEUED)
+
+        def get_mealplan_for_user(luser, num_days=1, should_stop=None):
+            self.assertFalse(should_stop())
+            self.assertTrue(mealplan_jobs.cancel_job(luser, job_id))
+            self.assertTrue(should_stop())
+            return MagicMock()
+
+        mock.side_effect = get_mealplan_for_user
+        mealplan_jobs._run_job(job_id, self.USER.id)
+
+        job = mealplan_jobs.get_job(self.USER, job_id)
+        self.assertEqual(job["status"], constants.MealplanJobStatus.CANCELLED)
+        self.assertIsNone(job["result"])
+
+    def test_get_job_mealplan(self):
+        job = mealplan_jobs.get_job(self.USER, mealplan_jobs.submit_job(self.USER))
+        with patch.object(mealplan.cp_model.CpSolver, "Solve") as mock:
+            lmealplan = mealplan_jobs.get_job_mealplan(self.USER, job)
+
+        mock.assert_not_called()
+        self.assertEqual(lmealplan.quantity_map, job["result"]["quantity_map"])
+        self.assertEqual(lmealplan.plan_id, job["result"]["plan_id"])
+        self.assertEqual([self.USER_INGREDIENT.external_id], [lfood.external_id for lfood in lmealplan.lfoods])
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from django.test import TestCase
+
+from nutrition_tracker.logic import preload
+from nutrition_tracker.models import user_meal
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestLogicPreload(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        test_objects.get_user_food_nutrient()
+        cls.USER_INGREDIENT_2 = test_objects.get_user_ingredient_2()
+        cls.RECIPE = test_objects.get_recipe()
+        test_objects.get_user_food_membership(cls.RECIPE, cls.USER_INGREDIENT_2)
+        lmeal = test_objects.get_meal_today_1()
+        test_objects.get_user_food_membership(lmeal, cls.USER_INGREDIENT)
+        test_objects.get_user_food_membership(lmeal, cls.RECIPE)
+        cls.USER_MEAL = user_meal.load_lmeal(cls.USER, id_=lmeal.id)
+
+    def test_load_preload(self):
+        lpreload = preload.load_preload(self.USER, [self.USER_MEAL])
+        self.assertEqual(set(lpreload.lfoods), {self.USER_INGREDIENT.id, self.USER_INGREDIENT_2.id})
+        self.assertEqual(set(lpreload.lrecipes), {self.RECIPE.id})
+        self.assertEqual(lpreload.lmember_recipes, [lpreload.lrecipes[self.RECIPE.id]])
+        self.assertEqual(len(lpreload.food_nutrients), 1)
+
+    def test_load_preload_empty(self):
+        with self.assertNumQueries(0):
+            lpreload = preload.load_preload(self.USER, [])
+
+        self.assertEqual(lpreload.lfoods, {})
+        self.assertEqual(lpreload.food_nutrients, [])
+
+    def test_get_context(self):
+        context = preload.get_context(self.USER, [self.USER_MEAL])
+        self.assertIs(preload.get_preload(context), context[preload.PRELOAD_KEY])
+        self.assertIsNone(preload.get_preload({}))
+
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import top_foods_indexing
+from nutrition_tracker.models import db_food_nutrient, top_food
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestLogicTopFoodsIndexing(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.CFOOD = test_objects.get_db_food()
+        cls.CFOOD_2 = test_objects.get_db_food_2()
+        test_objects.get_db_food_nutrient()
+        db_food_nutrient.create(id=3, db_food=cls.CFOOD_2, nutrient_id=constants.ENERGY_NUTRIENT_ID, amount=50)
+        test_objects.get_db_food_portion_2()
+
+    def test_get_top_foods(self):
+        top_foods = top_foods_indexing.get_top_foods(constants.ENERGY_NUTRIENT_ID)
+        self.assertEqual([self.CFOOD.id, self.CFOOD_2.id], [tf.db_food_id for tf in top_foods])
+        self.assertEqual([1, 2], [tf.rank for tf in top_foods])
+        self.assertEqual([100, 50], [tf.amount for tf in top_foods])
+
+    def test_get_top_foods_serving(self):
+        top_foods = top_foods_indexing.get_top_foods(
+            constants.ENERGY_NUTRIENT_ID, basis=constants.TopFoodBasis.SERVING
+        )
+        self.assertEqual([self.CFOOD_2.id], [tf.db_food_id for tf in top_foods])
+        self.assertAlmostEqual(73.5, top_foods[0].amount)
+
+    def test_get_top_foods_max_items(self):
+        top_foods = top_foods_indexing.get_top_foods(constants.ENERGY_NUTRIENT_ID, max_items=1)
+        self.assertEqual([self.CFOOD.id], [tf.db_food_id for tf in top_foods])
+
+    def test_get_top_foods_source_sub_types(self):
+        top_foods = top_foods_indexing.get_top_foods(
+            constants.ENERGY_NUTRIENT_ID,
+            db_source_sub_types=[constants.DBFoodSourceSubType.USDA_FOUNDATION_FOOD],
+        )
+        self.assertEqual([self.CFOOD_2.id], [tf.db_food_id for tf in top_foods])
+
+    def test_get_top_foods_category(self):
+        self.assertEqual([], top_foods_indexing.get_top_foods(constants.ENERGY_NUTRIENT_ID, category_id=1))
+
+    def test_get_top_foods_invalid_nutrient(self):
+        self.assertEqual([], top_foods_indexing.get_top_foods(-1))
+
+    def test_write_top_foods_bulk(self):
+        top_foods = top_foods_indexing.get_top_foods(constants.ENERGY_NUTRIENT_ID)
+        top_foods_indexing.write_top_foods_bulk(top_foods, constants.WRITE_BATCH_SIZE)
+        self.assertEqual(2, top_food.load_top_foods(constants.ENERGY_NUTRIENT_ID).count())
+
+
+class TestLogicTopFoodsIndexingGetTopCFoodsForNutrient(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.TOP_FOOD_2 = test_objects.get_top_food_2()
+        cls.TOP_FOOD = test_objects.get_top_food()
+
+    def test_top_cfoods(self):
+        top_cfoods = top_foods_indexing.get_top_cfoods_for_nutrient(constants.ENERGY_NUTRIENT_ID)
+        self.assertEqual([self.TOP_FOOD.db_food, self.TOP_FOOD_2.db_food], top_cfoods)
+
+    def test_top_cfoods_not_indexed(self):
+        self.assertEqual([], top_foods_indexing.get_top_cfoods_for_nutrient(constants.PROTEIN_NUTRIENT_ID))
+
+
+class TestLogicTopFoodsIndexingGetTopCFoodsForNutrientEmptyIndex(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.CFOOD = test_objects.get_db_food()
+        cls.CFOOD_2 = test_objects.get_db_food_2()
+        test_objects.get_db_food_nutrient()
+        db_food_nutrient.create(id=3, db_food=cls.CFOOD_2, nutrient_id=constants.ENERGY_NUTRIENT_ID, amount=50)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_top_cfoods_fallback(self):
+        self.assertTrue(top_food.is_empty())
+        # Same source sub types as top_foods_indexer, only CFOOD_2 is a foundation food.
+        self.assertEqual([self.CFOOD_2], top_foods_indexing.get_top_cfoods_for_nutrient(constants.ENERGY_NUTRIENT_ID))
+
+    def test_top_cfoods_fallback_cached(self):
+        top_foods_indexing.get_top_cfoods_for_nutrient(constants.ENERGY_NUTRIENT_ID)
+        # Index lookup and emptiness check, then the db foods of the cached ranking and their portions.
+        with self.assertNumQueries(4):
+            top_cfoods = top_foods_indexing.get_top_cfoods_for_nutrient(constants.ENERGY_NUTRIENT_ID)
+
+        self.assertEqual([self.CFOOD_2], top_cfoods)
@@ -26,6 +26,13 @@ class TestLogicUserPrefs(TestCase):
         test_objects.get_user_preference()
         self.assertEqual(1, user_prefs.load_food_preferences(self.USER).count())
 
+    def test_has_multi_day_thresholds(self):
+        luser_preference = test_objects.get_user_preference()
+        self.assertFalse(user_prefs.has_multi_day_thresholds(self.USER))
+
+        user_preference_threshold.create(self.USER, user_preference=luser_preference, num_days=7, max_value=500)
+        self.assertTrue(user_prefs.has_multi_day_thresholds(self.USER))
+
     def test_filter_preferences_by_id_empty(self):
         self.assertIsNone(user_prefs.filter_preferences_by_id([]))
 
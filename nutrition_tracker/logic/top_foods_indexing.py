@@ -0,0 +1,124 @@
+"""Top foods indexing module."""
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db.models import F, FloatField, OuterRef, QuerySet, Subquery
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.database import routers
+from nutrition_tracker.logic import food_nutrient
+from nutrition_tracker.models import db_food, db_food_nutrient, db_food_portion, top_food
+
+
+def _get_serving_size_subquery() -> Subquery:
+    """Serving size in grams for the db food of a food nutrient, from its first weighed portion."""
+    qs: QuerySet[db_food_portion.DBFoodPortion] = (
+        db_food_portion.DBFoodPortion.objects.filter(
+            db_food_id=OuterRef("db_food_id"),
+            serving_size__gt=0,
+            serving_size_unit=constants.ServingSizeUnit.WEIGHT,
+        )
+        .order_by("id")
+        .values("serving_size")[:1]
+    )
+    return Subquery(qs, output_field=FloatField())
+
+
+def get_top_foods(  # pylint: disable=too-many-arguments
+    nutrient_id: int,
+    basis: constants.TopFoodBasis = constants.TopFoodBasis.PORTION_SIZE,
+    category_id: int | None = None,
+    db_source_sub_types: list[constants.DBFoodSourceSubType] | None = None,
+    max_items: int = constants.TOP_FOODS_MAX_ITEMS,
+) -> list[top_food.TopFood]:
+    """Rank db foods by the amount of nutrient_id, and return the top max_items as unsaved top food objects."""
+    aliases: list[int] = food_nutrient.get_all_aliases_for_nutrient_id(nutrient_id)
+    if not aliases:
+        return []
+
+    qs: QuerySet[db_food_nutrient.DBFoodNutrient] = db_food_nutrient.load_nutrients(
+        nutrient_ids=aliases, db_source_sub_types=db_source_sub_types
+    ).filter(amount__gt=0)
+    if category_id is not None:
+        qs = qs.filter(db_food__food_category_id=category_id)
+
+    if basis == constants.TopFoodBasis.SERVING:
+        qs = qs.annotate(ranked_amount=F("amount") * _get_serving_size_subquery() / constants.PORTION_SIZE)
+    else:
+        qs = qs.annotate(ranked_amount=F("amount"))
+
+    # A food has at most one row per alias, over-fetch to fill max_items after de-duping foods.
+    rows = (
+        qs.filter(ranked_amount__isnull=False)
+        .order_by("-ranked_amount", "db_food_id")
+        .values_list("db_food_id", "ranked_amount")[: max_items * len(aliases)]
+    )
+
+    top_foods: list[top_food.TopFood] = []
+    db_food_ids: set[int] = set()
+    for db_food_id, amount in rows:
+        if db_food_id in db_food_ids:
+            continue
+
+        db_food_ids.add(db_food_id)
+        top_foods.append(
+            top_food.TopFood(
+                nutrient_id=nutrient_id,
+                basis=basis,
+                category_id=category_id,
+                rank=len(top_foods) + 1,
+                db_food_id=db_food_id,
+                amount=amount,
+            )
+        )
+        if len(top_foods) == max_items:
+            break
+
+    return top_foods
+
+
+def _get_unindexed_top_food_ids(
+    nutrient_id: int, basis: constants.TopFoodBasis, category_id: int | None = None
+) -> list[int]:
+    """Rank db foods live, for when the top foods index has not been written yet."""
+    cache_key: str = f"top_foods:{nutrient_id}:{basis}:{category_id}"
+    db_food_ids: list[int] | None = cache.get(cache_key)
+    if db_food_ids is None:
+        db_food_ids = [
+            top_food_.db_food_id
+            for top_food_ in get_top_foods(
+                nutrient_id,
+                basis=basis,
+                category_id=category_id,
+                db_source_sub_types=constants.TOP_FOODS_DB_SOURCE_SUB_TYPES,
+            )
+        ]
+        cache.set(cache_key, db_food_ids, constants.TOP_FOODS_FALLBACK_CACHE_TIMEOUT)
+
+    return db_food_ids
+
+
+@routers.use_replica()
+def get_top_cfoods_for_nutrient(
+    nutrient_id: int,
+    basis: constants.TopFoodBasis = constants.TopFoodBasis.PORTION_SIZE,
+    category_id: int | None = None,
+) -> list[db_food.DBFood]:
+    """Get top foods containing the given nutrient_id, from the precomputed top foods index.
+    Falls back to ranking foods live while the index is empty, e.g. before top_foods_indexer first runs."""
+    db_food_ids: list[int] = list(
+        top_food.load_top_foods(nutrient_id, basis=basis, category_id=category_id).values_list("db_food_id", flat=True)
+    )
+    if not db_food_ids and top_food.is_empty():
+        db_food_ids = _get_unindexed_top_food_ids(nutrient_id, basis, category_id=category_id)
+
+    if not db_food_ids:
+        return []
+
+    cfoods: dict[int, db_food.DBFood] = {cfood.id: cfood for cfood in db_food.load_cfoods(ids=db_food_ids)}
+    return [cfoods[db_food_id] for db_food_id in db_food_ids if db_food_id in cfoods]
+
+
+def write_top_foods_bulk(items: list[top_food.TopFood], write_batch_size: int) -> None:
+    """Write top foods to the database in batches."""
+    top_food.bulk_create(items, batch_size=write_batch_size)
@@ -22,6 +22,11 @@ def load_food_preferences(user: user_model.User) -> QuerySet[user_preference.Use
     return qs.exclude(food_external_id__isnull=True)
 
 
+def has_multi_day_thresholds(user: user_model.User) -> bool:
+    """Does the user have thresholds over more than one day, e.g. weekly. Mealplans apply daily thresholds only."""
+    return user_preference_threshold.UserPreferenceThreshold.objects.filter(user=user, num_days__gt=1).exists()
+
+
 def filter_preferences_by_id(
     luser_preferences: list[user_preference.UserPreference],
     food_external_id: UUID | None = None,
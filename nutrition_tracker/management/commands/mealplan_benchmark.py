@@ -0,0 +1,54 @@
+"""Mealplan Benchmark Module. Times mealplan solves for synthetic users, and writes a JSON report.
+Reports from different commits, run with the same arguments, are comparable."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from nutrition_tracker.logic import mealplan_benchmark
+
+
+class Command(BaseCommand):
+    """Benchmark mealplan solves."""
+
+    help = "Benchmark mealplan solves for synthetic users."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Command arguments."""
+        parser.add_argument("--num_foods", type=int, default=50, help="foods in the synthetic kitchen")
+        parser.add_argument("--num_recipes", type=int, default=10, help="recipes in the synthetic kitchen")
+        parser.add_argument("--recipe_size", type=int, default=4, help="foods per recipe")
+        parser.add_argument("--recipe_depth", type=int, default=1, help="recipe nesting depth")
+        parser.add_argument("--num_nutrient_thresholds", type=int, default=4, help="nutrient thresholds")
+        parser.add_argument("--num_category_thresholds", type=int, default=2, help="category thresholds")
+        parser.add_argument("--num_food_thresholds", type=int, default=10, help="food thresholds")
+        parser.add_argument("--repeat", type=int, default=3, help="synthetic users to solve")
+        parser.add_argument("--seed", type=int, default=0, help="random seed for synthetic users")
+        parser.add_argument("--label", default="", help="label for the report, e.g. a commit")
+        parser.add_argument("--output", help="report file path, defaults to stdout")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run command."""
+        config: mealplan_benchmark.BenchmarkConfig = mealplan_benchmark.BenchmarkConfig(
+            num_foods=options["num_foods"],
+            num_recipes=options["num_recipes"],
+            recipe_size=options["recipe_size"],
+            recipe_depth=options["recipe_depth"],
+            num_nutrient_thresholds=options["num_nutrient_thresholds"],
+            num_category_thresholds=options["num_category_thresholds"],
+            num_food_thresholds=options["num_food_thresholds"],
+        )
+        report: dict[str, Any] = mealplan_benchmark.run_benchmark(
+            config, repeat=options["repeat"], seed=options["seed"]
+        )
+        report["label"] = options["label"]
+
+        output: str = json.dumps(report, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as report_file:
+                report_file.write(output)
+            self.stdout.write(f"Report written to {options['output']}.")
+        else:
+            self.stdout.write(output)
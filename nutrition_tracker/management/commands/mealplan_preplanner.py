@@ -0,0 +1,82 @@
+"""Mealplan Preplanner Module. Precomputes mealplans for recently active users off-peak, into the mealplan cache.
+Interactive requests with unchanged planner inputs then hit the cache instead of solving."""
+from __future__ import annotations
+
+import datetime
+import itertools
+import zoneinfo
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connections
+from django.utils import timezone
+
+import users.models as user_model
+from nutrition_tracker.biz import user
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import mealplan
+
+
+def preplan_user(user_id: int, days_ahead: int, default_time_zone: str) -> bool:
+    """Solve and cache the mealplan for a user, days_ahead of their local date.
+    Returns False if not solved or infeasible."""
+    luser: user_model.User | None = user.load_luser(id_=user_id)
+    if not luser:
+        return False
+
+    with timezone.override(zoneinfo.ZoneInfo(luser.time_zone or default_time_zone)):
+        plan_date: datetime.date = timezone.localdate() + datetime.timedelta(days=days_ahead)
+        return not mealplan.get_mealplan_for_user(luser, plan_date=plan_date, quantities_only=True).infeasible
+
+
+class Command(BaseCommand):
+    """Precompute mealplans for recently active users."""
+
+    help = "Precompute mealplans for recently active users."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Command arguments."""
+        parser.add_argument("--dry_run", action="store_true", help="dry run")
+        parser.add_argument(
+            "--active_days",
+            type=int,
+            default=constants.MEALPLAN_PREPLAN_ACTIVE_DAYS,
+            help="preplan for users active within this many days",
+        )
+        parser.add_argument("--days_ahead", type=int, default=1, help="plan this many days ahead, 0 plans for today")
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=constants.MEALPLAN_PREPLAN_WORKERS,
+            help="worker processes solving concurrently, 0 solves in this process",
+        )
+        parser.add_argument(
+            "--timezone", default=settings.TIME_ZONE, help="timezone to compute plan dates in, for users without one"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run command."""
+        since: datetime.datetime = timezone.now() - datetime.timedelta(days=options["active_days"])
+
+        user_ids: list[int] = list(user.load_active_lusers(since).values_list("id", flat=True))
+        self.stdout.write(f"Preplanning {len(user_ids)} users {options['days_ahead']} days ahead ...")
+        if options["dry_run"]:
+            return
+
+        results: list[bool] = self.preplan(user_ids, options["days_ahead"], options["timezone"], options["workers"])
+        self.stdout.write(f"Preplanned {sum(results)} of {len(user_ids)} mealplans.")
+
+    def preplan(self, user_ids: list[int], days_ahead: int, default_time_zone: str, workers: int) -> list[bool]:
+        """Preplan users on a pool of worker processes."""
+        if workers <= 0:
+            return [preplan_user(user_id, days_ahead, default_time_zone) for user_id in user_ids]
+
+        # Worker processes open their own connections, don't share the parent's.
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+            return list(
+                executor.map(preplan_user, user_ids, itertools.repeat(days_ahead), itertools.repeat(default_time_zone))
+            )
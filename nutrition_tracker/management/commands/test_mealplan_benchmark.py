@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+
+class TestCommandMealplanBenchmark(TestCase):
+    def call_command(self, *args, **kwargs):
+        out = StringIO()
+        call_command(
+            "mealplan_benchmark",
+            *args,
+            stdout=out,
+            stderr=StringIO(),
+            num_foods=4,
+            num_recipes=1,
+            repeat=1,
+            **kwargs,
+        )
+        return out.getvalue()
+
+    def test_benchmark(self):
+        report = json.loads(self.call_command(label="test"))
+        self.assertEqual("test", report["label"])
+        self.assertEqual(1, len(report["runs"]))
+        self.assertEqual(4, report["config"]["num_foods"])
+
+    def test_benchmark_output(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "report.json")
+            output = self.call_command(output=path)
+            self.assertIn("Report written", output)
+            with open(path, encoding="utf-8") as report_file:
+                self.assertEqual(1, json.load(report_file)["repeat"])
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import datetime
+import zoneinfo
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from ortools.sat.python import cp_model
+
+from nutrition_tracker.logic import mealplan
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestCommandMealplanPreplanner(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER.last_login = timezone.now()
+        cls.USER.save()
+        test_objects.get_user_ingredient()
+        test_objects.get_user_food_nutrient()
+        test_objects.get_user_food_portion()
+        test_objects.get_nutrient_preference()
+
+    def setUp(self):
+        cache.clear()
+
+    def call_command(self, *args, **kwargs):
+        out = StringIO()
+        call_command("mealplan_preplanner", *args, stdout=out, stderr=StringIO(), workers=0, **kwargs)
+        return out.getvalue()
+
+    def test_dry_run(self):
+        with patch.object(mealplan, "get_mealplan_for_user") as mock:
+            output = self.call_command(dry_run=True)
+
+        self.assertIn("Preplanning 1 users", output)
+        mock.assert_not_called()
+
+    def test_inactive_users(self):
+        self.USER.last_login = timezone.now() - datetime.timedelta(days=30)
+        self.USER.save()
+        output = self.call_command()
+        self.assertIn("Preplanning 0 users", output)
+
+    def test_preplanner(self):
+        output = self.call_command()
+        self.assertIn("Preplanned 1 of 1 mealplans", output)
+
+        plan_date = timezone.localdate() + datetime.timedelta(days=1)
+        with patch.object(cp_model.CpSolver, "Solve") as mock:
+            lmealplan = mealplan.get_mealplan_for_user(self.USER, plan_date=plan_date)
+
+        mock.assert_not_called()
+        self.assertFalse(lmealplan.infeasible)
+        self.assertEqual(len(lmealplan.quantity_map), 1)
+
+    def test_preplanner_user_time_zone(self):
+        # More than a day apart, so the local dates always differ.
+        self.USER.time_zone = "Pacific/Kiritimati"
+        self.USER.save()
+        with patch.object(mealplan, "get_mealplan_for_user", wraps=mealplan.get_mealplan_for_user) as mock:
+            self.call_command(timezone="Etc/GMT+12")
+
+        with timezone.override(zoneinfo.ZoneInfo("Pacific/Kiritimati")):
+            plan_date = timezone.localdate() + datetime.timedelta(days=1)
+        mock.assert_called_once_with(self.USER, plan_date=plan_date, quantities_only=True)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.models import top_food
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestCommandTopFoodsIndexer(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        test_objects.get_db_food_2()
+        test_objects.get_top_food()
+        test_objects.get_db_food_nutrient()
+
+    def call_command(self, *args, **kwargs):
+        out = StringIO()
+        call_command("top_foods_indexer", *args, stdout=out, stderr=StringIO(), **kwargs)
+        return out.getvalue()
+
+    def test_dry_run(self):
+        self.call_command(dry_run=True)
+        self.assertEqual(1, top_food._load_queryset().count())
+
+    def test_top_foods_indexer(self):
+        self.call_command(source_sub_types=[constants.DBFoodSourceSubType.USDA_BRANDED_FOOD])
+        qs = top_food.load_top_foods(constants.ENERGY_NUTRIENT_ID)
+        self.assertEqual(1, qs.count())
+        self.assertEqual(100, qs[0].amount)
+        self.assertFalse(top_food.load_top_foods(constants.ENERGY_NUTRIENT_ID, basis=constants.TopFoodBasis.SERVING))
+
+    def test_top_foods_indexer_default_source_sub_types(self):
+        self.call_command()
+        self.assertFalse(top_food._load_queryset().exists())
+
+    def test_top_foods_indexer_nutrient_ids(self):
+        self.call_command(
+            nutrient_ids=[constants.PROTEIN_NUTRIENT_ID],
+            source_sub_types=[constants.DBFoodSourceSubType.USDA_BRANDED_FOOD],
+        )
+        self.assertFalse(top_food._load_queryset().exists())
+
+    def test_top_foods_indexer_category_ids(self):
+        output = self.call_command(
+            category_ids=[1],
+            nutrient_ids=[constants.ENERGY_NUTRIENT_ID],
+            source_sub_types=[constants.DBFoodSourceSubType.USDA_BRANDED_FOOD],
+        )
+        self.assertIn(f"Processed nutrient {constants.ENERGY_NUTRIENT_ID}", output)
+        self.assertEqual(1, top_food._load_queryset().count())
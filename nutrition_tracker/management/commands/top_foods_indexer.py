@@ -0,0 +1,84 @@
+"""Top Foods Indexer Module. Clears and re-computes top foods per nutrient on every run."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+from nutrition_tracker.config import nutrition as nutrition_config
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import top_foods_indexing
+from nutrition_tracker.models import top_food
+
+
+class Command(BaseCommand):
+    """Index top foods per nutrient."""
+
+    help = "Index top foods per nutrient."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Command arguments."""
+        parser.add_argument("--dry_run", action="store_true", help="dry run")
+        parser.add_argument(
+            "--nutrient_ids", nargs="*", type=int, help="nutrient ids to rank foods for, defaults to FDA RDI nutrients"
+        )
+        parser.add_argument(
+            "--category_ids", nargs="*", type=int, default=[], help="additionally rank foods within these categories"
+        )
+        parser.add_argument(
+            "--source_sub_types",
+            nargs="*",
+            type=int,
+            choices=constants.DBFoodSourceSubType.values,
+            help="db food source sub types to rank, defaults to foundation and sr legacy foods",
+        )
+        parser.add_argument(
+            "--max_items", type=int, default=constants.TOP_FOODS_MAX_ITEMS, help="foods per nutrient ranking"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Run command."""
+        dry_run: bool = options["dry_run"]
+        nutrient_ids: list[int] = options["nutrient_ids"] or [
+            rdi.nutrient_id for rdi in nutrition_config.fda_nutrient_rdis
+        ]
+        category_ids: list[int | None] = [None, *options["category_ids"]]
+        source_sub_types: list[int] = options["source_sub_types"] or constants.TOP_FOODS_DB_SOURCE_SUB_TYPES
+
+        index_items: list[top_food.TopFood] = self.get_index_items(
+            nutrient_ids, category_ids, source_sub_types, options["max_items"]
+        )
+        if not dry_run:
+            self.write_index(index_items)
+
+    def get_index_items(
+        self, nutrient_ids: list[int], category_ids: list[int | None], source_sub_types: list[int], max_items: int
+    ) -> list[top_food.TopFood]:
+        """Rank db foods for every nutrient, basis and category combination."""
+        items: list[top_food.TopFood] = []
+        for nutrient_id in nutrient_ids:
+            for basis in constants.TopFoodBasis:
+                for category_id in category_ids:
+                    items.extend(
+                        top_foods_indexing.get_top_foods(
+                            nutrient_id,
+                            basis=basis,
+                            category_id=category_id,
+                            db_source_sub_types=source_sub_types,  # type: ignore
+                            max_items=max_items,
+                        )
+                    )
+
+            self.stdout.write(f"Processed nutrient {nutrient_id} ...")
+
+        return items
+
+    def write_index(self, items: list[top_food.TopFood]) -> None:
+        """Replace the top foods index."""
+        self.stdout.write("Writing top foods index ...")
+        # Swap the index atomically, readers never see a partially written index.
+        with transaction.atomic():
+            top_food.delete_all()
+            top_foods_indexing.write_top_foods_bulk(items, constants.WRITE_BATCH_SIZE)
+        self.stdout.write("Index written.")
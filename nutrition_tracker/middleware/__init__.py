@@ -1,2 +1,5 @@
 """Middleware hooks responsible for specific tasks during request/response processing."""
 from .timezone import TimezoneMiddleware
+from .request_cache import RequestCacheMiddleware
+from .replica import ReplicaRoutingMiddleware
+from .query_stats import QueryStatsMiddleware
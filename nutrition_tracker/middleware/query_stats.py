@@ -0,0 +1,55 @@
+"""Query stats middleware."""
+from __future__ import annotations
+
+import logging
+from typing import Callable
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.utils import query_stats
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Time"
+
+
+class QueryStatsMiddleware:  # pylint: disable=too-few-public-methods
+    """
+    Middleware to report query count and DB time per request, in response headers and/or logs
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        self.headers: bool = settings.QUERY_STATS_HEADERS
+        self.log: bool = settings.QUERY_STATS_LOG
+        if not self.headers and not self.log:
+            raise MiddlewareNotUsed()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        with query_stats.record() as stats:
+            response: HttpResponse = self.get_response(request)
+
+        db_time: str = f"{stats.duration * 1000:.1f}"  # milliseconds
+        if self.headers:
+            response[QUERY_COUNT_HEADER] = str(stats.count)
+            response[QUERY_TIME_HEADER] = db_time
+
+        if self.log:
+            duplicates: dict[str, int] = stats.get_duplicates(constants.QUERY_STATS_MAX_REPEATS)
+            logger.log(
+                logging.WARNING if duplicates else logging.INFO,
+                "%s %s queries=%d db_ms=%s max_repeats=%d",
+                request.method,
+                request.path,
+                stats.count,
+                db_time,
+                stats.get_max_repeats(),
+            )
+            for fingerprint, count in duplicates.items():
+                logger.warning("Repeated query (%d times): %s", count, fingerprint)
+
+        return response
@@ -0,0 +1,25 @@
+"""Replica routing middleware."""
+from __future__ import annotations
+
+from contextvars import Token
+from typing import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from nutrition_tracker.database import routers
+
+
+class ReplicaRoutingMiddleware:  # pylint: disable=too-few-public-methods
+    """
+    Middleware to track writes during a request, and pin users that wrote to the primary database
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        token: Token = routers.activate(request)
+        try:
+            return self.get_response(request)
+        finally:
+            routers.deactivate(token)
@@ -0,0 +1,25 @@
+"""Request cache middleware."""
+from __future__ import annotations
+
+from contextvars import Token
+from typing import Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from nutrition_tracker.utils import request_cache
+
+
+class RequestCacheMiddleware:  # pylint: disable=too-few-public-methods
+    """
+    Middleware to memoize repeated lookups for the duration of a request
+    """
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        token: Token = request_cache.activate()
+        try:
+            return self.get_response(request)
+        finally:
+            request_cache.deactivate(token)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import TestCase, override_settings
+from django.test.client import RequestFactory
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.middleware import QueryStatsMiddleware
+from nutrition_tracker.middleware import query_stats as query_stats_middleware
+from nutrition_tracker.models import db_food
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestMiddlewareQueryStats(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.DB_FOOD = test_objects.get_db_food()
+
+    def get_response(self, request):
+        for _unused in range(2):
+            db_food.DBFood.objects.get(id=self.DB_FOOD.id)
+        return HttpResponse()
+
+    @override_settings(QUERY_STATS_HEADERS=False, QUERY_STATS_LOG=False)
+    def test_disabled(self):
+        self.assertRaises(MiddlewareNotUsed, QueryStatsMiddleware, self.get_response)
+
+    @override_settings(QUERY_STATS_HEADERS=True, QUERY_STATS_LOG=False)
+    def test_headers(self):
+        response = QueryStatsMiddleware(self.get_response)(RequestFactory().get("/"))
+        self.assertEqual("2", response[query_stats_middleware.QUERY_COUNT_HEADER])
+        self.assertIn(query_stats_middleware.QUERY_TIME_HEADER, response)
+
+    @override_settings(QUERY_STATS_HEADERS=False, QUERY_STATS_LOG=True)
+    def test_log(self):
+        with self.assertLogs(query_stats_middleware.logger, level="INFO") as logs:
+            response = QueryStatsMiddleware(self.get_response)(RequestFactory().get("/"))
+
+        self.assertNotIn(query_stats_middleware.QUERY_COUNT_HEADER, response)
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("GET / queries=2", logs.output[0])
+
+    @override_settings(QUERY_STATS_HEADERS=False, QUERY_STATS_LOG=True)
+    @patch.object(constants, "QUERY_STATS_MAX_REPEATS", 1)
+    def test_log_repeats(self):
+        with self.assertLogs(query_stats_middleware.logger, level="INFO") as logs:
+            QueryStatsMiddleware(self.get_response)(RequestFactory().get("/"))
+
+        self.assertEqual(2, len(logs.records))
+        self.assertIn("Repeated query (2 times)", logs.output[1])
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import SimpleTestCase
+from django.test.client import RequestFactory
+
+from nutrition_tracker.database import routers
+from nutrition_tracker.middleware import ReplicaRoutingMiddleware
+from nutrition_tracker.models import db_food
+
+
+class TestMiddlewareReplicaRouting(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def get_request(self):
+        request = RequestFactory().get("/")
+        request.user = SimpleNamespace(is_authenticated=True, id=1)
+        return request
+
+    @patch.object(routers, "is_replica_configured", return_value=True)
+    def test_replica_routing(self, _mock):
+        pinned = []
+
+        def read(request):
+            pinned.append(routers.is_pinned())
+            return HttpResponse()
+
+        def write(request):
+            routers.ReplicaRouter().db_for_write(db_food.DBFood)
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(read)(self.get_request())
+        ReplicaRoutingMiddleware(write)(self.get_request())
+        ReplicaRoutingMiddleware(read)(self.get_request())
+        self.assertEqual([False, True], pinned)
+        self.assertFalse(routers.is_pinned())
+
+    def test_replica_routing_exception(self):
+        def get_response(request):
+            raise ValueError()
+
+        with self.assertRaises(ValueError):
+            ReplicaRoutingMiddleware(get_response)(self.get_request())
+        self.assertIsNone(routers._routing_state.get())
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from django.http import HttpResponse
+from django.test import SimpleTestCase
+from django.test.client import RequestFactory
+
+from nutrition_tracker.middleware import RequestCacheMiddleware
+from nutrition_tracker.utils import request_cache
+
+
+class TestMiddlewareRequestCache(SimpleTestCase):
+    def test_request_cache(self):
+        request_caches = []
+
+        def get_response(request):
+            request_caches.append(request_cache.get_request_cache())
+            return HttpResponse()
+
+        request = RequestFactory().get("/")
+        RequestCacheMiddleware(get_response)(request)
+        RequestCacheMiddleware(get_response)(request)
+        self.assertIsInstance(request_caches[0], request_cache.RequestCache)
+        self.assertIsNot(request_caches[0], request_caches[1])
+        self.assertIsNone(request_cache.get_request_cache())
+
+    def test_request_cache_exception(self):
+        def get_response(request):
+            raise ValueError()
+
+        request = RequestFactory().get("/")
+        with self.assertRaises(ValueError):
+            RequestCacheMiddleware(get_response)(request)
+        self.assertIsNone(request_cache.get_request_cache())
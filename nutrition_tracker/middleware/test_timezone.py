@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from http import HTTPStatus
 from unittest.mock import Mock
 
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
 from django.test.client import RequestFactory
+from django.urls import reverse
 from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 from nutrition_tracker.middleware import TimezoneMiddleware
+from nutrition_tracker.rest_framework.views import APIMyMeals
+from nutrition_tracker.tests import objects as test_objects
 
 
 class TestMiddlewareTimezone(SimpleTestCase):
@@ -16,3 +21,37 @@ class TestMiddlewareTimezone(SimpleTestCase):
         request.COOKIES["user_tz"] = "Europe/London"
         TimezoneMiddleware(get_response)(request)
         self.assertEqual(timezone.get_current_timezone_name(), "Europe/London")
+
+    def test_timezone_header(self):
+        request = RequestFactory().get("/", HTTP_X_USER_TZ="Asia/Kolkata")
+        TimezoneMiddleware(Mock())(request)
+        self.assertEqual(timezone.get_current_timezone_name(), "Asia/Kolkata")
+
+
+class TestMiddlewareTimezoneUser(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+
+    def test_timezone_stored(self):
+        request = RequestFactory().get("/")
+        request.COOKIES["user_tz"] = "Europe/London"
+        request.user = self.USER
+        TimezoneMiddleware(Mock())(request)
+        self.USER.refresh_from_db()
+        self.assertEqual("Europe/London", self.USER.time_zone)
+
+        with self.assertNumQueries(0):
+            TimezoneMiddleware(Mock())(request)
+
+    def test_timezone_stored_api(self):
+        # API requests are authenticated by the view, not before the middleware runs.
+        request = APIRequestFactory().get(
+            reverse("api_my_meals"), HTTP_X_API_KEY=test_objects.get_api_key(), HTTP_X_USER_TZ="Asia/Kolkata"
+        )
+        force_authenticate(request, user=self.USER)
+        response = TimezoneMiddleware(APIMyMeals.as_view())(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.USER.refresh_from_db()
+        self.assertEqual("Asia/Kolkata", self.USER.time_zone)
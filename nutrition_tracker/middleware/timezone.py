@@ -8,6 +8,8 @@ from urllib.parse import unquote
 from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
 
+from nutrition_tracker.biz import user
+
 
 class TimezoneMiddleware:  # pylint: disable=too-few-public-methods
     """
@@ -18,12 +20,20 @@ class TimezoneMiddleware:  # pylint: disable=too-few-public-methods
         self.get_response = get_response
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # we are getting the users timezone from the cookie
-        tz_str: str | None = request.COOKIES.get("user_tz")
+        # we are getting the users timezone from the cookie, API clients send it in the X-User-TZ header
+        tz_str: str | None = request.COOKIES.get("user_tz") or request.headers.get("X-User-TZ")
         if tz_str:
             tz_str = unquote(tz_str)
             timezone.activate(zoneinfo.ZoneInfo(tz_str))
         else:
             timezone.deactivate()
 
-        return self.get_response(request)
+        response: HttpResponse = self.get_response(request)
+
+        # Stored for offline work in the user's timezone, e.g. mealplan preplanning.
+        # Read after the view, API requests are authenticated by the view and set request.user there.
+        luser = getattr(request, "user", None)
+        if tz_str and luser and luser.is_authenticated:
+            user.set_time_zone(luser, tz_str)
+
+        return response
@@ -5,7 +5,9 @@ from .db_food import DBFood  # noqa I100. IdBase is imported first.
 from .db_branded_food import DBBrandedFood  # noqa I100. DBFood is imported first.
 from .db_food_nutrient import DBFoodNutrient
 from .db_food_portion import DBFoodPortion
+from .mealplan_solve_stat import MealplanSolveStat
 from .search_result import SearchResult
+from .top_food import TopFood
 from .usda_food import USDAFood
 from .usda_branded_food import USDABrandedFood  # noqa I100. USDAFood is imported first.
 from .usda_fndds_food import USDAFnddsFood
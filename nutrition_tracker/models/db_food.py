@@ -157,6 +157,6 @@ def update_or_create(defaults: MutableMapping[str, Any] | None = None, **kwargs:
     return db_models.update_or_create(DBFood, defaults=defaults, **kwargs)
 
 
-def load_cfoods_iterator() -> Iterator[DBFood]:
-    """Returns an iterator over all db foods."""
-    return DBFood.objects.select_related("dbbrandedfood").all().iterator()
+def load_cfoods_iterator(chunk_size: int | None = None) -> Iterator[DBFood]:
+    """Returns an iterator over all db foods, in id order."""
+    return db_models.iterate(DBFood.objects.select_related("dbbrandedfood"), chunk_size=chunk_size)
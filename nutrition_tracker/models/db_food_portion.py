@@ -167,6 +167,13 @@ def load_portions(
     return db_models.bulk_load(qs, params)
 
 
+def bulk_create(
+    objs: list[DBFoodPortion], batch_size: int | None = None, ignore_conflicts: bool = False
+) -> list[DBFoodPortion]:
+    """Insert the provided list of db food portion objects into the database."""
+    return db_models.bulk_create(DBFoodPortion, objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+
+
 def create(**kwargs: Any) -> DBFoodPortion:
     """Create and save a db food portion in the database."""
     return db_models.create(DBFoodPortion, **kwargs)
@@ -0,0 +1,77 @@
+"""Model and APIs for mealplan solver statistics."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import models
+from django.db.models import QuerySet
+
+import users.models as user_model
+from nutrition_tracker.database import models as db_models
+from nutrition_tracker.models import user_base
+
+
+class MealplanSolveStat(user_base.UserBase):
+    """DB Model for mealplan solver statistics, one row per solve."""
+
+    num_foods = models.PositiveIntegerField(
+        verbose_name="num_foods", help_text="Number of candidate foods and recipes in the model."
+    )
+    num_nutrient_constraints = models.PositiveIntegerField(
+        verbose_name="num_nutrient_constraints", help_text="Number of nutrient preferences in the model."
+    )
+    num_category_constraints = models.PositiveIntegerField(
+        verbose_name="num_category_constraints", help_text="Number of category preferences in the model."
+    )
+    num_days = models.PositiveSmallIntegerField(
+        default=1, verbose_name="num_days", help_text="Number of days planned in the model."
+    )
+    num_search_workers = models.PositiveSmallIntegerField(
+        verbose_name="num_search_workers", help_text="Solver search workers used for the solve."
+    )
+    max_time_in_seconds = models.FloatField(
+        verbose_name="max_time_in_seconds", help_text="Solver time limit used for the solve."
+    )
+    warm_start = models.BooleanField(
+        default=False, verbose_name="warm_start", help_text="Solve was hinted with a previous solution."
+    )
+    status = models.CharField(max_length=20, verbose_name="status", help_text="Solver status name.")
+    wall_time = models.FloatField(verbose_name="wall_time", help_text="Solver wall time in seconds.")
+    objective_value = models.FloatField(
+        null=True, blank=True, verbose_name="objective_value", help_text="Objective value of the solution."
+    )
+    best_objective_bound = models.FloatField(
+        null=True, blank=True, verbose_name="best_objective_bound", help_text="Best proven objective bound."
+    )
+    gap = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name="gap",
+        help_text="Relative gap between the objective bound and value, 0 for optimal solutions.",
+    )
+
+    class Meta(user_base.UserBase.Meta):
+        db_table = "gt_mealplan_solve_stat"
+
+
+def empty_qs() -> QuerySet[MealplanSolveStat]:
+    """Empty QuerySet."""
+    return db_models.empty_qs(MealplanSolveStat)
+
+
+def _load_queryset(luser: user_model.User) -> QuerySet[MealplanSolveStat]:
+    """Base QuerySet for mealplan solve stats. All other APIs filter on this queryset."""
+    if not luser.is_authenticated:
+        return empty_qs()
+
+    return MealplanSolveStat.objects.filter(user=luser)
+
+
+def load_solve_stats(luser: user_model.User) -> QuerySet[MealplanSolveStat]:
+    """Batch load mealplan solve stats for a user."""
+    return db_models.bulk_load(_load_queryset(luser), {})
+
+
+def create(luser: user_model.User, **kwargs: Any) -> MealplanSolveStat:
+    """Create and save a mealplan solve stat in the database."""
+    return db_models.create(MealplanSolveStat, user=luser, **kwargs)
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+
+from nutrition_tracker.models import mealplan_solve_stat
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestModelsMealplanSolveStat(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_2 = test_objects.get_user_2()
+        cls.SOLVE_STAT = mealplan_solve_stat.create(
+            cls.USER,
+            num_foods=2,
+            num_nutrient_constraints=1,
+            num_category_constraints=0,
+            num_search_workers=1,
+            max_time_in_seconds=1,
+            status="OPTIMAL",
+            wall_time=0.01,
+            objective_value=1,
+            best_objective_bound=1,
+            gap=0,
+        )
+
+    def test_empty_qs(self):
+        self.assertFalse(mealplan_solve_stat.empty_qs().exists())
+
+    def test_load_queryset_anonymous_user(self):
+        self.assertFalse(mealplan_solve_stat._load_queryset(AnonymousUser()).exists())
+
+    def test_load_solve_stats(self):
+        self.assertEqual([self.SOLVE_STAT], list(mealplan_solve_stat.load_solve_stats(self.USER)))
+        self.assertFalse(mealplan_solve_stat.load_solve_stats(self.USER_2).exists())
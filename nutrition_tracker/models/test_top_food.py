@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from django.test import TestCase
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.models import top_food
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestModelsTopFood(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.TOP_FOOD_2 = test_objects.get_top_food_2()
+        cls.TOP_FOOD = test_objects.get_top_food()
+
+    def test_empty_qs(self):
+        self.assertFalse(top_food.empty_qs().exists())
+
+    def test_load_queryset(self):
+        self.assertEqual(2, top_food._load_queryset().count())
+
+    def test_load_top_foods(self):
+        self.assertEqual([self.TOP_FOOD, self.TOP_FOOD_2], list(top_food.load_top_foods(constants.ENERGY_NUTRIENT_ID)))
+
+    def test_load_top_foods_max_rows(self):
+        self.assertEqual([self.TOP_FOOD], list(top_food.load_top_foods(constants.ENERGY_NUTRIENT_ID, max_rows=1)))
+
+    def test_load_top_foods_basis(self):
+        self.assertFalse(
+            top_food.load_top_foods(constants.ENERGY_NUTRIENT_ID, basis=constants.TopFoodBasis.SERVING).exists()
+        )
+
+    def test_load_top_foods_category(self):
+        self.assertFalse(top_food.load_top_foods(constants.ENERGY_NUTRIENT_ID, category_id=1).exists())
+
+    def test_load_top_foods_other_nutrient(self):
+        self.assertFalse(top_food.load_top_foods(constants.PROTEIN_NUTRIENT_ID).exists())
+
+    def test_delete_all(self):
+        top_food.delete_all()
+        self.assertFalse(top_food._load_queryset().exists())
@@ -78,23 +78,23 @@ class TestModelsUSDAFood(TestCase):
 
     def test_load_cfoods_iterator_with_start_no_rows(self):
         usda_food.create(fdc_id=3, data_type=constants.USDA_FOUNDATION_FOOD)
-        qs = usda_food.load_cfoods_iterator(start=1)
-        self.assertEqual(1, qs.count())
+        foods = list(usda_food.load_cfoods_iterator(start=1))
+        self.assertEqual(1, len(foods))
 
     def test_load_cfoods_iterator_no_start_with_rows(self):
         usda_food.create(fdc_id=3, data_type=constants.USDA_FOUNDATION_FOOD)
-        qs = usda_food.load_cfoods_iterator(rows=1)
-        self.assertEqual(1, qs.count())
+        foods = list(usda_food.load_cfoods_iterator(rows=1))
+        self.assertEqual(1, len(foods))
 
     def test_load_cfoods_iterator_no_start_with_rows_more_than_total_foods(self):
         usda_food.create(fdc_id=3, data_type=constants.USDA_FOUNDATION_FOOD)
-        qs = usda_food.load_cfoods_iterator(rows=6)
-        self.assertEqual(2, qs.count())
+        foods = list(usda_food.load_cfoods_iterator(rows=6))
+        self.assertEqual(2, len(foods))
 
     def test_load_cfoods_iterator_with_start_and_rows(self):
         usda_food.create(fdc_id=3, data_type=constants.USDA_FOUNDATION_FOOD)
-        qs = usda_food.load_cfoods_iterator(start=1, rows=1)
-        self.assertEqual(1, qs.count())
+        foods = list(usda_food.load_cfoods_iterator(start=1, rows=1))
+        self.assertEqual(1, len(foods))
 
     def test_load_cfoods_iterator_with_data_type(self):
         USDA_FOOD_3 = usda_food.create(fdc_id=3, data_type=constants.USDA_FOUNDATION_FOOD)
@@ -37,6 +37,25 @@ class TestModelsUserFoodPortion(TestCase):
         user = test_objects.get_user()
         self.assertEqual(1, user_food_portion.load_lfood_portions(user, ids=[self.FOOD_PORTION.id]).count())
 
+    def test_load_portions_content_object(self):
+        user = test_objects.get_user()
+        self.assertEqual(
+            1,
+            user_food_portion.load_lfood_portions(
+                user,
+                content_type_id=data_loaders.get_content_type_ingredient_id(),
+                object_ids=[self.FOOD_PORTION.object_id],
+            ).count(),
+        )
+        self.assertEqual(
+            0,
+            user_food_portion.load_lfood_portions(
+                user,
+                content_type_id=data_loaders.get_content_type_recipe_id(),
+                object_ids=[self.FOOD_PORTION.object_id],
+            ).count(),
+        )
+
     def test_create(self):
         user = test_objects.get_user()
         user_food_portion.create(
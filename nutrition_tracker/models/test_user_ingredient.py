@@ -3,6 +3,7 @@ from __future__ import annotations
 from django.test import TestCase
 
 from nutrition_tracker.biz import user
+from nutrition_tracker.constants import constants
 from nutrition_tracker.models import user_ingredient
 from nutrition_tracker.tests import constants as test_constants
 from nutrition_tracker.tests import objects as test_objects
@@ -41,6 +42,31 @@ class TestModelsUserIngredient(TestCase):
     def test_load_queryset(self):
         self.assertEqual(2, user_ingredient._load_queryset(self.USER).count())
 
+    def test_load_queryset_load_profile_ids(self):
+        lfood = user_ingredient.load_lfood(
+            self.USER, id_=self.USER_INGREDIENT.id, load_profile=constants.LoadProfile.IDS
+        )
+        self.assertEqual(self.USER_INGREDIENT, lfood)
+        self.assertFalse(hasattr(lfood, "coalesced_name"))
+        self.assertFalse(hasattr(lfood, "branded_foods"))
+        self.assertFalse(hasattr(lfood, "portions"))
+
+    def test_load_queryset_load_profile_display(self):
+        test_objects.get_user_branded_food()
+        lfood = user_ingredient.load_lfood(
+            self.USER, id_=self.USER_INGREDIENT.id, load_profile=constants.LoadProfile.DISPLAY
+        )
+        self.assertFalse(hasattr(lfood, "portions"))
+        with self.assertNumQueries(0):
+            self.assertEqual("test", lfood.display_name)
+            self.assertEqual("brand, owner", lfood.display_brand_details)
+
+    def test_load_queryset_load_profile_full(self):
+        lfood = user_ingredient.load_lfood(self.USER, id_=self.USER_INGREDIENT.id)
+        self.assertTrue(hasattr(lfood, "coalesced_name"))
+        self.assertTrue(hasattr(lfood, "branded_foods"))
+        self.assertTrue(hasattr(lfood, "portions"))
+
     def test_load_queryset_with_family(self):
         luser_2 = test_objects.get_user_2()
         user.create_family(self.USER, luser_2.email)
@@ -67,6 +93,16 @@ class TestModelsUserIngredient(TestCase):
         qs = user_ingredient._load_queryset(luser_2)
         self.assertEqual(3, user_ingredient._filter_duplicate_db_foods(luser_2, qs).count())
 
+        # Each user keeps their own duplicate
+        for luser in [self.USER, luser_2]:
+            own_db_food_ids = set(
+                user_ingredient.UserIngredient.objects.filter(user=luser).values_list("db_food_id", flat=True)
+            )
+            qs = user_ingredient._filter_duplicate_db_foods(luser, user_ingredient._load_queryset(luser))
+            for lfood in qs:
+                if lfood.db_food_id in own_db_food_ids:
+                    self.assertEqual(luser.id, lfood.user_id)
+
     def test_load_lfood_no_params(self):
         self.assertIsNone(user_ingredient.load_lfood(self.USER))
 
@@ -26,6 +26,18 @@ class TestModelsUserMeal(TestCase):
     def test_load_queryset(self):
         self.assertEqual(4, user_meal._load_queryset(self.USER).count())
 
+    def test_load_queryset_load_profile(self):
+        with self.assertNumQueries(1):
+            lmeals = list(user_meal.load_lmeals(self.USER, load_profile=constants.LoadProfile.IDS))
+        self.assertEqual(4, len(lmeals))
+        self.assertFalse(hasattr(lmeals[0], "members"))
+
+        with self.assertNumQueries(1):
+            lmeals = list(user_meal.load_lmeals(self.USER, load_profile=constants.LoadProfile.DISPLAY))
+        self.assertFalse(hasattr(lmeals[0], "members"))
+
+        self.assertTrue(hasattr(user_meal.load_lmeal(self.USER, id_=self.USER_MEAL_1.id), "members"))
+
     def test_load_lmeal_no_params(self):
         self.assertIsNone(user_meal.load_lmeal(self.USER))
 
@@ -98,3 +110,14 @@ class TestModelsUserMeal(TestCase):
             self.USER, defaults={"meal_type": constants.MealType.DINNER}, external_id=test_constants.TEST_UUID_3
         )
         self.assertEqual(5, user_meal.load_lmeals(self.USER).count())
+
+    def test_delete_empty_lmeals(self):
+        test_objects.get_user_food_membership(self.USER_MEAL_1, test_objects.get_user_ingredient())
+        with self.assertNumQueries(0):
+            user_meal.delete_empty_lmeals(self.USER, [])
+
+        user_meal.delete_empty_lmeals(self.USER, [self.USER_MEAL_1.id, self.USER_MEAL_2.id])
+        self.assertEqual(
+            {self.USER_MEAL_1.id, self.USER_MEAL_3.id, self.USER_MEAL_4.id},
+            set(user_meal.load_lmeals(self.USER).values_list("id", flat=True)),
+        )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from django.test import TestCase
 
 from nutrition_tracker.biz import user
+from nutrition_tracker.constants import constants
 from nutrition_tracker.models import user_recipe
 from nutrition_tracker.tests import constants as test_constants
 from nutrition_tracker.tests import objects as test_objects
@@ -22,6 +23,21 @@ class TestModelsUserRecipe(TestCase):
     def test_load_queryset(self):
         self.assertEqual(1, user_recipe._load_queryset(self.USER).count())
 
+    def test_load_queryset_load_profile(self):
+        lrecipe = user_recipe.load_lrecipe(self.USER, id_=self.USER_RECIPE.id, load_profile=constants.LoadProfile.IDS)
+        self.assertFalse(hasattr(lrecipe, "portions"))
+        self.assertFalse(hasattr(lrecipe, "members"))
+
+        lrecipe = user_recipe.load_lrecipe(
+            self.USER, id_=self.USER_RECIPE.id, load_profile=constants.LoadProfile.DISPLAY
+        )
+        self.assertTrue(hasattr(lrecipe, "portions"))
+        self.assertFalse(hasattr(lrecipe, "members"))
+
+        lrecipe = user_recipe.load_lrecipe(self.USER, id_=self.USER_RECIPE.id)
+        self.assertTrue(hasattr(lrecipe, "portions"))
+        self.assertTrue(hasattr(lrecipe, "members"))
+
     def test_load_queryset_with_family(self):
         luser_2 = test_objects.get_user_2()
         user.create_family(self.USER, luser_2.email)
@@ -0,0 +1,97 @@
+"""Model and APIs for precomputed top foods per nutrient."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import models
+from django.db.models import QuerySet
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.database import models as db_models
+from nutrition_tracker.models import db_food, id_base
+
+
+class TopFood(id_base.IdBase):
+    """DB Model for top foods ranked by nutrient amount."""
+
+    nutrient_id = models.PositiveIntegerField(
+        verbose_name="nutrient_id", help_text="ID of the nutrient the food is ranked for."
+    )
+    basis = models.PositiveSmallIntegerField(
+        default=constants.TopFoodBasis.PORTION_SIZE,
+        choices=constants.TopFoodBasis.choices,
+        verbose_name="basis",
+        help_text="Basis of the nutrient amount used for ranking.",
+    )
+    category_id = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="food_category_id",
+        help_text="Id of the food category the ranking is restricted to, null for all foods.",
+    )
+    rank = models.PositiveSmallIntegerField(verbose_name="rank", help_text="Rank of the food, starting at 1.")
+    db_food = models.ForeignKey(
+        db_food.DBFood,
+        on_delete=models.CASCADE,
+        verbose_name="db_food",
+        help_text="DB Food for this ranking.",
+    )
+    amount = models.FloatField(
+        verbose_name="amount", help_text="Amount of the nutrient in the food, on the given basis."
+    )
+
+    class Meta(id_base.IdBase.Meta):
+        db_table = "gt_top_food"
+        indexes = [
+            models.Index(name="top_food_lookup_idx", fields=["nutrient_id", "basis", "category_id", "rank"]),
+        ]
+
+
+def empty_qs() -> QuerySet[TopFood]:
+    """Empty QuerySet."""
+    return db_models.empty_qs(TopFood)
+
+
+def _load_queryset() -> QuerySet[TopFood]:
+    """Base QuerySet for top foods. All other APIs filter on this queryset."""
+    return TopFood.objects.all()
+
+
+def load_top_foods(
+    nutrient_id: int,
+    basis: constants.TopFoodBasis = constants.TopFoodBasis.PORTION_SIZE,
+    category_id: int | None = None,
+    max_rows: int | None = None,
+) -> QuerySet[TopFood]:
+    """Load top foods for a nutrient, ordered by rank."""
+    params: dict[str, Any] = {"nutrient_id": nutrient_id, "basis": basis}
+    if category_id is None:
+        params["category_id__isnull"] = True
+    else:
+        params["category_id"] = category_id
+
+    qs: QuerySet[TopFood] = _load_queryset().filter(**params).order_by("rank")
+    if max_rows:
+        qs = qs[:max_rows]
+
+    return qs
+
+
+def is_empty() -> bool:
+    """True if no top foods are indexed."""
+    return not _load_queryset().exists()
+
+
+def bulk_create(objs: list[TopFood], batch_size: int | None = None) -> list[TopFood]:
+    """Insert the provided list of top foods into the database."""
+    return db_models.bulk_create(TopFood, objs, batch_size=batch_size)
+
+
+def create(**kwargs: Any) -> TopFood:
+    """Create and save a top food in the database."""
+    return db_models.create(TopFood, **kwargs)
+
+
+def delete_all() -> None:
+    """Delete all top food objects in the database."""
+    _load_queryset().delete()
@@ -141,13 +141,13 @@ def update_or_create(defaults: MutableMapping[str, Any] | None = None, **kwargs:
 
 
 def load_cfoods_iterator(
-    start: int | None = None, rows: int | None = None, data_types: list[str] | None = None
-) -> Iterator[USDAFood] | QuerySet[USDAFood]:
-    """Returns an iterator over all usda foods."""
-    if start is None:
-        start = 0
-    if rows is None:
-        rows = 0
+    start: int | None = None,
+    rows: int | None = None,
+    data_types: list[str] | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[USDAFood]:
+    """Returns an iterator over all usda foods, in fdc_id order.
+    Skips the first start foods, and stops after rows foods if rows is set."""
     if data_types is None:
         data_types = constants.USDA_DATA_TYPES
 
@@ -156,16 +156,4 @@ def load_cfoods_iterator(
         .prefetch_related("usdafoodportion_set", "usdafoodnutrient_set")
         .filter(data_type__in=data_types)
     )
-
-    # Slicing and iteration don't work together.
-    # Return the sliced queryset if start/rows are specified.
-    if start > 0:
-        if not rows:
-            return qs[start:]
-
-        return qs[start : start + rows]
-
-    if rows > 0:
-        return qs[0:rows]
-
-    return qs.iterator()
+    return db_models.iterate(qs, chunk_size=chunk_size, start=start or 0, rows=rows or 0)
@@ -60,9 +60,7 @@ def _load_queryset(luser: user_model.User) -> QuerySet[UserFoodMembership]:
     if not luser.is_authenticated:
         return empty_qs()
 
-    params: dict[str, QuerySet[user_model.User] | list[user_model.User]] = {
-        "user__in": user.get_family_members(luser) or [luser]
-    }
+    params: dict[str, list[int]] = {"user_id__in": user.get_family_member_ids(luser)}
     return UserFoodMembership.objects.prefetch_related(Prefetch("portion", to_attr="portions")).filter(**params)
 
 
@@ -117,6 +115,18 @@ def load_lmemberships(  # pylint: disable=too-many-arguments
     return qs.filter(**params)
 
 
+def bulk_create(
+    objs: list[UserFoodMembership], batch_size: int | None = None, ignore_conflicts: bool = False
+) -> list[UserFoodMembership]:
+    """Insert the provided list of user food membership objects into the database."""
+    return db_models.bulk_create(UserFoodMembership, objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+
+
+def bulk_update(objs: list[UserFoodMembership], fields: list[str], batch_size: int | None = None) -> None:
+    """Update the given fields on the provided model instances."""
+    return db_models.bulk_update(UserFoodMembership, objs, fields, batch_size=batch_size)
+
+
 def create(luser: user_model.User, **kwargs: Any) -> UserFoodMembership:
     """Create and save a user food membership in the database."""
     return db_models.create(UserFoodMembership, user=luser, **kwargs)
@@ -56,9 +56,7 @@ def _load_queryset(luser: user_model.User) -> QuerySet[UserFoodNutrient]:
     if not luser.is_authenticated:
         return empty_qs()
 
-    params: dict[str, QuerySet[user_model.User] | list[user_model.User]] = {
-        "user__in": user.get_family_members(luser) or [luser]
-    }
+    params: dict[str, list[int]] = {"user_id__in": user.get_family_member_ids(luser)}
     return UserFoodNutrient.objects.select_related("ingredient").filter(**params)
 
 
@@ -108,24 +108,49 @@ def _load_queryset(luser: user_model.User) -> QuerySet[UserFoodPortion]:
     if not luser.is_authenticated:
         return empty_qs()
 
-    params: dict[str, QuerySet[user_model.User] | list[user_model.User]] = {
-        "user__in": user.get_family_members(luser) or [luser]
-    }
+    params: dict[str, list[int]] = {"user_id__in": user.get_family_member_ids(luser)}
     return UserFoodPortion.objects.filter(**params)
 
 
-def load_lfood_portions(luser: user_model.User, ids: list[int] | None = None) -> QuerySet[UserFoodPortion]:
+def load_lfood_portions(
+    luser: user_model.User,
+    ids: list[int] | None = None,
+    content_type_id: int | None = None,
+    object_ids: list[int] | None = None,
+) -> QuerySet[UserFoodPortion]:
     """Batch load user food portion objects."""
     if not ids:
         ids = []
+    if not object_ids:
+        object_ids = []
 
     qs: QuerySet[UserFoodPortion] = _load_queryset(luser)
 
     params: dict[str, Any] = {}
     if ids:
         params["id__in"] = ids
+    if object_ids:
+        params["object_id__in"] = object_ids
 
-    return db_models.bulk_load(qs, params)
+    qs = db_models.bulk_load(qs, params)
+
+    params = {}
+    if content_type_id:
+        params["content_type_id"] = content_type_id
+
+    return qs.filter(**params)
+
+
+def bulk_create(
+    objs: list[UserFoodPortion], batch_size: int | None = None, ignore_conflicts: bool = False
+) -> list[UserFoodPortion]:
+    """Insert the provided list of user food portion objects into the database."""
+    return db_models.bulk_create(UserFoodPortion, objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts)
+
+
+def bulk_update(objs: list[UserFoodPortion], fields: list[str], batch_size: int | None = None) -> None:
+    """Update the given fields on the provided model instances."""
+    return db_models.bulk_update(UserFoodPortion, objs, fields, batch_size=batch_size)
 
 
 def create(luser: user_model.User, **kwargs: Any) -> UserFoodPortion:
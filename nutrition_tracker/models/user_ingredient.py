@@ -6,7 +6,7 @@ from typing import Any, MutableMapping, Sequence
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.db import models
-from django.db.models import Case, OuterRef, Prefetch, Q, QuerySet, Subquery, When
+from django.db.models import Case, Prefetch, Q, QuerySet, When
 from django.db.models.functions import Coalesce
 from django.utils.functional import cached_property
 
@@ -95,16 +95,26 @@ def empty_qs() -> QuerySet[UserIngredient]:
     return db_models.empty_qs(UserIngredient)
 
 
-def _load_queryset(luser: user_model.User) -> QuerySet[UserIngredient]:
-    """Base QuerySet for user foods/ingredients. All other APIs filter on this queryset."""
+def _load_queryset(
+    luser: user_model.User, load_profile: constants.LoadProfile = constants.LoadProfile.FULL
+) -> QuerySet[UserIngredient]:
+    """Base QuerySet for user foods/ingredients. All other APIs filter on this queryset.
+    load_profile picks the joins and prefetches: IDS loads ingredient rows only, DISPLAY adds names and brand fields,
+    FULL adds db food and user portions."""
     if not luser.is_authenticated:
         return empty_qs()
 
-    params: dict[str, QuerySet[user_model.User] | list[user_model.User]] = {
-        "user__in": user.get_family_members(luser) or [luser]
-    }
-    return (
-        UserIngredient.objects.prefetch_related(
+    params: dict[str, list[int]] = {"user_id__in": user.get_family_member_ids(luser)}
+    qs: QuerySet[UserIngredient] = UserIngredient.objects.filter(**params)
+    if load_profile == constants.LoadProfile.IDS:
+        return qs
+
+    if load_profile == constants.LoadProfile.DISPLAY:
+        qs = qs.select_related("db_food__dbbrandedfood").prefetch_related(
+            Prefetch("userbrandedfood_set", to_attr="branded_foods")
+        )
+    else:
+        qs = qs.prefetch_related(
             Prefetch(
                 "db_food",
                 queryset=db_food.DBFood.objects.select_related("dbbrandedfood").prefetch_related("dbfoodportion_set"),
@@ -112,8 +122,9 @@ def _load_queryset(luser: user_model.User) -> QuerySet[UserIngredient]:
             Prefetch("userbrandedfood_set", to_attr="branded_foods"),
             Prefetch("portion", to_attr="portions"),
         )
-        .filter(**params)
-        .annotate(coalesced_name=Coalesce("name", "db_food__description"))
+
+    return (
+        qs.annotate(coalesced_name=Coalesce("name", "db_food__description"))
         .annotate(coalesced_gtin_upc=Coalesce("userbrandedfood__gtin_upc", "db_food__dbbrandedfood__gtin_upc"))
         .annotate(coalesced_brand_name=Coalesce("userbrandedfood__brand_name", "db_food__dbbrandedfood__brand_name"))
         .annotate(
@@ -126,21 +137,23 @@ def _load_queryset(luser: user_model.User) -> QuerySet[UserIngredient]:
 
 
 def _filter_duplicate_db_foods(luser: user_model.User, qs: QuerySet[UserIngredient]) -> QuerySet[UserIngredient]:
-    """Filter duplicate foods in queryset."""
+    """Filter duplicate foods in queryset.
+    Family members may save the same db food, keep one food per db food: the user's own,
+    else the earliest family member's. Winners are picked with a single DISTINCT ON query."""
     if not luser.is_authenticated:
         return qs
 
-    if not user.get_family_members(luser):
+    if not luser.family_id:
         return qs
 
     qs1 = (
-        UserIngredient.objects.select_related("user")
-        .filter(db_food=OuterRef("db_food"))
+        UserIngredient.objects.filter(user_id__in=user.get_family_member_ids(luser), db_food__isnull=False)
         .annotate(user_match=Case(When(user=luser, then=0), default=1))
-        .order_by("user_match", "user__family_added_timestamp")
+        .order_by("db_food_id", "user_match", "user__family_added_timestamp", "id")
+        .distinct("db_food_id")
     )
 
-    return qs.filter(Q(db_food__isnull=True) | Q(id=Subquery(qs1.values("id")[:1])))
+    return qs.filter(Q(db_food__isnull=True) | Q(id__in=qs1.values("id")))
 
 
 def load_lfood(
@@ -148,9 +161,10 @@ def load_lfood(
     id_: int | None = None,
     external_id: str | uuid.UUID | None = None,
     db_food_id: int | None = None,
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> UserIngredient | None:
     """Loads a user ingredient object."""
-    qs: QuerySet[UserIngredient] = _load_queryset(luser)
+    qs: QuerySet[UserIngredient] = _load_queryset(luser, load_profile=load_profile)
 
     params: dict[str, Any] = {}
     if id_:
@@ -175,6 +189,7 @@ def load_lfoods(
     ids: list[int] | None = None,
     external_ids: Sequence[str | uuid.UUID] | None = None,
     db_food_ids: list[int] | None = None,
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> QuerySet[UserIngredient]:
     """Batch load user ingredient objects."""
     if ids is None:
@@ -184,7 +199,7 @@ def load_lfoods(
     if db_food_ids is None:
         db_food_ids = []
 
-    qs: QuerySet[UserIngredient] = _load_queryset(luser)
+    qs: QuerySet[UserIngredient] = _load_queryset(luser, load_profile=load_profile)
 
     params: dict[str, Any] = {}
     if ids:
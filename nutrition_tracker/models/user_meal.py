@@ -12,6 +12,7 @@ from django.utils import timezone
 from django.utils.functional import cached_property
 
 import users.models as user_model
+from nutrition_tracker.constants import constants
 from nutrition_tracker.database import models as db_models
 from nutrition_tracker.models import user_base, user_food_membership
 from nutrition_tracker.utils import text
@@ -67,12 +68,19 @@ def empty_qs() -> QuerySet[UserMeal]:
     return db_models.empty_qs(UserMeal)
 
 
-def _load_queryset(luser: user_model.User) -> QuerySet[UserMeal]:
-    """Base QuerySet for user meals. All other APIs filter on this queryset."""
+def _load_queryset(
+    luser: user_model.User, load_profile: constants.LoadProfile = constants.LoadProfile.FULL
+) -> QuerySet[UserMeal]:
+    """Base QuerySet for user meals. All other APIs filter on this queryset.
+    Meal rows hold their display fields, so IDS and DISPLAY load meal rows only, FULL adds members."""
     if not luser.is_authenticated:
         return empty_qs()
 
-    return UserMeal.objects.prefetch_related(
+    qs: QuerySet[UserMeal] = UserMeal.objects.filter(user=luser)
+    if load_profile != constants.LoadProfile.FULL:
+        return qs
+
+    return qs.prefetch_related(
         Prefetch(
             "membership",
             to_attr="members",
@@ -80,11 +88,14 @@ def _load_queryset(luser: user_model.User) -> QuerySet[UserMeal]:
                 "child", Prefetch("portion", to_attr="portions")
             ),
         )
-    ).filter(user=luser)
+    )
 
 
 def load_lmeal(
-    luser: user_model.User, id_: int | None = None, external_id: str | uuid.UUID | None = None
+    luser: user_model.User,
+    id_: int | None = None,
+    external_id: str | uuid.UUID | None = None,
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> UserMeal | None:
     """Loads a user meal object."""
     params: dict[str, Any] = {}
@@ -93,7 +104,7 @@ def load_lmeal(
     if external_id:
         params["external_id"] = external_id
 
-    return db_models.load(UserMeal, _load_queryset(luser), params)
+    return db_models.load(UserMeal, _load_queryset(luser, load_profile=load_profile), params)
 
 
 def load_lmeals(  # pylint: disable=too-many-arguments
@@ -104,6 +115,7 @@ def load_lmeals(  # pylint: disable=too-many-arguments
     meal_date: date | None = None,
     num_days: int | None = None,
     max_rows: int | None = None,
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> QuerySet[UserMeal]:
     """Batch load user meal objects."""
     if not ids:
@@ -111,7 +123,7 @@ def load_lmeals(  # pylint: disable=too-many-arguments
     if not external_ids:
         external_ids = []
 
-    qs: QuerySet[UserMeal] = _load_queryset(luser)
+    qs: QuerySet[UserMeal] = _load_queryset(luser, load_profile=load_profile)
 
     if meal_date:
         if num_days:
@@ -146,6 +158,14 @@ def load_latest_lmeal(luser: user_model.User, meal_date: date) -> UserMeal | Non
     return qs.latest("updated_timestamp")
 
 
+def delete_empty_lmeals(luser: user_model.User, ids: list[int]) -> None:
+    """Delete user meals in ids that have no members left."""
+    if not ids:
+        return
+
+    _load_queryset(luser, load_profile=constants.LoadProfile.IDS).filter(id__in=ids, membership__isnull=True).delete()
+
+
 def create(luser: user_model.User, **kwargs: Any) -> UserMeal:
     """Create and save a user meal in the database."""
     return db_models.create(UserMeal, user=luser, **kwargs)
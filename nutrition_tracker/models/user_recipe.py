@@ -12,6 +12,7 @@ from django.utils.functional import cached_property
 
 import users.models as user_model
 from nutrition_tracker.biz import user
+from nutrition_tracker.constants import constants
 from nutrition_tracker.database import models as db_models
 from nutrition_tracker.models import user_base, user_food_membership, user_food_portion
 from nutrition_tracker.utils import text
@@ -66,16 +67,24 @@ def empty_qs() -> QuerySet[UserRecipe]:
     return db_models.empty_qs(UserRecipe)
 
 
-def _load_queryset(luser: user_model.User) -> QuerySet[UserRecipe]:
-    """Base QuerySet for user recipes. All other APIs filter on this queryset."""
+def _load_queryset(
+    luser: user_model.User, load_profile: constants.LoadProfile = constants.LoadProfile.FULL
+) -> QuerySet[UserRecipe]:
+    """Base QuerySet for user recipes. All other APIs filter on this queryset.
+    load_profile picks the prefetches: IDS loads recipe rows only, DISPLAY adds portions, FULL adds members."""
     if not luser.is_authenticated:
         return empty_qs()
 
-    params: dict[str, QuerySet[user_model.User] | list[user_model.User]] = {
-        "user__in": user.get_family_members(luser) or [luser]
-    }
-    return UserRecipe.objects.prefetch_related(
-        Prefetch("portion", to_attr="portions"),
+    params: dict[str, list[int]] = {"user_id__in": user.get_family_member_ids(luser)}
+    qs: QuerySet[UserRecipe] = UserRecipe.objects.filter(**params)
+    if load_profile == constants.LoadProfile.IDS:
+        return qs
+
+    qs = qs.prefetch_related(Prefetch("portion", to_attr="portions"))
+    if load_profile == constants.LoadProfile.DISPLAY:
+        return qs
+
+    return qs.prefetch_related(
         Prefetch(
             "from_membership",
             to_attr="members",
@@ -83,11 +92,14 @@ def _load_queryset(luser: user_model.User) -> QuerySet[UserRecipe]:
                 "child", Prefetch("portion", to_attr="portions")
             ),
         ),
-    ).filter(**params)
+    )
 
 
 def load_lrecipe(
-    luser: user_model.User, id_: int | None = None, external_id: str | uuid.UUID | None = None
+    luser: user_model.User,
+    id_: int | None = None,
+    external_id: str | uuid.UUID | None = None,
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> UserRecipe | None:
     """Loads a user recipe object."""
     params: dict[str, Any] = {}
@@ -96,7 +108,7 @@ def load_lrecipe(
     if external_id:
         params["external_id"] = external_id
 
-    return db_models.load(UserRecipe, _load_queryset(luser), params)
+    return db_models.load(UserRecipe, _load_queryset(luser, load_profile=load_profile), params)
 
 
 def load_lrecipes(
@@ -104,6 +116,7 @@ def load_lrecipes(
     ids: list[int] | None = None,
     external_ids: Sequence[str | uuid.UUID] | None = None,
     order_by: str | None = None,
+    load_profile: constants.LoadProfile = constants.LoadProfile.FULL,
 ) -> QuerySet[UserRecipe]:
     """Batch load user recipe objects."""
     if ids is None:
@@ -111,7 +124,7 @@ def load_lrecipes(
     if external_ids is None:
         external_ids = []
 
-    qs: QuerySet[UserRecipe] = _load_queryset(luser)
+    qs: QuerySet[UserRecipe] = _load_queryset(luser, load_profile=load_profile)
 
     if order_by:
         qs = qs.order_by(order_by)
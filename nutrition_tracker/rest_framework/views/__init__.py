@@ -1,4 +1,6 @@
 """API responses package."""
+from __future__ import annotations
+
 from .app_constants import APIAppConstants
 from .delete_user_ingredient import APIDeleteUserIngredient
 from .delete_user_meal import APIDeleteUserMeal
@@ -11,9 +13,16 @@ from .edit_user_ingredient import APIEditUserIngredient
 from .edit_user_meal import APIEditUserMeal
 from .edit_user_recipe import APIEditUserRecipe
 from .log_db_food import APILogDBFood
+from .log_meal import APILogMeal
 from .log_user_ingredient import APILogUserIngredient
 from .log_user_recipe import APILogUserRecipe
-from .mealplan import APIMealplanFormOne, APIMealplanFormTwo, APIMealplanFormThree
+from .mealplan import (
+    APIMealplanFormOne,
+    APIMealplanFormThree,
+    APIMealplanFormTwo,
+    APIMealplanJob,
+    APIMealplanJobs,
+)
 from .my_foods import APIMyFoods
 from .my_meals import APIMyMeals
 from .my_nutrition import APIMyNutrition
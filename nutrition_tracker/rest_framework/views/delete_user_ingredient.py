@@ -8,7 +8,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from nutrition_tracker.models import user_food_membership, user_ingredient, user_meal
+from nutrition_tracker.logic import meal_log
+from nutrition_tracker.models import user_food_membership, user_ingredient
 
 
 class APIDeleteUserIngredient(APIView):
@@ -30,11 +31,7 @@ class APIDeleteUserIngredient(APIView):
         if mid:
             lmembership = user_food_membership.load_lmembership(request.user, external_id=mid)
             if lmembership:
-                old_meal_id: int = lmembership.parent_id
-                lmembership.delete()
-                old_lmeal = user_meal.load_lmeal(request.user, id_=old_meal_id)
-                if old_lmeal and len(old_lmeal.members) == 0:  # type: ignore
-                    old_lmeal.delete()
+                meal_log.delete_lmembership(request.user, lmembership)
                 return Response(status=status.HTTP_200_OK)
 
         lfood.delete()
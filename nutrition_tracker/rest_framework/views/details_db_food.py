@@ -8,6 +8,7 @@ from rest_framework import generics, mixins
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from nutrition_tracker.database import routers
 from nutrition_tracker.models import db_food
 from nutrition_tracker.serializers import DBFoodSerializer
 
@@ -21,7 +22,7 @@ class APIDetailsDBFood(mixins.RetrieveModelMixin, generics.GenericAPIView):
 
     def get_queryset(self) -> QuerySet[db_food.DBFood]:
         """Get view queryset."""
-        return db_food.load_cfoods()
+        return routers.using_replica(db_food.load_cfoods())
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """GET request handler."""
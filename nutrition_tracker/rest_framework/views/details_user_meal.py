@@ -8,6 +8,7 @@ from rest_framework import generics, mixins
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from nutrition_tracker.logic import preload
 from nutrition_tracker.models import user_meal
 from nutrition_tracker.serializers import UserMealDisplaySerializer
 
@@ -26,6 +27,14 @@ class APIDetailsUserMeal(mixins.RetrieveModelMixin, generics.GenericAPIView):
 
         return user_meal.load_lmeals(self.request.user)
 
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the meal, with its foods, recipes and nutrients preloaded."""
+        instance = self.get_object()
+        context = self.get_serializer_context()
+        context.update(preload.get_context(request.user, [instance]))
+        serializer = self.get_serializer(instance, context=context)
+        return Response(serializer.data)
+
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """GET request handler."""
         return self.retrieve(request, *args, **kwargs)
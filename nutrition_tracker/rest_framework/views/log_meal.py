@@ -0,0 +1,47 @@
+"""Batch log meal API view."""
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from nutrition_tracker.logic import meal_log
+from nutrition_tracker.models import db_food, user_ingredient, user_meal, user_recipe
+from nutrition_tracker.serializers import LogMealSerializer
+
+
+class APILogMeal(APIView):
+    """Log a meal of foods/recipes in one request REST API response."""
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """POST request handler."""
+        if not request.user.is_authenticated:
+            return Response(status=status.HTTP_401_UNAUTHORIZED)
+
+        serializer = LogMealSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        data: dict[str, Any] = serializer.validated_data
+        objects: dict[
+            UUID, tuple[user_ingredient.UserIngredient | user_recipe.UserRecipe | None, db_food.DBFood | None]
+        ] = meal_log.load_log_items_objects(request.user, [item["external_id"] for item in data["items"]])
+
+        items: list[meal_log.LogItem] = []
+        for item in data["items"]:
+            if item["external_id"] not in objects:
+                return Response(status=status.HTTP_400_BAD_REQUEST)
+
+            lobject, cfood = objects[item["external_id"]]
+            items.append(
+                meal_log.LogItem(
+                    lobject, item["quantity"], item["serving"], cfood=cfood, is_available=item["is_available"]
+                )
+            )
+
+        lmeal: user_meal.UserMeal = meal_log.log_items(request.user, data["meal_date"], data["meal_type"], items)
+        return Response({"external_id": lmeal.external_id}, status=status.HTTP_200_OK)
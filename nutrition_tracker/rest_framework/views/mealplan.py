@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 from typing import Any
+from uuid import UUID
 
+from django.db.models import QuerySet
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from nutrition_tracker.logic import mealplan, user_prefs
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import mealplan_jobs, user_prefs
 from nutrition_tracker.models import user_ingredient, user_preference, user_recipe
 from nutrition_tracker.serializers import (
     MealplanFormOneSerializer,
@@ -18,6 +21,89 @@ from nutrition_tracker.serializers import (
     UserPreferenceSerializer,
     UserRecipeDisplaySerializer,
 )
+from nutrition_tracker.utils import text
+
+
+def _get_results(
+    lfoods: list[user_ingredient.UserIngredient] | QuerySet[user_ingredient.UserIngredient],
+    lrecipes: list[user_recipe.UserRecipe] | QuerySet[user_recipe.UserRecipe],
+    quantity_map: dict[UUID, float | None],
+) -> list[dict]:
+    """Serialize mealplan foods and recipes with non zero quantities."""
+    results: list[dict] = []
+    for lfood in lfoods:
+        quantity = quantity_map.get(lfood.external_id)
+        if not quantity:
+            continue
+
+        food_serializer = UserIngredientDisplaySerializer(instance=lfood, fields=["external_id", "display_name"])
+        value: dict = {}
+        value.update(food_serializer.data)
+        # Rename 'display_name' to 'name'.
+        value["name"] = value["display_name"]
+        del value["display_name"]
+        value.update({"quantity": quantity})
+        results.append(value)
+
+    for lrecipe in lrecipes:
+        quantity = quantity_map.get(lrecipe.external_id)
+        if not quantity:
+            continue
+
+        recipe_serializer = UserRecipeDisplaySerializer(instance=lrecipe, fields=["external_id", "name"])
+        value = {}
+        value.update(recipe_serializer.data)
+        value.update({"quantity": quantity})
+        results.append(value)
+
+    return results
+
+
+def _get_job_values(request: Request, job: dict) -> dict:
+    """Serialize a job status, and its mealplan once solved."""
+    values: dict = {"job_id": job["job_id"], "status": job["status"]}
+    if job["status"] != constants.MealplanJobStatus.DONE:
+        return values
+
+    quantity_maps: list[dict[UUID, float | None]] = job["result"]["quantity_maps"]
+    external_ids: list[UUID] = list(
+        {external_id for quantity_map in quantity_maps for external_id, quantity in quantity_map.items() if quantity}
+    )
+    lfoods: list[user_ingredient.UserIngredient] = []
+    lrecipes: list[user_recipe.UserRecipe] = []
+    if external_ids:
+        lfoods = list(
+            user_ingredient.load_lfoods(
+                request.user, external_ids=external_ids, load_profile=constants.LoadProfile.DISPLAY
+            )
+        )
+        lrecipes = list(
+            user_recipe.load_lrecipes(request.user, external_ids=external_ids, load_profile=constants.LoadProfile.IDS)
+        )
+
+    values["infeasible"] = job["result"]["infeasible"]
+    values["results"] = _get_results(lfoods, lrecipes, job["result"]["quantity_map"])
+    values["plan_id"] = job["result"]["plan_id"]
+    if job["num_days"] > 1:
+        values["days"] = [_get_results(lfoods, lrecipes, quantity_map) for quantity_map in quantity_maps]
+    return values
+
+
+def _get_num_days(request: Request, value: Any) -> int | None:
+    """Parse the number of days to plan, None if invalid.
+    Multi day plans are rejected for users with multi day (e.g. weekly) thresholds, the planner can't apply them."""
+    try:
+        num_days = int(value)
+    except (TypeError, ValueError):
+        return None
+
+    if not 1 <= num_days <= constants.MEALPLAN_MAX_DAYS:
+        return None
+
+    if num_days > 1 and user_prefs.has_multi_day_thresholds(request.user):
+        return None
+
+    return num_days
 
 
 class APIMealplanFormOne(APIView):
@@ -57,7 +143,11 @@ class APIMealplanFormTwo(APIView):
         items = {fp.food_external_id: fp for fp in usable_preferences if fp.food_external_id}
 
         values = []
-        lfoods = list(user_ingredient.load_lfoods(request.user, external_ids=list(items.keys())))
+        lfoods = list(
+            user_ingredient.load_lfoods(
+                request.user, external_ids=list(items.keys()), load_profile=constants.LoadProfile.DISPLAY
+            )
+        )
         for lfood in lfoods:
             food_serializer = UserIngredientDisplaySerializer(instance=lfood, fields=["external_id", "display_name"])
             preference_serializer = UserPreferenceSerializer(instance=items[lfood.external_id], fields=["thresholds"])
@@ -69,7 +159,11 @@ class APIMealplanFormTwo(APIView):
             value.update(preference_serializer.data)
             values.append(value)
 
-        lrecipes = list(user_recipe.load_lrecipes(request.user, external_ids=list(items.keys())))
+        lrecipes = list(
+            user_recipe.load_lrecipes(
+                request.user, external_ids=list(items.keys()), load_profile=constants.LoadProfile.IDS
+            )
+        )
         for lrecipe in lrecipes:
             recipe_serializer = UserRecipeDisplaySerializer(instance=lrecipe, fields=["external_id", "name"])
             preference_serializer = UserPreferenceSerializer(
@@ -105,38 +199,30 @@ class APIMealplanFormThree(APIView):
     """Mealplan Form Three REST API response."""
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        """GET request handler."""
+        """GET request handler. Solves run on the job pool: a 202 response has the job ID, GET again with
+        ?job=<job_id> until the mealplan is ready."""
         if not request.user.is_authenticated:
             return Response(status=status.HTTP_401_UNAUTHORIZED)
 
-        lmealplan = mealplan.get_mealplan_for_user(request.user)
-        values = {"infeasible": lmealplan.infeasible, "results": []}
-        for lfood in lmealplan.lfoods:
-            quantity = lmealplan.quantity_map.get(lfood.external_id)
-            if not quantity:
-                continue
+        job_id: str | None = request.query_params.get("job")
+        if job_id:
+            if not text.is_valid_uuid(job_id):
+                return Response(status=status.HTTP_400_BAD_REQUEST)
+        else:
+            num_days = _get_num_days(request, request.query_params.get("days", 1))
+            if not num_days:
+                return Response(status=status.HTTP_400_BAD_REQUEST)
 
-            food_serializer = UserIngredientDisplaySerializer(instance=lfood, fields=["external_id", "display_name"])
-            value: dict = {}
-            value.update(food_serializer.data)
-            # Rename 'display_name' to 'name'.
-            value["name"] = value["display_name"]
-            del value["display_name"]
-            value.update({"quantity": quantity})
-            values["results"].append(value)  # type: ignore
+            job_id = mealplan_jobs.submit_job(request.user, num_days=num_days)
 
-        for lrecipe in lmealplan.lrecipes:
-            quantity = lmealplan.quantity_map.get(lrecipe.external_id)
-            if not quantity:
-                continue
+        job = mealplan_jobs.get_job(request.user, job_id)
+        if not job:
+            return Response(status=status.HTTP_404_NOT_FOUND)
 
-            recipe_serializer = UserRecipeDisplaySerializer(instance=lrecipe, fields=["external_id", "name"])
-            value = {}
-            value.update(recipe_serializer.data)
-            value.update({"quantity": quantity})
-            values["results"].append(value)  # type: ignore
+        if job["status"] not in mealplan_jobs.FINAL_STATUSES:
+            return Response({"job_id": job["job_id"], "status": job["status"]}, status.HTTP_202_ACCEPTED)
 
-        return Response(values, status.HTTP_200_OK)
+        return Response(_get_job_values(request, job), status.HTTP_200_OK)
 
     def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """POST request handler."""
@@ -153,10 +239,50 @@ class APIMealplanFormThree(APIView):
         if not serializer.is_valid():
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        # The rendered mealplan is gone once computed.
-        # serializer.form_instance doesn't have
-        # serializer.form_instance.data set.
-        # Explicitly set it to request.data here.
-        serializer.form_instance.data = request.data
         serializer.form_instance.save()
         return Response(status=status.HTTP_200_OK)
+
+
+class APIMealplanJobs(APIView):
+    """Mealplan solve jobs REST API response."""
+
+    def post(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """POST request handler. Submits a mealplan solve job, for "days" consecutive days."""
+        if not request.user.is_authenticated:
+            return Response(status=status.HTTP_401_UNAUTHORIZED)
+
+        num_days = _get_num_days(request, request.data.get("days", 1))
+        if not num_days:
+            return Response(status=status.HTTP_400_BAD_REQUEST)
+
+        job_id = mealplan_jobs.submit_job(request.user, num_days=num_days)
+        job = mealplan_jobs.get_job(request.user, job_id)
+        return Response(
+            {"job_id": job_id, "status": job["status"] if job else constants.MealplanJobStatus.QUEUED},
+            status.HTTP_202_ACCEPTED,
+        )
+
+
+class APIMealplanJob(APIView):
+    """Mealplan solve job REST API response."""
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """GET request handler. Returns the job status, and the mealplan and its plan ID once solved."""
+        if not request.user.is_authenticated:
+            return Response(status=status.HTTP_401_UNAUTHORIZED)
+
+        job = mealplan_jobs.get_job(request.user, kwargs["job_id"])
+        if not job:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        return Response(_get_job_values(request, job), status.HTTP_200_OK)
+
+    def delete(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """DELETE request handler. Cancels the job."""
+        if not request.user.is_authenticated:
+            return Response(status=status.HTTP_401_UNAUTHORIZED)
+
+        if not mealplan_jobs.cancel_job(request.user, kwargs["job_id"]):
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
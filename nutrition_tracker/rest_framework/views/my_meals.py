@@ -7,6 +7,7 @@ from django.db.models import QuerySet
 from rest_framework import generics
 from rest_framework.serializers import BaseSerializer
 
+from nutrition_tracker.constants import constants
 from nutrition_tracker.models import user_meal
 from nutrition_tracker.serializers import UserMealDisplaySerializer
 from nutrition_tracker.utils import model as model_utils
@@ -31,7 +32,9 @@ class APIMyMeals(generics.ListAPIView):
         if not self.request.user.is_authenticated:
             return user_meal.empty_qs()
 
-        return user_meal.load_lmeals(self.request.user, order_by="-meal_date")
+        return user_meal.load_lmeals(
+            self.request.user, order_by="-meal_date", load_profile=constants.LoadProfile.DISPLAY
+        )
 
     def paginate_queryset(self, queryset: QuerySet[Any] | Sequence[Any]) -> Sequence[Any] | None:
         object_list = super().paginate_queryset(queryset)
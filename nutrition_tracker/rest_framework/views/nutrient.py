@@ -8,7 +8,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from nutrition_tracker.logic import food_nutrient, user_prefs
+from nutrition_tracker.logic import food_nutrient, top_foods_indexing, user_prefs
 from nutrition_tracker.serializers import DBFoodSerializer, UserIngredientDisplaySerializer
 
 DEFAULT_CHART_DAYS = 5
@@ -50,7 +50,7 @@ class APINutrient(APIView):
         response.update({"recent_lfoods": serializer.data})
 
         # Top cfoods
-        cfoods = food_nutrient.get_top_cfoods_for_nutrient(nutrient_id)
+        cfoods = top_foods_indexing.get_top_cfoods_for_nutrient(nutrient_id)
         db_serializer = DBFoodSerializer(instance=cfoods, many=True, fields=["external_id", "description", "brand"])
         response.update({"top_cfoods": db_serializer.data})
 
@@ -7,9 +7,10 @@ from rest_framework.test import APIRequestFactory, APITestCase, force_authentica
 
 from nutrition_tracker.rest_framework.views import APIDetailsUserMeal
 from nutrition_tracker.tests import objects as test_objects
+from nutrition_tracker.tests import utils as test_utils
 
 
-class TestViewsAPIDetailsUserMeal(APITestCase):
+class TestViewsAPIDetailsUserMeal(test_utils.QueryBudgetMixin, APITestCase):
     @classmethod
     def setUpTestData(cls):
         cls.USER_MEAL = test_objects.get_meal_today_1()
@@ -49,3 +50,28 @@ class TestViewsAPIDetailsUserMeal(APITestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(response.data["external_id"], str(self.USER_MEAL.external_id))
         self.assertEqual(response.data["meal_type"], self.USER_MEAL.meal_type)
+
+    def test_query_budget(self):
+        factory = APIRequestFactory()
+        view = APIDetailsUserMeal.as_view()
+
+        lchildren = [
+            test_objects.get_user_ingredient(),
+            test_objects.get_user_ingredient_2(),
+            test_objects.get_recipe(),
+        ]
+        for lchild in lchildren * 3:
+            test_objects.get_user_food_membership_portion(
+                test_objects.get_user_food_membership(self.USER_MEAL, lchild)
+            )
+
+        request = factory.get(
+            reverse("api_details_user_meal", kwargs={"id": self.USER_MEAL.external_id}),
+            HTTP_X_API_KEY=self.API_KEY,
+        )
+        force_authenticate(request, user=self.USER)
+        # Member graph lookups repeat once per level, 9 members would repeat per member queries more often.
+        with self.assertQueryBudget(18, max_repeats=3):
+            response = view(request, id=self.USER_MEAL.external_id)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import uuid
+from http import HTTPStatus
+
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+
+from nutrition_tracker.constants import constants
+from nutrition_tracker.models import user_ingredient, user_meal
+from nutrition_tracker.rest_framework.views import APILogMeal
+from nutrition_tracker.tests import objects as test_objects
+
+
+class TestViewsAPILogMeal(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.API_KEY = test_objects.get_api_key()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        cls.RECIPE = test_objects.get_recipe()
+        test_objects.get_user_recipe_portion()
+        cls.DB_FOOD = test_objects.get_db_food_2()
+
+    def post(self, data, user=None):
+        factory = APIRequestFactory()
+        view = APILogMeal.as_view()
+
+        request = factory.post(reverse("api_log_meal"), data, format="json", HTTP_X_API_KEY=self.API_KEY)
+        if user:
+            force_authenticate(request, user=user)
+        return view(request)
+
+    def test_unauthorized_post_fails(self):
+        response = self.post({})
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_authorized_post_no_api_key_fails(self):
+        factory = APIRequestFactory()
+        view = APILogMeal.as_view()
+
+        request = factory.post(reverse("api_log_meal"))
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_log_authorized_request_bad_meal_type(self):
+        response = self.post(
+            {"meal_type": constants.MealType.__empty__, "items": [{"external_id": self.USER_INGREDIENT.external_id}]},
+            user=self.USER,
+        )
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_log_authorized_request_no_items(self):
+        response = self.post({"meal_type": constants.MealType.LUNCH, "items": []}, user=self.USER)
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_log_authorized_request_too_many_items(self):
+        response = self.post(
+            {
+                "meal_type": constants.MealType.LUNCH,
+                "items": [{"external_id": self.USER_INGREDIENT.external_id}] * (constants.LOG_MEAL_MAX_ITEMS + 1),
+            },
+            user=self.USER,
+        )
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_log_authorized_request_bad_id(self):
+        response = self.post(
+            {
+                "meal_type": constants.MealType.LUNCH,
+                "items": [{"external_id": self.USER_INGREDIENT.external_id}, {"external_id": uuid.uuid4()}],
+            },
+            user=self.USER,
+        )
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(user_meal.load_lmeals(self.USER).count(), 0)
+
+    def test_log_authorized_mutation_request(self):
+        response = self.post(
+            {
+                "meal_type": constants.MealType.LUNCH,
+                "items": [
+                    {"external_id": self.USER_INGREDIENT.external_id, "quantity": 2},
+                    {
+                        "external_id": self.RECIPE.external_id,
+                        "serving": f"{constants.HUNDRED_SERVING_ID}",
+                        "quantity": 1,
+                        "is_available": True,
+                    },
+                    {"external_id": self.DB_FOOD.external_id, "quantity": 1},
+                ],
+            },
+            user=self.USER,
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        lmeal = user_meal.load_lmeal(self.USER, external_id=response.data["external_id"])
+        self.assertEqual(len(lmeal.members), 3)
+        self.assertEqual(user_ingredient.load_lfoods(self.USER, db_food_ids=[self.DB_FOOD.id]).count(), 1)
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import uuid
 from http import HTTPStatus
+from unittest.mock import patch
 
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 
-from nutrition_tracker.logic import user_prefs
-from nutrition_tracker.models import user_meal
-from nutrition_tracker.rest_framework.views import APIMealplanFormOne, APIMealplanFormThree, APIMealplanFormTwo
+from nutrition_tracker.constants import constants
+from nutrition_tracker.logic import mealplan, mealplan_jobs, user_prefs
+from nutrition_tracker.models import user_meal, user_preference_threshold
+from nutrition_tracker.rest_framework.views import (
+    APIMealplanFormOne,
+    APIMealplanFormThree,
+    APIMealplanFormTwo,
+    APIMealplanJob,
+    APIMealplanJobs,
+)
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.utils import form as form_utils
 
@@ -191,6 +202,9 @@ class TestViewsAPIMealplanFormThree(APITestCase):
         test_objects.get_nutrient_preference()
         cls.API_KEY = test_objects.get_api_key()
 
+    def setUp(self):
+        cache.clear()
+
     def test_unauthorized_get_fails(self):
         factory = APIRequestFactory()
         view = APIMealplanFormThree.as_view()
@@ -234,12 +248,15 @@ class TestViewsAPIMealplanFormThree(APITestCase):
         field_name = form_utils.get_field_name(lfood.external_id)
         meal_field_name = form_utils.get_meal_field_name(lfood.external_id)
 
+        lmealplan = mealplan.Mealplan(False, [lfood], [], [], [], [], {lfood.external_id: 5})
+
         factory = APIRequestFactory()
         view = APIMealplanFormThree.as_view()
 
         request = factory.post(
             reverse("api_mealplan_form_three"),
             {
+                "plan_id": mealplan.save_plan(self.USER, lmealplan)[0],
                 field_name: 5,
                 meal_field_name: "Lunch",
             },
@@ -251,6 +268,47 @@ class TestViewsAPIMealplanFormThree(APITestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(user_meal.load_lmeals(self.USER).count(), 1)
 
+    def test_authorized_post_unknown_plan_fails(self):
+        lfood = test_objects.get_user_ingredient()
+
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+
+        request = factory.post(
+            reverse("api_mealplan_form_three"),
+            {
+                "plan_id": uuid.uuid4(),
+                form_utils.get_field_name(lfood.external_id): 5,
+                form_utils.get_meal_field_name(lfood.external_id): "Lunch",
+            },
+            HTTP_X_API_KEY=self.API_KEY,
+        )
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(user_meal.load_lmeals(self.USER).count(), 0)
+
+    def test_authorized_post_no_plan_fails(self):
+        lfood = test_objects.get_user_ingredient()
+
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+
+        request = factory.post(
+            reverse("api_mealplan_form_three"),
+            {
+                form_utils.get_field_name(lfood.external_id): 5,
+                form_utils.get_meal_field_name(lfood.external_id): "Lunch",
+            },
+            HTTP_X_API_KEY=self.API_KEY,
+        )
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(user_meal.load_lmeals(self.USER).count(), 0)
+
     def test_authorized_get_request(self):
         factory = APIRequestFactory()
         view = APIMealplanFormThree.as_view()
@@ -265,3 +323,275 @@ class TestViewsAPIMealplanFormThree(APITestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertFalse(response.data["infeasible"])
         self.assertEqual(len(response.data["results"]), 1)
+        self.assertNotIn("days", response.data)
+        self.assertIsNotNone(mealplan.load_plan(self.USER, response.data["plan_id"]))
+
+    def test_authorized_get_multi_day_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+
+        request = factory.get(
+            reverse("api_mealplan_form_three"),
+            {"days": 2},
+            HTTP_X_API_KEY=self.API_KEY,
+        )
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertFalse(response.data["infeasible"])
+        self.assertEqual(len(response.data["days"]), 2)
+        self.assertEqual(response.data["results"], response.data["days"][0])
+
+    def test_authorized_get_pending_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+        job_id = str(uuid.uuid4())
+        cache.set(mealplan_jobs._get_user_key(self.USER.id), job_id)
+        mealplan_jobs._set_job(job_id, self.USER.id, constants.MealplanJobStatus.RUNNING)
+
+        request = factory.get(
+            reverse("api_mealplan_form_three"),
+            HTTP_X_API_KEY=self.API_KEY,
+        )
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.ACCEPTED)
+        self.assertEqual(response.data, {"job_id": job_id, "status": constants.MealplanJobStatus.RUNNING})
+
+    @override_settings(MEALPLAN_JOB_WORKERS=1)
+    @patch.object(mealplan, "get_mealplan_for_user")
+    def test_authorized_get_pool_request(self, mock):
+        mock.return_value = mealplan.Mealplan(
+            False, [self.USER_INGREDIENT], [], [], [], [], {self.USER_INGREDIENT.external_id: 100}
+        )
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+
+        with patch.object(mealplan_jobs.user, "load_luser", return_value=self.USER):
+            request = factory.get(reverse("api_mealplan_form_three"), HTTP_X_API_KEY=self.API_KEY)
+            force_authenticate(request, user=self.USER)
+            response = view(request)
+            self.assertIn(response.status_code, [HTTPStatus.OK, HTTPStatus.ACCEPTED])
+            job_id = response.data["job_id"]
+            future = mealplan_jobs._futures.get(job_id)
+            if future:
+                future.result(timeout=30)
+
+        request = factory.get(reverse("api_mealplan_form_three"), {"job": job_id}, HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.data["status"], constants.MealplanJobStatus.DONE)
+        self.assertEqual(response.data["results"][0]["external_id"], str(self.USER_INGREDIENT.external_id))
+        self.assertIsNotNone(mealplan.load_plan(self.USER, response.data["plan_id"]))
+
+    def test_authorized_get_job_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+        failed_job_id = str(uuid.uuid4())
+        mealplan_jobs._set_job(failed_job_id, self.USER.id, constants.MealplanJobStatus.FAILED)
+
+        for job_id, status_code in [
+            ("x", HTTPStatus.BAD_REQUEST),
+            (str(uuid.uuid4()), HTTPStatus.NOT_FOUND),
+            (failed_job_id, HTTPStatus.OK),
+        ]:
+            request = factory.get(reverse("api_mealplan_form_three"), {"job": job_id}, HTTP_X_API_KEY=self.API_KEY)
+            force_authenticate(request, user=self.USER)
+            response = view(request)
+
+            self.assertEqual(response.status_code, status_code)
+
+        self.assertEqual(response.data, {"job_id": failed_job_id, "status": constants.MealplanJobStatus.FAILED})
+
+    def test_authorized_get_multi_day_thresholds_fails(self):
+        luser_preference = test_objects.get_user_preference()
+        user_preference_threshold.create(self.USER, user_preference=luser_preference, num_days=7, max_value=500)
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+
+        request = factory.get(reverse("api_mealplan_form_three"), {"days": 2}, HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+        request = factory.get(reverse("api_mealplan_form_three"), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_authorized_get_invalid_days_fails(self):
+        factory = APIRequestFactory()
+        view = APIMealplanFormThree.as_view()
+
+        for days in ["0", "x", str(constants.MEALPLAN_MAX_DAYS + 1)]:
+            request = factory.get(
+                reverse("api_mealplan_form_three"),
+                {"days": days},
+                HTTP_X_API_KEY=self.API_KEY,
+            )
+            force_authenticate(request, user=self.USER)
+            response = view(request)
+
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+
+class TestViewsAPIMealplanJobs(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        test_objects.get_user_food_nutrient()
+        test_objects.get_user_food_portion()
+        test_objects.get_nutrient_preference()
+        cls.API_KEY = test_objects.get_api_key()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_unauthorized_post_fails(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJobs.as_view()
+
+        request = factory.post(reverse("api_mealplan_jobs"))
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_authorized_post_no_api_key_fails(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJobs.as_view()
+
+        request = factory.post(reverse("api_mealplan_jobs"))
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_authorized_post_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJobs.as_view()
+
+        request = factory.post(reverse("api_mealplan_jobs"), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.ACCEPTED)
+        self.assertEqual(response.data["status"], constants.MealplanJobStatus.DONE)
+        self.assertIsNotNone(mealplan_jobs.get_job(self.USER, response.data["job_id"]))
+
+    def test_authorized_post_multi_day_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJobs.as_view()
+
+        request = factory.post(reverse("api_mealplan_jobs"), {"days": 2}, HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.ACCEPTED)
+        self.assertEqual(mealplan_jobs.get_job(self.USER, response.data["job_id"])["num_days"], 2)
+
+    def test_authorized_post_invalid_days_fails(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJobs.as_view()
+
+        for days in ["0", "x", str(constants.MEALPLAN_MAX_DAYS + 1)]:
+            request = factory.post(reverse("api_mealplan_jobs"), {"days": days}, HTTP_X_API_KEY=self.API_KEY)
+            force_authenticate(request, user=self.USER)
+            response = view(request)
+
+            self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+
+class TestViewsAPIMealplanJob(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.USER = test_objects.get_user()
+        cls.USER_INGREDIENT = test_objects.get_user_ingredient()
+        test_objects.get_user_food_nutrient()
+        test_objects.get_user_food_portion()
+        test_objects.get_nutrient_preference()
+        cls.API_KEY = test_objects.get_api_key()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_unauthorized_get_fails(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJob.as_view()
+        job_id = uuid.uuid4()
+
+        request = factory.get(reverse("api_mealplan_job", kwargs={"job_id": job_id}))
+        response = view(request, job_id=job_id)
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_authorized_get_unknown_job(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJob.as_view()
+        job_id = uuid.uuid4()
+
+        request = factory.get(reverse("api_mealplan_job", kwargs={"job_id": job_id}), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request, job_id=job_id)
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_authorized_get_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJob.as_view()
+        job_id = mealplan_jobs.submit_job(self.USER)
+
+        request = factory.get(reverse("api_mealplan_job", kwargs={"job_id": job_id}), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request, job_id=job_id)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.data["status"], constants.MealplanJobStatus.DONE)
+        self.assertFalse(response.data["infeasible"])
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["external_id"], str(self.USER_INGREDIENT.external_id))
+        self.assertNotIn("days", response.data)
+        self.assertIn(str(self.USER_INGREDIENT.external_id), mealplan.load_plan(self.USER, response.data["plan_id"]))
+
+    def test_authorized_get_multi_day_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJob.as_view()
+        job_id = mealplan_jobs.submit_job(self.USER, num_days=2)
+
+        request = factory.get(reverse("api_mealplan_job", kwargs={"job_id": job_id}), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request, job_id=job_id)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(response.data["days"]), 2)
+        self.assertEqual(response.data["results"], response.data["days"][0])
+
+    def test_authorized_delete_request(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJob.as_view()
+        job_id = str(uuid.uuid4())
+        mealplan_jobs._set_job(job_id, self.USER.id, constants.MealplanJobStatus.QUEUED)
+
+        request = factory.delete(reverse("api_mealplan_job", kwargs={"job_id": job_id}), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request, job_id=job_id)
+
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+
+        response = view(request, job_id=job_id)
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+
+    def test_authorized_delete_finished_job(self):
+        factory = APIRequestFactory()
+        view = APIMealplanJob.as_view()
+        job_id = mealplan_jobs.submit_job(self.USER)
+
+        request = factory.delete(reverse("api_mealplan_job", kwargs={"job_id": job_id}), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        response = view(request, job_id=job_id)
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
@@ -5,11 +5,13 @@ from http import HTTPStatus
 from django.urls import reverse
 from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 
+from nutrition_tracker.models import user_ingredient
 from nutrition_tracker.rest_framework.views import APIMyFoods
 from nutrition_tracker.tests import objects as test_objects
+from nutrition_tracker.tests import utils as test_utils
 
 
-class TestViewsAPIMyFoods(APITestCase):
+class TestViewsAPIMyFoods(test_utils.QueryBudgetMixin, APITestCase):
     @classmethod
     def setUpTestData(cls):
         test_objects.get_user_ingredient()
@@ -69,3 +71,17 @@ class TestViewsAPIMyFoods(APITestCase):
 
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(response.data["count"], 1)
+
+    def test_query_budget(self):
+        factory = APIRequestFactory()
+        view = APIMyFoods.as_view()
+        for index in range(3):
+            user_ingredient.create(self.USER, name=f"test_{index + 3}")
+
+        request = factory.get(reverse("api_my_foods"), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        with self.assertQueryBudget(7):
+            response = view(request)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.data["count"], 5)
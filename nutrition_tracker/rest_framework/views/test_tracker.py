@@ -2,15 +2,18 @@ from __future__ import annotations
 
 from http import HTTPStatus
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
 
 from nutrition_tracker.rest_framework.views import APITracker
 from nutrition_tracker.tests import objects as test_objects
+from nutrition_tracker.tests import utils as test_utils
 
 
-class TestViewsAPITracker(APITestCase):
+class TestViewsAPITracker(test_utils.QueryBudgetMixin, APITestCase):
     @classmethod
     def setUpTestData(cls):
         cls.USER_MEAL = test_objects.get_meal_today_1()
@@ -49,3 +52,54 @@ class TestViewsAPITracker(APITestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTrue("display_meals" in response.data)
         self.assertTrue("display_nutrients" in response.data)
+
+    def test_constant_queries(self):
+        factory = APIRequestFactory()
+        view = APITracker.as_view()
+
+        def count_queries():
+            request = factory.get(reverse("api_tracker", kwargs={"td": self.td}), HTTP_X_API_KEY=self.API_KEY)
+            force_authenticate(request, user=self.USER)
+            with CaptureQueriesContext(connection) as context:
+                response = view(request, td=self.td)
+
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            return len(context.captured_queries)
+
+        lchildren = [
+            test_objects.get_user_ingredient(),
+            test_objects.get_user_ingredient_2(),
+            test_objects.get_recipe(),
+        ]
+        for lchild in lchildren:
+            test_objects.get_user_food_membership_portion(
+                test_objects.get_user_food_membership(self.USER_MEAL, lchild)
+            )
+        num_queries = count_queries()
+
+        for lmeal in [self.USER_MEAL, self.USER_MEAL_2]:
+            for lchild in lchildren * 5:
+                test_objects.get_user_food_membership_portion(test_objects.get_user_food_membership(lmeal, lchild))
+
+        self.assertEqual(num_queries, count_queries())
+
+    def test_query_budget(self):
+        factory = APIRequestFactory()
+        view = APITracker.as_view()
+
+        lchildren = [
+            test_objects.get_user_ingredient(),
+            test_objects.get_user_ingredient_2(),
+            test_objects.get_recipe(),
+        ]
+        for lmeal in [self.USER_MEAL, self.USER_MEAL_2]:
+            for lchild in lchildren * 3:
+                test_objects.get_user_food_membership_portion(test_objects.get_user_food_membership(lmeal, lchild))
+
+        request = factory.get(reverse("api_tracker", kwargs={"td": self.td}), HTTP_X_API_KEY=self.API_KEY)
+        force_authenticate(request, user=self.USER)
+        # Member graph lookups repeat once per level, 18 members would repeat per member queries more often.
+        with self.assertQueryBudget(17, max_repeats=3):
+            response = view(request, td=self.td)
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
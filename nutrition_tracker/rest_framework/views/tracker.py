@@ -10,7 +10,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from nutrition_tracker.constants import constants
-from nutrition_tracker.logic import data_loaders, food_nutrient
+from nutrition_tracker.logic import food_nutrient, preload
 from nutrition_tracker.models import user_meal
 from nutrition_tracker.serializers import UserMealDisplaySerializer
 from nutrition_tracker.utils import model as model_utils
@@ -33,18 +33,17 @@ class APITracker(APIView):
         response: dict[str, Any] = {}
         lmeals = list(user_meal.load_lmeals(request.user, meal_date=tracker_datetime))
         lmeals = model_utils.sort_meals(lmeals)
-        lfoods = list(data_loaders.load_lfoods_for_lparents(request.user, lmeals))
-        lmember_recipes = list(data_loaders.load_lrecipes_for_lparents(request.user, lmeals))
-        food_nutrients = food_nutrient.get_foods_nutrients(request.user, lfoods)
+        context = preload.get_context(request.user, lmeals)
+        lmember_recipes = context[preload.PRELOAD_KEY].lmember_recipes
+        food_nutrients = context[preload.PRELOAD_KEY].food_nutrients
 
-        display_meals = [
-            UserMealDisplaySerializer(
-                instance=lmeal,
-                fields=["external_id", "meal_date", "meal_type", "member_ingredients", "member_recipes"],
-            )
-            for lmeal in lmeals
-        ]
-        response.update({"display_meals": [item.data for item in display_meals]})
+        display_meals = UserMealDisplaySerializer(
+            instance=lmeals,
+            many=True,
+            context=context,
+            fields=["external_id", "meal_date", "meal_type", "member_ingredients", "member_recipes"],
+        )
+        response.update({"display_meals": display_meals.data})
 
         values = []
         for nutrient_id in constants.TRACKER_NUTRIENT_IDS:
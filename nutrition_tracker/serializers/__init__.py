@@ -8,6 +8,7 @@ from .db_food import DBFoodSerializer
 from .food_form import FoodFormSerializer
 from .form_data import FormDataSerializer
 from .log import LogSerializer
+from .log_meal import LogMealItemSerializer, LogMealSerializer
 from .meal_form import MealFormSerializer
 from .mealplan_form import MealplanFormOneSerializer, MealplanFormTwoSerializer, MealplanFormThreeSerializer
 from .nutrition import NutritionSerializer
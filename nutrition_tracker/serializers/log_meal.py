@@ -0,0 +1,38 @@
+"""Batch log meal serializer module."""
+from __future__ import annotations
+
+from typing import Any
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework import serializers
+
+from nutrition_tracker.constants import constants
+
+
+class LogMealItemSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Food/recipe/db food to log in a batch log request."""
+
+    external_id = serializers.UUIDField()
+    quantity = serializers.FloatField(min_value=0, required=False, allow_null=True, default=None)
+    serving = serializers.CharField(required=False, default=str(constants.HUNDRED_SERVING_ID))
+    is_available = serializers.BooleanField(required=False, allow_null=True, default=None)
+
+
+class LogMealSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Batch log food/recipe items into a meal Serializer class."""
+
+    meal_type = serializers.ChoiceField(choices=[choice for choice in constants.MealType.choices if choice[0]])
+    meal_date = serializers.DateField(
+        required=False, default=timezone.localdate, input_formats=["%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"]
+    )
+    items = LogMealItemSerializer(many=True, allow_empty=False)
+
+    def validate_items(self, value: list[dict[str, Any]]) -> list[dict[str, Any]]:  # pylint: disable=no-self-use
+        """Cap the number of items logged per request."""
+        if len(value) > constants.LOG_MEAL_MAX_ITEMS:
+            raise serializers.ValidationError(
+                _("Ensure this field has no more than %(max)d items.") % {"max": constants.LOG_MEAL_MAX_ITEMS}
+            )
+
+        return value
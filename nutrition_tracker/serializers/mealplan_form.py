@@ -62,11 +62,16 @@ class MealplanFormThreeSerializer(FormSerializer):
         form = MealplanFormThree
         field_mapping = {
             forms.FloatField: fields.FloatField,
+            forms.UUIDField: fields.UUIDField,
         }
 
     def get_form(self, data: dict | None = None, **kwargs: Any) -> MealplanFormThree:
         """Create an instance of configured form class. Update
-        kwargs with context data."""
+        kwargs with context data. Mealplan item fields are built from the persisted plan,
+        so the form is bound to the request data, not only the serializer validated data."""
+
+        if data is not None:
+            data = {**dict(self.initial_data.items()), **data}
 
         kwargs.update(
             {
@@ -92,7 +92,7 @@ class TestSerializersMealplanFormThree(TestCase):
                 "user": self.USER,
             },
         )
-        self.assertTrue(serializer.is_valid())
+        self.assertFalse(serializer.is_valid())
 
     def test_with_values(self):
         field_name = form_utils.get_field_name(test_constants.TEST_UUID)
@@ -107,4 +107,5 @@ class TestSerializersMealplanFormThree(TestCase):
                 "user": self.USER,
             },
         )
-        self.assertTrue(serializer.is_valid())
+        # Submissions without a plan are not saved.
+        self.assertFalse(serializer.is_valid())
@@ -5,6 +5,7 @@ from django.utils import timezone
 from rest_framework.renderers import JSONRenderer
 from rest_framework.test import force_authenticate
 
+from nutrition_tracker.logic import preload
 from nutrition_tracker.models import user_meal
 from nutrition_tracker.serializers import UserMealDisplaySerializer
 from nutrition_tracker.tests import objects as test_objects
@@ -35,6 +36,7 @@ class TestSerializersUserMealDisplay(TestCase):
         cls.USER_MEMBER_RECIPE_MEMBERSHIP_PORTION = ufm2p
         cls.USER_MEAL = user_meal.load_lmeal(request.user, external_id=lmeal.external_id)
         cls.SERIALIZED_USER_MEAL = UserMealDisplaySerializer(instance=cls.USER_MEAL, context={"request": request})
+        cls.REQUEST = request
 
     def test_contains_expected_fields(self):
         data = self.SERIALIZED_USER_MEAL.data
@@ -164,3 +166,13 @@ class TestSerializersUserMealDisplay(TestCase):
                 }
             ],
         )
+
+    def test_preloaded_content(self):
+        serializer = UserMealDisplaySerializer(
+            instance=self.USER_MEAL,
+            context={"request": self.REQUEST, **preload.get_context(self.REQUEST.user, [self.USER_MEAL])},
+        )
+        with self.assertNumQueries(0):
+            data = serializer.data
+
+        self.assertEqual(JSONRenderer().render(data), JSONRenderer().render(self.SERIALIZED_USER_MEAL.data))
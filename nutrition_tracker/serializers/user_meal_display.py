@@ -7,7 +7,7 @@ from django.http import HttpRequest
 from rest_framework import serializers
 
 from nutrition_tracker.constants import constants
-from nutrition_tracker.logic import data_loaders, food_nutrient
+from nutrition_tracker.logic import data_loaders, food_nutrient, preload
 from nutrition_tracker.models import UserMeal
 from nutrition_tracker.serializers import base, user_member_ingredient_display, user_member_recipe_display
 
@@ -46,9 +46,9 @@ class UserMealDisplaySerializer(base.DynamicFieldsModelSerializer, base.NonNullM
         if not request.user.is_authenticated:
             return {}
 
-        lfoods = list(data_loaders.load_lfoods_for_lparents(request.user, [obj]))
-        lmember_recipes = list(data_loaders.load_lrecipes_for_lparents(request.user, [obj]))
-        food_nutrients = food_nutrient.get_foods_nutrients(request.user, lfoods)
+        lpreload = preload.get_preload(self.context) or preload.load_preload(request.user, [obj])
+        lmember_recipes = lpreload.lmember_recipes
+        food_nutrients = lpreload.food_nutrients
 
         values = []
         for nutrient_id in constants.LABEL_NUTRIENT_IDS:
@@ -71,8 +71,9 @@ class UserMealDisplaySerializer(base.DynamicFieldsModelSerializer, base.NonNullM
     def get_member_ingredients(self, obj: UserMeal) -> list:
         """Get member ingredients for this UserMeal."""
         values = []
+        ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_ingredient_id():
+            if member.child_type_id == ingredient_type_id:
                 serializer = user_member_ingredient_display.UserMemberIngredientDisplaySerializer(
                     instance=member, context=self.context
                 )
@@ -83,8 +84,9 @@ class UserMealDisplaySerializer(base.DynamicFieldsModelSerializer, base.NonNullM
     def get_member_recipes(self, obj: UserMeal) -> list:
         """Get member recipes for this UserMeal."""
         values = []
+        recipe_type_id: int = data_loaders.get_content_type_recipe_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_recipe_id():
+            if member.child_type_id == recipe_type_id:
                 serializer = user_member_recipe_display.UserMemberRecipeDisplaySerializer(
                     instance=member, context=self.context
                 )
@@ -32,8 +32,9 @@ class UserMealMutableSerializer(base.DynamicFieldsModelSerializer, base.NonNullM
     def get_member_ingredients(self, obj: UserMeal) -> list:
         """Get member ingredients for this UserMeal."""
         values = []
+        ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_ingredient_id():
+            if member.child_type_id == ingredient_type_id:
                 serializer = user_food_membership.UserFoodMembershipSerializer(instance=member, context=self.context)
                 values.append(serializer.data)
 
@@ -42,8 +43,9 @@ class UserMealMutableSerializer(base.DynamicFieldsModelSerializer, base.NonNullM
     def get_member_recipes(self, obj: UserMeal) -> list:
         """Get member recipes for this UserMeal."""
         values = []
+        recipe_type_id: int = data_loaders.get_content_type_recipe_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_recipe_id():
+            if member.child_type_id == recipe_type_id:
                 serializer = user_food_membership.UserFoodMembershipSerializer(instance=member, context=self.context)
                 values.append(serializer.data)
 
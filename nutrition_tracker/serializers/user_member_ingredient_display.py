@@ -7,7 +7,7 @@ from django.http import HttpRequest
 from rest_framework import serializers
 
 from nutrition_tracker.constants import constants
-from nutrition_tracker.logic import food_portion
+from nutrition_tracker.logic import food_portion, preload
 from nutrition_tracker.models import UserFoodMembership, user_ingredient
 from nutrition_tracker.serializers import base
 
@@ -34,10 +34,10 @@ class UserMemberIngredientDisplaySerializer(base.DynamicFieldsModelSerializer, b
             "ingredient_portion_external_id",
         )
 
-    def get_display_ingredient(self, obj: UserFoodMembership) -> dict[str, Any]:  # pylint: disable=no-self-use
+    def get_display_ingredient(self, obj: UserFoodMembership) -> dict[str, Any]:
         """Get UserIngredientDisplay for this UserMemberIngredient."""
         # UserIngredientDisplaySerializer causes cyclic import. Return the ingredient response manually.
-        lfood: user_ingredient.UserIngredient | None = obj.child
+        lfood: user_ingredient.UserIngredient | None = self._get_lfood(obj) or obj.child
         if lfood:
             display_brand = {}
             for field in constants.BRAND_FIELDS:
@@ -76,7 +76,12 @@ class UserMemberIngredientDisplaySerializer(base.DynamicFieldsModelSerializer, b
         if not request.user.is_authenticated:
             return None
 
-        lfood = user_ingredient.load_lfood(request.user, id_=obj.child_id)
+        lfood = self._get_lfood(obj) or user_ingredient.load_lfood(request.user, id_=obj.child_id)
         lfood_portions = food_portion.for_display_choices(lfood, cfood=lfood.db_food)  # type: ignore
         portion = food_portion.get_food_member_portion(obj.portions[0], lfood_portions)  # type: ignore
         return str(portion[0][0])
+
+    def _get_lfood(self, obj: UserFoodMembership) -> user_ingredient.UserIngredient | None:
+        """Get the preloaded member ingredient, None if the view didn't preload."""
+        lpreload: preload.Preload | None = preload.get_preload(self.context)
+        return lpreload.lfoods.get(obj.child_id) if lpreload else None
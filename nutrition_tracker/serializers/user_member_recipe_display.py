@@ -6,7 +6,7 @@ from typing import Any
 from django.http import HttpRequest
 from rest_framework import serializers
 
-from nutrition_tracker.logic import food_portion
+from nutrition_tracker.logic import food_portion, preload
 from nutrition_tracker.models import UserFoodMembership, user_recipe
 from nutrition_tracker.serializers import base
 
@@ -57,7 +57,7 @@ class UserMemberRecipeDisplaySerializer(base.DynamicFieldsModelSerializer, base.
             "quantity": portion.quantity,
         }
 
-    def get_recipe_portion_external_id(self, obj: UserFoodMembership) -> str | None:  # pylint: disable=no-self-use
+    def get_recipe_portion_external_id(self, obj: UserFoodMembership) -> str | None:
         """Get display portion for this member ingredient."""
         request: HttpRequest | None = self.context.get("request")
         if not request:
@@ -69,7 +69,10 @@ class UserMemberRecipeDisplaySerializer(base.DynamicFieldsModelSerializer, base.
         if not request.user.is_authenticated:
             return None
 
-        lrecipe = user_recipe.load_lrecipe(request.user, id_=obj.child_id)
+        lpreload: preload.Preload | None = preload.get_preload(self.context)
+        lrecipe = (lpreload.lrecipes.get(obj.child_id) if lpreload else None) or user_recipe.load_lrecipe(
+            request.user, id_=obj.child_id
+        )
         lrecipe_portions = food_portion.for_display_choices(lrecipe)
         portion = food_portion.get_food_member_portion(obj.portions[0], lrecipe_portions)  # type: ignore
         return str(portion[0][0])
@@ -101,8 +101,9 @@ class UserRecipeDisplaySerializer(base.DynamicFieldsModelSerializer, base.NonNul
     def get_member_ingredients(self, obj: UserRecipe) -> list:  # pylint: disable=no-self-use
         """Get member ingredients for this UserRecipe."""
         values = []
+        ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_ingredient_id():
+            if member.child_type_id == ingredient_type_id:
                 serializer = user_member_ingredient_display.UserMemberIngredientDisplaySerializer(
                     instance=member, context=self.context
                 )
@@ -113,8 +114,9 @@ class UserRecipeDisplaySerializer(base.DynamicFieldsModelSerializer, base.NonNul
     def get_member_recipes(self, obj: UserRecipe) -> list:  # pylint: disable=no-self-use
         """Get member recipes for this UserRecipe."""
         values = []
+        recipe_type_id: int = data_loaders.get_content_type_recipe_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_recipe_id():
+            if member.child_type_id == recipe_type_id:
                 serializer = user_member_recipe_display.UserMemberRecipeDisplaySerializer(
                     instance=member, context=self.context
                 )
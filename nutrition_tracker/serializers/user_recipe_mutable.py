@@ -35,8 +35,9 @@ class UserRecipeMutableSerializer(base.DynamicFieldsModelSerializer, base.NonNul
     def get_member_ingredients(self, obj: UserRecipe) -> list:
         """Get member ingredients for this UserRecipe."""
         values = []
+        ingredient_type_id: int = data_loaders.get_content_type_ingredient_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_ingredient_id():
+            if member.child_type_id == ingredient_type_id:
                 serializer = user_food_membership.UserFoodMembershipSerializer(instance=member, context=self.context)
                 values.append(serializer.data)
 
@@ -45,8 +46,9 @@ class UserRecipeMutableSerializer(base.DynamicFieldsModelSerializer, base.NonNul
     def get_member_recipes(self, obj: UserRecipe) -> list:
         """Get member recipes for this UserRecipe."""
         values = []
+        recipe_type_id: int = data_loaders.get_content_type_recipe_id()
         for member in obj.members:  # type: ignore
-            if member.child_type_id == data_loaders.get_content_type_recipe_id():
+            if member.child_type_id == recipe_type_id:
                 serializer = user_food_membership.UserFoodMembershipSerializer(instance=member, context=self.context)
                 values.append(serializer.data)
 
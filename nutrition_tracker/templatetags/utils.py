@@ -12,15 +12,14 @@ from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import data_loaders, food_category, food_nutrient, food_portion, user_prefs
 from nutrition_tracker.models import (
     db_food,
-    db_food_nutrient,
     db_food_portion,
-    user_food_nutrient,
     user_food_portion,
     user_ingredient,
     user_meal,
     user_preference,
     user_recipe,
 )
+from nutrition_tracker.utils import request_cache
 
 register = template.Library()
 
@@ -31,21 +30,32 @@ def _highlight_base(path: str, paths: list[str]) -> bool:
     return any(p == prefix for p in paths)
 
 
+# Context lists live for the whole render, index each list object once.
+@request_cache.memoize(key=id)
+def _index_by_id(objects: list) -> dict[int, Any]:
+    """Index context objects by ID, first object wins."""
+    index: dict[int, Any] = {}
+    for obj in objects:
+        index.setdefault(obj.id, obj)
+
+    return index
+
+
 def _get_lfood_cfood_from_context(
     context: dict, lfood_id: int | None = None
 ) -> tuple[user_ingredient.UserIngredient | None, db_food.DBFood | None]:
     """Return lfood and cfood objects from context, if they exist."""
+    lfood: user_ingredient.UserIngredient | None = None
+    cfood: db_food.DBFood | None = None
     if lfood_id:
-        lfoods: list[user_ingredient.UserIngredient] = context.get("lfoods", [])
-        lfood: user_ingredient.UserIngredient | None = next((lfood for lfood in lfoods if lfood_id == lfood.id), None)
-        if lfood:
-            cfoods: list[db_food.DBFood] = context.get("cfoods", [])
-            cfood: db_food.DBFood | None = next((cfood for cfood in cfoods if cfood.id == lfood.db_food_id), None)
+        lfood = _index_by_id(context.get("lfoods", [])).get(lfood_id)
+        if lfood and lfood.db_food_id:
+            cfood = _index_by_id(context.get("cfoods", [])).get(lfood.db_food_id)
 
-    if not lfood_id or not lfood:
+    if not lfood:
         lfood = context.get("lfood")
 
-    if not lfood_id or not cfood:
+    if not cfood:
         cfood = context.get("cfood")
 
     return lfood, cfood
@@ -53,17 +63,13 @@ def _get_lfood_cfood_from_context(
 
 def _get_lrecipe_from_context(context: dict, lrecipe_id: int | None = None) -> user_recipe.UserRecipe | None:
     """Return lrecipe object from context, if it exists."""
+    lrecipe: user_recipe.UserRecipe | None = None
     if lrecipe_id:
-        lrecipes: list[user_recipe.UserRecipe] = context.get("lrecipes", [])
-        lrecipe: user_recipe.UserRecipe | None = next(
-            (lrecipe for lrecipe in lrecipes if lrecipe_id == lrecipe.id), None
-        )
-
-        if not lrecipe:
-            member_recipes: list[user_recipe.UserRecipe] = context.get("member_recipes", [])
-            lrecipe = next((member_recipe for member_recipe in member_recipes if lrecipe_id == member_recipe.id), None)
+        lrecipe = _index_by_id(context.get("lrecipes", [])).get(lrecipe_id) or _index_by_id(
+            context.get("member_recipes", [])
+        ).get(lrecipe_id)
 
-    if not lrecipe_id or not lrecipe:
+    if not lrecipe:
         lrecipe = context.get("lrecipe")
 
     return lrecipe
@@ -222,9 +228,7 @@ def get_nutrient_amount(  # pylint: disable=too-many-return-statements
     context: dict, nutrient_id: int, type_: int | None = 0
 ) -> float | None:
     """Get formatted nutrient amount for display."""
-    food_nutrients: list[db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient] = context.get(
-        "food_nutrients", []
-    )
+    food_nutrients: list[food_nutrient.FoodNutrientValue] = context.get("food_nutrients", [])
     if not food_nutrients:
         return None
 
@@ -19,6 +19,7 @@ from nutrition_tracker.models import (
     db_food_nutrient,
     db_food_portion,
     search_result,
+    top_food,
     usda_branded_food,
     usda_fndds_food,
     usda_food,
@@ -493,6 +494,18 @@ def get_search_result_2() -> search_result.SearchResult:
     return search_result.create(external_id=test_constants.TEST_UUID_2, name="search_result_2")
 
 
+def get_top_food() -> top_food.TopFood:
+    """Get Top Food."""
+    cfood: db_food.DBFood = get_db_food()
+    return top_food.create(nutrient_id=constants.ENERGY_NUTRIENT_ID, rank=1, db_food=cfood, amount=100)
+
+
+def get_top_food_2() -> top_food.TopFood:
+    """Get Top Food 2."""
+    cfood: db_food.DBFood = get_db_food_2()
+    return top_food.create(nutrient_id=constants.ENERGY_NUTRIENT_ID, rank=2, db_food=cfood, amount=50)
+
+
 def index_cfood() -> None:
     """Create a branded db food and index it in search."""
     cfood = get_db_food()
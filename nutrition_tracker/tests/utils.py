@@ -1,9 +1,12 @@
 """Util functions used by python tests."""
 from __future__ import annotations
 
+import contextlib
 import logging
 import os
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
+
+from nutrition_tracker.utils import query_stats
 
 
 def prevent_request_warnings(original_function: Callable) -> Callable:
@@ -30,3 +33,34 @@ def prevent_request_warnings(original_function: Callable) -> Callable:
 def get_golden_dir() -> str:
     """Returns base path for test goldens."""
     return f"{os.getcwd()}/nutrition_tracker/tests/goldens/"
+
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin to assert query budgets. A budget caps the number of queries in a block,
+    and the number of times any single query shape may repeat, which catches N+1 queries
+    """
+
+    @contextlib.contextmanager
+    def assertQueryBudget(  # pylint: disable=invalid-name
+        self, max_queries: int, max_repeats: int = 1
+    ) -> Iterator[query_stats.QueryStats]:
+        """Fail if the block runs more than max_queries queries, or repeats a query more than max_repeats times."""
+        with query_stats.record() as stats:
+            yield stats
+
+        duplicates: dict[str, int] = stats.get_duplicates(max_repeats)
+        if duplicates:
+            self.fail(  # type: ignore
+                "\n".join(
+                    [f"Queries repeated more than {max_repeats} times:"]
+                    + [f"{count}x {fingerprint}" for fingerprint, count in duplicates.items()]
+                )
+            )
+        if stats.count > max_queries:
+            self.fail(  # type: ignore
+                "\n".join(
+                    [f"{stats.count} queries over a budget of {max_queries}:"]
+                    + [f"{count}x {fingerprint}" for fingerprint, count in stats.fingerprints.items()]
+                )
+            )
@@ -17,11 +17,14 @@ from nutrition_tracker.rest_framework.views import (
     APIEditUserMeal,
     APIEditUserRecipe,
     APILogDBFood,
+    APILogMeal,
     APILogUserIngredient,
     APILogUserRecipe,
     APIMealplanFormOne,
     APIMealplanFormThree,
     APIMealplanFormTwo,
+    APIMealplanJob,
+    APIMealplanJobs,
     APIMyFoods,
     APIMyMeals,
     APIMyNutrition,
@@ -68,11 +71,14 @@ urlpatterns = [
     path("edit/userrecipe/", APIEditUserRecipe.as_view(), name="api_edit_user_recipe"),
     path("edit/userrecipe/<uuid:id>/", APIEditUserRecipe.as_view(), name="api_edit_user_recipe"),
     path("log/dbfood/<uuid:id>/", APILogDBFood.as_view(), name="api_log_db_food"),
+    path("log/meal/", APILogMeal.as_view(), name="api_log_meal"),
     path("log/useringredient/<uuid:id>/", APILogUserIngredient.as_view(), name="api_log_user_ingredient"),
     path("log/useringredient/<uuid:id>/<uuid:mid>/", APILogUserIngredient.as_view(), name="api_log_user_ingredient"),
     path("log/userrecipe/<uuid:id>/", APILogUserRecipe.as_view(), name="api_log_user_recipe"),
     path("log/userrecipe/<uuid:id>/<uuid:mid>/", APILogUserRecipe.as_view(), name="api_log_user_recipe"),
     path("myfoods/", APIMyFoods.as_view(), name="api_my_foods"),
+    path("mealplan/jobs/", APIMealplanJobs.as_view(), name="api_mealplan_jobs"),
+    path("mealplan/jobs/<uuid:job_id>/", APIMealplanJob.as_view(), name="api_mealplan_job"),
     path("mymeals/", APIMyMeals.as_view(), name="api_my_meals"),
     path("mynutrition/", APIMyNutrition.as_view(), name="api_my_nutrition"),
     path("myrecipes/", APIMyRecipes.as_view(), name="api_my_recipes"),
@@ -51,8 +51,9 @@ def is_sum_variable(variable_name: str) -> bool:
 
 def get_constraint_variable(base_id: int | str | uuid.UUID, day: int = 1) -> str:
     """Get constraint variable for an item with base_id.
-    Constraint variable represent whether the constraint item_id is true in the proposed mealplan."""
-    to_return = f"{base_id}-{uuid.uuid4()}:c"
+    Constraint variable represent whether the constraint item_id is true in the proposed mealplan.
+    An item may have several constraint variables with the same name."""
+    to_return = f"{base_id}:c"
     if day is not None:
         to_return = f"{to_return}{day}"
 
@@ -0,0 +1,64 @@
+"""Query instrumentation utility methods.
+
+Counts the queries run in a block, their total DB time, and how often each query shape repeats.
+A shape repeating once per row is the signature of an N+1 query."""
+from __future__ import annotations
+
+import contextlib
+import re
+import time
+from collections import Counter
+from typing import Any, Callable, Iterator
+
+from django.db import connections
+
+_PLACEHOLDER_LIST_RE = re.compile(r"%s(?:, %s)+")
+_VALUES_LIST_RE = re.compile(r"\(%s\)(?:, \(%s\))+")
+_CURSOR_NAME_RE = re.compile(r'"_django_curs_\w+"')
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """Queries recorded for a block, keyed by fingerprint."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.duration: float = 0.0  # seconds
+        self.fingerprints: Counter[str] = Counter()
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+        """Database execute wrapper, see django.db.backends.base.base.BaseDatabaseWrapper.execute_wrapper."""
+        start: float = time.monotonic()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.monotonic() - start
+            self.count += 1
+            self.fingerprints[get_fingerprint(sql)] += 1
+
+    def get_duplicates(self, max_repeats: int = 1) -> dict[str, int]:
+        """Fingerprints that ran more than max_repeats times, with their counts."""
+        return {fingerprint: count for fingerprint, count in self.fingerprints.items() if count > max_repeats}
+
+    def get_max_repeats(self) -> int:
+        """Number of times the most repeated fingerprint ran."""
+        return max(self.fingerprints.values(), default=0)
+
+
+def get_fingerprint(sql: str) -> str:
+    """Query shape of sql. Whitespace, placeholder lists of any length and server-side cursor names are collapsed,
+    so the same lookup for a different number of ids, or from a different cursor, has the same fingerprint."""
+    sql = _WHITESPACE_RE.sub(" ", sql).strip()
+    sql = _CURSOR_NAME_RE.sub('"_django_curs"', sql)
+    sql = _PLACEHOLDER_LIST_RE.sub("%s", sql)
+    return _VALUES_LIST_RE.sub("(%s)", sql)
+
+
+@contextlib.contextmanager
+def record() -> Iterator[QueryStats]:
+    """Record queries run on any database connection in this block."""
+    stats = QueryStats()
+    with contextlib.ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+        yield stats
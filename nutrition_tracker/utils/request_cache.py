@@ -0,0 +1,108 @@
+"""Request scoped memoization utility methods."""
+from __future__ import annotations
+
+import functools
+import uuid
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Hashable, Iterable, TypeVar
+
+from django.db.models import Model
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_VALUE_TYPES: tuple[type, ...] = (int, float, str, bool, bytes, uuid.UUID, type(None))
+
+
+class RequestCache:
+    """Memoized results for the duration of a single request."""
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[tuple, dict, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_compute(self, key: Hashable, func: Callable, args: tuple, kwargs: dict) -> Any:
+        """Return the memoized result for key, computing func(*args, **kwargs) on the first call."""
+        entry: tuple[tuple, dict, Any] | None = self._entries.get(key)
+        if entry is None:
+            # Arguments are stored with the result, so identity parts of keys stay valid until the cache is dropped.
+            entry = (args, kwargs, func(*args, **kwargs))
+            self._entries[key] = entry
+
+        return entry[2]
+
+
+_request_cache: ContextVar[RequestCache | None] = ContextVar("request_cache", default=None)
+
+
+def _get_args_key(args: tuple, kwargs: dict) -> tuple | None:
+    """Key scalar arguments by value, None if any argument is not a scalar."""
+    values: list[Any] = [*args, *kwargs.values()]
+    if not all(isinstance(value, _VALUE_TYPES) for value in values):
+        return None
+
+    return (
+        tuple((type(arg), arg) for arg in args),
+        tuple(sorted((name, (type(value), value)) for name, value in kwargs.items())),
+    )
+
+
+def get_model_key(obj: Model | None) -> tuple | None:
+    """Stable key for a saved model instance, None for unsaved instances and None."""
+    if obj is None or obj.pk is None:
+        return None
+
+    return (obj._meta.label, obj.pk)  # pylint: disable=protected-access
+
+
+def get_models_key(objs: Iterable[Model]) -> tuple | None:
+    """Stable key for saved model instances, None if any instance is unsaved."""
+    keys: list[tuple | None] = [get_model_key(obj) for obj in objs]
+    if None in keys:
+        return None
+
+    return tuple(keys)
+
+
+def activate() -> Token:
+    """Install a fresh request cache for the current context."""
+    return _request_cache.set(RequestCache())
+
+
+def deactivate(token: Token) -> None:
+    """Drop the request cache installed by the matching activate call."""
+    _request_cache.reset(token)
+
+
+def get_request_cache() -> RequestCache | None:
+    """Return the active request cache, None outside of a request."""
+    return _request_cache.get()
+
+
+def memoize(func: _F | None = None, *, key: Callable[..., Hashable | None] | None = None) -> Any:
+    """Memoize func for the active request. Calls outside a request are not cached.
+    Scalar arguments are keyed by value. Functions taking other arguments pass key, mapping the call arguments
+    to a hashable key, e.g. model primary keys. Calls that key to None are not cached.
+    Keys must cover any argument contents callers may change within a request, e.g. by value rather than by identity.
+    Results are shared by reference, callers must not modify them."""
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            request_cache: RequestCache | None = _request_cache.get()
+            if request_cache is None:
+                return func(*args, **kwargs)
+
+            call_key: Hashable | None = key(*args, **kwargs) if key else _get_args_key(args, kwargs)
+            if call_key is None:
+                return func(*args, **kwargs)
+
+            return request_cache.get_or_compute((func.__module__, func.__qualname__, call_key), func, args, kwargs)
+
+        return wrapper  # type: ignore
+
+    if func is not None:
+        return decorator(func)
+
+    return decorator
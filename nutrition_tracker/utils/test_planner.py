@@ -1,11 +1,7 @@
 from __future__ import annotations
 
-import uuid
-from unittest.mock import Mock, patch
-
 from django.test import SimpleTestCase
 
-from nutrition_tracker.tests import constants as test_constants
 from nutrition_tracker.utils import planner
 
 
@@ -64,16 +60,14 @@ class TestUtilsPlanner(SimpleTestCase):
         variable_name = "abc"
         self.assertFalse(planner.is_sum_variable(variable_name))
 
-    @patch(target="uuid.uuid4", new=Mock(return_value=uuid.UUID(test_constants.TEST_UUID)))
     def test_get_constraint_variable(self):
         base_id = "abc"
-        expected_output = "abc-%s:c1" % test_constants.TEST_UUID
+        expected_output = "abc:c1"
         self.assertEqual(expected_output, planner.get_constraint_variable(base_id))
 
-    @patch(target="uuid.uuid4", new=Mock(return_value=uuid.UUID(test_constants.TEST_UUID)))
     def test_get_constraint_variable_day_none(self):
         base_id = "abc"
-        expected_output = "abc-%s:c" % test_constants.TEST_UUID
+        expected_output = "abc:c"
         self.assertEqual(expected_output, planner.get_constraint_variable(base_id, day=None))
 
     def test_is_constraint_variable(self):
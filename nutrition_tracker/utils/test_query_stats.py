@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from django.test import TestCase
+
+from nutrition_tracker.models import db_food
+from nutrition_tracker.tests import objects as test_objects
+from nutrition_tracker.utils import query_stats
+
+
+class TestUtilsQueryStats(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.DB_FOOD = test_objects.get_db_food()
+        cls.DB_FOOD_2 = test_objects.get_db_food_2()
+
+    def test_get_fingerprint(self):
+        self.assertEqual(
+            query_stats.get_fingerprint('SELECT * FROM "t" WHERE "t"."id" IN (%s, %s)'),
+            query_stats.get_fingerprint('SELECT *\n  FROM "t" WHERE "t"."id" IN (%s)'),
+        )
+        self.assertEqual(
+            query_stats.get_fingerprint('INSERT INTO "t" ("a", "b") VALUES (%s, %s), (%s, %s)'),
+            query_stats.get_fingerprint('INSERT INTO "t" ("a", "b") VALUES (%s, %s)'),
+        )
+        self.assertEqual(
+            query_stats.get_fingerprint('DECLARE "_django_curs_1_sync_1" NO SCROLL CURSOR FOR SELECT 1'),
+            query_stats.get_fingerprint('DECLARE "_django_curs_2_sync_5" NO SCROLL CURSOR FOR SELECT 1'),
+        )
+        self.assertNotEqual(
+            query_stats.get_fingerprint('SELECT * FROM "t" WHERE "t"."id" = %s'),
+            query_stats.get_fingerprint('SELECT * FROM "t" WHERE "t"."name" = %s'),
+        )
+
+    def test_record(self):
+        with query_stats.record() as stats:
+            for cfood in [self.DB_FOOD, self.DB_FOOD_2]:
+                db_food.DBFood.objects.get(id=cfood.id)
+            list(db_food.DBFood.objects.filter(id__in=[self.DB_FOOD.id, self.DB_FOOD_2.id]))
+
+        self.assertEqual(3, stats.count)
+        self.assertGreater(stats.duration, 0)
+        self.assertEqual(2, stats.get_max_repeats())
+        self.assertEqual([2], list(stats.get_duplicates().values()))
+        self.assertEqual({}, stats.get_duplicates(2))
+
+    def test_record_empty(self):
+        with query_stats.record() as stats:
+            pass
+
+        self.assertEqual(0, stats.count)
+        self.assertEqual(0, stats.get_max_repeats())
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from django.test import SimpleTestCase
+
+from nutrition_tracker.models import db_food
+from nutrition_tracker.utils import request_cache
+
+
+class TestUtilsRequestCache(SimpleTestCase):
+    def test_memoize_no_request(self):
+        func = Mock(__qualname__="func", return_value=1)
+        memoized = request_cache.memoize(func)
+        self.assertEqual(1, memoized(1))
+        self.assertEqual(1, memoized(1))
+        self.assertEqual(2, func.call_count)
+        self.assertIsNone(request_cache.get_request_cache())
+
+    def test_memoize_request(self):
+        func = Mock(__qualname__="func", return_value=1)
+        memoized = request_cache.memoize(func)
+        token = request_cache.activate()
+        try:
+            self.assertEqual(1, memoized(1, nutrient_id=2))
+            self.assertEqual(1, memoized(1, nutrient_id=2))
+            self.assertEqual(1, func.call_count)
+            memoized(1, nutrient_id=3)
+            self.assertEqual(2, func.call_count)
+            self.assertEqual(2, len(request_cache.get_request_cache()))
+        finally:
+            request_cache.deactivate(token)
+
+        self.assertIsNone(request_cache.get_request_cache())
+
+    def test_memoize_request_non_scalar_args(self):
+        func = Mock(__qualname__="func", return_value=1)
+        memoized = request_cache.memoize(func)
+        lfoods = [1, 2]
+        token = request_cache.activate()
+        try:
+            memoized(lfoods)
+            memoized(lfoods)
+            self.assertEqual(2, func.call_count)
+            self.assertEqual(0, len(request_cache.get_request_cache()))
+        finally:
+            request_cache.deactivate(token)
+
+    def test_memoize_request_key(self):
+        func = Mock(__qualname__="func", return_value=1)
+        memoized = request_cache.memoize(key=lambda lfoods, nutrient_id: (tuple(lfoods), nutrient_id))(func)
+        token = request_cache.activate()
+        try:
+            memoized([1, 2], 3)
+            memoized([1, 2], 3)
+            self.assertEqual(1, func.call_count)
+            memoized([1, 2], 4)
+            self.assertEqual(2, func.call_count)
+        finally:
+            request_cache.deactivate(token)
+
+    def test_memoize_request_key_none(self):
+        func = Mock(__qualname__="func", return_value=1)
+        memoized = request_cache.memoize(key=lambda value: None)(func)
+        token = request_cache.activate()
+        try:
+            memoized(1)
+            memoized(1)
+            self.assertEqual(2, func.call_count)
+            self.assertEqual(0, len(request_cache.get_request_cache()))
+        finally:
+            request_cache.deactivate(token)
+
+    def test_get_model_key(self):
+        cfood = db_food.DBFood(id=1)
+        self.assertEqual(("nutrition_tracker.DBFood", 1), request_cache.get_model_key(cfood))
+        self.assertIsNone(request_cache.get_model_key(db_food.DBFood()))
+        self.assertIsNone(request_cache.get_model_key(None))
+        self.assertEqual(
+            (("nutrition_tracker.DBFood", 1), ("nutrition_tracker.DBFood", 2)),
+            request_cache.get_models_key([cfood, db_food.DBFood(id=2)]),
+        )
+        self.assertIsNone(request_cache.get_models_key([cfood, db_food.DBFood()]))
+        self.assertEqual((), request_cache.get_models_key([]))
+
+    def test_memoize_value_types(self):
+        func = Mock(__qualname__="func", return_value=1)
+        memoized = request_cache.memoize(func)
+        token = request_cache.activate()
+        try:
+            memoized(1)
+            memoized(True)
+            memoized("1")
+            self.assertEqual(3, func.call_count)
+        finally:
+            request_cache.deactivate(token)
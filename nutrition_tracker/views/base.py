@@ -21,6 +21,7 @@ from django.views.generic.list import ListView
 
 from nutrition_tracker.constants import constants
 from nutrition_tracker.forms import LogForm, SearchForm, UUIDForm
+from nutrition_tracker.logic import meal_log
 from nutrition_tracker.models import user_meal, user_preference
 from nutrition_tracker.utils import views as views_util
 
@@ -95,11 +96,7 @@ class DeleteFormBaseView(FormView):
                 messages.add_message(self.request, messages.ERROR, self.MESSAGE_NOT_ALLOWED)
                 return redirect(self.URL_NOT_ALLOWED)  # type: ignore
 
-            old_meal_id: int = self.lmembership.parent_id  # type: ignore
-            self.lmembership.delete()  # type: ignore
-            old_lmeal = user_meal.load_lmeal(self.request.user, id_=old_meal_id)  # type: ignore
-            if old_lmeal and len(old_lmeal.members) == 0:  # type: ignore
-                old_lmeal.delete()
+            meal_log.delete_lmembership(self.request.user, self.lmembership)  # type: ignore
         else:
             self.lobject.delete()  # type: ignore
 
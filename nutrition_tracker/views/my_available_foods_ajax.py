@@ -1,7 +1,7 @@
 """Ajax view that returns available foods in a user's kitchen for a given nutrient_id, sorted in descending order by the amount of nutrient."""
 from __future__ import annotations
 
-from typing import Any, Sequence
+from typing import Any
 
 from django.contrib import messages
 from django.http import HttpResponse
@@ -11,7 +11,7 @@ from django.views.generic import TemplateView
 from nutrition_tracker.config import usda_config
 from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import food_nutrient
-from nutrition_tracker.models import db_food_nutrient, user_food_nutrient, user_ingredient
+from nutrition_tracker.models import user_ingredient
 from nutrition_tracker.utils import views as views_util
 
 MAX_ITEMS: int = 10
@@ -37,23 +37,9 @@ class MyAvailableFoodsAjaxView(TemplateView):
             user_ingredient.UserIngredient
         ] = []
         if self.request.user.is_authenticated and lnutrient:
-            lfoods: list[user_ingredient.UserIngredient] = list(user_ingredient.load_lfoods(self.request.user))
-            lfoods_nutrients: Sequence[
-                db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient
-            ] = food_nutrient.get_foods_nutrients(self.request.user, lfoods, nutrient_id=nutrient_id)
-            lfoods_nutrients = sorted(lfoods_nutrients, key=lambda x: x.amount, reverse=True)  # type: ignore
-
-            for lfn in lfoods_nutrients:
-                if not lfn.amount:
-                    continue
-
-                if hasattr(lfn, "ingredient"):
-                    lfood = next((lfood for lfood in lfoods if lfood == lfn.ingredient), None)  # type: ignore
-                else:
-                    lfood = next((lfood for lfood in lfoods if lfood.db_food == lfn.db_food), None)  # type: ignore
-
-                if lfood and lfood not in self.available_lfoods:
-                    self.available_lfoods.append(lfood)
+            self.available_lfoods = food_nutrient.load_top_lfoods_for_nutrient(
+                self.request.user, nutrient_id, max_items=MAX_ITEMS
+            )
 
         return super().get(*args, **kwargs)
 
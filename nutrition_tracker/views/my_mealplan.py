@@ -6,13 +6,15 @@ from typing import Any
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db import transaction
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseRedirect
+from django.shortcuts import render
 from django.urls import reverse_lazy
 from django.views.generic.edit import FormView
 
 from nutrition_tracker.constants import constants
 from nutrition_tracker.forms import MealplanFormOne, MealplanFormThree, MealplanFormTwo
-from nutrition_tracker.logic import mealplan, user_prefs
+from nutrition_tracker.logic import mealplan_jobs, user_prefs
+from nutrition_tracker.utils import text
 
 STEP_ONE: int = 1
 STEP_TWO: int = 2
@@ -32,6 +34,8 @@ TEMPLATES: dict[int, str] = {
     STEP_THREE: "nutrition_tracker/my_mealplan_three.html",
 }
 
+PENDING_TEMPLATE: str = "nutrition_tracker/my_mealplan_pending.html"
+
 
 NEXT_URL: dict[int, str] = {
     STEP_ONE: constants.URL_MY_MEALPLAN,
@@ -51,8 +55,32 @@ class MyMealplanView(LoginRequiredMixin, FormView):
     def get(self, *args: Any, **kwargs: Any) -> HttpResponse:
         self.step = self._get_step_value()  # pylint: disable=attribute-defined-outside-init
         if self.step == STEP_THREE:
-            self.lmealplan = mealplan.get_mealplan_for_user(  # pylint: disable=attribute-defined-outside-init
-                self.request.user  # type: ignore
+            # Solves run on the job pool, the page reloads until the job is done.
+            job_id: str | None = self.request.GET.get("job")
+            job: dict | None = None
+            if job_id and text.is_valid_uuid(job_id):
+                job = mealplan_jobs.get_job(self.request.user, job_id)  # type: ignore
+            if not job:
+                job = mealplan_jobs.get_job(
+                    self.request.user, mealplan_jobs.submit_job(self.request.user)  # type: ignore
+                )
+
+            if not job or job["status"] in [
+                constants.MealplanJobStatus.FAILED,
+                constants.MealplanJobStatus.CANCELLED,
+            ]:
+                messages.add_message(self.request, messages.ERROR, constants.MESSAGE_ERROR_MEALPLAN_FAILED)
+                return HttpResponseRedirect(reverse_lazy(constants.URL_MY_MEALPLAN, kwargs={"step": STEP_TWO}))
+
+            if job["status"] != constants.MealplanJobStatus.DONE:
+                return render(
+                    self.request,
+                    PENDING_TEMPLATE,
+                    {"job_id": job["job_id"], "poll_interval": constants.MEALPLAN_JOB_POLL_INTERVAL},
+                )
+
+            self.lmealplan = mealplan_jobs.get_job_mealplan(  # pylint: disable=attribute-defined-outside-init
+                self.request.user, job  # type: ignore
             )
         return super().get(*args, **kwargs)
 
@@ -107,3 +135,11 @@ class MyMealplanView(LoginRequiredMixin, FormView):
             self.return_value = form.save()  # pylint: disable=attribute-defined-outside-init
 
         return super().form_valid(form)
+
+    def form_invalid(self, form: Any) -> HttpResponse:
+        if self.step == STEP_THREE:
+            # Expired or unknown plan, the submitted mealplan can't be rendered again. Review a fresh plan.
+            messages.add_message(self.request, messages.ERROR, constants.MESSAGE_ERROR_MEALPLAN_EXPIRED)
+            return HttpResponseRedirect(reverse_lazy(constants.URL_MY_MEALPLAN, kwargs={"step": STEP_THREE}))
+
+        return super().form_invalid(form)
@@ -8,6 +8,7 @@ from django.core.paginator import Paginator
 from django.db.models import QuerySet
 
 import users.models as user_model
+from nutrition_tracker.constants import constants
 from nutrition_tracker.models import user_meal
 from nutrition_tracker.utils import model as model_utils
 from nutrition_tracker.views import ListBaseView, MealMixin
@@ -22,7 +23,7 @@ class MyMealsView(LoginRequiredMixin, MealMixin, ListBaseView):  # pylint: disab
 
     def get_queryset(self) -> QuerySet[user_meal.UserMeal]:
         luser: user_model.User = self.request.user  # type: ignore
-        return user_meal.load_lmeals(luser, order_by="-meal_date")
+        return user_meal.load_lmeals(luser, order_by="-meal_date", load_profile=constants.LoadProfile.DISPLAY)
 
     def get_results(self, context: dict[str, Any]) -> list:
         """Return meal browse results."""
@@ -1,7 +1,7 @@
 """Ajax view to lookup nutrient information for a food/recipe."""
 from __future__ import annotations
 
-from typing import Any, Sequence
+from typing import Any
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -13,7 +13,7 @@ from django.views.generic import TemplateView
 import users.models as user_model
 from nutrition_tracker.constants import constants
 from nutrition_tracker.logic import data_loaders, food_nutrient
-from nutrition_tracker.models import db_food_nutrient, user_food_nutrient, user_ingredient, user_recipe
+from nutrition_tracker.models import user_ingredient, user_recipe
 from nutrition_tracker.utils import views as views_util
 
 
@@ -33,9 +33,9 @@ class MyNutrientAjaxView(LoginRequiredMixin, TemplateView):
 
         lfood: user_ingredient.UserIngredient | None = user_ingredient.load_lfood(luser, external_id=external_id)
         if lfood:
-            food_nutrients: Sequence[
-                db_food_nutrient.DBFoodNutrient | user_food_nutrient.UserFoodNutrient
-            ] = food_nutrient.get_food_nutrients(lfood, lfood.db_food)
+            food_nutrients: list[food_nutrient.FoodNutrientValue] = food_nutrient.get_food_nutrients(
+                lfood, lfood.db_food
+            )
             data: list = [
                 {
                     "nutrient_id": nutrient_id,
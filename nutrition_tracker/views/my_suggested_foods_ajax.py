@@ -32,7 +32,9 @@ class MySuggestedFoodsAjaxView(TemplateView):
 
         suggested_lobjects: list[user_ingredient.UserIngredient | user_recipe.UserRecipe] = []
         if self.request.user.is_authenticated:
-            lmeals = user_meal.load_lmeals(self.request.user, order_by="-meal_date", num_days=MEAL_DAYS)
+            lmeals = user_meal.load_lmeals(
+                self.request.user, order_by="-meal_date", num_days=MEAL_DAYS, load_profile=constants.LoadProfile.IDS
+            )
 
             filtered_lmeals = []
             for days in range(1, MEAL_DAYS):
@@ -48,8 +50,16 @@ class MySuggestedFoodsAjaxView(TemplateView):
                     ]
                 )
 
-            suggested_lfoods = list(data_loaders.load_lfoods_for_lparents(self.request.user, filtered_lmeals))
-            suggested_lrecipes = list(data_loaders.load_lrecipes_for_lparents(self.request.user, filtered_lmeals))
+            suggested_lfoods = list(
+                data_loaders.load_lfoods_for_lparents(
+                    self.request.user, filtered_lmeals, load_profile=constants.LoadProfile.DISPLAY
+                )
+            )
+            suggested_lrecipes = list(
+                data_loaders.load_lrecipes_for_lparents(
+                    self.request.user, filtered_lmeals, load_profile=constants.LoadProfile.DISPLAY
+                )
+            )
             suggested_lobjects = [
                 item for pair in zip_longest(suggested_lfoods, suggested_lrecipes) for item in pair if item is not None
             ]
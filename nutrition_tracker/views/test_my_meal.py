@@ -12,7 +12,7 @@ from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.tests import utils as test_utils
 
 
-class TestViewsMyMeal(TestCase):
+class TestViewsMyMeal(test_utils.QueryBudgetMixin, TestCase):
     @classmethod
     def setUpTestData(cls):
         cls.USER_MEAL = test_objects.get_meal_today_1()
@@ -61,3 +61,21 @@ class TestViewsMyMeal(TestCase):
         self.assertTrue(response.context["food_nutrients"])
         self.assertFalse(response.context["food_portions"])
         self.assertTrue(response.context["nutrient_preferences"])
+
+    def test_meal_query_budget(self):
+        lchildren = [
+            test_objects.get_user_ingredient(),
+            test_objects.get_user_ingredient_2(),
+            test_objects.get_recipe(),
+        ]
+        for lchild in lchildren * 2:
+            test_objects.get_user_food_membership_portion(
+                test_objects.get_user_food_membership(self.USER_MEAL, lchild)
+            )
+
+        self.client.login(email="user@famnom.com", password="password")
+        # Member graph lookups repeat once per level, 8 members would repeat per member queries more often.
+        with self.assertQueryBudget(20, max_repeats=3):
+            response = self.client.get(reverse("my_meal", kwargs={"id": self.USER_MEAL.external_id}))
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import uuid
 from http import HTTPStatus
 
 from django.contrib.messages import get_messages
@@ -8,7 +9,7 @@ from django.urls import reverse
 from django.utils import timezone
 
 from nutrition_tracker.constants import constants
-from nutrition_tracker.logic import user_prefs
+from nutrition_tracker.logic import mealplan, mealplan_jobs, user_prefs
 from nutrition_tracker.models import user_food_membership, user_meal, user_preference
 from nutrition_tracker.tests import objects as test_objects
 from nutrition_tracker.utils import form as form_utils
@@ -123,17 +124,55 @@ class TestViewsMyMealplan(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertTemplateUsed(response, "nutrition_tracker/my_mealplan_three.html")
 
+    def test_logged_in_step_three_job(self):
+        luser = test_objects.get_user()
+        job_id = mealplan_jobs.submit_job(luser)
+        self.client.login(email="user@famnom.com", password="password")
+        response = self.client.get(reverse("my_mealplan", kwargs={"step": 3}), {"job": job_id})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, "nutrition_tracker/my_mealplan_three.html")
+
+    def test_logged_in_step_three_pending(self):
+        luser = test_objects.get_user()
+        job_id = str(uuid.uuid4())
+        mealplan_jobs._set_job(job_id, luser.id, constants.MealplanJobStatus.RUNNING)
+        self.client.login(email="user@famnom.com", password="password")
+        response = self.client.get(reverse("my_mealplan", kwargs={"step": 3}), {"job": job_id})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTemplateUsed(response, "nutrition_tracker/my_mealplan_pending.html")
+        self.assertContains(response, f"?job={job_id}")
+
+    def test_logged_in_step_three_failed(self):
+        luser = test_objects.get_user()
+        job_id = str(uuid.uuid4())
+        mealplan_jobs._set_job(job_id, luser.id, constants.MealplanJobStatus.FAILED)
+        self.client.login(email="user@famnom.com", password="password")
+        response = self.client.get(reverse("my_mealplan", kwargs={"step": 3}), {"job": job_id})
+        self.assertRedirects(response, reverse("my_mealplan", kwargs={"step": 2}), fetch_redirect_response=False)
+        messages = [m.message for m in get_messages(response.wsgi_request)]
+        self.assertIn(constants.MESSAGE_ERROR_MEALPLAN_FAILED, messages)
+
     def test_logged_in_step_three_submit(self):
         luser = test_objects.get_user()
         lfood_1 = test_objects.get_user_ingredient()
         lfood_2 = test_objects.get_user_ingredient_2()
         lrecipe_1 = test_objects.get_recipe()
         lrecipe_2 = test_objects.get_recipe_2()
+        lmealplan = mealplan.Mealplan(
+            False,
+            [lfood_1, lfood_2],
+            [lrecipe_1, lrecipe_2],
+            [],
+            [],
+            [],
+            {lfood_1.external_id: 53, lfood_2.external_id: 19, lrecipe_1.external_id: 24, lrecipe_2.external_id: 112},
+        )
 
         self.client.login(email="user@famnom.com", password="password")
         response = self.client.post(
             reverse("my_mealplan", kwargs={"step": 3}),
             {
+                "plan_id": mealplan.save_plan(luser, lmealplan)[0],
                 form_utils.get_field_name(lfood_1.external_id): 53,
                 form_utils.get_meal_field_name(lfood_1.external_id): constants.MealType.BREAKFAST,
                 form_utils.get_field_name(lfood_2.external_id): 19,
@@ -158,11 +197,21 @@ class TestViewsMyMealplan(TestCase):
         lfood_2 = test_objects.get_user_ingredient_2()
         lrecipe_1 = test_objects.get_recipe()
         lrecipe_2 = test_objects.get_recipe_2()
+        lmealplan = mealplan.Mealplan(
+            False,
+            [lfood_1, lfood_2],
+            [lrecipe_1, lrecipe_2],
+            [],
+            [],
+            [],
+            {lfood_1.external_id: 53, lfood_2.external_id: 19, lrecipe_1.external_id: 24, lrecipe_2.external_id: 112},
+        )
 
         self.client.login(email="user@famnom.com", password="password")
         response = self.client.post(
             reverse("my_mealplan", kwargs={"step": 3}),
             {
+                "plan_id": mealplan.save_plan(luser, lmealplan)[0],
                 form_utils.get_field_name(lfood_1.external_id): 53,
                 form_utils.get_meal_field_name(lfood_1.external_id): "",
                 form_utils.get_field_name(lfood_2.external_id): 19,
@@ -180,3 +229,36 @@ class TestViewsMyMealplan(TestCase):
         self.assertIn(constants.MESSAGE_INFO_MEALPLAN_NOT_SAVED, messages)
         self.assertEqual(0, user_meal.load_lmeals(luser, meal_date=timezone.localdate()).count())
         self.assertEqual(0, user_food_membership.load_lmemberships(luser).count())
+
+    def test_logged_in_step_three_submit_no_plan(self):
+        luser = test_objects.get_user()
+        lfood_1 = test_objects.get_user_ingredient()
+
+        self.client.login(email="user@famnom.com", password="password")
+        response = self.client.post(
+            reverse("my_mealplan", kwargs={"step": 3}),
+            {
+                form_utils.get_field_name(lfood_1.external_id): 53,
+                form_utils.get_meal_field_name(lfood_1.external_id): constants.MealType.BREAKFAST,
+            },
+        )
+        self.assertRedirects(response, reverse("my_mealplan", kwargs={"step": 3}), fetch_redirect_response=False)
+        self.assertEqual(0, user_food_membership.load_lmemberships(luser).count())
+
+    def test_logged_in_step_three_submit_unknown_plan(self):
+        luser = test_objects.get_user()
+        lfood_1 = test_objects.get_user_ingredient()
+
+        self.client.login(email="user@famnom.com", password="password")
+        response = self.client.post(
+            reverse("my_mealplan", kwargs={"step": 3}),
+            {
+                "plan_id": uuid.uuid4(),
+                form_utils.get_field_name(lfood_1.external_id): 53,
+                form_utils.get_meal_field_name(lfood_1.external_id): constants.MealType.BREAKFAST,
+            },
+        )
+        self.assertRedirects(response, reverse("my_mealplan", kwargs={"step": 3}), fetch_redirect_response=False)
+        messages = [m.message for m in get_messages(response.wsgi_request)]
+        self.assertIn(constants.MESSAGE_ERROR_MEALPLAN_EXPIRED, messages)
+        self.assertEqual(0, user_food_membership.load_lmemberships(luser).count())
@@ -9,7 +9,7 @@ from django.shortcuts import redirect
 from django.views.generic import TemplateView
 
 from nutrition_tracker.constants import constants
-from nutrition_tracker.logic import food_nutrient
+from nutrition_tracker.logic import top_foods_indexing
 from nutrition_tracker.utils import views as views_util
 
 
@@ -27,8 +27,10 @@ class TopFoodsAjaxView(TemplateView):
         if not nutrient_id:
             return super().get(*args, **kwargs)
 
-        self.top_cfoods = food_nutrient.get_top_cfoods_for_nutrient(  # pylint: disable=attribute-defined-outside-init
-            nutrient_id
+        self.top_cfoods = (
+            top_foods_indexing.get_top_cfoods_for_nutrient(  # pylint: disable=attribute-defined-outside-init
+                nutrient_id
+            )
         )
         return super().get(*args, **kwargs)
 
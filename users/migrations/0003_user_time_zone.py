@@ -0,0 +1,18 @@
+# Generated by Django 4.0.6 on 2026-10-19 19:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_alter_user_first_name_alter_user_last_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='time_zone',
+            field=models.CharField(blank=True, help_text="User's IANA timezone name.", max_length=64, null=True, verbose_name='time_zone'),
+        ),
+    ]
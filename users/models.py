@@ -10,6 +10,7 @@ from bitfield import BitField
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import PermissionsMixin
+from django.core.cache import cache
 from django.core.mail import send_mail
 from django.db import models
 from django.dispatch import receiver
@@ -20,6 +21,11 @@ from django.utils.translation import gettext_lazy as _
 from nutrition_tracker.models import db_base
 
 
+def get_family_roster_key(family_id: str | uuid.UUID) -> str:
+    """Cache key for the user ids in a family."""
+    return f"family_roster:{family_id}"
+
+
 class UserManager(BaseUserManager):
     """Extend BaseUserManager for custom User model."""
 
@@ -88,6 +94,9 @@ class User(AbstractBaseUser, PermissionsMixin, db_base.DbBase):
         help_text="Timestamp when the user was added to a family.",
     )
     flags = BitField(flags=(FLAG_IS_PREGNANT,), null=True)
+    time_zone = models.CharField(
+        max_length=64, blank=True, null=True, verbose_name="time_zone", help_text="User's IANA timezone name."
+    )
     is_staff = models.BooleanField(
         _("staff status"),
         default=False,
@@ -119,9 +128,20 @@ class User(AbstractBaseUser, PermissionsMixin, db_base.DbBase):
         self.__original_family_id = self.family_id
 
     def save(self, *args: Any, **kwargs: Any) -> None:
-        if self.__original_family_id != self.family_id:
+        family_changed: bool = self.__original_family_id != self.family_id
+        if family_changed:
             self.family_added_timestamp = timezone.now()
         super().save(*args, **kwargs)
+        if family_changed:
+            # Both the old and the new family rosters changed.
+            cache.delete_many(
+                [
+                    get_family_roster_key(family_id)
+                    for family_id in [self.__original_family_id, self.family_id]
+                    if family_id
+                ]
+            )
+            self.__original_family_id = self.family_id
 
     def clean(self) -> None:
         super().clean()